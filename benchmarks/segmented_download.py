@@ -0,0 +1,166 @@
+"""Benchmark segmented downloads against a throttled local HTTP server.
+
+The server limits the rate at which each connection is served, in the same
+way as a CDN or network path that throttles individual streams. The same
+content is then downloaded with ``download_file()``, using a range of values
+for ``BRIEFCASE_DOWNLOAD_SEGMENTS``.
+
+Usage::
+
+    python benchmarks/segmented_download.py --size 16 --rate 4 --segments 1 2 4
+
+Every download uses a fresh, temporary data directory, so nothing is served
+from the download cache.
+"""
+import argparse
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from briefcase.commands.base import BaseCommand
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BenchmarkCommand(BaseCommand):
+    command = "benchmark"
+    platform = "benchmark"
+    output_format = "benchmark"
+    description = "Benchmark downloads"
+
+    def binary_path(self, app):
+        raise NotImplementedError()
+
+    def distribution_path(self, app, packaging_format):
+        raise NotImplementedError()
+
+
+def throttled_handler(content, rate):
+    """Create a request handler that serves content at a limited rate.
+
+    :param content: The content to serve.
+    :param rate: The maximum rate of each connection, in bytes per second.
+    """
+    etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+
+    class ThrottledHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            start, end = 0, len(content) - 1
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            if match:
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), end)
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.end_headers()
+
+            begin = time.perf_counter()
+            sent = 0
+            for offset in range(start, end + 1, CHUNK_SIZE):
+                stop = min(offset + CHUNK_SIZE, end + 1)
+                chunk = content[offset:stop]
+                try:
+                    self.wfile.write(chunk)
+                except ConnectionError:
+                    # The client abandoned the response (e.g., the initial
+                    # request of a segmented download).
+                    return
+                sent += len(chunk)
+                # Sleep until this connection is back under its rate limit.
+                delay = sent / rate - (time.perf_counter() - begin)
+                if delay > 0:
+                    time.sleep(delay)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThrottledHandler
+
+
+def download(url, segments):
+    """Download a URL with a fresh command and data directory.
+
+    :param url: The URL to download.
+    :param segments: The number of segments to request.
+    :returns: The time taken, in seconds, and the digest of the download.
+    """
+    os.environ["BRIEFCASE_DOWNLOAD_SEGMENTS"] = str(segments)
+    with tempfile.TemporaryDirectory() as tmp:
+        command = BenchmarkCommand(
+            base_path=Path(tmp),
+            data_path=Path(tmp) / "data",
+            input_enabled=False,
+        )
+        start = time.perf_counter()
+        filename = command.download_file(url=url, download_path=Path(tmp) / "out")
+        elapsed = time.perf_counter() - start
+        return elapsed, hashlib.sha256(filename.read_bytes()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size", type=int, default=16, help="Size of the content, in MB"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=4, help="Rate limit per connection, in MB/s"
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Segment counts to benchmark",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Downloads per segment count"
+    )
+    args = parser.parse_args()
+
+    content = os.urandom(args.size * 1024 * 1024)
+    expected = hashlib.sha256(content).hexdigest()
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        throttled_handler(content, args.rate * 1024 * 1024),
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/content.bin"
+    # Don't send requests for the local server through a proxy.
+    os.environ["NO_PROXY"] = "127.0.0.1"
+
+    results = []
+    try:
+        for segments in args.segments:
+            times = []
+            for _ in range(args.repeat):
+                elapsed, digest = download(url, segments)
+                if digest != expected:
+                    raise RuntimeError(f"Corrupt download with {segments} segments")
+                times.append(elapsed)
+            results.append((segments, min(times), sorted(times)[len(times) // 2]))
+    finally:
+        server.shutdown()
+
+    print()
+    print(f"{args.size} MB at {args.rate} MB/s per connection")
+    print(f"{'segments':>8} {'best (s)':>9} {'median (s)':>11} {'speedup':>8}")
+    baseline = results[0][2]
+    for segments, best, median in results:
+        print(f"{segments:>8} {best:>9.2f} {median:>11.2f} {baseline / median:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
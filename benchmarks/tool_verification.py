@@ -0,0 +1,236 @@
+"""Benchmark a first run of the Android tool verification.
+
+``verify_tools()`` of the Android ``create`` command is run with a fresh data
+directory, so the JDK and the Android SDK Command-Line Tools are downloaded
+and installed. The downloads are served by a throttled local HTTP server
+(configured as a mirror of the upstream servers), in place of the real
+archives. The JDK is a tarball containing a stub ``javac``; the SDK is a zip
+containing a stub ``sdkmanager`` that accepts the licenses. Each archive is
+padded with random content to the requested size.
+
+The tools are verified with the task graph that Briefcase uses, and again
+with the task graph limited to one worker, so the tools are installed one
+after the other.
+
+Usage::
+
+    python benchmarks/tool_verification.py --jdk-size 100 --sdk-size 130 --rate 10
+
+Only the download, unpacking and installation of the tools are real; the
+time taken by a real ``sdkmanager`` to accept the licenses isn't included.
+"""
+import argparse
+import io
+import os
+import re
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from briefcase.integrations.java import JDK
+from briefcase.platforms.android import gradle
+from briefcase.tasks import run_tasks
+
+CHUNK_SIZE = 64 * 1024
+
+# A stub sdkmanager; accepting the licenses creates the license file.
+SDKMANAGER = b"""\
+#!/bin/sh
+root="$(cd "$(dirname "$0")/../../.." && pwd)"
+if [ "$1" = "--licenses" ]; then
+    mkdir -p "$root/licenses"
+    touch "$root/licenses/android-sdk-license"
+fi
+"""
+
+
+def jdk_archive(size):
+    """Generate a JDK tarball, for the JDK release that Briefcase installs.
+
+    :param size: The size of the random content in the archive, in bytes.
+    """
+    jdk = JDK(command=None, java_home=None)
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, content, mode in [
+            ("bin/javac", f"#!/bin/sh\necho javac {jdk.release}\n".encode(), 0o755),
+            ("lib/rt.jar", os.urandom(size), 0o644),
+        ]:
+            info = tarfile.TarInfo(f"jdk{jdk.release}-{jdk.build}/{name}")
+            info.size = len(content)
+            info.mode = mode
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def sdk_archive(size):
+    """Generate an Android SDK Command-Line Tools zip file.
+
+    :param size: The size of the random content in the archive, in bytes.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        info = zipfile.ZipInfo("cmdline-tools/bin/sdkmanager")
+        # Unix permissions, so the stub is unpacked as an executable.
+        info.create_system = 3
+        info.external_attr = 0o100755 << 16
+        archive.writestr(info, SDKMANAGER)
+        archive.writestr("cmdline-tools/lib/sdkmanager.jar", os.urandom(size))
+    return buffer.getvalue()
+
+
+def throttled_handler(archives, rate):
+    """Create a request handler that serves archives at a limited rate.
+
+    :param archives: A dictionary of filename suffix->content.
+    :param rate: The maximum rate of each connection, in bytes per second.
+    """
+
+    class ThrottledHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            content = next(
+                (
+                    content
+                    for suffix, content in archives.items()
+                    if self.path.endswith(suffix)
+                ),
+                None,
+            )
+            if content is None:
+                self.send_error(404)
+                return
+
+            start, end = 0, len(content) - 1
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            if match:
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), end)
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(content)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(end - start + 1))
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+
+            begin = time.perf_counter()
+            sent = 0
+            for offset in range(start, end + 1, CHUNK_SIZE):
+                stop = min(offset + CHUNK_SIZE, end + 1)
+                chunk = content[offset:stop]
+                try:
+                    self.wfile.write(chunk)
+                except ConnectionError:
+                    return
+                sent += len(chunk)
+                # Sleep until this connection is back under its rate limit.
+                delay = sent / rate - (time.perf_counter() - begin)
+                if delay > 0:
+                    time.sleep(delay)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThrottledHandler
+
+
+def verify_tools(mirror_url, max_workers):
+    """Verify the Android tools with a fresh command and data directory.
+
+    :param mirror_url: The URL of the local server.
+    :param max_workers: The maximum number of tools to verify at once; or
+        ``None`` to use Briefcase's default.
+    :returns: The time taken, in seconds.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        mirrors = Path(tmp) / "mirrors.toml"
+        mirrors.write_text(
+            "[mirrors]\n"
+            f'"https://github.com/" = "{mirror_url}/github/"\n'
+            f'"https://dl.google.com/" = "{mirror_url}/google/"\n',
+            encoding="utf-8",
+        )
+        os.environ["BRIEFCASE_MIRRORS"] = os.fsdecode(mirrors)
+        command = gradle.GradleCreateCommand(
+            base_path=Path(tmp),
+            data_path=Path(tmp) / "data",
+            input_enabled=False,
+        )
+        with mock.patch.object(
+            gradle, "run_tasks", partial(run_tasks, max_workers=max_workers)
+        ):
+            start = time.perf_counter()
+            command.verify_tools()
+            elapsed = time.perf_counter() - start
+
+        if not (command.tools_path / "java" / "bin" / "javac").exists():
+            raise RuntimeError("The JDK wasn't installed")
+        if not command.android_sdk.exists():
+            raise RuntimeError("The Android SDK wasn't installed")
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--jdk-size", type=int, default=100, help="Size of the JDK archive, in MB"
+    )
+    parser.add_argument(
+        "--sdk-size", type=int, default=130, help="Size of the SDK archive, in MB"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=10, help="Rate limit per connection, in MB/s"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Verifications per configuration"
+    )
+    args = parser.parse_args()
+
+    archives = {
+        ".tar.gz": jdk_archive(args.jdk_size * 1024 * 1024),
+        ".zip": sdk_archive(args.sdk_size * 1024 * 1024),
+    }
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0),
+        throttled_handler(archives, args.rate * 1024 * 1024),
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    mirror_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Use a single connection for each download, and the Briefcase-managed
+    # tools, rather than any that are already installed.
+    os.environ["BRIEFCASE_DOWNLOAD_SEGMENTS"] = "1"
+    os.environ["NO_PROXY"] = "127.0.0.1"
+    os.environ.pop("JAVA_HOME", None)
+    os.environ.pop("ANDROID_SDK_ROOT", None)
+
+    results = []
+    try:
+        for name, max_workers in [("sequential", 1), ("concurrent", None)]:
+            times = [verify_tools(mirror_url, max_workers) for _ in range(args.repeat)]
+            results.append((name, min(times), sorted(times)[len(times) // 2]))
+    finally:
+        server.shutdown()
+
+    print()
+    print(
+        f"JDK {args.jdk_size} MB, SDK {args.sdk_size} MB, "
+        f"{args.rate} MB/s per connection; {os.cpu_count()} CPUs"
+    )
+    print(f"{'tasks':>10} {'best (s)':>9} {'median (s)':>11} {'speedup':>8}")
+    baseline = results[0][2]
+    for name, best, median in results:
+        print(f"{name:>10} {best:>9.2f} {median:>11.2f} {baseline / median:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
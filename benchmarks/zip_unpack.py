@@ -0,0 +1,115 @@
+"""Benchmark unpacking a large zip archive with ``unpack_zip()``.
+
+A zip archive with many members is generated, and then unpacked with
+``shutil.unpack_archive()`` (the unpacker that Briefcase used previously),
+and with ``unpack_zip()``, using a range of worker counts.
+
+Usage::
+
+    python benchmarks/zip_unpack.py --members 5000 --size 64 --workers 1 2 4 8
+
+Decompression can only be performed concurrently on a machine with more than
+one CPU; the number of CPUs available is reported with the results.
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from briefcase.archive import unpack_zip
+
+
+def make_archive(path, members, size):
+    """Generate a zip archive.
+
+    The members have a spread of sizes, like the content of a support
+    package; about half of their content is compressible text, and the rest
+    is random bytes.
+
+    :param path: The path of the archive to create.
+    :param members: The number of members in the archive.
+    :param size: The approximate total (uncompressed) size of the members, in
+        bytes.
+    """
+    rng = random.Random(42)
+    weights = [rng.paretovariate(1.5) for _ in range(members)]
+    scale = size / sum(weights)
+    text = b"def function(argument):\n    return argument * 2\n\n"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, weight in enumerate(weights):
+            length = max(1, int(weight * scale))
+            content = (text * (length // (2 * len(text)) + 1))[: length // 2]
+            content += os.urandom(length - len(content))
+            archive.writestr(f"package{index % 50}/module{index}.py", content)
+
+
+def unpack(archive, function):
+    """Unpack an archive into a fresh, temporary folder.
+
+    :param archive: The archive to unpack.
+    :param function: A function that unpacks an archive into a folder.
+    :returns: The time taken, in seconds.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        function(archive, tmp)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--members", type=int, default=5000, help="Number of members in the archive"
+    )
+    parser.add_argument(
+        "--size", type=int, default=64, help="Uncompressed size of the archive, in MB"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Worker counts to benchmark",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Unpacks per configuration"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "archive.zip"
+        make_archive(archive, args.members, args.size * 1024 * 1024)
+
+        candidates = [("shutil", lambda a, d: shutil.unpack_archive(a, d, "zip"))]
+        for workers in args.workers:
+            candidates.append(
+                (
+                    f"{workers} workers",
+                    lambda a, d, workers=workers: unpack_zip(a, d, max_workers=workers),
+                )
+            )
+
+        results = []
+        for name, function in candidates:
+            times = [unpack(archive, function) for _ in range(args.repeat)]
+            results.append((name, min(times), sorted(times)[len(times) // 2]))
+
+        compressed = archive.stat().st_size / (1024 * 1024)
+
+    print()
+    print(
+        f"{args.members} members, {args.size} MB ({compressed:.1f} MB compressed); "
+        f"{os.cpu_count()} CPUs"
+    )
+    print(f"{'unpacker':>10} {'best (s)':>9} {'median (s)':>11} {'speedup':>8}")
+    baseline = results[0][2]
+    for name, best, median in results:
+        print(f"{name:>10} {best:>9.2f} {median:>11.2f} {baseline / median:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import importlib.util
+import os
+import py_compile
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# The flags in the header of a checked hash-based .pyc file (PEP 552).
+CHECKED_HASH_FLAGS = 0b11
+
+
+def bytecode_path(source, optimize=0, sourceless=False):
+    """The path of the compiled bytecode for a Python source file.
+
+    :param source: The Python source file.
+    :param optimize: The optimization level of the bytecode (0, 1 or 2).
+    :param sourceless: If True, the path of a bytecode file that can be
+        imported without its source file (i.e., ``module.pyc``, next to
+        ``module.py``); otherwise, the path in ``__pycache__`` that is used
+        when the source file exists.
+    :returns: The path of the bytecode file.
+    """
+    source = Path(source)
+    if sourceless:
+        return source.with_suffix(".pyc")
+    return Path(importlib.util.cache_from_source(source, optimization=optimize or ""))
+
+
+def is_current(source, cfile):
+    """Determine if a bytecode file is a checked hash-based .pyc that was
+    compiled from the current content of a source file.
+
+    :param source: The Python source file.
+    :param cfile: The bytecode file.
+    :returns: True if the bytecode file doesn't need to be recompiled.
+    """
+    try:
+        with open(cfile, "rb") as f:
+            header = f.read(16)
+        content = Path(source).read_bytes()
+    except OSError:
+        return False
+    return (
+        header[:4] == importlib.util.MAGIC_NUMBER
+        and int.from_bytes(header[4:8], "little") == CHECKED_HASH_FLAGS
+        and header[8:16] == importlib.util.source_hash(content)
+    )
+
+
+def _compile_file(job):
+    """Compile a single source file.
+
+    This is invoked in a worker process, so it must be a module-level
+    function, and its argument and result must be picklable.
+
+    :param job: A ``(source, cfile, dfile, optimize, sourceless)`` tuple.
+    :returns: ``"compiled"`` if the file was compiled; ``"current"`` if the
+        existing bytecode was already up to date; or ``"failed"`` if the file
+        couldn't be compiled (e.g., because it contains a syntax error).
+    """
+    source, cfile, dfile, optimize, sourceless = job
+    # The name of a sourceless bytecode file doesn't describe its
+    # optimization level, so it is always recompiled.
+    if not sourceless and is_current(source, cfile):
+        status = "current"
+    else:
+        try:
+            py_compile.compile(
+                source,
+                cfile=cfile,
+                dfile=dfile,
+                doraise=True,
+                optimize=optimize,
+                invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+            )
+            status = "compiled"
+        except (py_compile.PyCompileError, OSError):
+            return "failed"
+
+    if sourceless:
+        # The source (and any bytecode that would only be used alongside
+        # the source) is no longer needed.
+        source = Path(source)
+        for cached in (source.parent / "__pycache__").glob(f"{source.stem}.*.pyc"):
+            cached.unlink()
+        source.unlink()
+    return status
+
+
+def compile_bytecode(paths, optimize=0, sourceless=False, max_workers=None):
+    """Compile every Python source file in a collection of folders.
+
+    Files are compiled to checked hash-based .pyc files (PEP 552). Unlike
+    timestamp-based .pyc files, they remain valid if the modification times
+    of the source files are changed when the app is packaged or installed,
+    and their content doesn't depend on when they were compiled. A file
+    whose bytecode is already up to date isn't recompiled.
+
+    The bytecode is produced by the running interpreter, so it can only be
+    used by an interpreter with the same ``major.minor`` version.
+
+    :param paths: The folders containing Python source files.
+    :param optimize: The optimization level of the bytecode (0, 1 or 2).
+        Unless the bytecode is sourceless, optimized bytecode is only used by
+        an interpreter running with the same optimization level.
+    :param sourceless: If True, source files are replaced by bytecode that
+        can be imported without the source. Files that can't be compiled
+        are retained.
+    :param max_workers: (Optional) The maximum number of processes that will
+        compile files at the same time. Defaults to the number of CPUs.
+    :returns: A ``(compiled, failed)`` tuple, describing the number of files
+        that were compiled (or were already up to date), and the number of
+        files that couldn't be compiled.
+    """
+    jobs = []
+    for path in paths:
+        path = Path(path)
+        for source in sorted(path.rglob("*.py")):
+            if not source.is_file() or source.is_symlink():
+                continue
+            jobs.append(
+                (
+                    os.fspath(source),
+                    os.fspath(bytecode_path(source, optimize, sourceless)),
+                    # The filename recorded in the bytecode is relative to
+                    # the folder, so it doesn't depend on where the bundle
+                    # was built.
+                    source.relative_to(path).as_posix(),
+                    optimize,
+                    sourceless,
+                )
+            )
+
+    workers = max_workers or os.cpu_count() or 1
+    if sys.platform == "win32":  # pragma: no cover
+        # A process pool on Windows can't have more than 61 workers.
+        workers = min(workers, 61)
+    if workers == 1 or len(jobs) < 2:
+        results = [_compile_file(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _compile_file,
+                    jobs,
+                    chunksize=max(1, len(jobs) // (workers * 4)),
+                )
+            )
+
+    failed = results.count("failed")
+    return len(results) - failed, failed
@@ -0,0 +1,1225 @@
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from briefcase import __version__
+from briefcase.archive import unpack_archive as unpack_archive_members
+from briefcase.clone import clone_tree
+from briefcase.exceptions import BriefcaseCommandError
+from briefcase.locks import FileLock
+
+# Multipliers for the units that can be used to describe a cache size.
+SIZE_UNITS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "M": 1024**2,
+    "MB": 1024**2,
+    "G": 1024**3,
+    "GB": 1024**3,
+    "T": 1024**4,
+    "TB": 1024**4,
+}
+
+# The default number of seconds for which the result of a successful tool
+# verification check can be reused.
+DEFAULT_VERIFICATION_TTL = 24 * 60 * 60
+
+
+def parse_size(value):
+    """Parse a human-readable description of a size into a number of bytes.
+
+    :param value: A size, such as ``"500M"`` or ``"10GB"``. A value without
+        a unit is interpreted as a number of bytes. Units are binary
+        (i.e., 1K is 1024 bytes).
+    :returns: The size in bytes.
+    :raises ValueError: If the value isn't a valid size.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([A-Za-z]*)\s*", str(value))
+    if match is None or match.group(2).upper() not in SIZE_UNITS:
+        raise ValueError(f"{value!r} is not a valid size")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size):
+    """Describe a number of bytes in a human-readable form.
+
+    :param size: The number of bytes.
+    :returns: A string describing the size, such as ``"1.5 GB"``.
+    """
+    for unit in ["bytes", "KB", "MB", "GB"]:
+        if size < 1024:
+            break
+        size /= 1024
+    else:
+        unit = "TB"
+    if unit == "bytes":
+        return f"{size} bytes"
+    return f"{size:.1f} {unit}"
+
+
+def file_sha256(path):
+    """Compute the SHA256 digest of a file's content.
+
+    :param path: The file to hash.
+    :returns: The hex digest of the file's content.
+    """
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for data in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def _synchronized(method):
+    """Serialize calls to a method of a ``DownloadCache``.
+
+    The index is updated by reading, modifying and rewriting it; if
+    downloads are performed concurrently (by multiple threads, or by multiple
+    processes sharing the cache), updates must be serialized so that they
+    aren't lost.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class DownloadCache:
+    """A content-addressed store of downloaded files.
+
+    Downloaded content is stored as a blob named by the SHA256 digest of the
+    content; an index records the digest of the content that was served by
+    each URL. Files in download folders are hard links to (or, if linking
+    isn't possible, copies of) the blobs. This means:
+
+    * cached files can be verified against the digest that was recorded
+      when they were downloaded;
+    * if two URLs serve identical content, only one copy is stored; and
+    * if a file in a download folder is deleted, it can be restored from
+      the store without a download.
+
+    The index also records when the content of each URL was last used, and
+    where the content has been placed, so that the least recently used
+    content can be removed when the cache needs to be reduced in size.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = FileLock.for_path(self.path / "index.lock")
+
+    @property
+    def blobs_path(self):
+        return self.path / "blobs"
+
+    @property
+    def index_path(self):
+        return self.path / "index.json"
+
+    def blob_path(self, digest):
+        """The path where content with a given digest is stored.
+
+        :param digest: The SHA256 hex digest of the content.
+        """
+        return self.blobs_path / digest[:2] / digest
+
+    def load_index(self):
+        """Load the URL index for the cache.
+
+        A missing or unreadable index is treated as empty.
+
+        :returns: A dictionary of URL->record, where each record is a
+            dictionary describing the content served by the URL.
+        """
+        try:
+            with self.index_path.open(encoding="utf-8") as f:
+                return json.load(f)["urls"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def save_index(self, index):
+        """Persist the URL index for the cache.
+
+        The index is written to a temporary file, then moved into place, so
+        that a reader never sees a partially written index.
+
+        :param index: The dictionary of URL->record to save.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump({"urls": index}, f, indent=2, sort_keys=True)
+        temp_path.replace(self.index_path)
+
+    def record(self, url):
+        """The details recorded when a URL was last downloaded.
+
+        :param url: The URL to look up.
+        :returns: A dictionary describing the downloaded content (including
+            the ``digest`` and ``filename`` of the content), or ``None`` if
+            the URL hasn't been downloaded.
+        """
+        return self.load_index().get(url)
+
+    def conditional_headers(self, url):
+        """The HTTP headers required to revalidate the cached content of a
+        URL.
+
+        :param url: The URL to revalidate.
+        :returns: A dictionary of request headers. The dictionary will be
+            empty if the server didn't provide any cache validators when the
+            URL was downloaded.
+        """
+        record = self.record(url) or {}
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def digest(self, url):
+        """The digest of the content that was last downloaded from a URL.
+
+        :param url: The URL to look up.
+        :returns: The SHA256 hex digest of the content, or ``None`` if the URL
+            hasn't been downloaded.
+        """
+        return (self.record(url) or {}).get("digest")
+
+    def verify(self, url, path):
+        """Verify that a file contains the content downloaded from a URL.
+
+        :param url: The URL from which the file was downloaded.
+        :param path: The file to verify.
+        :returns: True if the file's content matches the recorded digest;
+            False if it doesn't match; ``None`` if there is no record for the
+            URL.
+        """
+        digest = self.digest(url)
+        if digest is None:
+            return None
+        return file_sha256(path) == digest
+
+    @_synchronized
+    def touch(self, url, path=None):
+        """Record that the content of a URL has been used.
+
+        :param url: The URL whose content was used.
+        :param path: (Optional) The location where the content was placed.
+        """
+        index = self.load_index()
+        record = index.get(url)
+        if record is None:
+            return
+
+        record["last_used"] = time.time()
+        if path is not None:
+            record["paths"] = sorted(set(record.get("paths", [])) | {os.fsdecode(path)})
+        self.save_index(index)
+
+    @_synchronized
+    def forget(self, url):
+        """Remove the record of a URL from the index.
+
+        :param url: The URL to forget.
+        """
+        index = self.load_index()
+        if index.pop(url, None) is not None:
+            self.save_index(index)
+
+    @_synchronized
+    def materialize(self, url, target):
+        """Restore the content of a URL from the store into a target location.
+
+        The stored content is verified before it is used; if it has been
+        corrupted, it is removed from the store.
+
+        :param url: The URL whose content should be restored.
+        :param target: The path where the content should be placed.
+        :returns: True if the content was restored; False if the content of
+            the URL isn't available in the store.
+        """
+        digest = self.digest(url)
+        if digest is None:
+            return False
+
+        blob_path = self.blob_path(digest)
+        if not blob_path.exists():
+            self.forget(url)
+            return False
+        if file_sha256(blob_path) != digest:
+            blob_path.unlink()
+            self.forget(url)
+            return False
+
+        self._link(blob_path, target)
+        self.touch(url, target)
+        return True
+
+    @_synchronized
+    def add(self, url, path, target, digest=None, **metadata):
+        """Add newly downloaded content to the store.
+
+        The content is moved into the store, and linked into the target
+        location. If the store already contains identical content (possibly
+        downloaded from a different URL), the existing blob is reused.
+
+        :param url: The URL from which the content was downloaded.
+        :param path: The file containing the downloaded content. This file
+            will be consumed.
+        :param target: The path where the content should be placed.
+        :param digest: (Optional) The SHA256 hex digest of the content, if it
+            has already been computed.
+        :param metadata: Any additional details to record about the URL.
+        :returns: The SHA256 hex digest of the content.
+        """
+        if digest is None:
+            digest = file_sha256(path)
+
+        blob_path = self.blob_path(digest)
+        if blob_path.exists() and file_sha256(blob_path) == digest:
+            # We already have this content; the new copy isn't needed.
+            Path(path).unlink()
+        else:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            Path(path).replace(blob_path)
+
+        index = self.load_index()
+        index[url] = dict(
+            metadata,
+            digest=digest,
+            filename=Path(target).name,
+            paths=[os.fsdecode(target)],
+            last_used=time.time(),
+        )
+        self.save_index(index)
+
+        if Path(target) != blob_path:
+            self._link(blob_path, target)
+        return digest
+
+    def _link(self, blob_path, target):
+        """Place a blob at a target location.
+
+        A hard link is used if possible; if the target is on a different
+        filesystem (or the filesystem doesn't support hard links), the blob
+        is copied.
+
+        :param blob_path: The blob to place.
+        :param target: The location where the blob should be placed.
+        """
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            target.unlink()
+        try:
+            os.link(blob_path, target)
+        except OSError:
+            shutil.copy2(blob_path, target)
+
+    def entries(self):
+        """Describe the content of the cache.
+
+        :returns: A list of dictionaries, one for each URL in the cache,
+            ordered from the least to the most recently used. Each dictionary
+            contains the ``url``, the ``digest`` and ``size`` of the content,
+            the time the content was ``last_used`` (as a timestamp), and the
+            ``paths`` where the content has been placed.
+        """
+        entries = []
+        for url, record in self.load_index().items():
+            blob_path = self.blob_path(record["digest"])
+            try:
+                stat = blob_path.stat()
+                size, modified = stat.st_size, stat.st_mtime
+            except FileNotFoundError:
+                size, modified = 0, 0
+            entries.append(
+                {
+                    "url": url,
+                    "digest": record["digest"],
+                    "size": size,
+                    # Content that was downloaded before usage was being
+                    # recorded was last used when it was downloaded.
+                    "last_used": record.get("last_used", modified),
+                    "paths": [Path(path) for path in record.get("paths", [])],
+                }
+            )
+        return sorted(entries, key=lambda entry: entry["last_used"])
+
+    def blobs(self):
+        """The content stored in the cache.
+
+        :returns: A list of paths to stored blobs.
+        """
+        return [path for path in self.blobs_path.glob("*/*") if path.is_file()]
+
+    def size(self):
+        """The total size of the content stored in the cache.
+
+        :returns: The size, in bytes.
+        """
+        return sum(path.stat().st_size for path in self.blobs())
+
+    @_synchronized
+    def evict(self, url):
+        """Remove the content of a URL from the cache.
+
+        Any files that were placed by the cache (and which haven't been
+        modified since) are removed, along with the stored content, unless
+        the content is also used by another URL.
+
+        :param url: The URL to remove.
+        :returns: The number of bytes of stored content that were removed.
+        """
+        index = self.load_index()
+        record = index.pop(url, None)
+        if record is None:
+            return 0
+
+        digest = record["digest"]
+        blob_path = self.blob_path(digest)
+        for path in record.get("paths", []):
+            self._unlink_placed(Path(path), blob_path, digest)
+        self.save_index(index)
+
+        if any(other["digest"] == digest for other in index.values()):
+            return 0
+        return self._remove_blob(blob_path)
+
+    @_synchronized
+    def remove_orphans(self):
+        """Remove stored content that isn't used by any URL.
+
+        :returns: The number of bytes of stored content that were removed.
+        """
+        digests = {record["digest"] for record in self.load_index().values()}
+        return sum(
+            self._remove_blob(path) for path in self.blobs() if path.name not in digests
+        )
+
+    @_synchronized
+    def prune(self, older_than, keep=None):
+        """Remove content that hasn't been used recently.
+
+        :param older_than: A timestamp. Content that was last used before this
+            time is removed.
+        :param keep: (Optional) A function that accepts an entry (as returned
+            by ``entries()``), and returns True if the entry must be retained.
+        :returns: The list of entries that were removed.
+        """
+        evicted = [
+            entry
+            for entry in self.entries()
+            if entry["last_used"] < older_than and not (keep and keep(entry))
+        ]
+        for entry in evicted:
+            self.evict(entry["url"])
+        self.remove_orphans()
+        return evicted
+
+    @_synchronized
+    def gc(self, max_size, keep=None):
+        """Remove the least recently used content until the cache is no
+        larger than a given size.
+
+        :param max_size: The maximum size of the cache, in bytes.
+        :param keep: (Optional) A function that accepts an entry (as returned
+            by ``entries()``), and returns True if the entry must be retained.
+        :returns: The list of entries that were removed.
+        """
+        self.remove_orphans()
+        size = self.size()
+        evicted = []
+        for entry in self.entries():
+            if size <= max_size:
+                break
+            if keep and keep(entry):
+                continue
+            size -= self.evict(entry["url"])
+            evicted.append(entry)
+        return evicted
+
+    def _unlink_placed(self, path, blob_path, digest):
+        """Remove a file that was placed by the cache.
+
+        The file is only removed if it still contains the cached content. If
+        the folder containing the file is left empty, it is also removed.
+
+        :param path: The file to remove.
+        :param blob_path: The stored blob for the content.
+        :param digest: The SHA256 hex digest of the content.
+        """
+        try:
+            if blob_path.exists() and path.samefile(blob_path):
+                placed = True
+            else:
+                placed = file_sha256(path) == digest
+        except OSError:
+            # The file doesn't exist anymore.
+            return
+
+        if placed:
+            path.unlink()
+            try:
+                path.parent.rmdir()
+            except OSError:
+                # The folder isn't empty.
+                pass
+
+    def _remove_blob(self, blob_path):
+        """Remove a stored blob.
+
+        :param blob_path: The blob to remove.
+        :returns: The number of bytes that were removed.
+        """
+        try:
+            size = blob_path.stat().st_size
+            blob_path.unlink()
+        except FileNotFoundError:
+            return 0
+
+        try:
+            blob_path.parent.rmdir()
+        except OSError:
+            # Other blobs share the folder.
+            pass
+        return size
+
+
+class FolderStore:
+    """A store of folders, each identified by a name.
+
+    Content is added to the store by populating a staging folder, which is
+    moved into place once it is complete; if the folder for an entry exists,
+    it contains the full content of the entry. Content is copied out of the
+    store wherever it is needed, sharing storage with the store where the
+    filesystem allows (see ``briefcase.clone.clone_file()``).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def _lock(self, entry_path):
+        return FileLock.for_path(entry_path.with_name(f"{entry_path.name}.lock"))
+
+    def staging_path(self):
+        """Create a new folder that can be populated, before it is added to
+        the store.
+
+        :returns: The path to the (empty) staging folder.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        staging_path = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.path))
+        # mkdtemp() creates a folder that is only accessible to its owner; the
+        # permissions of the folder are copied when the content is used, so
+        # use the (umask-derived) permissions of the store instead.
+        os.chmod(staging_path, self.path.stat().st_mode & 0o7777)
+        return staging_path
+
+    def discard(self, staging_path):
+        """Remove a staging folder that won't be added to the store.
+
+        :param staging_path: The staging folder to remove.
+        """
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+    def _adopt(self, staging_path, entry_path):
+        with self._lock(entry_path):
+            if entry_path.is_dir():
+                self.discard(staging_path)
+            else:
+                Path(staging_path).rename(entry_path)
+        return entry_path
+
+    def _populate(self, entry_path, populate):
+        with self._lock(entry_path):
+            if not entry_path.is_dir():
+                staging_path = self.staging_path()
+                try:
+                    populate(staging_path)
+                except BaseException:
+                    self.discard(staging_path)
+                    raise
+                self._adopt(staging_path, entry_path)
+        return entry_path
+
+    def _materialize(self, entry_path, target):
+        with self._lock(entry_path):
+            clone_tree(entry_path, target)
+            # Record the time the content was last used.
+            os.utime(entry_path)
+
+    def _size(self, entry_path):
+        return sum(
+            path.lstat().st_size
+            for path in entry_path.rglob("*")
+            if not path.is_dir() or path.is_symlink()
+        )
+
+    def entries(self):
+        """Describe the content of the store.
+
+        :returns: A list of dictionaries, one for each entry, ordered from the
+            least to the most recently used. Each dictionary contains the
+            ``name`` of the entry, the ``size`` of its content, and the time
+            the content was ``last_used`` (as a timestamp).
+        """
+        entries = []
+        if self.path.is_dir():
+            for entry_path in self.path.iterdir():
+                if entry_path.is_dir() and not entry_path.name.startswith("."):
+                    entries.append(
+                        {
+                            "name": entry_path.name,
+                            "size": self._size(entry_path),
+                            "last_used": entry_path.stat().st_mtime,
+                        }
+                    )
+        return sorted(entries, key=lambda entry: entry["last_used"])
+
+    def remove(self, name):
+        """Remove an entry from the store.
+
+        :param name: The name of the entry, as returned by ``entries()``.
+        """
+        entry_path = self.path / name
+        with self._lock(entry_path):
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+
+class UnpackedArchiveStore(FolderStore):
+    """A store of unpacked archives, keyed by the SHA256 digest of the
+    archive.
+
+    Unpacking a large archive (such as a support package) can take a long
+    time; if the same archive is needed in several places, it is unpacked
+    into the store once, and the unpacked content is then copied wherever it
+    is needed.
+
+    If only some members of an archive are needed (see
+    ``briefcase.archive.MemberFilter``), only those members are unpacked; the
+    unpacked content is stored separately for each selection of members.
+    """
+
+    def entry_path(self, digest, members=None):
+        """The folder containing the unpacked content of an archive.
+
+        :param digest: The SHA256 hex digest of the archive.
+        :param members: (Optional) The ``MemberFilter`` that selected the
+            members that were unpacked.
+        """
+        if members is None:
+            return self.path / digest
+        return self.path / f"{digest}-{members.key}"
+
+    def contains(self, digest, members=None):
+        """Determine if an archive has been unpacked into the store.
+
+        :param digest: The SHA256 hex digest of the archive.
+        :param members: (Optional) The ``MemberFilter`` selecting the members
+            that are needed.
+        :returns: True if the unpacked content is available.
+        """
+        return self.entry_path(digest, members=members).is_dir()
+
+    def adopt(self, staging_path, digest, members=None):
+        """Add the content of a staging folder to the store.
+
+        If the archive has already been unpacked into the store (e.g., by
+        another process), the staging folder is discarded.
+
+        :param staging_path: A staging folder containing the complete,
+            unpacked content of the archive.
+        :param digest: The SHA256 hex digest of the archive.
+        :param members: (Optional) The ``MemberFilter`` that selected the
+            members that were unpacked into the staging folder.
+        :returns: The path to the unpacked content in the store.
+        """
+        return self._adopt(staging_path, self.entry_path(digest, members=members))
+
+    def unpack(
+        self,
+        archive,
+        digest=None,
+        members=None,
+        unpack_archive=unpack_archive_members,
+    ):
+        """Ensure that an archive has been unpacked into the store.
+
+        :param archive: The archive file.
+        :param digest: (Optional) The SHA256 hex digest of the archive, if it
+            is already known.
+        :param members: (Optional) A ``MemberFilter`` selecting the members
+            of the archive that are needed. By default, the entire archive is
+            unpacked.
+        :param unpack_archive: The function that will be used to unpack the
+            entire archive, with the same interface as
+            ``shutil.unpack_archive()``. Defaults to
+            ``briefcase.archive.unpack_archive()``. Any error raised while unpacking is
+            propagated.
+        :returns: The path to the unpacked content in the store.
+        """
+        if digest is None:
+            digest = file_sha256(archive)
+
+        def populate(staging_path):
+            if members is None:
+                unpack_archive(archive, extract_dir=staging_path)
+            else:
+                unpack_archive_members(
+                    archive,
+                    extract_dir=staging_path,
+                    members=members,
+                )
+
+        return self._populate(self.entry_path(digest, members=members), populate)
+
+    def materialize(self, digest, target, members=None):
+        """Copy the unpacked content of an archive into a target location.
+
+        :param digest: The SHA256 hex digest of the archive. The archive must
+            have been unpacked into the store.
+        :param target: The folder into which the content should be copied.
+            If the folder already exists, the content is merged into it.
+        :param members: (Optional) The ``MemberFilter`` that selected the
+            members that were unpacked.
+        """
+        self._materialize(self.entry_path(digest, members=members), target)
+
+    def entries(self):
+        """Describe the content of the store.
+
+        :returns: A list of dictionaries, one for each unpacked archive (or
+            selection of members of an archive), ordered from the least to the
+            most recently used. Each dictionary contains the ``name`` of the
+            entry, the ``digest`` of the archive, the ``size`` of the unpacked
+            content, and the time the content was ``last_used`` (as a
+            timestamp).
+        """
+        entries = super().entries()
+        for entry in entries:
+            entry["digest"] = entry["name"].split("-")[0]
+        return entries
+
+    def remove_unused(self, keep_digests):
+        """Remove unpacked archives that are no longer needed.
+
+        :param keep_digests: The digests of the archives whose unpacked
+            content should be retained (e.g., the archives that are still in
+            the download cache).
+        :returns: The list of entries that were removed.
+        """
+        removed = [
+            entry for entry in self.entries() if entry["digest"] not in keep_digests
+        ]
+        for entry in removed:
+            self.remove(entry["name"])
+        return removed
+
+
+class DependencyStore(FolderStore):
+    """A store of installed app dependencies, keyed by a fingerprint of the
+    requirements (or locked packages) that were installed, and the
+    environment in which they were installed.
+
+    Installing dependencies with pip involves resolving, downloading and
+    unpacking every requirement; if the same requirements have been installed
+    before, the installed packages are copied from the store instead, without
+    using the network.
+
+    The same interface is used to store individual distributions, keyed by a
+    fingerprint of the pinned distribution (e.g., ``name==1.0``), so that
+    apps whose requirements differ can share the distributions they have in
+    common.
+    """
+
+    def __init__(self, path, enabled=True):
+        """
+        :param path: The folder containing the store.
+        :param enabled: If False, stored packages aren't reused; every
+            install is performed (and its result stored).
+        """
+        super().__init__(path)
+        self.enabled = enabled
+
+    @staticmethod
+    def fingerprint(requires, **environment):
+        """Compute the key that identifies an installed set of requirements.
+
+        :param requires: The requirements that are installed. The order of
+            the requirements, and any whitespace in them, is ignored.
+        :param environment: Details of the environment in which the
+            requirements are installed (e.g., the Python version, and the
+            target platform).
+        :returns: A SHA256 hex digest.
+        """
+        description = {
+            "requires": sorted(
+                "".join(requirement.split()) for requirement in requires
+            ),
+            "environment": environment,
+        }
+        return hashlib.sha256(
+            json.dumps(description, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def entry_path(self, key):
+        """The folder containing an installed set of requirements.
+
+        :param key: The fingerprint of the requirements.
+        """
+        return self.path / key
+
+    def contains(self, key):
+        """Determine if a set of requirements has been installed into the
+        store.
+
+        :param key: The fingerprint of the requirements.
+        :returns: True if the installed packages are available, and the store
+            is enabled.
+        """
+        return self.enabled and self.entry_path(key).is_dir()
+
+    def install(self, key, install):
+        """Ensure that a set of requirements has been installed into the
+        store.
+
+        :param key: The fingerprint of the requirements.
+        :param install: A function that accepts the path to an (empty)
+            folder, and installs the requirements into that folder. Any error
+            raised while installing is propagated, and nothing is stored.
+        :returns: The path to the installed packages in the store.
+        """
+        entry_path = self.entry_path(key)
+        if not self.enabled:
+            # Replace any stored packages with a fresh install.
+            self.remove(key)
+        return self._populate(entry_path, install)
+
+    def materialize(self, key, target):
+        """Copy an installed set of requirements into a target location.
+
+        :param key: The fingerprint of the requirements. The requirements
+            must have been installed into the store.
+        :param target: The folder into which the packages should be copied.
+            If the folder already exists, the packages are merged into it.
+        """
+        self._materialize(self.entry_path(key), target)
+
+    def size(self, key):
+        """The size of an installed set of requirements.
+
+        :param key: The fingerprint of the requirements. The requirements
+            must have been installed into the store.
+        :returns: The size of the installed packages, in bytes.
+        """
+        return self._size(self.entry_path(key))
+
+    def prune(self, older_than):
+        """Remove installed requirements that haven't been used recently.
+
+        :param older_than: A timestamp. Installed requirements that were last
+            used before this time are removed.
+        :returns: The list of entries that were removed.
+        """
+        removed = [entry for entry in self.entries() if entry["last_used"] < older_than]
+        for entry in removed:
+            self.remove(entry["name"])
+        return removed
+
+
+class PackageIndexCache:
+    """A cache of the project pages and files served by a Python package
+    index.
+
+    The links on the index's page for each project are recorded, so that the
+    page can be served without contacting the index; files are stored the
+    first time they are downloaded, so that each file is only downloaded
+    once. Files are stored by the name of the project and the name of the
+    file; the content of a released file on an index never changes.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @property
+    def pages_path(self):
+        return self.path / "pages"
+
+    @property
+    def files_path(self):
+        return self.path / "files"
+
+    def _replace(self, path, write):
+        """Atomically write a file, so that concurrent readers never see a
+        partial file.
+
+        :param path: The file to write.
+        :param write: A function that accepts a binary file object, and
+            writes the content of the file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def load_page(self, project):
+        """Load the recorded links for a project.
+
+        :param project: The canonical name of the project.
+        :returns: The list of links on the project's page, or ``None`` if the
+            page hasn't been recorded (or can't be read).
+        """
+        try:
+            with (self.pages_path / f"{project}.json").open(encoding="utf-8") as f:
+                return json.load(f)["links"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save_page(self, project, links):
+        """Record the links on a project's page.
+
+        :param project: The canonical name of the project.
+        :param links: The list of links on the project's page; each link is
+            a JSON-serializable dictionary.
+        """
+        content = json.dumps({"links": links}, indent=2, sort_keys=True)
+        self._replace(
+            self.pages_path / f"{project}.json",
+            lambda f: f.write(content.encode("utf-8")),
+        )
+
+    def file_path(self, project, filename):
+        """The path where a file for a project is stored.
+
+        :param project: The canonical name of the project.
+        :param filename: The name of the file.
+        """
+        return self.files_path / project / filename
+
+    def add_file(self, project, filename, chunks, digest=None):
+        """Store a file for a project.
+
+        :param project: The canonical name of the project.
+        :param filename: The name of the file.
+        :param chunks: An iterable of the chunks of bytes that make up the
+            content of the file.
+        :param digest: (Optional) The expected digest of the content, as
+            ``<algorithm>=<hex digest>``. Digests that use an algorithm that
+            isn't available aren't verified.
+        :returns: The path to the stored file.
+        :raises ValueError: If the content doesn't match the digest; the file
+            isn't stored.
+        """
+        algorithm, _, expected = (digest or "").partition("=")
+        if algorithm not in hashlib.algorithms_available:
+            algorithm = expected = None
+        hasher = hashlib.new(algorithm) if algorithm else None
+
+        def write(f):
+            for chunk in chunks:
+                f.write(chunk)
+                if hasher:
+                    hasher.update(chunk)
+            if hasher and hasher.hexdigest() != expected.lower():
+                raise ValueError(f"{filename} doesn't match {algorithm} digest")
+
+        path = self.file_path(project, filename)
+        self._replace(path, write)
+        return path
+
+    def touch(self, path):
+        """Record that a stored file has been used.
+
+        :param path: The path to the stored file.
+        """
+        os.utime(path)
+
+    def entries(self):
+        """Describe the stored files.
+
+        :returns: A list of dictionaries, one for each file, ordered from the
+            least to the most recently used. Each dictionary contains the
+            ``name`` of the file (as ``<project>/<filename>``), its ``size``,
+            and the time it was ``last_used`` (as a timestamp).
+        """
+        entries = []
+        if self.files_path.is_dir():
+            for path in self.files_path.glob("*/*"):
+                if path.is_file() and not path.name.startswith("."):
+                    stat = path.stat()
+                    entries.append(
+                        {
+                            "name": f"{path.parent.name}/{path.name}",
+                            "size": stat.st_size,
+                            "last_used": stat.st_mtime,
+                        }
+                    )
+        return sorted(entries, key=lambda entry: entry["last_used"])
+
+    def prune(self, older_than):
+        """Remove stored files that haven't been used recently.
+
+        Recorded pages are retained, as they are small, and describe files
+        that can be downloaded again.
+
+        :param older_than: A timestamp. Files that were last used before this
+            time are removed.
+        :returns: The list of entries that were removed.
+        """
+        removed = [entry for entry in self.entries() if entry["last_used"] < older_than]
+        for entry in removed:
+            try:
+                (self.files_path / entry["name"]).unlink()
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+class Wheelhouse:
+    """A folder of wheels, downloaded for the platforms targeted by apps.
+
+    The wheelhouse is shared by every app and every platform; pip can use it
+    as a source of packages (with ``--find-links``) and will only select the
+    wheels that are compatible with the platform it is installing for. Wheels
+    are downloaded into a staging folder, and then moved into the wheelhouse,
+    so that concurrent readers never see a partial wheel.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def staging_path(self):
+        """Create a staging folder for downloads.
+
+        :returns: The path to an empty folder, on the same filesystem as the
+            wheelhouse.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix=".staging-", dir=self.path))
+
+    def discard(self, staging_path):
+        """Remove a staging folder, without adding its content.
+
+        :param staging_path: The staging folder.
+        """
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+    def add(self, staging_path):
+        """Move the wheels in a staging folder into the wheelhouse, and remove
+        the staging folder.
+
+        Wheels that are already in the wheelhouse are replaced; the content
+        of a released wheel never changes, so this only records that the
+        wheel has been used.
+
+        :param staging_path: The staging folder.
+        :returns: The list of paths to the added wheels.
+        """
+        paths = []
+        try:
+            for wheel in sorted(staging_path.glob("*.whl")):
+                path = self.path / wheel.name
+                os.replace(wheel, path)
+                os.utime(path)
+                paths.append(path)
+        finally:
+            self.discard(staging_path)
+        return paths
+
+    def entries(self):
+        """Describe the wheels in the wheelhouse.
+
+        :returns: A list of dictionaries, one for each wheel, ordered from
+            the least to the most recently used. Each dictionary contains the
+            ``name`` of the wheel, its ``size``, and the time it was
+            ``last_used`` (as a timestamp).
+        """
+        entries = []
+        if self.path.is_dir():
+            for path in self.path.glob("*.whl"):
+                if path.is_file():
+                    stat = path.stat()
+                    entries.append(
+                        {
+                            "name": path.name,
+                            "size": stat.st_size,
+                            "last_used": stat.st_mtime,
+                        }
+                    )
+        return sorted(entries, key=lambda entry: entry["last_used"])
+
+    def prune(self, older_than):
+        """Remove wheels that haven't been used recently.
+
+        :param older_than: A timestamp. Wheels that were last used before this
+            time are removed.
+        :returns: The list of entries that were removed.
+        """
+        removed = [entry for entry in self.entries() if entry["last_used"] < older_than]
+        for entry in removed:
+            try:
+                (self.path / entry["name"]).unlink()
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+class VerificationCache:
+    """A persistent record of the results of successful tool verification
+    checks.
+
+    Verifying a tool can involve running the tool (e.g., to determine its
+    version), which can be slow. The result of a successful check is
+    recorded, along with a fingerprint of the files that could affect the
+    result; the recorded result is reused until the fingerprint changes, or
+    the result is older than the cache's time-to-live.
+
+    Checks that fail aren't recorded, so they are always re-run.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_VERIFICATION_TTL, enabled=True):
+        """
+        :param path: The file in which results are recorded.
+        :param ttl: The number of seconds for which a result can be reused.
+        :param enabled: If False, recorded results aren't used; every check
+            is run (and its result recorded).
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.enabled = enabled
+        self._lock = FileLock.for_path(self.path.with_name(f"{self.path.name}.lock"))
+
+    def load(self):
+        """Load the recorded results.
+
+        A missing or unreadable file is treated as empty.
+
+        :returns: A dictionary of key->record.
+        """
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                return json.load(f)["checks"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def fingerprint(self, paths, extra=()):
+        """Compute a fingerprint of the files that affect a check.
+
+        :param paths: The files (or folders) that affect the check. A name
+            that doesn't contain a path separator (e.g., ``"docker"``) is
+            treated as an executable, and is found on the ``PATH``. Paths that
+            don't exist are included in the fingerprint as missing.
+        :param extra: Any other values that affect the check (e.g., the value
+            of an environment variable).
+        :returns: A list that describes the current state of the files and
+            values.
+        """
+        fingerprint = []
+        for path in paths:
+            path = os.fsdecode(path)
+            if os.sep not in path and "/" not in path:
+                path = shutil.which(path) or path
+            try:
+                stat = os.stat(path)
+                fingerprint.append(
+                    [path, os.path.realpath(path), stat.st_mtime_ns, stat.st_size]
+                )
+            except OSError:
+                fingerprint.append([path, None])
+        fingerprint.extend(str(value) for value in extra)
+        return fingerprint
+
+    def check(self, key, check, paths=(), extra=()):
+        """Run a verification check, unless it has been run successfully
+        before.
+
+        :param key: A unique name for the check.
+        :param check: A function that performs the check, and returns a
+            JSON-serializable result. If the check fails, it should raise an
+            exception.
+        :param paths: The files that can affect the result of the check; see
+            ``fingerprint()``.
+        :param extra: Any other values that can affect the result of the
+            check; see ``fingerprint()``.
+        :returns: The result of the check.
+        """
+        fingerprint = self.fingerprint(paths, extra=extra)
+        if self.enabled:
+            record = self.load().get(key)
+            if (
+                record is not None
+                and record.get("version") == __version__
+                and record.get("fingerprint") == fingerprint
+                and time.time() - record.get("checked", 0) < self.ttl
+            ):
+                return record["result"]
+
+        result = check()
+
+        with self._lock:
+            records = self.load()
+            records[key] = {
+                "version": __version__,
+                "fingerprint": fingerprint,
+                "checked": time.time(),
+                "result": result,
+            }
+            content = json.dumps({"checks": records}, indent=2, sort_keys=True)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}")
+            temp_path.write_text(content, encoding="utf-8")
+            temp_path.replace(self.path)
+        return result
+
+    def clear(self):
+        """Remove all recorded results."""
+        with self._lock:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def verification_cache_from_environ(environ, data_path):
+    """Construct the verification cache for a data path, using any settings
+    defined in the environment.
+
+    * ``BRIEFCASE_VERIFICATION_TTL`` sets the number of seconds for which the
+      result of a tool verification check can be reused. A value of 0 disables
+      the reuse of results.
+
+    :param environ: The environment to inspect.
+    :param data_path: The Briefcase data path.
+    :returns: A configured ``VerificationCache``.
+    """
+    kwargs = {}
+    if environ.get("BRIEFCASE_VERIFICATION_TTL"):
+        try:
+            kwargs["ttl"] = float(environ["BRIEFCASE_VERIFICATION_TTL"])
+            if kwargs["ttl"] < 0:
+                raise ValueError("TTL must be positive")
+        except ValueError as e:
+            raise BriefcaseCommandError(
+                "The value of BRIEFCASE_VERIFICATION_TTL must be a positive "
+                "number of seconds."
+            ) from e
+
+    return VerificationCache(Path(data_path) / "verification.json", **kwargs)
@@ -0,0 +1,11 @@
+from .build import BuildCommand  # noqa
+from .cache import CacheCommand  # noqa
+from .create import CreateCommand  # noqa
+from .dev import DevCommand  # noqa
+from .fetch import FetchCommand  # noqa
+from .new import NewCommand  # noqa
+from .package import PackageCommand  # noqa
+from .publish import PublishCommand  # noqa
+from .run import RunCommand  # noqa
+from .update import UpdateCommand  # noqa
+from .upgrade import UpgradeCommand  # noqa
@@ -0,0 +1,1897 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from cgi import parse_header
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from cookiecutter.main import cookiecutter
+from cookiecutter.repository import is_repo_url
+from platformdirs import PlatformDirs
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    import tomli as tomllib
+
+from briefcase import __version__, integrations
+from briefcase.archive import (
+    StreamingTarExtractor,
+    is_tar_archive,
+    move_contents,
+    unpack_archive,
+)
+from briefcase.cache import (
+    DependencyStore,
+    DownloadCache,
+    PackageIndexCache,
+    UnpackedArchiveStore,
+    Wheelhouse,
+    file_sha256,
+    format_size,
+    parse_size,
+    verification_cache_from_environ,
+)
+from briefcase.config import AppConfig, BaseConfig, GlobalConfig, parse_config
+from briefcase.console import Console, InputDisabled, Log
+from briefcase.exceptions import (
+    BadNetworkResourceError,
+    BriefcaseCommandError,
+    BriefcaseConfigError,
+    BriefcaseError,
+    CorruptNetworkResourceError,
+    InfoHelpText,
+    MissingNetworkResourceError,
+    NetworkFailure,
+    OfflineModeError,
+)
+from briefcase.index_proxy import DEFAULT_INDEX_URL, IndexProxy
+from briefcase.integrations.subprocess import Subprocess
+from briefcase.lockfile import (
+    HASH_ALGORITHMS,
+    LOCK_FILENAME,
+    LockFile,
+    is_index_requirement,
+)
+from briefcase.locks import FileLock
+from briefcase.mirrors import mirrors_from_environ
+from briefcase.network import (
+    DEFAULT_BACKOFF_FACTOR,
+    NETWORK_ERRORS,
+    session_from_environ,
+)
+
+# The smallest chunk of content that is worth downloading as a separate
+# segment when performing a segmented download.
+MIN_DOWNLOAD_SEGMENT_SIZE = 4 * 1024 * 1024
+
+
+class TemplateUnsupportedVersion(BriefcaseCommandError):
+    def __init__(self, python_version_tag):
+        self.python_version_tag = python_version_tag
+        super().__init__(
+            f"""\
+Could not find template for Python {self.python_version_tag}.
+
+This is likely because Python {self.python_version_tag} is not yet supported. You will need to:
+  * Use an older version of Python; or
+  * Define your own custom template.
+"""
+        )
+
+
+class UnsupportedPlatform(BriefcaseCommandError):
+    def __init__(self, platform):
+        self.platform = platform
+        super().__init__(
+            f"""\
+App cannot be deployed on {platform}. This is probably because one or more
+dependencies (e.g., the GUI library) doesn't support {platform}.
+"""
+        )
+
+
+def create_config(klass, config, msg):
+    try:
+        return klass(**config)
+    except TypeError as e:
+        # Inspect the GlobalConfig constructor to find which
+        # parameters are required and don't have a default value.
+        required_args = {
+            name
+            for name, param in inspect.signature(klass.__init__).parameters.items()
+            if param.default == inspect._empty and name not in {"self", "kwargs"}
+        }
+        missing_args = required_args - config.keys()
+        missing = ", ".join(f"'{arg}'" for arg in sorted(missing_args))
+        raise BriefcaseConfigError(f"{msg} is incomplete (missing {missing})") from e
+
+
+def cookiecutter_cache_path(template):
+    """Determine the cookiecutter template cache directory given a template
+    URL.
+
+    This will return a valid path, regardless of whether `template`
+
+    :param template: The template to use. This can be a filesystem path or
+        a URL.
+    :returns: The path that cookiecutter would use for the given template name.
+    """
+    template = template.rstrip("/")
+    tail = template.split("/")[-1]
+    cache_name = tail.rsplit(".git")[0]
+    return Path.home() / ".cookiecutters" / cache_name
+
+
+def _is_encoded(response):
+    """Determine if the content of a response has a content encoding applied.
+
+    :param response: The response to inspect.
+    :returns: True if the response body is encoded (e.g., gzipped).
+    """
+    return response.headers.get("Content-Encoding", "identity") != "identity"
+
+
+def _range_validator(response):
+    """Determine the validator that identifies the content of a response.
+
+    Partial content can only be safely combined with a byte range of the
+    same representation. A strong ETag identifies a representation exactly;
+    if one isn't available, the Last-Modified date is used.
+
+    :param response: The response to inspect.
+    :returns: The validator, or ``None`` if the response doesn't provide one.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _validator_path(partial_filename):
+    """The file that records the validator of a partial download.
+
+    :param partial_filename: The path of the partial download.
+    """
+    return partial_filename.with_name(f"{partial_filename.name}.validator")
+
+
+def _record_validator(response, partial_filename):
+    """Record the validator of the content that is being written into a
+    partial download, so that the download can be safely resumed.
+
+    :param response: The response whose content is being downloaded.
+    :param partial_filename: The path of the partial download.
+    """
+    validator = _range_validator(response)
+    validator_path = _validator_path(partial_filename)
+    if validator:
+        validator_path.write_text(validator, encoding="utf-8")
+    elif validator_path.exists():
+        validator_path.unlink()
+
+
+def _discard_partial(partial_filename):
+    """Remove a partial download, and the record of its validator.
+
+    :param partial_filename: The path of the partial download.
+    """
+    for path in [partial_filename, _validator_path(partial_filename)]:
+        if path.exists():
+            path.unlink()
+
+
+def full_options(state, options):
+    """Merge command state with keyword arguments.
+
+    Command state takes precedence over any keyword argument.
+
+    :param state: The current command state. Can be ``None``.
+    :param options: The base options.
+    :returns: A dictionary containing all of ``options``, with any values
+        provided in ``state`` overriding the base ``options`` values.
+    """
+    if state is not None:
+        full = options.copy()
+        full.update(state)
+    else:
+        full = options
+
+    return full
+
+
+class BaseCommand(ABC):
+    cmd_line = "briefcase {command} {platform} {output_format}"
+    GLOBAL_CONFIG_CLASS = GlobalConfig
+    APP_CONFIG_CLASS = AppConfig
+
+    def __init__(
+        self,
+        base_path,
+        home_path=None,
+        data_path=None,
+        apps=None,
+        input_enabled=True,
+    ):
+        # Distinguish the top-level command from triggered commands, e.g. `run`
+        # may trigger `update` and `build`.
+        self.is_clone = False
+
+        # Some details about the host machine
+        self.host_arch = platform.machine()
+        self.host_os = platform.system()
+
+        self.base_path = Path(base_path)
+
+        # If a home path is provided during construction, use it. This usually
+        # indicates we're under test conditions.
+        if home_path is None:
+            home_path = Path.home()
+        self.home_path = Path(home_path)
+
+        # If a data path is provided during construction, use it. This usually
+        # indicates we're under test conditions. If there's no data path
+        # provided, look for a BRIEFCASE_HOME environment variable. If that
+        # isn't defined, use a platform-specific default data path.
+        if data_path is None:
+            try:
+                briefcase_home = os.environ["BRIEFCASE_HOME"]
+                data_path = Path(briefcase_home).resolve()
+                # Path("") converts to ".", so check for that edge case.
+                if briefcase_home == "" or not data_path.exists():
+                    raise BriefcaseCommandError(
+                        "The path specified by BRIEFCASE_HOME does not exist."
+                    )
+            except KeyError:
+                if self.host_os == "Darwin":
+                    # macOS uses a bundle name, rather than just the app name
+                    app_name = "org.beeware.briefcase"
+                else:
+                    app_name = "briefcase"
+
+                data_path = PlatformDirs(
+                    appname=app_name,
+                    appauthor="BeeWare",
+                ).user_cache_path
+
+        if " " in os.fsdecode(data_path):
+            raise BriefcaseCommandError(
+                f"""
+The location Briefcase will use to store tools and support files:
+
+    {data_path}
+
+contains spaces. This will cause problems with some tools, preventing
+you from building and packaging applications.
+
+You can set the environment variable BRIEFCASE_HOME to specify
+a custom location for Briefcase's tools.
+
+"""
+            )
+
+        self.data_path = Path(data_path)
+
+        self.tools_path = self.data_path / "tools"
+        self.download_cache = DownloadCache(self.data_path / "cache")
+        self.unpacked_archives = UnpackedArchiveStore(
+            self.data_path / "cache" / "unpacked"
+        )
+        self.dependency_store = DependencyStore(
+            self.data_path / "cache" / "dependencies"
+        )
+        self.distribution_store = DependencyStore(
+            self.data_path / "cache" / "distributions"
+        )
+        self.package_index_cache = PackageIndexCache(
+            self.data_path / "cache" / "packages"
+        )
+        self.wheelhouse = Wheelhouse(self.data_path / "cache" / "wheelhouse")
+        self.mirrors = mirrors_from_environ(os.environ, self.data_path)
+        self.verification_cache = verification_cache_from_environ(
+            os.environ, self.data_path
+        )
+
+        self.global_config = None
+        self.apps = {} if apps is None else apps
+        self._path_index = {}
+
+        # External service APIs.
+        # These are abstracted to enable testing without patching.
+        self.cookiecutter = cookiecutter
+        self.requests = session_from_environ(os.environ)
+        self.input = Console(enabled=input_enabled)
+        self.os = os
+        self.sys = sys
+        self.stdlib_platform = platform
+        self.sleep = time.sleep
+        self.shutil = shutil
+        self.subprocess = Subprocess(self)
+
+        # The internal Briefcase integrations API.
+        self.integrations = integrations
+
+        # Initialize default logger (replaced when options are parsed).
+        self.logger = Log()
+        self.save_log = False
+        self.offline = False
+
+        # The URL of the package index proxy, while it is running.
+        self.index_url = None
+        # The options that point pip at the wheelhouse, while wheels that
+        # have been prefetched for the app are available.
+        self.wheelhouse_options = None
+
+    def check_obsolete_data_dir(self):
+        """Inform user if obsolete data directory exists.
+
+        TODO: Remove this check after 1 JAN 2023 since most users will have transitioned by then
+
+        Previous versions used the ~/.briefcase directory to store
+        downloads, tools, etc. This check lets users know the old
+        directory still exists and their options to migrate or clean up.
+        """
+        dot_briefcase_path = self.home_path / ".briefcase"
+
+        # If there's no .briefcase path, no need to check for migration.
+        if not dot_briefcase_path.exists():
+            return
+
+        # If the data path is user-provided, don't check for migration.
+        if "BRIEFCASE_HOME" in os.environ:
+            return
+
+        if self.data_path.exists():
+            self.logger.warning(
+                f"""\
+Briefcase is no longer using the data directory:
+
+    {dot_briefcase_path}
+
+This directory can be safely deleted.
+"""
+            )
+        else:
+            self.logger.warning(
+                f"""\
+*************************************************************************
+** NOTICE: Briefcase is changing its data directory                   **
+*************************************************************************
+
+    Briefcase is moving its data directory from:
+
+        {dot_briefcase_path}
+
+    to:
+
+        {self.data_path}
+
+    If you continue, Briefcase will re-download the tools and data it
+    uses to build and package applications.
+
+    To avoid potentially large downloads and long installations, you
+    can manually move the old data directory to the new location.
+
+    If you continue and allow Briefcase to re-download its tools, the
+    old data directory can be safely deleted.
+
+*************************************************************************
+"""
+            )
+            self.input.prompt()
+            if not self.input.boolean_input(
+                "Do you want to re-download the Briefcase support tools",
+                # Default to continuing for non-interactive runs
+                default=not self.input.enabled,
+            ):
+                raise InfoHelpText(
+                    f"""\
+Move the Briefcase data directory from:
+
+    {dot_briefcase_path}
+
+to:
+
+    {self.data_path}
+
+or delete the old data directory, and re-run Briefcase.
+
+"""
+                )
+
+            # Create data directory to prevent full notice showing again.
+            self.data_path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def create_command(self):
+        """Factory property; return an instance of a create command for the
+        same format."""
+        format_module = importlib.import_module(self.__module__)
+        command = format_module.create(
+            base_path=self.base_path,
+            apps=self.apps,
+            input_enabled=self.input.enabled,
+        )
+        command.clone_options(self)
+        return command
+
+    @property
+    def update_command(self):
+        """Factory property; return an instance of an update command for the
+        same format."""
+        format_module = importlib.import_module(self.__module__)
+        command = format_module.update(
+            base_path=self.base_path,
+            apps=self.apps,
+            input_enabled=self.input.enabled,
+        )
+        command.clone_options(self)
+        return command
+
+    @property
+    def build_command(self):
+        """Factory property; return an instance of a build command for the same
+        format."""
+        format_module = importlib.import_module(self.__module__)
+        command = format_module.build(
+            base_path=self.base_path,
+            apps=self.apps,
+            input_enabled=self.input.enabled,
+        )
+        command.clone_options(self)
+        return command
+
+    @property
+    def run_command(self):
+        """Factory property; return an instance of a run command for the same
+        format."""
+        format_module = importlib.import_module(self.__module__)
+        command = format_module.run(
+            base_path=self.base_path,
+            apps=self.apps,
+            input_enabled=self.input.enabled,
+        )
+        command.clone_options(self)
+        return command
+
+    @property
+    def package_command(self):
+        """Factory property; return an instance of a package command for the
+        same format."""
+        format_module = importlib.import_module(self.__module__)
+        command = format_module.package(
+            base_path=self.base_path,
+            apps=self.apps,
+            input_enabled=self.input.enabled,
+        )
+        command.clone_options(self)
+        return command
+
+    @property
+    def publish_command(self):
+        """Factory property; return an instance of a publish command for the
+        same format."""
+        format_module = importlib.import_module(self.__module__)
+        command = format_module.publish(
+            base_path=self.base_path,
+            apps=self.apps,
+            input_enabled=self.input.enabled,
+        )
+        command.clone_options(self)
+        return command
+
+    @property
+    def platform_path(self):
+        """The path for all applications for this command's platform."""
+        return self.base_path / self.platform
+
+    def bundle_path(self, app):
+        """The path to the bundle for the app in the output format.
+
+        The bundle is the template-generated source form of the app.
+        The path will usually be a directory, the existence of which is
+        indicative that the template has been rolled out for an app.
+
+        :param app: The app config
+        """
+        return self.platform_path / self.output_format / app.formal_name
+
+    @abstractmethod
+    def binary_path(self, app):
+        """The path to the executable artefact for the app in the output
+        format.
+
+        This may be a binary file produced by compilation; however, if
+        the output format doesn't require compilation, it may be the same
+        as the bundle path (assuming the bundle path is inherently
+        "executable"), or a path that reasonably represents the thing that can
+        be executed.
+
+        :param app: The app config
+        """
+        ...
+
+    @abstractmethod
+    def distribution_path(self, app, packaging_format):
+        """The path to the distributable artefact for the app in the given
+        packaging format.
+
+        This is the single file that should be uploaded for distribution.
+        This may be the binary (if the binary is a self contained executable);
+        however, if the output format produces an installer, it will be the
+        path to the installer.
+
+        :param app: The app config
+        :param packaging_format: The format of the redistributable artefact.
+        """
+        ...
+
+    def _load_path_index(self, app: BaseConfig):
+        """Load the path index from the index file provided by the app
+        template.
+
+        :param app: The config object for the app
+        :return: The contents of the application path index.
+        """
+        with (self.bundle_path(app) / "briefcase.toml").open("rb") as f:
+            self._path_index[app] = tomllib.load(f)["paths"]
+        return self._path_index[app]
+
+    def support_path(self, app: BaseConfig):
+        """Obtain the path into which the support package should be unpacked.
+
+        :param app: The config object for the app
+        :return: The full path where the support package should be unpacked.
+        """
+        # If the index file hasn't been loaded for this app, load it.
+        try:
+            path_index = self._path_index[app]
+        except KeyError:
+            path_index = self._load_path_index(app)
+        return self.bundle_path(app) / path_index["support_path"]
+
+    def app_requirements_path(self, app: BaseConfig):
+        """Obtain the path into which a requirements.txt file should be
+        written.
+
+        :param app: The config object for the app
+        :return: The full path where the requirements.txt file should be written
+        """
+        # If the index file hasn't been loaded for this app, load it.
+        try:
+            path_index = self._path_index[app]
+        except KeyError:
+            path_index = self._load_path_index(app)
+        return self.bundle_path(app) / path_index["app_requirements_path"]
+
+    def app_packages_path(self, app: BaseConfig):
+        """Obtain the path into which dependencies should be installed.
+
+        :param app: The config object for the app
+        :return: The full path where application dependencies should be installed.
+        """
+        # If the index file hasn't been loaded for this app, load it.
+        try:
+            path_index = self._path_index[app]
+        except KeyError:
+            path_index = self._load_path_index(app)
+        return self.bundle_path(app) / path_index["app_packages_path"]
+
+    def app_path(self, app: BaseConfig):
+        """Obtain the path into which the application should be installed.
+
+        :param app: The config object for the app
+        :return: The full path where application code should be installed.
+        """
+        # If the index file hasn't been loaded for this app, load it.
+        try:
+            path_index = self._path_index[app]
+        except KeyError:
+            path_index = self._load_path_index(app)
+        return self.bundle_path(app) / path_index["app_path"]
+
+    def app_module_path(self, app):
+        """Find the path for the application module for an app.
+
+        :param app: The config object for the app
+        :returns: The Path to the dist-info folder.
+        """
+        app_home = [
+            path.split("/")
+            for path in app.sources
+            if path.rsplit("/", 1)[-1] == app.module_name
+        ]
+        try:
+            if len(app_home) == 1:
+                path = Path(str(self.base_path), *app_home[0])
+            else:
+                raise BriefcaseCommandError(
+                    f"Multiple paths in sources found for application '{app.app_name}'"
+                )
+        except IndexError as e:
+            raise BriefcaseCommandError(
+                f"Unable to find code for application '{app.app_name}'"
+            ) from e
+
+        return path
+
+    @property
+    def python_version_tag(self):
+        """The major.minor of the Python version in use, as a string.
+
+        This is used as a repository label/tag to identify the
+        appropriate templates, etc to use.
+        """
+        return f"{self.sys.version_info.major}.{self.sys.version_info.minor}"
+
+    def verify_tools(self):
+        """Verify that the tools needed to run this command exist.
+
+        Raises MissingToolException if a required system tool is
+        missing.
+        """
+        pass
+
+    def required_tools(self, app: BaseConfig):
+        """The Briefcase-managed tools that the output format requires.
+
+        This is used to determine the tools that can be downloaded before
+        they are needed.
+
+        :param app: The config object for the app
+        :returns: A list of ``(tool class, kwargs)`` pairs. The tool can be
+            downloaded by calling ``tool_class.fetch(command, **kwargs)``.
+        """
+        return []
+
+    def parse_options(self, extra):
+        parser = argparse.ArgumentParser(
+            prog=self.cmd_line.format(
+                command=self.command,
+                platform=self.platform,
+                output_format=self.output_format,
+            ),
+            description=self.description,
+        )
+
+        self.add_default_options(parser)
+        self.add_options(parser)
+
+        # Parse the full set of command line options from the content
+        # remaining after the basic command/platform/output format
+        # has been extracted.
+        options = vars(parser.parse_args(extra))
+
+        # Extract the base default options onto the command
+        self.input.enabled = options.pop("input_enabled")
+        self.logger.verbosity = options.pop("verbosity")
+        self.save_log = options.pop("save_log")
+        self.offline = options.pop("offline")
+        use_cache = options.pop("use_cache")
+        self.verification_cache.enabled = use_cache
+        self.dependency_store.enabled = use_cache
+        self.distribution_store.enabled = use_cache
+
+        return options
+
+    def clone_options(self, command):
+        """Clone options from one command to this one.
+
+        :param command: The command whose options are to be cloned
+        """
+        # Share the console, so that the state of the console (e.g., whether
+        # dynamic output is enabled) applies to every command.
+        self.input = command.input
+        self.logger = command.logger
+        self.offline = command.offline
+        self.verification_cache = command.verification_cache
+        self.dependency_store = command.dependency_store
+        self.distribution_store = command.distribution_store
+        self.package_index_cache = command.package_index_cache
+        self.wheelhouse = command.wheelhouse
+        # Share the HTTP session (and its connection pool).
+        self.requests = command.requests
+        self.is_clone = True
+
+    def app_command(self):
+        """Construct a new instance of this command, with the same options,
+        that can process an app while other apps are processed concurrently.
+
+        :returns: The new command.
+        """
+        command = type(self)(
+            base_path=self.base_path,
+            home_path=self.home_path,
+            data_path=self.data_path,
+            apps=self.apps,
+        )
+        command.clone_options(self)
+        command.global_config = self.global_config
+        return command
+
+    def add_jobs_option(
+        self,
+        parser,
+        default=1,
+        help="The number of apps to process at the same time",
+    ):
+        """Add an option to do several things at the same time.
+
+        The value of the option should be passed to ``resolve_jobs()`` before
+        it is used.
+
+        :param parser: a stub argparse parser for the command.
+        :param default: The default number of jobs.
+        :param help: A description of what the number of jobs controls.
+        """
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=default,
+            help=f"{help}; 0 uses one job per CPU (default: {default}).",
+        )
+
+    def resolve_jobs(self, jobs):
+        """Determine the number of jobs to use for a ``--jobs`` value.
+
+        :param jobs: The value of the ``--jobs`` option; 0 uses one job per
+            CPU.
+        :returns: The number of jobs to use; always at least 1.
+        """
+        if jobs < 0:
+            raise BriefcaseCommandError("--jobs must be at least 0.")
+        return jobs or self.os.cpu_count() or 1
+
+    def call_apps_concurrently(self, jobs, **options):
+        """Invoke the command for every app in the project, processing several
+        apps at the same time.
+
+        Each app is processed by a separate instance of the command (see
+        ``app_command()``), so that state that is specific to one app isn't
+        shared. Output is labelled with the name of the app that produced it.
+        The user can't be asked questions while apps are processed
+        concurrently, so default answers are assumed. Once every app has been
+        processed, a summary is displayed.
+
+        :param jobs: The maximum number of apps to process at once; 0 uses
+            one job per CPU.
+        :param options: The options to pass to the command for each app.
+        """
+        jobs = self.resolve_jobs(jobs)
+
+        def process(app):
+            start = time.monotonic()
+            with self.logger.labelled(app.app_name):
+                try:
+                    self.app_command()(app, **options)
+                except (BriefcaseError, InputDisabled) as e:
+                    self.logger.error(str(e))
+                    return e, time.monotonic() - start
+            return None, time.monotonic() - start
+
+        input_enabled = self.input.enabled
+        is_output_controlled = self.input.is_output_controlled
+        self.input.enabled = False
+        # Output from subprocesses must also be printed by Rich, so that the
+        # output of each app can be labelled.
+        self.input.is_output_controlled = True
+        try:
+            # Progress bars can't be displayed for concurrent apps.
+            with self.input.static_output():
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    futures = {
+                        executor.submit(process, app): app_name
+                        for app_name, app in sorted(self.apps.items())
+                    }
+                    results = {
+                        futures[future]: future.result()
+                        for future in as_completed(futures)
+                    }
+        finally:
+            self.input.enabled = input_enabled
+            self.input.is_output_controlled = is_output_controlled
+
+        width = max(len(app_name) for app_name in results)
+        self.logger.info()
+        self.logger.info("Summary:", prefix=self.command)
+        for app_name, (error, duration) in sorted(results.items()):
+            status = "failed" if error else "done"
+            self.logger.info(f"  {app_name:<{width}}  {status:<6}  {duration:7.1f}s")
+
+        failures = sorted(
+            app_name for app_name, (error, _) in results.items() if error is not None
+        )
+        if failures:
+            raise BriefcaseCommandError(
+                f"Unable to {self.command} {len(failures)} of {len(results)} apps: "
+                f"{', '.join(failures)}."
+            )
+
+    def add_default_options(self, parser):
+        """Add the default options that exist on *all* commands.
+
+        :param parser: a stub argparse parser for the command.
+        """
+        parser.add_argument(
+            "-v",
+            "--verbosity",
+            action="count",
+            default=1,
+            help="set the verbosity of output",
+        )
+        parser.add_argument("-V", "--version", action="version", version=__version__)
+        parser.add_argument(
+            "--no-input",
+            action="store_false",
+            default=True,
+            dest="input_enabled",
+            help=(
+                "Don't ask for user input. If any action would be destructive, "
+                "an error will be raised; otherwise, default answers will be "
+                "assumed."
+            ),
+        )
+        parser.add_argument(
+            "--log",
+            action="store_true",
+            dest="save_log",
+            help="Save a detailed log to file. By default, this log file is only created for critical errors.",
+        )
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            help=(
+                "Don't use the network. Tools and support files will only be "
+                "used if they have been previously downloaded."
+            ),
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_false",
+            dest="use_cache",
+            help=(
+                "Re-run all tool verification checks, and reinstall app "
+                "dependencies, rather than reusing the results of previous "
+                "checks and installs."
+            ),
+        )
+
+    def add_options(self, parser):
+        """Add any options that this command needs to parse from the command
+        line.
+
+        :param parser: a stub argparse parser for the command.
+        """
+        pass
+
+    def parse_config(self, filename):
+        try:
+            with open(filename, "rb") as config_file:
+                # Parse the content of the pyproject.toml file, extracting
+                # any platform and output format configuration for each app,
+                # creating a single set of configuration options.
+                global_config, app_configs = parse_config(
+                    config_file,
+                    platform=self.platform,
+                    output_format=self.output_format,
+                )
+
+                self.global_config = create_config(
+                    klass=self.GLOBAL_CONFIG_CLASS,
+                    config=global_config,
+                    msg="Global configuration",
+                )
+
+                for app_name, app_config in app_configs.items():
+                    # Construct an AppConfig object with the final set of
+                    # configuration options for the app.
+                    self.apps[app_name] = create_config(
+                        klass=self.APP_CONFIG_CLASS,
+                        config=app_config,
+                        msg=f"Configuration for '{app_name}'",
+                    )
+
+        except FileNotFoundError as e:
+            raise BriefcaseConfigError(
+                f"""Configuration file not found. Did you run briefcase in the directory that contains {filename!r}?"""
+            ) from e
+
+    @contextmanager
+    def lock(self, name, description):
+        """Hold a lock that is shared by every Briefcase process that uses
+        the same data path.
+
+        If another process holds the lock, a message is displayed, and the
+        current process waits until the lock is released.
+
+        :param name: The name of the lock.
+        :param description: A description of the resource protected by the
+            lock; used to construct the message displayed while waiting.
+            Should be able to fit into the sentence "Waiting for another
+            Briefcase process to finish with {description}".
+        """
+        lock = FileLock.for_path(self.data_path / "locks" / f"{name}.lock")
+        lock.acquire(
+            on_wait=lambda: self.logger.info(
+                f"Waiting for another Briefcase process to finish with {description}..."
+            )
+        )
+        try:
+            yield
+        finally:
+            lock.release()
+
+    @contextmanager
+    def package_index(self, app: BaseConfig):
+        """Serve the package index from a local cache while the app's
+        dependencies are installed.
+
+        If the app uses the index proxy, a local package index is started
+        that serves the pages and files of the upstream index (PyPI, or the
+        index configured with ``PIP_INDEX_URL``) from the package index cache;
+        while it is running, pip is pointed at it (see
+        ``pip_index_options()``). Files are only downloaded from the upstream
+        index the first time they are needed, and in offline mode, only
+        cached files are used.
+
+        :param app: The config object for the app
+        :returns: A context manager that yields the URL of the local index;
+            or ``None`` if the app doesn't use the index proxy.
+        """
+        if not getattr(app, "index_proxy", False) or self.index_url is not None:
+            yield self.index_url
+            return
+
+        proxy = IndexProxy(
+            self.package_index_cache,
+            self._request_download,
+            upstream=self.os.environ.get("PIP_INDEX_URL", DEFAULT_INDEX_URL),
+            offline=self.offline,
+        )
+        with proxy.serve() as index_url:
+            self.index_url = index_url
+            try:
+                yield index_url
+            finally:
+                self.index_url = None
+
+    def pip_index_options(self):
+        """The options that point pip at the package index proxy, if it is
+        running, and at the wheelhouse, if wheels have been prefetched.
+
+        :returns: A list of options for pip.
+        """
+        options = [f"--index-url={self.index_url}"] if self.index_url else []
+        return options + (self.wheelhouse_options or [])
+
+    def resolve_requirements(self, requirements):
+        """Determine the distributions that pip would install for a list of
+        requirements, without installing them.
+
+        The requirements are resolved by the command's subprocess, so they are
+        resolved in the same environment in which they are installed.
+
+        :param requirements: The requirements to resolve.
+        :returns: A list of the distributions that would be installed, as
+            dictionaries with a ``name``, a ``version``, and a list of the
+            ``hashes`` (as ``<algorithm>:<digest>``) of the artefact that
+            would be installed; or ``None`` if the requirements couldn't be
+            resolved (e.g., because the installed version of pip can't report
+            the result of a resolution).
+        """
+        try:
+            output = self.subprocess.check_output(
+                [
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "install",
+                    "--dry-run",
+                    "--ignore-installed",
+                    "--no-user",
+                    "--quiet",
+                    "--report",
+                    "-",
+                ]
+                + self.pip_index_options()
+                + list(requirements),
+            )
+            packages = []
+            for item in json.loads(output)["install"]:
+                archive_info = item.get("download_info", {}).get("archive_info", {})
+                hashes = archive_info.get("hashes")
+                if not hashes and archive_info.get("hash"):
+                    # Older versions of pip report a single "<algorithm>=<digest>"
+                    hashes = dict([archive_info["hash"].split("=", 1)])
+                packages.append(
+                    {
+                        "name": item["metadata"]["name"],
+                        "version": item["metadata"]["version"],
+                        "hashes": [
+                            f"{algorithm}:{digest}"
+                            for algorithm, digest in sorted((hashes or {}).items())
+                            if algorithm in HASH_ALGORITHMS
+                        ],
+                    }
+                )
+            return packages
+        except (
+            subprocess.CalledProcessError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+        ):
+            return None
+
+    def locked_app_requirements(self, app: BaseConfig):
+        """Determine the exact packages that will be installed for an app's
+        requirements, using the project's lock file.
+
+        Packages are locked for each app, on each platform and output format,
+        for each host architecture and Python version; the hashes that are
+        locked are those of the wheels for that architecture and Python
+        version, so they can't be used to install on any other. If the app's
+        requirements haven't been locked (or have changed since they were
+        locked), they are resolved, and the result is recorded in the lock
+        file.
+
+        :param app: The app configuration
+        :returns: A list of the locked packages, as dictionaries with a
+            ``name``, a ``version``, and a list of ``hashes``; or ``None`` if
+            the app doesn't lock its dependencies.
+        """
+        if not (getattr(app, "lock_dependencies", False) and app.requires):
+            return None
+
+        unlockable = [
+            requirement
+            for requirement in app.requires
+            if not is_index_requirement(requirement)
+        ]
+        if unlockable:
+            raise BriefcaseCommandError(
+                f"Unable to lock the dependencies of {app.app_name}; only "
+                "requirements that are installed from a package index can be "
+                f"locked, but {app.app_name} requires:\n\n"
+                + "\n".join(f"    {requirement}" for requirement in unlockable)
+            )
+
+        lock_file = LockFile(self.base_path / LOCK_FILENAME)
+        target = "/".join(
+            [
+                self.platform,
+                self.output_format or self.command,
+                self.host_arch,
+                f"py{self.python_version_tag}",
+            ]
+        )
+        # The lock file is shared by every app in the project, so it can't be
+        # updated by more than one process at a time.
+        project_id = hashlib.sha256(os.fsencode(self.base_path.absolute())).hexdigest()[
+            :16
+        ]
+        with self.lock(f"project-{project_id}", "the project's lock file"):
+            packages = lock_file.packages(app.app_name, target, app.requires)
+            if packages is not None:
+                return packages
+
+            with self.input.wait_bar("Locking app dependencies..."):
+                packages = self.resolve_requirements(app.requires)
+            if packages is None:
+                raise BriefcaseCommandError(
+                    f"Unable to resolve the requirements of {app.app_name}. "
+                    "Locking dependencies requires pip 22.2 or later."
+                )
+            if not all(package["hashes"] for package in packages):
+                # pip can only verify hashes if every package has one.
+                self.logger.warning(
+                    "The package index didn't provide hashes for every "
+                    "dependency; only the versions of the dependencies "
+                    "will be locked."
+                )
+                packages = [dict(package, hashes=[]) for package in packages]
+            lock_file.lock(app.app_name, target, app.requires, packages)
+
+        self.logger.info(
+            f"Locked {len(packages)} dependencies in {LOCK_FILENAME}.",
+            prefix=app.app_name,
+        )
+        return packages
+
+    def download_file(
+        self,
+        url,
+        download_path,
+        role=None,
+        checksum=None,
+        revalidate=False,
+        extract_path=None,
+        extract_members=None,
+    ):
+        """Download a given URL, caching it. If it has already been downloaded,
+        return the value that has been cached.
+
+        This is a utility method used to obtain assets used by the
+        install process. The cached filename will be the filename portion of
+        the URL, appended to the download path.
+
+        Content is streamed into a ``.part`` file alongside the final
+        filename. If a previous download was interrupted, the partial
+        content is retained, along with the ETag or Last-Modified validator
+        of the resource it came from. The download is resumed using an HTTP
+        Range request, made conditional on that validator with ``If-Range``;
+        if the resource has changed, or no validator is known, the download
+        starts again from the beginning. The partial file is only moved into
+        its final location once the full content has been received (and, if a
+        checksum has been provided, the content has been verified).
+
+        Completed downloads are added to the content-addressed download
+        cache; the file in the download path is a link to the cached
+        content. If the URL has been downloaded before, the cached content is
+        verified and used without contacting the server. If the command is
+        running in offline mode, and the URL hasn't been downloaded before,
+        an error is raised.
+
+        :param url: The URL to download
+        :param download_path: The path to the download cache folder. This path
+            will be created if it doesn't exist.
+        :param role: A string describing the role played by the file being
+            downloaded; used to construct log and error messages. Should be
+            able to fit into the sentence "Error downloading {role}".
+        :param checksum: (Optional) The expected SHA256 hex digest of the
+            downloaded content.
+        :param revalidate: If True, and the server provided an ETag or
+            Last-Modified header when the URL was downloaded, a cached file
+            will be revalidated with a conditional request. Revalidation
+            isn't performed in offline mode.
+        :param extract_path: (Optional) A directory into which the downloaded
+            file should be unpacked. If the file is a tar archive that isn't
+            already cached, it is unpacked while it is downloaded; otherwise,
+            it is unpacked once it is available. The content is unpacked into
+            a staging folder, and is only moved into ``extract_path`` once the
+            download is complete and verified. Raises ``shutil.ReadError``
+            (or ``EOFError``) if the file can't be unpacked.
+        :param extract_members: (Optional) A ``MemberFilter`` selecting the
+            members of the archive that should be unpacked into
+            ``extract_path``. By default, the entire archive is unpacked.
+        :returns: The filename of the downloaded (or cached) file.
+        """
+        extractor = None
+        staging_path = None
+        if extract_path is not None:
+            # Content is unpacked into a staging folder alongside the extract
+            # path, so that nothing is put in place until the download has
+            # been verified.
+            extract_path.parent.mkdir(parents=True, exist_ok=True)
+            staging_path = Path(
+                tempfile.mkdtemp(prefix=".unpacking-", dir=extract_path.parent)
+            )
+            extractor = StreamingTarExtractor(staging_path, members=extract_members)
+
+        try:
+            # If another process is downloading the same URL, wait for that
+            # download to complete; the download will then be in the cache.
+            url_digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+            with self.lock(f"download-{url_digest[:16]}", description=url):
+                filename = self._download_file(
+                    url=url,
+                    download_path=download_path,
+                    role=role,
+                    checksum=checksum,
+                    revalidate=revalidate,
+                    extractor=extractor,
+                )
+
+            if extractor is not None:
+                if not extractor.started:
+                    with self.input.wait_bar(f"Unpacking {filename.name}..."):
+                        unpack_archive(
+                            filename,
+                            extract_dir=staging_path,
+                            members=extract_members,
+                        )
+                move_contents(staging_path, extract_path)
+        finally:
+            if staging_path is not None:
+                shutil.rmtree(staging_path, ignore_errors=True)
+        return filename
+
+    def _download_file(
+        self,
+        url,
+        download_path,
+        role,
+        checksum,
+        revalidate,
+        extractor,
+    ):
+        """Download a given URL, caching it.
+
+        See ``download_file()`` for the details of the arguments.
+
+        :param extractor: A ``StreamingTarExtractor`` that should be used to
+            unpack the content while it is downloaded, or ``None`` if the
+            content doesn't need to be unpacked.
+        :returns: The filename of the downloaded (or cached) file.
+        """
+        download_path.mkdir(parents=True, exist_ok=True)
+        filename = None
+        try:
+            # If the URL has been downloaded before, use the cached content
+            # without making a request.
+            filename = self._cached_download(url, download_path)
+            if filename is None and self.offline:
+                raise OfflineModeError(url=url, role=role)
+            elif filename is not None and (self.offline or not revalidate):
+                return filename
+
+            conditional_headers = {}
+            if filename is not None:
+                conditional_headers = self.download_cache.conditional_headers(url)
+
+            response = self._request_download(url, headers=conditional_headers)
+            if conditional_headers and response.status_code == 304:
+                response.close()
+                self.logger.info(f"{filename.name} is up to date")
+                return filename
+
+            if response.status_code == 404:
+                raise MissingNetworkResourceError(url=url)
+            elif response.status_code != 200:
+                raise BadNetworkResourceError(url=url, status_code=response.status_code)
+
+            # The initial URL might (read: will) go through URL redirects, so
+            # we need the *final* response. We look at either the `Content-Disposition`
+            # header, or the final URL, to extract the cache filename.
+            cache_full_name = urlparse(response.url).path
+            header_value = response.headers.get("Content-Disposition")
+            if header_value:
+                # See also https://tools.ietf.org/html/rfc6266
+                value, parameters = parse_header(header_value)
+                content_type = value.split(":", 1)[-1].strip().lower()
+                if content_type == "attachment" and parameters.get("filename"):
+                    cache_full_name = parameters["filename"]
+            cache_name = cache_full_name.split("/")[-1]
+            filename = download_path / cache_name
+
+            if conditional_headers:
+                # The server has reported that the content has changed since
+                # it was cached; the cached content can't be used.
+                self.download_cache.forget(url)
+                if filename.exists():
+                    filename.unlink()
+
+            if filename.exists():
+                # Confirm the cached file hasn't been modified or corrupted
+                # since it was downloaded.
+                verified = self.download_cache.verify(url, filename)
+                if verified is None:
+                    # The file was downloaded before content was being
+                    # recorded; adopt it into the download cache.
+                    self.download_cache.add(url, filename, filename)
+                elif not verified:
+                    self.logger.warning(
+                        f"{cache_name} does not match the content that was "
+                        "downloaded; downloading again..."
+                    )
+                    filename.unlink()
+
+            if filename.exists():
+                self.logger.info(f"{cache_name} already downloaded")
+                self.download_cache.touch(url, filename)
+            elif self.download_cache.materialize(url, filename):
+                self.logger.info(f"{cache_name} restored from download cache")
+            else:
+                # We have meaningful content, and it hasn't been cached previously,
+                # so save it in the requested location
+                partial_filename = download_path / f"{cache_name}.part"
+                offset = 0
+                if partial_filename.exists():
+                    response, offset = self._resume_download(
+                        url=url,
+                        response=response,
+                        partial_filename=partial_filename,
+                    )
+
+                # Preserve any cache validators provided by the server, so
+                # the download can be revalidated in future.
+                validators = {
+                    key: value
+                    for key, value in [
+                        ("etag", response.headers.get("ETag")),
+                        ("last_modified", response.headers.get("Last-Modified")),
+                    ]
+                    if value
+                }
+
+                if offset:
+                    self.logger.info(f"Resuming download of {cache_name}...")
+                    segments = 1
+                else:
+                    _record_validator(response, partial_filename)
+                    self.logger.info(f"Downloading {cache_name}...")
+                    segments = self._download_segment_count(response)
+
+                streaming = extractor is not None and is_tar_archive(cache_name)
+                if streaming:
+                    # The archive is unpacked as it is written, so it must be
+                    # written in order, from the start of the archive. Any
+                    # partial content that isn't being resumed is discarded
+                    # before it can be read.
+                    self.logger.debug(f"Unpacking {cache_name} as it is downloaded")
+                    segments = 1
+                    if not offset and partial_filename.exists():
+                        partial_filename.unlink()
+                    extractor.start(partial_filename)
+
+                try:
+                    self._write_download(
+                        url=url,
+                        response=response,
+                        partial_filename=partial_filename,
+                        offset=offset,
+                        segments=segments,
+                    )
+                except BaseException:
+                    if streaming:
+                        extractor.finish(complete=False)
+                    raise
+
+                if streaming:
+                    extractor.finish()
+
+                # Only move the download into the cache if it is complete
+                # and intact. An incomplete download is retained, so that it
+                # can be resumed; a corrupted download is discarded.
+                digest = file_sha256(partial_filename)
+                if checksum and digest != checksum.lower():
+                    _discard_partial(partial_filename)
+                    raise CorruptNetworkResourceError(
+                        url=url,
+                        expected=checksum,
+                        actual=digest,
+                    )
+                self.download_cache.add(
+                    url,
+                    partial_filename,
+                    filename,
+                    digest=digest,
+                    **validators,
+                )
+                _discard_partial(partial_filename)
+                self._enforce_cache_budget(url)
+
+                if streaming:
+                    extractor.raise_for_error()
+
+        except NETWORK_ERRORS as e:
+            if role:
+                description = role
+            else:
+                description = filename.name if filename else url
+            raise NetworkFailure(f"download {description}") from e
+
+        return filename
+
+    def _write_download(self, url, response, partial_filename, offset, segments):
+        """Write the content of a response into a partial download file.
+
+        :param url: The URL being downloaded.
+        :param response: The response whose content should be written.
+        :param partial_filename: The file into which content will be written.
+        :param offset: The number of bytes of content that are already in the
+            partial file.
+        :param segments: The number of segments that should be used to
+            download the content.
+        """
+        if segments > 1:
+            total = int(response.headers.get("content-length"))
+            response.close()
+            if not self._segmented_download(
+                url=url,
+                total=total,
+                segments=segments,
+                partial_filename=partial_filename,
+            ):
+                # The server didn't honor the segment requests;
+                # fall back to a single stream.
+                self.logger.debug(
+                    "Server did not accept range request; "
+                    "using a single download stream"
+                )
+                response = self._request_download(url)
+                _record_validator(response, partial_filename)
+                segments = 1
+
+        if segments == 1:
+            self._stream_download_with_retries(
+                url=url,
+                response=response,
+                partial_filename=partial_filename,
+                offset=offset,
+            )
+
+    def cache_entry_in_use(self, entry):
+        """Determine if cached content is in use by an installed tool.
+
+        Content that has been placed in the tools folder (e.g., an AppImage
+        or executable that is used as-is) is part of an installed tool, and
+        must not be removed from the cache.
+
+        :param entry: A download cache entry, as returned by
+            ``DownloadCache.entries()``.
+        :returns: True if the content is in use.
+        """
+        for path in entry["paths"]:
+            try:
+                path.relative_to(self.tools_path)
+            except ValueError:
+                continue
+            if path.exists():
+                return True
+        return False
+
+    def _enforce_cache_budget(self, url):
+        """Remove the least recently used content from the download cache if
+        the cache is larger than the budget set by the
+        ``BRIEFCASE_CACHE_MAX_SIZE`` environment variable.
+
+        :param url: The URL that was just downloaded. This content will be
+            retained, even if it exceeds the budget on its own.
+        """
+        max_size = self.os.environ.get("BRIEFCASE_CACHE_MAX_SIZE")
+        if not max_size:
+            return
+
+        try:
+            max_size = parse_size(max_size)
+        except ValueError as e:
+            raise BriefcaseCommandError(
+                "The value of BRIEFCASE_CACHE_MAX_SIZE must be a size "
+                "(e.g., 500M or 10G)."
+            ) from e
+
+        evicted = self.download_cache.gc(
+            max_size,
+            keep=lambda entry: entry["url"] == url or self.cache_entry_in_use(entry),
+        )
+        for entry in evicted:
+            self.logger.info(
+                f"Removed {entry['url']} from the download cache "
+                f"({format_size(entry['size'])})"
+            )
+        if evicted:
+            # The unpacked content of removed archives is no longer needed.
+            self.unpacked_archives.remove_unused(
+                {entry["digest"] for entry in self.download_cache.entries()}
+            )
+
+    def _request_download(self, url, headers=None):
+        """Request the content of a URL, using any configured mirrors.
+
+        The mirrors for the URL are tried in order; the first mirror that
+        can provide the content (or, for a range request, the requested part
+        of the content) is used. If no mirror can provide the content, the
+        URL itself is requested.
+
+        :param url: The URL to request.
+        :param headers: (Optional) Any additional headers for the request.
+        :returns: The response for the content.
+        """
+        kwargs = {"headers": headers} if headers else {}
+        for mirror_url in self.mirrors.urls(url):
+            try:
+                response = self.requests.get(mirror_url, stream=True, **kwargs)
+            except NETWORK_ERRORS as e:
+                self.logger.debug(f"Mirror {mirror_url} is unavailable: {e}")
+                continue
+
+            if response.status_code in {200, 206, 304}:
+                self.logger.debug(f"Using mirror {mirror_url}")
+                return response
+
+            self.logger.debug(
+                f"Mirror {mirror_url} returned status code {response.status_code}"
+            )
+            response.close()
+
+        return self.requests.get(url, stream=True, **kwargs)
+
+    def _cached_download(self, url, download_path):
+        """Obtain the previously downloaded content of a URL, if available.
+
+        :param url: The URL that has been downloaded.
+        :param download_path: The download cache folder where the cached
+            file should be.
+        :returns: The path of the cached file, or ``None`` if the URL hasn't
+            been downloaded, or its content is no longer available.
+        """
+        record = self.download_cache.record(url)
+        if record is None:
+            return None
+
+        filename = download_path / record["filename"]
+        if filename.exists():
+            # Confirm the cached file hasn't been modified or corrupted
+            # since it was downloaded.
+            if self.download_cache.verify(url, filename):
+                self.logger.info(f"{filename.name} already downloaded")
+                self.download_cache.touch(url, filename)
+                return filename
+
+            self.logger.warning(
+                f"{filename.name} does not match the content that was downloaded"
+            )
+            filename.unlink()
+
+        if self.download_cache.materialize(url, filename):
+            self.logger.info(f"{filename.name} restored from download cache")
+            return filename
+
+        return None
+
+    def _resume_download(self, url, response, partial_filename):
+        """Attempt to resume an interrupted download.
+
+        :param url: The URL being downloaded.
+        :param response: The response that was received for the unqualified
+            request for the URL.
+        :param partial_filename: The path of the partially downloaded content.
+        :returns: A tuple containing the response that should be used to
+            complete the download, and the offset into the content at which
+            that response starts.
+        """
+        offset = partial_filename.stat().st_size
+        if (
+            offset == 0
+            or response.headers.get("Accept-Ranges") == "none"
+            or _is_encoded(response)
+        ):
+            return response, 0
+
+        # The partial content can only be resumed if we know which version
+        # of the resource it came from, and that version is still current.
+        validator_path = _validator_path(partial_filename)
+        try:
+            validator = validator_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            self.logger.debug(
+                f"Previous download of {partial_filename.name} can't be "
+                "validated; restarting download"
+            )
+            return response, 0
+
+        if validator != _range_validator(response):
+            self.logger.debug(
+                f"{url} has changed since the previous download; " "restarting download"
+            )
+            return response, 0
+
+        self.logger.debug(
+            f"Found {offset} bytes of a previous download of {partial_filename.name}"
+        )
+        ranged_response = self.requests.get(
+            response.url,
+            stream=True,
+            headers={"Range": f"bytes={offset}-", "If-Range": validator},
+        )
+        if ranged_response.status_code == 206:
+            # The server is honoring the range request. Abandon the original
+            # request, and continue from where we left off.
+            response.close()
+            return ranged_response, offset
+
+        # The server doesn't support ranges, the resource has changed (in
+        # which case If-Range causes the full content to be returned), or
+        # the partial content isn't valid for the resource anymore (e.g., a
+        # 416 because the resource is now shorter than the partial content).
+        # Start from the beginning.
+        ranged_response.close()
+        self.logger.debug("Server did not accept range request; restarting download")
+        return response, 0
+
+    def _download_segment_count(self, response):
+        """Determine the number of segments to use when downloading a
+        response.
+
+        Segmented downloads are opt-in, using the
+        ``BRIEFCASE_DOWNLOAD_SEGMENTS`` environment variable. They are only
+        used if the server advertises support for byte ranges, and the
+        content is large enough to benefit from being split.
+
+        :param response: The response for the content to be downloaded.
+        :returns: The number of segments to use. A value of 1 indicates that
+            the content should be downloaded as a single stream.
+        """
+        try:
+            requested = int(self.os.environ.get("BRIEFCASE_DOWNLOAD_SEGMENTS", "1"))
+        except ValueError as e:
+            raise BriefcaseCommandError(
+                "The value of BRIEFCASE_DOWNLOAD_SEGMENTS must be an integer."
+            ) from e
+
+        if (
+            requested < 2
+            or response.headers.get("Accept-Ranges") != "bytes"
+            or _is_encoded(response)
+        ):
+            return 1
+
+        try:
+            total = int(response.headers.get("content-length"))
+        except (TypeError, ValueError):
+            return 1
+
+        return max(1, min(requested, total // MIN_DOWNLOAD_SEGMENT_SIZE))
+
+    def _segmented_download(self, url, total, segments, partial_filename):
+        """Download content as a collection of concurrently downloaded byte
+        ranges.
+
+        The partial download file is preallocated to the full size of the
+        content; each segment writes into its own region of the file. As the
+        resulting file may contain holes, the partial file is discarded if
+        the download fails, rather than being retained for resumption.
+
+        :param url: The URL to download.
+        :param total: The total size of the content, in bytes.
+        :param segments: The number of segments to split the content into.
+        :param partial_filename: The file into which content will be written.
+        :returns: True if the content was downloaded; False if the server
+            did not honor the range requests.
+        """
+        segment_size = -(-total // segments)
+        ranges = [
+            (start, min(start + segment_size, total) - 1)
+            for start in range(0, total, segment_size)
+        ]
+        self.logger.debug(f"Downloading {url} in {len(ranges)} segments")
+
+        with partial_filename.open("wb") as f:
+            f.truncate(total)
+
+        abort = threading.Event()
+        progress_bar = self.input.progress_bar()
+        task_id = progress_bar.add_task("Downloader", total=total)
+
+        def download_segment(start, end):
+            response = self._request_download(
+                url,
+                headers={"Range": f"bytes={start}-{end}"},
+            )
+            try:
+                if response.status_code != 206:
+                    abort.set()
+                    return False
+
+                position = start
+                with partial_filename.open("r+b") as f:
+                    f.seek(start)
+                    for data in response.iter_content(chunk_size=1024 * 1024):
+                        if abort.is_set():
+                            return False
+                        f.write(data)
+                        position += len(data)
+                        progress_bar.update(task_id, advance=len(data))
+
+                if position != end + 1:
+                    raise requests.exceptions.ConnectionError(
+                        f"Segment {start}-{end} of {url} ended after "
+                        f"{position - start} bytes"
+                    )
+                return True
+            except BaseException:
+                abort.set()
+                raise
+            finally:
+                response.close()
+
+        try:
+            with progress_bar:
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    futures = [
+                        executor.submit(download_segment, start, end)
+                        for start, end in ranges
+                    ]
+                    # Retrieve every result, so that any error is raised.
+                    complete = all([future.result() for future in futures])
+        except BaseException:
+            _discard_partial(partial_filename)
+            raise
+
+        if not complete:
+            _discard_partial(partial_filename)
+        return complete
+
+    def _stream_download_with_retries(self, url, response, partial_filename, offset):
+        """Write the content of a response into a partial download file,
+        resuming the download if the connection is interrupted.
+
+        The download will be resumed as many times as the HTTP session
+        allows requests to be retried, with an exponential backoff between
+        attempts.
+
+        :param url: The URL being downloaded.
+        :param response: The response whose content should be written.
+        :param partial_filename: The file into which content will be written.
+        :param offset: The number of bytes of content that are already in the
+            partial file.
+        """
+        attempt = 1
+        while True:
+            try:
+                self._stream_download(
+                    response=response,
+                    partial_filename=partial_filename,
+                    offset=offset,
+                )
+                return
+            except NETWORK_ERRORS:
+                if attempt > self.requests.retries:
+                    raise
+
+            self.sleep(DEFAULT_BACKOFF_FACTOR * (2 ** (attempt - 1)))
+            attempt += 1
+            self.logger.info("Download interrupted; resuming...")
+            response, offset = self._resume_download(
+                url=url,
+                response=response,
+                partial_filename=partial_filename,
+            )
+            if offset == 0:
+                # The download couldn't be resumed; the original response has
+                # been consumed, so start again with a new request.
+                response.close()
+                response = self._request_download(url)
+                _record_validator(response, partial_filename)
+
+    def _stream_download(self, response, partial_filename, offset):
+        """Write the content of a response into a partial download file.
+
+        :param response: The response whose content should be written.
+        :param partial_filename: The file into which content will be written.
+        :param offset: The number of bytes of content that are already in the
+            partial file. If zero, any existing partial file is truncated.
+        """
+        # If the content has a transfer encoding (e.g., gzip), the bytes
+        # written to disk won't match the content length that was reported.
+        verify_size = not _is_encoded(response)
+        with partial_filename.open("ab" if offset else "wb") as f:
+            total = response.headers.get("content-length")
+            if total is None:
+                # The size of the content isn't known (e.g., a chunked
+                # response). The content is still streamed, so that memory
+                # use is bounded; progress is reported as a transfer rate.
+                progress_bar = self.input.transfer_bar()
+            else:
+                total = offset + int(total)
+                progress_bar = self.input.progress_bar()
+            task_id = progress_bar.add_task("Downloader", total=total, completed=offset)
+            with progress_bar:
+                for data in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(data)
+                    progress_bar.update(task_id, advance=len(data))
+
+        if (
+            verify_size
+            and total is not None
+            and partial_filename.stat().st_size != total
+        ):
+            # The connection was dropped without raising an error. Treat it
+            # as a network failure; the partial content will be resumed on
+            # the next attempt.
+            raise requests.exceptions.ConnectionError(
+                f"Download of {response.url} ended after "
+                f"{partial_filename.stat().st_size} of {total} bytes"
+            )
+
+    def template_cache_lock(self, template):
+        """Hold the lock that protects the cached copy of a template.
+
+        The cache is a single checkout, so the lock must be held from the
+        time the required branch is checked out until the template has been
+        rolled out.
+
+        :param template: The template URL or path.
+        """
+        return self.lock(
+            f"template-{cookiecutter_cache_path(template).name}",
+            description=f"the {template} template",
+        )
+
+    def update_cookiecutter_cache(self, template: str, branch="master"):
+        """Ensure that we have a current checkout of a template path.
+
+        If the path is a local path, use the path as is.
+
+        If the path is a URL, look for a local cache; if one exists, update it,
+        including checking out the required branch.
+
+        :param template: The template URL or path.
+        :param branch: The template branch to use. Default: ``master``
+        :return: The path to the cached template. This may be the originally
+            provided path if the template was a file path.
+        """
+        if is_repo_url(template):
+            # The app template is a repository URL.
+            #
+            # When in `no_input=True` mode, cookiecutter deletes and reclones
+            # a template directory, rather than updating the existing repo.
+            #
+            # Look for a cookiecutter cache of the template; if one exists,
+            # try to update it using git. If no cache exists, or if the cache
+            # directory isn't a git directory, or git fails for some reason,
+            # fall back to using the specified template directly.
+            try:
+                cached_template = cookiecutter_cache_path(template)
+                repo = self.git.Repo(cached_template)
+                remote = repo.remote(name="origin")
+                try:
+                    # Attempt to update the repository
+                    if self.offline:
+                        self.logger.info(
+                            "Offline mode; using existing template without updating"
+                        )
+                    else:
+                        remote.fetch()
+                except self.git.exc.GitCommandError:
+                    # We are offline, or otherwise unable to contact
+                    # the origin git repo. It's OK to continue; but warn
+                    # the user that the template may be stale.
+                    self.logger.warning(
+                        """
+*************************************************************************
+** WARNING: Unable to update template                                  **
+*************************************************************************
+
+   Briefcase is unable the update the application template. This
+   may be because your computer is currently offline. Briefcase will
+   use existing template without updating.
+
+*************************************************************************
+"""
+                    )
+                try:
+                    # Check out the branch for the required version tag.
+                    head = remote.refs[branch]
+
+                    self.logger.info(
+                        f"Using existing template (sha {head.commit.hexsha}, "
+                        f"updated {head.commit.committed_datetime.strftime('%c')})"
+                    )
+                    head.checkout()
+                except IndexError as e:
+                    # No branch exists for the requested version.
+                    raise TemplateUnsupportedVersion(branch) from e
+            except self.git.exc.NoSuchPathError as e:
+                # Template cache path doesn't exist. If we're offline, the
+                # template can't be obtained; otherwise, just use the template
+                # directly, rather than attempting an update.
+                if self.offline:
+                    raise OfflineModeError(url=template, role="app template") from e
+                cached_template = template
+            except self.git.exc.InvalidGitRepositoryError:
+                # Template cache path exists, but isn't a git repository
+                # Just use the template directly, rather than attempting an update.
+                cached_template = template
+        else:
+            # If this isn't a repository URL, treat it as a local directory
+            cached_template = template
+
+        return cached_template
@@ -0,0 +1,109 @@
+from typing import Optional
+
+from briefcase.config import BaseConfig
+
+from .base import full_options
+from .create import CreateCommand
+
+
+class UpdateCommand(CreateCommand):
+    command = "update"
+
+    def add_options(self, parser):
+        parser.add_argument(
+            "-d",
+            "--update-dependencies",
+            action="store_true",
+            help="Update dependencies for app",
+        )
+        parser.add_argument(
+            "-r",
+            "--update-resources",
+            action="store_true",
+            help="Update app resources (icons, splash screens, etc)",
+        )
+        self.add_jobs_option(parser)
+
+    def update_app(
+        self,
+        app: BaseConfig,
+        update_dependencies=False,
+        update_resources=False,
+        **options,
+    ):
+        """Update an existing application bundle.
+
+        :param app: The config object for the app
+        :param update_dependencies: Should dependencies be updated? (default: False)
+        :param update_resources: Should extra resources be updated? (default: False)
+        """
+
+        bundle_path = self.bundle_path(app)
+        if not bundle_path.exists():
+            self.logger.error(
+                "Application does not exist; call create first!", prefix=app.app_name
+            )
+            return
+
+        if update_dependencies:
+            self.logger.info("Updating dependencies...", prefix=app.app_name)
+            self.install_app_dependencies(app=app)
+
+        self.logger.info("Updating application code...", prefix=app.app_name)
+        self.install_app_code(app=app)
+
+        if update_resources:
+            self.logger.info(
+                "Updating extra application resources...", prefix=app.app_name
+            )
+            self.install_app_resources(app=app)
+
+        if getattr(app, "prune_stdlib", False):
+            # The updated code may import modules that were pruned, so the
+            # standard library is restored before it is pruned again.
+            self.logger.info("Pruning standard library...", prefix=app.app_name)
+            self.install_app_support_package(app=app)
+            self.prune_app_stdlib(app=app)
+
+        if getattr(app, "precompile", False):
+            self.logger.info("Compiling bytecode...", prefix=app.app_name)
+            self.compile_app_bytecode(app=app)
+
+        self.logger.info("Application updated.", prefix=app.app_name)
+
+    def __call__(
+        self,
+        app: Optional[BaseConfig] = None,
+        update_dependencies: bool = False,
+        update_resources: bool = False,
+        jobs: int = 1,
+        **options,
+    ):
+        # Confirm all required tools are available
+        self.verify_tools()
+
+        if app:
+            state = self.update_app(
+                app,
+                update_dependencies=update_dependencies,
+                update_resources=update_resources,
+                **options,
+            )
+        elif jobs != 1 and len(self.apps) > 1:
+            state = self.call_apps_concurrently(
+                jobs,
+                update_dependencies=update_dependencies,
+                update_resources=update_resources,
+                **options,
+            )
+        else:
+            state = None
+            for app_name, app in sorted(self.apps.items()):
+                state = self.update_app(
+                    app,
+                    update_dependencies=update_dependencies,
+                    update_resources=update_resources,
+                    **full_options(state, options),
+                )
+
+        return state
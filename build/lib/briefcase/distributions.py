@@ -0,0 +1,136 @@
+import csv
+import os
+import re
+import shutil
+from email.parser import HeaderParser
+from pathlib import Path
+
+
+def canonical_name(name):
+    """Normalize the name of a distribution (PEP 503), so that names that
+    differ only in case or punctuation compare equal.
+
+    :param name: The name of a distribution.
+    :returns: The normalized name.
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def installed_distributions(path):
+    """Find the distributions that are installed in a folder.
+
+    :param path: The folder into which distributions have been installed
+        (e.g., an ``app_packages`` folder).
+    :returns: A dictionary of canonical name->``(version, dist_info_path)``.
+        If the metadata of a distribution can't be read, its version is
+        ``None``.
+    """
+    distributions = {}
+    for dist_info_path in sorted(Path(path).glob("*.dist-info")):
+        try:
+            with (dist_info_path / "METADATA").open(encoding="utf-8") as f:
+                metadata = HeaderParser().parse(f)
+            name, version = metadata["Name"], metadata["Version"]
+        except (OSError, UnicodeDecodeError):
+            name, version = None, None
+        if not name:
+            # Fall back to the name of the folder ("<name>-<version>.dist-info")
+            name = dist_info_path.name[: -len(".dist-info")].split("-")[0]
+        distributions[canonical_name(name)] = (version, dist_info_path)
+    return distributions
+
+
+def distribution_files(path, dist_info_path):
+    """Determine the files that belong to an installed distribution.
+
+    :param path: The folder into which the distribution was installed.
+    :param dist_info_path: The ``.dist-info`` folder of the distribution.
+    :returns: A list of the paths of the files that were installed, as
+        recorded in the distribution's ``RECORD`` file; paths that are outside
+        ``path`` are excluded. If the distribution doesn't have a ``RECORD``
+        file, returns ``None``.
+    """
+    path = Path(path).absolute()
+    try:
+        with (dist_info_path / "RECORD").open(encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+    except OSError:
+        return None
+
+    files = []
+    for row in rows:
+        if not row or not row[0]:
+            continue
+        file_path = Path(os.path.normpath(path / row[0]))
+        if path in file_path.parents:
+            files.append(file_path)
+    return files
+
+
+def remove_distribution(path, dist_info_path):
+    """Remove an installed distribution.
+
+    Every file recorded in the distribution's ``RECORD`` file is removed,
+    along with any bytecode compiled from those files, and any folders that
+    are left empty.
+
+    :param path: The folder into which the distribution was installed.
+    :param dist_info_path: The ``.dist-info`` folder of the distribution.
+    :returns: True if the distribution was removed; False if it couldn't be
+        removed because it doesn't have a ``RECORD`` file.
+    """
+    files = distribution_files(path, dist_info_path)
+    if files is None:
+        return False
+
+    folders = set()
+    for file_path in files:
+        candidates = [file_path]
+        if file_path.suffix == ".py":
+            # Bytecode that may have been compiled after installation
+            candidates.append(file_path.with_suffix(".pyc"))
+            candidates.extend(
+                (file_path.parent / "__pycache__").glob(f"{file_path.stem}.*.pyc")
+            )
+        for candidate in candidates:
+            if candidate.is_file() or candidate.is_symlink():
+                candidate.unlink()
+                folders.add(candidate.parent)
+
+    # Remove folders that are now empty, from the deepest up.
+    path = Path(path).absolute()
+    for folder in sorted(folders, key=lambda folder: len(folder.parts), reverse=True):
+        while folder != path and path in folder.parents:
+            try:
+                folder.rmdir()
+            except OSError:
+                # The folder isn't empty (or has already been removed).
+                break
+            folder = folder.parent
+
+    if dist_info_path.exists():
+        shutil.rmtree(dist_info_path)
+    return True
+
+
+def merge_tree(source, target):
+    """Move the content of a folder into another folder, merging folders
+    that exist in both.
+
+    Unlike replacing each top-level folder, this retains the content of
+    folders that are shared between distributions (e.g., namespace
+    packages).
+
+    :param source: The folder whose content will be moved. The folders it
+        contains are left in place (empty).
+    :param target: The folder into which the content will be moved.
+    """
+    for dirpath, dirnames, filenames in os.walk(source):
+        target_dir = os.path.join(target, os.path.relpath(dirpath, source))
+        os.makedirs(target_dir, exist_ok=True)
+        for name in filenames:
+            os.replace(os.path.join(dirpath, name), os.path.join(target_dir, name))
+        for name in list(dirnames):
+            if os.path.islink(os.path.join(dirpath, name)):
+                os.replace(os.path.join(dirpath, name), os.path.join(target_dir, name))
+                dirnames.remove(name)
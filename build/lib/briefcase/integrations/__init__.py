@@ -0,0 +1,29 @@
+from . import (
+    android_sdk,
+    cookiecutter,
+    docker,
+    flatpak,
+    git,
+    java,
+    linuxdeploy,
+    rcedit,
+    subprocess,
+    visualstudio,
+    wix,
+    xcode,
+)
+
+__all__ = [
+    "android_sdk",
+    "cookiecutter",
+    "docker",
+    "flatpak",
+    "git",
+    "java",
+    "linuxdeploy",
+    "rcedit",
+    "subprocess",
+    "visualstudio",
+    "wix",
+    "xcode",
+]
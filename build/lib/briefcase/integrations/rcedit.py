@@ -0,0 +1,93 @@
+from briefcase.exceptions import MissingToolError
+
+
+class RCEdit:
+    name = "rcedit"
+    full_name = "RCEdit"
+
+    def __init__(self, command):
+        self.command = command
+
+    @property
+    def download_url(self):
+        return (
+            "https://github.com/electron/rcedit/releases/download/v1.1.1/rcedit-x64.exe"
+        )
+
+    @property
+    def rcedit_path(self):
+        return self.command.tools_path / "rcedit-x64.exe"
+
+    @classmethod
+    def verify(cls, command, install=True):
+        """Verify that rcedit is available.
+
+        :param command: The command that needs to use rcedit
+        :param install: Should the tool be installed if it is not found?
+        :returns: A valid rcedit tool wrapper. If rcedit is not
+            available, and was not installed, raises MissingToolError.
+        """
+        rcedit = RCEdit(command)
+
+        # If another process is installing RCEdit, wait for it to finish, and
+        # use the RCEdit it installed.
+        with command.lock(f"tool-{cls.name}", description=cls.full_name):
+            if not rcedit.exists():
+                if install:
+                    command.logger.info(
+                        "RCEdit was not found; downloading and installing...",
+                        prefix=cls.name,
+                    )
+                    rcedit.install()
+                else:
+                    raise MissingToolError("RCEdit")
+
+        return RCEdit(command)
+
+    @classmethod
+    def fetch(cls, command):
+        """Download RCEdit.
+
+        RCEdit is a single executable, so downloading it installs it. Nothing
+        is downloaded if RCEdit has already been installed.
+
+        :param command: The command that will use RCEdit.
+        """
+        rcedit = RCEdit(command)
+        with command.lock(f"tool-{cls.name}", description=cls.full_name):
+            if not rcedit.exists():
+                rcedit.install()
+
+    def exists(self):
+        return self.rcedit_path.exists()
+
+    @property
+    def managed_install(self):
+        return True
+
+    def install(self, revalidate=False):
+        """Download and install RCEdit.
+
+        :param revalidate: Should a previously downloaded copy be revalidated
+            with the server?
+        """
+        self.command.download_file(
+            url=self.download_url,
+            download_path=self.command.tools_path,
+            role="RCEdit",
+            revalidate=revalidate,
+        )
+
+    def uninstall(self):
+        """Uninstall RCEdit."""
+        with self.command.input.wait_bar("Removing old RCEdit install..."):
+            self.rcedit_path.unlink()
+
+    def upgrade(self):
+        """Upgrade an existing RCEdit install."""
+        if not self.exists():
+            raise MissingToolError("RCEdit")
+
+        with self.command.lock(f"tool-{self.name}", description=self.full_name):
+            self.uninstall()
+            self.install(revalidate=True)
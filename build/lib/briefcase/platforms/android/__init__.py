@@ -0,0 +1 @@
+DEFAULT_OUTPUT_FORMAT = "gradle"
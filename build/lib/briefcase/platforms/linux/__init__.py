@@ -0,0 +1,5 @@
+DEFAULT_OUTPUT_FORMAT = "appimage"
+
+
+class LinuxMixin:
+    platform = "linux"
@@ -0,0 +1,96 @@
+from briefcase.commands import (
+    BuildCommand,
+    CreateCommand,
+    PackageCommand,
+    PublishCommand,
+    RunCommand,
+    UpdateCommand,
+)
+from briefcase.config import BaseConfig
+from briefcase.platforms.macOS import (
+    macOSMixin,
+    macOSPackageMixin,
+    macOSRunMixin,
+    macOSSigningMixin,
+)
+
+
+class macOSAppMixin(macOSMixin):
+    output_format = "app"
+
+    def binary_path(self, app):
+        return self.bundle_path(app) / f"{app.formal_name}.app"
+
+    def distribution_path(self, app, packaging_format):
+        if packaging_format == "dmg":
+            return self.platform_path / f"{app.formal_name}-{app.version}.dmg"
+        else:
+            return self.binary_path(app)
+
+    def entitlements_path(self, app):
+        return self.bundle_path(app) / "Entitlements.plist"
+
+
+class macOSAppCreateCommand(macOSAppMixin, CreateCommand):
+    description = "Create and populate a macOS app."
+
+    # Only the Python standard library is needed from the support package.
+    support_package_include = ["Python/Resources/lib"]
+
+    def install_app_support_package(self, app: BaseConfig):
+        """Install the application support package.
+
+        :param app: The config object for the app
+        """
+        # The support folder should only contain the Python standard library;
+        # remove anything else that has been put there.
+        try:
+            support_path = self.support_path(app)
+        except KeyError:
+            pass
+        else:
+            if support_path.exists():
+                self.shutil.rmtree(support_path)
+
+        super().install_app_support_package(app)
+
+
+class macOSAppUpdateCommand(macOSAppMixin, UpdateCommand):
+    description = "Update an existing macOS app."
+
+
+class macOSAppBuildCommand(macOSAppMixin, macOSSigningMixin, BuildCommand):
+    description = "Build a macOS app."
+
+    def build_app(self, app: BaseConfig, **kwargs):
+        """Build the macOS app.
+
+        :param app: The application to build
+        """
+        # macOS apps don't have anything to compile, but they do need to be
+        # signed to be able to execute on M1 hardware - even if it's only an
+        # adhoc signing identity. Apply an adhoc signing identity to the
+        # app bundle.
+        self.logger.info("Adhoc signing app...", prefix=app.app_name)
+        self.sign_app(app=app, identity="-")
+
+
+class macOSAppRunCommand(macOSRunMixin, macOSAppMixin, RunCommand):
+    description = "Run a macOS app."
+
+
+class macOSAppPackageCommand(macOSPackageMixin, macOSAppMixin, PackageCommand):
+    description = "Package a macOS app for distribution."
+
+
+class macOSAppPublishCommand(macOSAppMixin, PublishCommand):
+    description = "Publish a macOS app."
+
+
+# Declare the briefcase command bindings
+create = macOSAppCreateCommand  # noqa
+update = macOSAppUpdateCommand  # noqa
+build = macOSAppBuildCommand  # noqa
+run = macOSAppRunCommand  # noqa
+package = macOSAppPackageCommand  # noqa
+publish = macOSAppPublishCommand  # noqa
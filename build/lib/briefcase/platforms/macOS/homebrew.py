@@ -0,0 +1 @@
+# An implementation would go here!
@@ -0,0 +1,382 @@
+import ast
+import dis
+import fnmatch
+import importlib.util
+import marshal
+import os
+import re
+import shutil
+import types
+from pathlib import Path
+
+# Modules that are needed by the interpreter (or by the Briefcase bootstrap
+# that starts an app), or that are imported in a way that can't be found by
+# inspecting import statements (e.g., by C extension modules, or using a
+# computed module name).
+DEFAULT_KEEP = [
+    "__future__",
+    "_collections_abc",
+    "_compat_pickle",
+    "_sitebuiltins",
+    "_strptime",
+    "_sysconfigdata*",
+    "abc",
+    "codecs",
+    "copyreg",
+    "encodings",
+    "genericpath",
+    "io",
+    "ntpath",
+    "numbers",
+    "os",
+    "posixpath",
+    "runpy",
+    "site",
+    "sitecustomize",
+    "stat",
+    "traceback",
+    "warnings",
+    "zipimport",
+]
+
+# Statements that look like absolute imports, used to find the imports of
+# files that can't be parsed.
+IMPORT_RE = re.compile(
+    r"^\s*(?:from\s+([\w.]+)\s+import\b|import\s+([\w.]+(?:\s*,\s*[\w.]+)*))",
+    re.MULTILINE,
+)
+
+# The filename extensions of binary extension modules.
+EXTENSION_SUFFIXES = (".so", ".pyd", ".dylib")
+
+
+def find_stdlib(path):
+    """Find the uncompiled Python standard library in a folder.
+
+    :param path: The folder to search (e.g., the location of an unpacked
+        support package).
+    :returns: The folder containing the standard library, or ``None`` if the
+        folder doesn't contain an uncompiled standard library (e.g., because
+        it is provided as a zip file of bytecode).
+    """
+    candidates = sorted(
+        Path(path).rglob("os.py"),
+        key=lambda os_path: len(os_path.parts),
+    )
+    for os_path in candidates:
+        stdlib_path = os_path.parent
+        if (stdlib_path / "encodings" / "__init__.py").is_file():
+            return stdlib_path
+    return None
+
+
+def find_modules(path):
+    """Find the Python modules in a folder.
+
+    :param path: The folder to search; this should be a folder that is on
+        ``sys.path`` (e.g., the standard library, or ``app_packages``).
+    :returns: A dictionary of dotted module name->source file. The source
+        file of a package is its ``__init__.py``.
+    """
+    path = Path(path)
+    modules = {}
+    for source in path.rglob("*.py"):
+        parts = source.relative_to(path).with_suffix("").parts
+        # Only folders that are packages contain importable modules.
+        if not all(
+            part.isidentifier()
+            and (path.joinpath(*parts[: index + 1]) / "__init__.py").is_file()
+            for index, part in enumerate(parts[:-1])
+        ):
+            continue
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if parts and all(part.isidentifier() for part in parts):
+            modules[".".join(parts)] = source
+    return modules
+
+
+def _string_literal(node):
+    """The value of an AST node, if it is a string literal; otherwise
+    ``None``."""
+    # TODO: Py3.7 compatibility; string literals are ast.Str nodes (with the
+    # value in ``s``) in Py3.7, and ast.Constant nodes in Py3.8.
+    if not isinstance(node, (ast.Constant, getattr(ast, "Str", ast.Constant))):
+        return None
+    value = getattr(node, "value", getattr(node, "s", None))
+    return value if isinstance(value, str) else None
+
+
+def imported_modules(source, module_name=None):
+    """Find the modules that are imported by a Python source file.
+
+    Every import statement in the file is considered, including imports
+    that are conditional, or inside functions; imports using
+    ``importlib.import_module()`` or ``__import__()`` with a literal module
+    name are also found.
+
+    :param source: The Python source file.
+    :param module_name: (Optional) The dotted name of the module defined by
+        the file, used to resolve relative imports. The name of a package is
+        the name of the package, not ``package.__init__``.
+    :returns: A set of absolute dotted module names. For each import, the
+        module and all its parent packages are included; for ``from x import
+        y``, ``x.y`` is included (as ``y`` may be a module).
+    """
+    try:
+        content = Path(source).read_bytes()
+    except OSError:
+        return set()
+
+    names = set()
+    try:
+        tree = ast.parse(content, filename=os.fsdecode(source))
+    except (SyntaxError, ValueError):
+        # The file can't be parsed (e.g., it is Python 2 code, or uses syntax
+        # that isn't supported by this version of Python). Fall back to
+        # finding anything that looks like an absolute import statement.
+        tree = None
+        for match in IMPORT_RE.finditer(content.decode("utf-8", errors="replace")):
+            if match.group(1):
+                names.add(match.group(1))
+            else:
+                names.update(
+                    name.split()[0] for name in match.group(2).split(",") if name
+                )
+
+    is_package = Path(source).name == "__init__.py"
+    for node in ast.walk(tree) if tree else []:
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if module_name is None:
+                    continue
+                package = module_name.split(".")
+                if not is_package:
+                    package = package[:-1]
+                if node.level > 1:
+                    package = package[: -(node.level - 1)]
+                if not package:
+                    continue
+                base = ".".join(package + ([node.module] if node.module else []))
+            else:
+                base = node.module
+            names.add(base)
+            names.update(
+                f"{base}.{alias.name}" for alias in node.names if alias.name != "*"
+            )
+        elif (
+            isinstance(node, ast.Call)
+            and node.args
+            and _string_literal(node.args[0]) is not None
+            and (
+                (isinstance(node.func, ast.Name) and node.func.id == "__import__")
+                or (
+                    isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "import_module"
+                )
+            )
+        ):
+            names.add(_string_literal(node.args[0]))
+
+    # Importing a module imports all its parent packages.
+    modules = set()
+    for name in names:
+        parts = name.split(".")
+        modules.update(".".join(parts[: index + 1]) for index in range(len(parts)))
+    return modules
+
+
+def compiled_imports(path):
+    """Find the modules that are imported by a compiled bytecode file.
+
+    This allows the imports of a package that has been installed without
+    its source (e.g., by compiling it to sourceless bytecode) to be found.
+    Only absolute import statements are found.
+
+    :param path: The bytecode (``.pyc``) file.
+    :returns: A set of absolute dotted module names, as for
+        ``imported_modules()``. If the file can't be read, or was compiled by
+        a different version of Python, the set is empty.
+    """
+    try:
+        content = Path(path).read_bytes()
+    except OSError:
+        return set()
+    if content[:4] != importlib.util.MAGIC_NUMBER:
+        return set()
+    try:
+        code = marshal.loads(content[16:])
+    except (EOFError, ValueError, TypeError):
+        return set()
+
+    names = set()
+    pending = [code]
+    while pending:
+        code = pending.pop()
+        constants = []
+        module = None
+        for instruction in dis.get_instructions(code):
+            if instruction.opname in {"LOAD_CONST", "LOAD_SMALL_INT"}:
+                constants.append(instruction.argval)
+            elif instruction.opname == "IMPORT_NAME":
+                # An import is compiled as "LOAD_CONST <level>; LOAD_CONST
+                # <fromlist>; IMPORT_NAME <module>".
+                level = constants[-2] if len(constants) > 1 else 0
+                module = instruction.argval if level == 0 else None
+                if module:
+                    names.add(module)
+            elif instruction.opname == "IMPORT_FROM" and module:
+                names.add(f"{module}.{instruction.argval}")
+        pending.extend(
+            constant
+            for constant in code.co_consts
+            if isinstance(constant, types.CodeType)
+        )
+
+    modules = set()
+    for name in names:
+        parts = name.split(".")
+        modules.update(".".join(parts[: index + 1]) for index in range(len(parts)))
+    return modules
+
+
+def binary_imports(path, names):
+    """Find the modules that may be imported by a binary extension module.
+
+    Extension modules (e.g., modules compiled with Cython) import modules
+    from C, so their imports can't be found by inspecting source code; but
+    the names of the modules they import are embedded in the binary as
+    strings. This is a heuristic: it may find modules that aren't imported,
+    and it can't find modules whose names aren't stored as separate strings;
+    those modules must be listed in ``stdlib_keep``.
+
+    :param path: The extension module.
+    :param names: The top-level module names to look for.
+    :returns: The set of names that appear in the binary.
+    """
+    try:
+        content = Path(path).read_bytes()
+    except OSError:
+        return set()
+    return {name for name in names if b"\0" + name.encode() + b"\0" in content}
+
+
+def reachable_modules(stdlib, roots, keep=()):
+    """Determine the standard library modules that can be imported by an app.
+
+    :param stdlib: A dictionary of dotted module name->source file, describing
+        the standard library (see ``find_modules()``).
+    :param roots: A set of dotted module names that are imported by the app.
+    :param keep: A list of glob-style patterns of module names that must be
+        retained, along with any modules they import. A module that is kept
+        also keeps its submodules.
+    :returns: The set of reachable module names.
+    """
+
+    def kept(name):
+        parts = name.split(".")
+        return any(
+            fnmatch.fnmatchcase(".".join(parts[: index + 1]), pattern)
+            for index in range(len(parts))
+            for pattern in keep
+        )
+
+    pending = {name for name in roots if name in stdlib}
+    pending.update(name for name in stdlib if kept(name))
+
+    reachable = set()
+    while pending:
+        name = pending.pop()
+        if name in reachable:
+            continue
+        reachable.add(name)
+        # Importing a module imports all its parent packages.
+        parts = name.split(".")
+        pending.update(".".join(parts[:index]) for index in range(1, len(parts)))
+        pending.update(
+            imported
+            for imported in imported_modules(stdlib[name], module_name=name)
+            if imported in stdlib and imported not in reachable
+        )
+    return reachable
+
+
+def _size(path):
+    if path.is_dir() and not path.is_symlink():
+        return sum(_size(child) for child in path.iterdir())
+    return path.lstat().st_size
+
+
+def prune_stdlib(stdlib_path, source_paths, keep=()):
+    """Remove the standard library modules that can't be imported by an app.
+
+    Imports are found by inspecting the import statements of the app's code
+    (and the packages it uses), and then of every standard library module
+    that is imported, until no more modules are found. The imports of
+    sourceless bytecode in the app's code and packages are also found.
+    Modules that aren't imported are removed, along with their compiled
+    bytecode. A package is removed entirely (including any data files) if
+    none of its modules are imported. Binary extension modules are always
+    retained.
+
+    :param stdlib_path: The folder containing the standard library.
+    :param source_paths: The folders containing the app's code and packages.
+    :param keep: A list of glob-style patterns of module names that must be
+        retained, in addition to ``DEFAULT_KEEP``.
+    :returns: A ``(modules, size)`` tuple, describing the number of modules
+        that were removed, and the number of bytes that were freed.
+    """
+    stdlib_path = Path(stdlib_path)
+    stdlib = find_modules(stdlib_path)
+    top_level = {name for name in stdlib if "." not in name}
+
+    # Every source file of the app is considered, whether or not it is part
+    # of an importable package (e.g., a namespace package, or a script).
+    roots = set()
+    for source_path in source_paths:
+        for path in Path(source_path).rglob("*"):
+            if path.suffix == ".py":
+                roots.update(imported_modules(path))
+            elif path.suffix == ".pyc":
+                roots.update(compiled_imports(path))
+            elif path.suffix in EXTENSION_SUFFIXES:
+                roots.update(binary_imports(path, top_level))
+
+    reachable = reachable_modules(stdlib, roots, keep=DEFAULT_KEEP + list(keep))
+    unreachable = sorted(set(stdlib) - reachable)
+
+    # A package that has no reachable modules is removed as a whole
+    # (including any data files); otherwise, unreachable modules are removed
+    # individually.
+    packages = [
+        name
+        for name in unreachable
+        if stdlib[name].name == "__init__.py"
+        and not any(other.startswith(f"{name}.") for other in reachable)
+    ]
+
+    removed = []
+    for name in unreachable:
+        if any(name.startswith(f"{package}.") for package in packages):
+            # The module will be removed with its package.
+            continue
+        source = stdlib[name]
+        if name in packages:
+            removed.append(source.parent)
+        else:
+            removed.append(source)
+            removed.extend((source.parent / "__pycache__").glob(f"{source.stem}.*.pyc"))
+            # Sourceless bytecode, if the module has been compiled.
+            if source.with_suffix(".pyc").is_file():
+                removed.append(source.with_suffix(".pyc"))
+
+    size = 0
+    for path in removed:
+        size += _size(path)
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    return len(unreachable), size
@@ -0,0 +1,82 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Task:
+    """A unit of work that can be run once the tasks it depends on have
+    completed."""
+
+    def __init__(self, func, requires=(), after=()):
+        """
+        :param func: The callable that performs the task. It is called with
+            the results of the tasks it ``requires``, as keyword arguments
+            named after those tasks.
+        :param requires: The names of the tasks whose results are needed to
+            perform this task.
+        :param after: The names of tasks that must complete before this task
+            is started, but whose results aren't needed.
+        """
+        self.func = func
+        self.requires = tuple(requires)
+        self.after = tuple(after)
+
+    @property
+    def dependencies(self):
+        return self.requires + self.after
+
+
+def run_tasks(tasks, max_workers=None):
+    """Run a graph of tasks, concurrently where their dependencies allow.
+
+    Each task is started as soon as all the tasks it depends on have
+    completed. If a task fails, no more tasks are started; the tasks that are
+    already running are allowed to complete, and the first error is then
+    raised.
+
+    :param tasks: A dictionary of name->``Task``.
+    :param max_workers: (Optional) The maximum number of tasks that will be
+        run at the same time.
+    :returns: A dictionary of name->result, for every task.
+    """
+    for name, task in tasks.items():
+        unknown = sorted(set(task.dependencies) - tasks.keys())
+        if unknown:
+            raise ValueError(f"Task {name!r} depends on unknown task {unknown[0]!r}")
+
+    results = {}
+    pending = dict(tasks)
+    running = {}
+    error = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            if error is None:
+                for name, task in list(pending.items()):
+                    if all(dependency in results for dependency in task.dependencies):
+                        del pending[name]
+                        future = executor.submit(
+                            task.func,
+                            **{
+                                requirement: results[requirement]
+                                for requirement in task.requires
+                            },
+                        )
+                        running[future] = name
+
+            if not running:
+                if error is not None:
+                    break
+                raise ValueError(
+                    f"Tasks have circular dependencies: {', '.join(sorted(pending))}"
+                )
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except BaseException as e:
+                    if error is None:
+                        error = e
+
+    if error is not None:
+        raise error
+    return results
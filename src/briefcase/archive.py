@@ -0,0 +1,398 @@
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import shutil
+import stat
+import sys
+import tarfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# The filename extensions of archives that can be unpacked as a stream.
+TAR_EXTENSIONS = (
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tbz2",
+    ".tar.xz",
+    ".txz",
+)
+
+# How long (in seconds) a reader will wait for more content to be written
+# before checking the file again.
+POLL_INTERVAL = 0.05
+
+
+def is_tar_archive(filename):
+    """Determine if a file is a tar archive, based on its filename.
+
+    :param filename: The filename to inspect.
+    :returns: True if the filename has the extension of a (possibly
+        compressed) tar archive.
+    """
+    return str(filename).lower().endswith(TAR_EXTENSIONS)
+
+
+def _tar_extract_kwargs():
+    # Python 3.12 added extraction filters to tarfile. Use the ``tar`` filter
+    # (which rejects absolute paths and members outside the destination) if
+    # it is available, so that extraction doesn't raise a deprecation warning.
+    if hasattr(tarfile, "tar_filter"):
+        return {"filter": "tar"}
+    return {}
+
+
+class MemberFilter:
+    """Select the members of an archive that should be unpacked.
+
+    Patterns are glob-style patterns (as used by ``fnmatch``), matched
+    against the path of a member inside the archive, using ``/`` as a
+    separator. A pattern that matches a folder also matches everything in
+    that folder; so ``Python/Resources/lib`` selects the entire standard
+    library, and ``*/test`` selects every ``test`` folder one level down.
+    """
+
+    def __init__(self, include=None, exclude=None):
+        """
+        :param include: (Optional) A list of patterns. If provided, only
+            members that match one of these patterns are unpacked.
+        :param exclude: (Optional) A list of patterns. Members that match any
+            of these patterns are never unpacked.
+        """
+        self.include = list(include) if include is not None else None
+        self.exclude = list(exclude) if exclude is not None else []
+
+    @property
+    def key(self):
+        """A short string that uniquely identifies the patterns of the
+        filter."""
+        patterns = json.dumps([self.include, self.exclude])
+        return hashlib.sha256(patterns.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _matches(name, patterns):
+        parts = name.split("/")
+        return any(
+            fnmatch.fnmatchcase("/".join(parts[: index + 1]), pattern.strip("/"))
+            for index in range(len(parts))
+            for pattern in patterns
+        )
+
+    def __call__(self, name):
+        """Determine if a member should be unpacked.
+
+        :param name: The path of the member inside the archive.
+        :returns: True if the member should be unpacked.
+        """
+        name = name.replace("\\", "/")
+        while name.startswith("./"):
+            name = name[2:]
+        name = name.strip("/")
+        if not name or name == ".":
+            return False
+        if self.include is not None and not self._matches(name, self.include):
+            return False
+        return not self._matches(name, self.exclude)
+
+
+def _zip_member_path(extract_dir, name):
+    """The path where a zip archive member should be written.
+
+    Follows the rules used by ``shutil.unpack_archive()``: members with an
+    absolute path, or a path containing ``..``, are skipped.
+
+    :returns: The path for the member, or ``None`` if it should be skipped.
+    """
+    if name.startswith("/") or ".." in name:
+        return None
+    return os.path.join(extract_dir, *name.split("/"))
+
+
+def _zip_member_mode(info):
+    """The permissions that should be applied to an unpacked zip member.
+
+    Permissions are only recorded by archives created on Unix; and only
+    permissions that make a file executable need to be restored (the
+    permissions of other files are determined by the user's umask).
+
+    :returns: The permission bits for the file, or ``None`` if the default
+        permissions should be retained.
+    """
+    mode = info.external_attr >> 16
+    if info.create_system == 3 and stat.S_ISREG(mode) and mode & 0o111:
+        return stat.S_IMODE(mode)
+    return None
+
+
+def unpack_zip(filename, extract_dir, members=None, max_workers=None):
+    """Unpack a zip archive, decompressing and writing members concurrently.
+
+    Decompression releases the GIL, so members are unpacked on a pool of
+    threads, each of which reads the archive through its own handle. The
+    folders for every member are created before any content is written.
+
+    Unlike ``shutil.unpack_archive()``, the executable permission bits of
+    members created on Unix are restored.
+
+    :param filename: The zip archive to unpack.
+    :param extract_dir: The folder into which the archive is unpacked.
+    :param members: (Optional) A ``MemberFilter`` selecting the members to
+        unpack. By default, every member is unpacked.
+    :param max_workers: (Optional) The maximum number of members that will be
+        unpacked at the same time. Defaults to the number of CPUs.
+    :raises shutil.ReadError: If the file isn't a zip archive.
+    """
+    extract_dir = os.fspath(extract_dir)
+    if not zipfile.is_zipfile(filename):
+        raise shutil.ReadError(f"{filename} is not a zip file")
+
+    with zipfile.ZipFile(filename) as archive:
+        infos = archive.infolist()
+
+    files = []
+    folders = {extract_dir}
+    for info in infos:
+        if members is not None and not members(info.filename):
+            continue
+        path = _zip_member_path(extract_dir, info.filename)
+        if path is None:
+            continue
+        if info.is_dir():
+            folders.add(path)
+        else:
+            folders.add(os.path.dirname(path))
+            files.append((info, path))
+
+    for folder in sorted(folders):
+        os.makedirs(folder, exist_ok=True)
+
+    handles = []
+    local = threading.local()
+
+    def unpack_member(info, path):
+        try:
+            handle = local.archive
+        except AttributeError:
+            handle = local.archive = zipfile.ZipFile(filename)
+            handles.append(handle)
+
+        with handle.open(info) as source, open(path, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+        mode = _zip_member_mode(info)
+        if mode is not None and sys.platform != "win32":
+            os.chmod(path, mode)
+
+    workers = max_workers or os.cpu_count() or 1
+    try:
+        if workers == 1:
+            for info, path in files:
+                unpack_member(info, path)
+        else:
+            # Start with the largest members, so that one large member doesn't
+            # delay the completion of the archive.
+            files.sort(key=lambda member: member[0].file_size, reverse=True)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [
+                    executor.submit(unpack_member, info, path) for info, path in files
+                ]:
+                    future.result()
+    except zipfile.BadZipFile as e:
+        raise shutil.ReadError(f"{filename} is not a valid zip file") from e
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def move_contents(source, target):
+    """Move the content of a folder into another folder.
+
+    Any file or folder in the target that has the same name as an item being
+    moved is replaced.
+
+    :param source: The folder whose content is moved.
+    :param target: The folder into which the content is moved. It will be
+        created if it doesn't exist.
+    """
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+    for path in Path(source).iterdir():
+        destination = target / path.name
+        if destination.is_dir() and not destination.is_symlink():
+            shutil.rmtree(destination)
+        elif destination.exists() or destination.is_symlink():
+            destination.unlink()
+        path.rename(destination)
+
+
+def unpack_archive(filename, extract_dir, members=None):
+    """Unpack an archive, optionally unpacking only some of its members.
+
+    Only the selected members are decompressed and written; the folders
+    that contain them are created as required.
+
+    :param filename: The archive to unpack.
+    :param extract_dir: The folder into which the archive is unpacked.
+    :param members: (Optional) A ``MemberFilter`` selecting the members to
+        unpack. If not provided, the entire archive is unpacked.
+    :raises shutil.ReadError: If the file isn't an archive that can be read.
+    """
+    if members is None:
+        if zipfile.is_zipfile(filename):
+            unpack_zip(filename, extract_dir)
+        else:
+            shutil.unpack_archive(filename, extract_dir=extract_dir)
+        return
+
+    Path(extract_dir).mkdir(parents=True, exist_ok=True)
+    if zipfile.is_zipfile(filename):
+        unpack_zip(filename, extract_dir, members=members)
+    else:
+        try:
+            with tarfile.open(filename) as archive:
+                archive.extractall(
+                    path=extract_dir,
+                    members=[member for member in archive if members(member.name)],
+                    **_tar_extract_kwargs(),
+                )
+        except tarfile.TarError as e:
+            raise shutil.ReadError(f"{filename} is not a valid archive") from e
+
+
+class GrowingFileReader(io.RawIOBase):
+    """A readable stream over a file that is still being written.
+
+    Reads block until content is available. Once the writer has finished,
+    the end of the file is reported as the end of the stream; if the writer
+    abandons the file, reads raise an error.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        self.position = 0
+        self.complete = threading.Event()
+        self.abandoned = threading.Event()
+        self._file = None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while True:
+            if self.abandoned.is_set():
+                raise OSError(f"Writing of {self.path.name} was abandoned")
+
+            # Check for completion *before* reading, so that content written
+            # between the read and the check isn't lost.
+            complete = self.complete.is_set()
+            if self._file is None:
+                try:
+                    self._file = self.path.open("rb")
+                except FileNotFoundError:
+                    if complete:
+                        raise
+                    self.abandoned.wait(POLL_INTERVAL)
+                    continue
+
+            # Always seek to the last known position; the writer may have
+            # truncated and rewritten the file.
+            self._file.seek(self.position)
+            count = self._file.readinto(buffer)
+            if count:
+                self.position += count
+                return count
+            elif complete:
+                return 0
+
+            self.abandoned.wait(POLL_INTERVAL)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+
+class StreamingTarExtractor:
+    """Unpack a tar archive while it is being downloaded.
+
+    The archive is read from the file it is being downloaded into, as the
+    content arrives; extraction is performed in a background thread, so
+    decompression overlaps with the download.
+    """
+
+    def __init__(self, extract_path, members=None):
+        """
+        :param extract_path: The folder into which the archive is unpacked.
+        :param members: (Optional) A ``MemberFilter`` selecting the members to
+            unpack. By default, the entire archive is unpacked.
+        """
+        self.extract_path = Path(extract_path)
+        self.members = members
+        self.reader = None
+        self.error = None
+        self._thread = None
+
+    @property
+    def started(self):
+        return self._thread is not None
+
+    def start(self, archive_path):
+        """Start unpacking an archive that is being written.
+
+        :param archive_path: The file into which the archive is being written.
+        """
+        self.reader = GrowingFileReader(archive_path)
+        self._thread = threading.Thread(target=self._extract, daemon=True)
+        self._thread.start()
+
+    def _extract(self):
+        try:
+            self.extract_path.mkdir(parents=True, exist_ok=True)
+            stream = io.BufferedReader(self.reader, buffer_size=1024 * 1024)
+            with tarfile.open(fileobj=stream, mode="r|*") as tar:
+                # A stream can only be read in order, so members are selected
+                # as they are reached.
+                tar.extractall(
+                    path=self.extract_path,
+                    members=(
+                        (member for member in tar if self.members(member.name))
+                        if self.members is not None
+                        else None
+                    ),
+                    **_tar_extract_kwargs(),
+                )
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.reader.close()
+
+    def finish(self, complete=True):
+        """Wait for extraction to finish.
+
+        :param complete: True if the archive was written in full; False if
+            writing was abandoned, in which case extraction is stopped.
+        """
+        if complete:
+            self.reader.complete.set()
+        else:
+            self.reader.abandoned.set()
+        self._thread.join()
+
+    def raise_for_error(self):
+        """Raise an error if the archive couldn't be unpacked.
+
+        Errors are raised in the same form as ``shutil.unpack_archive()``.
+        """
+        if isinstance(self.error, tarfile.TarError):
+            raise shutil.ReadError(
+                f"{self.reader.path.name} is not a valid tar archive"
+            ) from self.error
+        elif self.error is not None:
+            raise self.error
@@ -0,0 +1,193 @@
+import errno
+import os
+import shutil
+import sys
+import threading
+
+if sys.platform == "linux":
+    import fcntl
+
+    # The ioctl that makes one file share the storage of another
+    # (from linux/fs.h).
+    FICLONE = 0x40049409
+
+# Errors indicating that a filesystem (or a pair of filesystems) can't
+# perform a particular type of copy.
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+}
+
+# The pairs of devices (source, target) between which each type of copy is
+# known to be unsupported; once a copy has failed, it won't be attempted
+# again for files on the same devices.
+_unsupported = {"reflink": set(), "copy_file_range": set()}
+_unsupported_lock = threading.Lock()
+
+_clonefile = None
+
+
+def _devices(source, target):
+    return (os.stat(source).st_dev, os.stat(os.path.dirname(target) or ".").st_dev)
+
+
+def _supported(method, devices):
+    with _unsupported_lock:
+        return devices not in _unsupported[method]
+
+
+def _unsupported_by(method, devices):
+    with _unsupported_lock:
+        _unsupported[method].add(devices)
+
+
+def _macos_clonefile():
+    """Look up the ``clonefile()`` system call provided by macOS.
+
+    :returns: The ``clonefile`` function, or ``None`` if it isn't available.
+    """
+    global _clonefile
+    if _clonefile is None:
+        import ctypes
+
+        try:
+            _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+            _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+            _clonefile.restype = ctypes.c_int
+        except (AttributeError, OSError):
+            _clonefile = False
+    return _clonefile or None
+
+
+def _reflink(source, target):
+    """Make a copy of a file that shares storage with the original, using a
+    copy-on-write clone.
+
+    :returns: True if the file was cloned; False if the filesystem doesn't
+        support clones.
+    """
+    if sys.platform == "linux":
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return True
+        except OSError as e:
+            os.unlink(target)
+            if e.errno in UNSUPPORTED_ERRNOS:
+                return False
+            raise
+    elif sys.platform == "darwin":  # pragma: no cover
+        import ctypes
+
+        clonefile = _macos_clonefile()
+        if clonefile is None:
+            return False
+        if clonefile(os.fsencode(source), os.fsencode(target), 0) == 0:
+            return True
+        error = ctypes.get_errno()
+        if error in UNSUPPORTED_ERRNOS:
+            return False
+        raise OSError(error, os.strerror(error), os.fsdecode(target))
+    return False
+
+
+def _copy_file_range(source, target):
+    """Copy a file inside the kernel, without passing the content through
+    user space.
+
+    :returns: True if the file was copied; False if the filesystem doesn't
+        support in-kernel copies.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        return True
+    except OSError as e:
+        os.unlink(target)
+        if e.errno in UNSUPPORTED_ERRNOS:
+            return False
+        raise
+
+
+def clone_file(source, target):
+    """Copy a file, sharing storage with the original if possible.
+
+    A copy-on-write clone (a "reflink") is used if the filesystem supports
+    it; the clone doesn't use any additional storage until it is modified,
+    and modifying the clone doesn't modify the original. If a clone isn't
+    possible, the file is copied inside the kernel if possible, and by
+    reading and writing the content if not. The permissions and
+    modification time of the original are preserved.
+
+    Hard links are deliberately *not* used; a hard link is the same file as
+    the original, so modifying one (e.g., by signing a binary in an app
+    bundle) would modify the other.
+
+    :param source: The file to copy.
+    :param target: The path of the copy. Any existing file at this path is
+        replaced.
+    :returns: The path of the copy.
+    """
+    if os.path.lexists(target):
+        os.unlink(target)
+
+    devices = _devices(source, target)
+    for method, copy in [("reflink", _reflink), ("copy_file_range", _copy_file_range)]:
+        if _supported(method, devices):
+            if copy(source, target):
+                break
+            _unsupported_by(method, devices)
+    else:
+        shutil.copyfile(source, target)
+
+    shutil.copystat(source, target)
+    return target
+
+
+def clone_tree(source, target):
+    """Copy a directory tree, sharing storage with the original if possible.
+
+    Files are copied with ``clone_file()``; symbolic links are copied as
+    links. If the target already exists, the content of the source is merged
+    into it.
+
+    :param source: The directory to copy.
+    :param target: The path of the copy.
+    """
+    # TODO: Py3.7 compatibility; shutil.copytree(dirs_exist_ok=True) is
+    # available in Py3.8.
+    directories = []
+    for dirpath, dirnames, filenames in os.walk(source):
+        target_dir = os.path.normpath(
+            os.path.join(target, os.path.relpath(dirpath, source))
+        )
+        os.makedirs(target_dir, exist_ok=True)
+        directories.append((dirpath, target_dir))
+        for name in dirnames + filenames:
+            source_path = os.path.join(dirpath, name)
+            target_path = os.path.join(target_dir, name)
+            if os.path.islink(source_path):
+                # os.walk() doesn't descend into links to directories, so
+                # every link (to a file or a directory) is copied here.
+                if os.path.lexists(target_path):
+                    os.unlink(target_path)
+                os.symlink(os.readlink(source_path), target_path)
+            elif name in filenames:
+                clone_file(source_path, target_path)
+
+    # Copying content into a directory changes its modification time, so
+    # the metadata of directories is copied last, from the bottom up.
+    for source_dir, target_dir in reversed(directories):
+        shutil.copystat(source_dir, target_dir)
@@ -3,7 +3,13 @@ import sys
 from pathlib import Path
 
 from briefcase import __version__
-from briefcase.commands import DevCommand, NewCommand, UpgradeCommand
+from briefcase.commands import (
+    CacheCommand,
+    DevCommand,
+    FetchCommand,
+    NewCommand,
+    UpgradeCommand,
+)
 from briefcase.platforms import get_output_formats, get_platforms
 
 from .exceptions import (
@@ -45,6 +51,8 @@ def parse_cmdline(args):
             "new",
             "dev",
             "upgrade",
+            "cache",
+            "fetch",
             "create",
             "update",
             "build",
@@ -88,6 +96,14 @@ def parse_cmdline(args):
         command = UpgradeCommand(base_path=Path.cwd())
         options = command.parse_options(extra=extra)
         return command, options
+    elif options.command == "cache":
+        command = CacheCommand(base_path=Path.cwd())
+        options = command.parse_options(extra=extra)
+        return command, options
+    elif options.command == "fetch":
+        command = FetchCommand(base_path=Path.cwd())
+        options = command.parse_options(extra=extra)
+        return command, options
 
     parser.add_argument(
         "platform",
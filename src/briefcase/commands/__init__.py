@@ -1,6 +1,8 @@
 from .build import BuildCommand  # noqa
+from .cache import CacheCommand  # noqa
 from .create import CreateCommand  # noqa
 from .dev import DevCommand  # noqa
+from .fetch import FetchCommand  # noqa
 from .new import NewCommand  # noqa
 from .package import PackageCommand  # noqa
 from .publish import PublishCommand  # noqa
@@ -12,6 +12,7 @@ class BuildCommand(BaseCommand):
         parser.add_argument(
             "-u", "--update", action="store_true", help="Update the app before building"
         )
+        self.add_jobs_option(parser)
 
     def build_app(self, app: BaseConfig, **options):
         """Build an application.
@@ -44,14 +45,24 @@ class BuildCommand(BaseCommand):
         )
         return state
 
+    def prerequisite_commands(self):
+        """An app may need to be created or updated before it is built."""
+        return [self.create_command, self.update_command]
+
     def __call__(
-        self, app: Optional[BaseConfig] = None, update: bool = False, **options
+        self,
+        app: Optional[BaseConfig] = None,
+        update: bool = False,
+        jobs: int = 1,
+        **options,
     ):
         # Confirm all required tools are available
-        self.verify_tools()
+        self.verify_tools_once()
 
         if app:
             state = self._build_app(app, update=update, **options)
+        elif jobs != 1 and len(self.apps) > 1:
+            state = self.call_apps_concurrently(jobs, update=update, **options)
         else:
             state = None
             for app_name, app in sorted(self.apps.items()):
@@ -0,0 +1,247 @@
+import sys
+import time
+from datetime import datetime
+
+from briefcase.cache import format_size, parse_size
+from briefcase.exceptions import BriefcaseCommandError
+
+from .base import BaseCommand
+
+# The number of seconds in a day.
+DAY = 24 * 60 * 60
+
+
+class CacheCommand(BaseCommand):
+    cmd_line = "briefcase cache"
+    command = "cache"
+    output_format = None
+    description = "Manage the Briefcase download cache"
+
+    @property
+    def platform(self):
+        """The cache command always reports as the local platform."""
+        return {
+            "darwin": "macOS",
+            "linux": "linux",
+            "win32": "windows",
+        }[sys.platform]
+
+    def bundle_path(self, app):
+        """A placeholder; Cache command doesn't have a bundle path."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def binary_path(self, app):
+        """A placeholder; Cache command doesn't have a binary path."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def distribution_path(self, app, packaging_format):
+        """A placeholder; Cache command doesn't have a distribution path."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def add_options(self, parser):
+        parser.add_argument(
+            "action",
+            choices=["stats", "list", "prune", "gc"],
+            help=(
+                "The action to perform: show cache statistics (stats); list the "
+                "cached downloads (list); remove downloads that haven't been used "
+                "recently (prune); or remove the least recently used downloads until "
+                "the cache fits a size budget (gc)."
+            ),
+        )
+        parser.add_argument(
+            "--older-than",
+            dest="older_than",
+            type=int,
+            default=30,
+            metavar="DAYS",
+            help="prune: remove downloads that haven't been used for this many days (default: 30).",
+        )
+        parser.add_argument(
+            "--max-size",
+            dest="max_size",
+            metavar="SIZE",
+            help=(
+                "gc: the maximum size of the cache (e.g., 500M or 10G). Defaults to "
+                "the value of the BRIEFCASE_CACHE_MAX_SIZE environment variable."
+            ),
+        )
+
+    def stats(self):
+        """Describe the size and content of the download cache."""
+        entries = self.download_cache.entries()
+        in_use = [entry for entry in entries if self.cache_entry_in_use(entry)]
+        referenced = {entry["digest"] for entry in entries}
+        blobs = self.download_cache.blobs()
+        unreferenced = [blob for blob in blobs if blob.name not in referenced]
+
+        self.logger.info(f"Download cache: {self.download_cache.path}")
+        self.logger.info(f"  Cached downloads: {len(entries)}")
+        self.logger.info(
+            f"  Stored content: {format_size(self.download_cache.size())} "
+            f"in {len(blobs)} files"
+        )
+        self.logger.info(f"  Used by installed tools: {len(in_use)}")
+        if unreferenced:
+            self.logger.info(
+                f"  Unused content: "
+                f"{format_size(sum(blob.stat().st_size for blob in unreferenced))} "
+                f"in {len(unreferenced)} files"
+            )
+        unpacked = self.unpacked_archives.entries()
+        if unpacked:
+            self.logger.info(
+                f"  Unpacked archives: {len(unpacked)} "
+                f"({format_size(sum(entry['size'] for entry in unpacked))})"
+            )
+        dependencies = self.dependency_store.entries()
+        if dependencies:
+            self.logger.info(
+                f"  Installed dependencies: {len(dependencies)} "
+                f"({format_size(sum(entry['size'] for entry in dependencies))})"
+            )
+        distributions = self.distribution_store.entries()
+        if distributions:
+            self.logger.info(
+                f"  Installed distributions: {len(distributions)} "
+                f"({format_size(sum(entry['size'] for entry in distributions))})"
+            )
+        packages = self.package_index_cache.entries()
+        if packages:
+            self.logger.info(
+                f"  Cached package files: {len(packages)} "
+                f"({format_size(sum(entry['size'] for entry in packages))})"
+            )
+        wheels = self.wheelhouse.entries()
+        if wheels:
+            self.logger.info(
+                f"  Prefetched wheels: {len(wheels)} "
+                f"({format_size(sum(entry['size'] for entry in wheels))})"
+            )
+
+    def list_cache(self):
+        """List the content of the download cache, from the least to the most
+        recently used."""
+        entries = self.download_cache.entries()
+        if not entries:
+            self.logger.info("The download cache is empty.")
+            return
+
+        for entry in entries:
+            last_used = datetime.fromtimestamp(entry["last_used"]).strftime(
+                "%Y-%m-%d %H:%M"
+            )
+            in_use = " (in use)" if self.cache_entry_in_use(entry) else ""
+            self.logger.info(
+                f"{last_used}  {format_size(entry['size']):>10}  {entry['url']}{in_use}"
+            )
+
+    def prune(self, older_than):
+        """Remove content that hasn't been used recently.
+
+        :param older_than: The number of days since the content was last used.
+        """
+        if older_than < 0:
+            raise BriefcaseCommandError(
+                "--older-than must be a positive number of days."
+            )
+
+        self.report_evicted(
+            self.download_cache.prune(
+                time.time() - older_than * DAY,
+                keep=self.cache_entry_in_use,
+            )
+        )
+        self.remove_unused_unpacked_archives()
+
+        removed = self.dependency_store.prune(time.time() - older_than * DAY)
+        if removed:
+            self.logger.info(
+                f"Removed {len(removed)} sets of installed dependencies "
+                f"({format_size(sum(entry['size'] for entry in removed))})."
+            )
+        removed = self.distribution_store.prune(time.time() - older_than * DAY)
+        if removed:
+            self.logger.info(
+                f"Removed {len(removed)} installed distributions "
+                f"({format_size(sum(entry['size'] for entry in removed))})."
+            )
+        removed = self.package_index_cache.prune(time.time() - older_than * DAY)
+        if removed:
+            self.logger.info(
+                f"Removed {len(removed)} cached package files "
+                f"({format_size(sum(entry['size'] for entry in removed))})."
+            )
+        removed = self.wheelhouse.prune(time.time() - older_than * DAY)
+        if removed:
+            self.logger.info(
+                f"Removed {len(removed)} prefetched wheels "
+                f"({format_size(sum(entry['size'] for entry in removed))})."
+            )
+
+    def gc(self, max_size):
+        """Remove the least recently used content until the cache fits a size
+        budget.
+
+        :param max_size: The maximum size of the cache, as a human-readable
+            size, or ``None`` to use the budget set in the environment.
+        """
+        if max_size is None:
+            max_size = self.os.environ.get("BRIEFCASE_CACHE_MAX_SIZE")
+        if max_size is None:
+            raise BriefcaseCommandError(
+                "A maximum cache size must be provided with --max-size, or by setting "
+                "BRIEFCASE_CACHE_MAX_SIZE."
+            )
+
+        try:
+            max_size = parse_size(max_size)
+        except ValueError as e:
+            raise BriefcaseCommandError(
+                f"{max_size!r} is not a valid cache size (e.g., 500M or 10G)."
+            ) from e
+
+        self.report_evicted(
+            self.download_cache.gc(max_size, keep=self.cache_entry_in_use)
+        )
+        self.remove_unused_unpacked_archives()
+
+    def report_evicted(self, evicted):
+        """Report the content that was removed from the cache.
+
+        :param evicted: The list of removed cache entries.
+        """
+        if evicted:
+            for entry in evicted:
+                self.logger.info(f"Removed {entry['url']}")
+            self.logger.info(
+                f"Removed {len(evicted)} downloads from the cache; the cache is now "
+                f"{format_size(self.download_cache.size())}."
+            )
+        else:
+            self.logger.info(
+                f"Nothing to remove; the cache is "
+                f"{format_size(self.download_cache.size())}."
+            )
+
+    def remove_unused_unpacked_archives(self):
+        """Remove unpacked archives whose archive is no longer in the download
+        cache."""
+        removed = self.unpacked_archives.remove_unused(
+            {entry["digest"] for entry in self.download_cache.entries()}
+        )
+        if removed:
+            self.logger.info(
+                f"Removed {len(removed)} unpacked archives "
+                f"({format_size(sum(entry['size'] for entry in removed))})."
+            )
+
+    def __call__(self, action, older_than=30, max_size=None, **options):
+        if action == "stats":
+            self.stats()
+        elif action == "list":
+            self.list_cache()
+        elif action == "prune":
+            self.prune(older_than)
+        else:
+            self.gc(max_size)
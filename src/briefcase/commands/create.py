@@ -1,9 +1,11 @@
+import functools
 import hashlib
 import os
 import platform
 import shutil
 import subprocess
 import sys
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
 from typing import Optional
@@ -12,12 +14,32 @@ from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from cookiecutter import exceptions as cookiecutter_exceptions
 
 import briefcase
+from briefcase.archive import MemberFilter
+from briefcase.bytecode import compile_bytecode
+from briefcase.cache import file_sha256, format_size
+from briefcase.clone import clone_file, clone_tree
 from briefcase.config import BaseConfig
+from briefcase.distributions import (
+    canonical_name,
+    distribution_files,
+    installed_distributions,
+    merge_tree,
+    remove_distribution,
+)
 from briefcase.exceptions import (
     BriefcaseCommandError,
+    BriefcaseConfigError,
     MissingNetworkResourceError,
     NetworkFailure,
 )
+from briefcase.lockfile import (
+    has_url,
+    is_index_requirement,
+    requirement_line,
+    requirements_file,
+)
+from briefcase.stdlib import find_stdlib, prune_stdlib
+from briefcase.tasks import Task, run_tasks
 
 from .base import (
     BaseCommand,
@@ -119,6 +141,13 @@ def write_dist_info(app: BaseConfig, dist_info_path: Path):
 class CreateCommand(BaseCommand):
     command = "create"
 
+    # Glob patterns describing the members of the support package that are
+    # needed by apps of this type (see ``briefcase.archive.MemberFilter``).
+    # If an include list is defined, only members matching those patterns are
+    # unpacked; members matching an exclude pattern are never unpacked.
+    support_package_include = None
+    support_package_exclude = None
+
     def __init__(self, *args, **options):
         super().__init__(*args, **options)
         self._s3 = None
@@ -141,6 +170,18 @@ class CreateCommand(BaseCommand):
         """The URL of the support package to use for apps of this type."""
         return f"https://briefcase-support.org/python?{urlencode(self.support_package_url_query)}"
 
+    @property
+    def support_package_members(self):
+        """The ``MemberFilter`` that selects the members of the support
+        package that should be unpacked, or ``None`` if the entire support
+        package should be unpacked."""
+        if self.support_package_include is None and not self.support_package_exclude:
+            return None
+        return MemberFilter(
+            include=self.support_package_include,
+            exclude=self.support_package_exclude,
+        )
+
     def icon_targets(self, app: BaseConfig):
         """Obtain the dictionary of icon targets that the template requires.
 
@@ -248,69 +289,104 @@ class CreateCommand(BaseCommand):
             f"Using app template: {app.template}, branch {app.template_branch}"
         )
 
-        # Make sure we have an updated cookiecutter template,
-        # checked out to the right branch
-        cached_template = self.update_cookiecutter_cache(
-            template=app.template, branch=app.template_branch
-        )
+        # Another process may be using the same cached template; hold the
+        # lock on the cache until the template has been rolled out.
+        with self.template_cache_lock(app.template):
+            # Make sure we have an updated cookiecutter template,
+            # checked out to the right branch
+            cached_template = self.update_cookiecutter_cache(
+                template=app.template, branch=app.template_branch
+            )
 
-        # Construct a template context from the app configuration.
-        extra_context = app.__dict__.copy()
-        # Augment with some extra fields.
-        extra_context.update(
-            {
-                # Properties of the generating environment
-                "python_version": platform.python_version(),
-                # Transformations of explicit properties into useful forms
-                "module_name": app.module_name,
-                "package_name": app.package_name,
-                # Properties that are a function of the execution
-                "year": date.today().strftime("%Y"),
-                "month": date.today().strftime("%B"),
-            }
-        )
+            # Construct a template context from the app configuration.
+            extra_context = app.__dict__.copy()
+            # Augment with some extra fields.
+            extra_context.update(
+                {
+                    # Properties of the generating environment
+                    "python_version": platform.python_version(),
+                    # Transformations of explicit properties into useful forms
+                    "module_name": app.module_name,
+                    "package_name": app.package_name,
+                    # Properties that are a function of the execution
+                    "year": date.today().strftime("%Y"),
+                    "month": date.today().strftime("%B"),
+                }
+            )
 
-        # Add in any extra template context required by the output format.
-        extra_context.update(self.output_format_template_context(app))
+            # Add in any extra template context required by the output format.
+            extra_context.update(self.output_format_template_context(app))
 
-        try:
-            # Create the platform directory (if it doesn't already exist)
-            output_path = self.bundle_path(app).parent
-            output_path.mkdir(parents=True, exist_ok=True)
-            # Unroll the template
-            self.cookiecutter(
-                str(cached_template),
-                no_input=True,
-                output_dir=os.fsdecode(output_path),
-                checkout=app.template_branch,
-                extra_context=extra_context,
-            )
-        except subprocess.CalledProcessError as e:
-            # Computer is offline
-            # status code == 128 - certificate validation error.
-            raise NetworkFailure("clone template repository") from e
-        except cookiecutter_exceptions.RepositoryNotFound as e:
-            # Either the template path is invalid,
-            # or it isn't a cookiecutter template (i.e., no cookiecutter.json)
-            raise InvalidTemplateRepository(app.template) from e
-        except cookiecutter_exceptions.RepositoryCloneFailed as e:
-            # Branch does not exist for python version
-            raise TemplateUnsupportedVersion(app.template_branch) from e
-
-    def _unpack_support_package(self, support_file_path, support_path):
+            try:
+                # Create the platform directory (if it doesn't already exist)
+                output_path = self.bundle_path(app).parent
+                output_path.mkdir(parents=True, exist_ok=True)
+                # Unroll the template
+                self.cookiecutter(
+                    str(cached_template),
+                    no_input=True,
+                    output_dir=os.fsdecode(output_path),
+                    checkout=app.template_branch,
+                    extra_context=extra_context,
+                )
+            except subprocess.CalledProcessError as e:
+                # Computer is offline
+                # status code == 128 - certificate validation error.
+                raise NetworkFailure("clone template repository") from e
+            except cookiecutter_exceptions.RepositoryNotFound as e:
+                # Either the template path is invalid,
+                # or it isn't a cookiecutter template (i.e., no cookiecutter.json)
+                raise InvalidTemplateRepository(app.template) from e
+            except cookiecutter_exceptions.RepositoryCloneFailed as e:
+                # Branch does not exist for python version
+                raise TemplateUnsupportedVersion(app.template_branch) from e
+
+    def _unpack_support_package(
+        self,
+        support_file_path,
+        support_path,
+        digest=None,
+        staging_path=None,
+    ):
         """Unpack a support package into a specific location.
 
+        A support package is only unpacked once; the unpacked content is
+        retained in a store, keyed by the digest of the package, and copied
+        into place from the store. Only the members of the package selected
+        by ``support_package_members`` are unpacked.
+
         :param support_file_path: The path to the support file to be unpacked.
         :param support_path: The path where support files should unpacked.
+        :param digest: (Optional) The SHA256 hex digest of the support file,
+            if it is already known.
+        :param staging_path: (Optional) A staging folder of the unpacked
+            archive store into which the (selected members of the) support
+            file have already been unpacked.
         """
+        members = self.support_package_members
         try:
             with self.input.wait_bar("Unpacking support package..."):
+                if digest is None:
+                    digest = file_sha256(support_file_path)
+                if staging_path is not None:
+                    self.unpacked_archives.adopt(
+                        staging_path,
+                        digest,
+                        members=members,
+                    )
+                else:
+                    self.unpacked_archives.unpack(
+                        support_file_path,
+                        digest=digest,
+                        members=members,
+                    )
                 support_path.mkdir(parents=True, exist_ok=True)
-                self.shutil.unpack_archive(
-                    support_file_path,
-                    extract_dir=support_path,
+                self.unpacked_archives.materialize(
+                    digest,
+                    support_path,
+                    members=members,
                 )
-        except (shutil.ReadError, EOFError) as e:
+        except (shutil.ReadError, EOFError, FileNotFoundError) as e:
             raise InvalidSupportPackage(support_file_path) from e
 
     def install_app_support_package(self, app: BaseConfig):
@@ -323,10 +399,106 @@ class CreateCommand(BaseCommand):
         except KeyError:
             self.logger.info("No support package required.")
         else:
-            support_file_path = self._download_support_package(app)
-            self._unpack_support_package(support_file_path, support_path)
+            self._download_support_package(app, support_path)
+
+    def prune_app_stdlib(self, app: BaseConfig):
+        """Remove the standard library modules that can't be imported by the
+        app from the support package in the bundle.
+
+        This is only done if the app sets ``prune_stdlib``. The app's code
+        and dependencies must already be installed.
+
+        :param app: The config object for the app
+        """
+        if not getattr(app, "prune_stdlib", False):
+            return
+
+        try:
+            stdlib_path = find_stdlib(self.support_path(app))
+        except KeyError:
+            stdlib_path = None
+        if stdlib_path is None:
+            self.logger.warning(
+                "Support package doesn't contain an uncompiled standard library; "
+                "it can't be pruned."
+            )
+            return
+
+        try:
+            app_packages_path = self.app_packages_path(app)
+        except KeyError:
+            self.logger.warning(
+                "App dependencies aren't installed until the app is built; "
+                "the standard library can't be pruned."
+            )
+            return
+
+        with self.input.wait_bar("Analyzing imports..."):
+            modules, size = prune_stdlib(
+                stdlib_path,
+                [self.app_path(app), app_packages_path],
+                keep=getattr(app, "stdlib_keep", []),
+            )
+        self.logger.info(
+            f"Removed {modules} unused standard library modules ({format_size(size)})."
+        )
+
+    def compile_app_bytecode(self, app: BaseConfig):
+        """Compile the app's code, its dependencies, and the standard library
+        to bytecode, so that the app doesn't need to compile them when it is
+        started.
+
+        This is only done if the app sets ``precompile``. The app's code and
+        dependencies must already be installed.
+
+        :param app: The config object for the app
+        """
+        if not getattr(app, "precompile", False):
+            return
 
-    def _download_support_package(self, app):
+        optimize = getattr(app, "precompile_optimize", 0)
+        if optimize not in {0, 1, 2}:
+            raise BriefcaseConfigError(
+                f"precompile_optimize must be 0, 1 or 2 (not {optimize!r})."
+            )
+
+        paths = [self.app_path(app)]
+        try:
+            paths.append(self.app_packages_path(app))
+        except KeyError:
+            # Dependencies are installed when the app is built.
+            pass
+        try:
+            stdlib_path = find_stdlib(self.support_path(app))
+        except KeyError:
+            stdlib_path = None
+        if stdlib_path is not None:
+            paths.append(stdlib_path)
+
+        with self.input.wait_bar("Compiling..."):
+            compiled, failed = compile_bytecode(
+                paths,
+                optimize=optimize,
+                sourceless=getattr(app, "precompile_sourceless", False),
+            )
+        self.logger.info(f"Compiled {compiled} files to bytecode.")
+        if failed:
+            self.logger.info(
+                f"{failed} files couldn't be compiled; "
+                "they will be compiled when they are imported."
+            )
+
+    def _download_support_package(self, app, support_path=None):
+        """Obtain the support package for an app.
+
+        If the support package is unpacked, a downloaded support package
+        will be unpacked while it is being downloaded, if possible.
+
+        :param app: The config object for the app
+        :param support_path: (Optional) The path where support files should be
+            unpacked. If not provided, the support package isn't unpacked.
+        :returns: The path to the support package file.
+        """
         try:
             # Work out if the app defines a custom override for
             # the support package URL.
@@ -352,10 +524,14 @@ class CreateCommand(BaseCommand):
                     query.append(("revision", app.support_revision))
                     url_parts[3] = urlencode(query)
                     support_package_url = urlunsplit(url_parts)
+                    revalidate = False
 
                 except AttributeError:
-                    # No support revision specified.
+                    # No support revision specified. The most recent revision
+                    # may have changed since the package was last downloaded,
+                    # so any cached download must be revalidated.
                     self.logger.info("... using most recent revision")
+                    revalidate = True
 
                 if custom_support_package:
                     # If the support package is custom, cache it using a hash of
@@ -372,15 +548,56 @@ class CreateCommand(BaseCommand):
                 else:
                     download_path = self.data_path / "support"
 
+                # If the support package will need to be unpacked, and it
+                # hasn't been unpacked before, unpack it into the unpacked
+                # archive store as it is downloaded.
+                members = self.support_package_members
+                staging_path = None
+                if support_path is not None:
+                    digest = self.download_cache.digest(support_package_url)
+                    if digest is None or not self.unpacked_archives.contains(
+                        digest, members=members
+                    ):
+                        staging_path = self.unpacked_archives.staging_path()
+
                 # Download the support file, caching the result
                 # in the user's briefcase support cache directory.
-                return self.download_file(
-                    url=support_package_url,
-                    download_path=download_path,
-                    role="support package",
-                )
+                try:
+                    try:
+                        support_file_path = self.download_file(
+                            url=support_package_url,
+                            download_path=download_path,
+                            role="support package",
+                            revalidate=revalidate,
+                            extract_path=staging_path,
+                            extract_members=members,
+                        )
+                    except (shutil.ReadError, EOFError) as e:
+                        # Discard the download, so that it is downloaded again.
+                        self.download_cache.evict(support_package_url)
+                        raise InvalidSupportPackage(support_package_url) from e
+                except BaseException:
+                    if staging_path is not None:
+                        self.unpacked_archives.discard(staging_path)
+                    raise
+
+                if support_path is not None:
+                    try:
+                        self._unpack_support_package(
+                            support_file_path,
+                            support_path,
+                            digest=self.download_cache.digest(support_package_url),
+                            staging_path=staging_path,
+                        )
+                    except InvalidSupportPackage:
+                        self.download_cache.evict(support_package_url)
+                        raise
+                return support_file_path
             else:
-                return Path(support_package_url)
+                support_file_path = Path(support_package_url)
+                if support_path is not None:
+                    self._unpack_support_package(support_file_path, support_path)
+                return support_file_path
         except MissingNetworkResourceError as e:
             # If there is a custom support package, report the missing resource as-is.
             if custom_support_package:
@@ -391,67 +608,530 @@ class CreateCommand(BaseCommand):
                     host_arch=self.host_arch,
                 ) from e
 
-    def _write_requirements_file(self, app: BaseConfig, requirements_path):
+    def _write_requirements_file(self, app: BaseConfig, requirements_path, wheels=()):
         """Configure application dependencies by writing a requirements.txt
         file.
 
         :param app: The app configuration
         :param requirements_path: The full path to a requirements.txt file that
             will be written.
+        :param wheels: (Optional) Wheels that have been prefetched for the
+            app's requirements. The wheels are copied into a ``wheels`` folder
+            next to the requirements file, which the requirements file refers
+            to with a relative path (pip resolves it relative to the
+            requirements file), so the bundle doesn't refer to the host's
+            wheelhouse.
         """
         # Windows allows both / and \ as a path separator in requirements.
         separators = [os.sep]
         if os.altsep:
             separators.append(os.altsep)
 
+        wheels_path = requirements_path.parent / "wheels"
+        if wheels_path.exists():
+            self.shutil.rmtree(wheels_path)
+        if wheels:
+            with self.input.wait_bar("Copying prefetched wheels..."):
+                wheels_path.mkdir(parents=True)
+                for wheel in wheels:
+                    clone_file(wheel, wheels_path / wheel.name)
+
         with self.input.wait_bar("Writing requirements file..."):
             with (requirements_path).open("w", encoding="utf-8") as f:
+                if wheels:
+                    f.write("--find-links wheels\n")
+                    if "--no-index" in self.wheelhouse_options:
+                        f.write("--no-index\n")
                 if app.requires:
                     for requirement in app.requires:
                         # If the requirement is a local path, convert it to
                         # absolute, because Flatpak moves the requirements file
                         # to a different place before using it.
                         if any(sep in requirement for sep in separators) and (
-                            not _has_url(requirement)
+                            not has_url(requirement)
                         ):
                             # We use os.path.abspath() rather than Path.resolve()
                             # because we *don't* want Path's symlink resolving behavior.
                             requirement = os.path.abspath(self.base_path / requirement)
                         f.write(f"{requirement}\n")
 
+    def app_dependencies_key(self, app: BaseConfig, locked=None):
+        """Compute the key that identifies the installed dependencies of an
+        app in the dependency store.
+
+        The key is computed from the app's requirements (or, if the app locks
+        its dependencies, the locked packages) and the environment in which
+        they are installed, so it can be computed without resolving the
+        requirements.
+
+        :param app: The app configuration
+        :param locked: The locked packages for the app's requirements, or
+            ``None`` if the app doesn't lock its dependencies.
+        :returns: The key of the app's dependencies, or ``None`` if the
+            dependencies can't be stored (e.g., because the requirements
+            refer to local paths, URLs or files, whose content may change
+            without the requirement changing).
+        """
+        if locked is not None:
+            requires = [requirement_line(package) for package in locked]
+        elif all(is_index_requirement(requirement) for requirement in app.requires):
+            requires = app.requires
+        else:
+            return None
+
+        return self.dependency_store.fingerprint(
+            requires,
+            **self.dependency_environment(app),
+        )
+
+    def dependency_environment(self, app: BaseConfig):
+        """Describe the environment in which app dependencies are installed.
+
+        Dependencies that were installed in one environment are only reused
+        in an identical environment. Output formats that install
+        dependencies in a different way (e.g., in a container) should extend
+        this description.
+
+        :param app: The app configuration
+        :returns: A dictionary describing the environment; the values must be
+            JSON-serializable.
+        """
+        return {
+            "python_version_tag": self.python_version_tag,
+            "platform": self.platform,
+            "output_format": self.output_format,
+            "host_os": self.host_os,
+            "host_arch": self.host_arch,
+            # pip's configuration can change the packages that are installed
+            # (e.g., by using a different package index).
+            "pip_environment": {
+                key: value
+                for key, value in self.os.environ.items()
+                if key.startswith("PIP_")
+            },
+        }
+
+    def wheel_platforms(self, app: BaseConfig):
+        """The platforms for which wheels are prefetched, if the app's
+        dependencies are installed by pip for a platform other than the host
+        (e.g., in a container).
+
+        If the app's dependencies are installed by a template's build system,
+        the wheels are copied into the bundle (see
+        ``_write_requirements_file()``).
+
+        :param app: The config object for the app
+        :returns: A list of wheel platform tags (e.g.,
+            ``manylinux2014_x86_64``). By default, no wheels are prefetched.
+        """
+        return []
+
+    def _download_wheels(self, platform_tag, requirements):
+        """Download the wheels for a platform into the wheelhouse.
+
+        :param platform_tag: The wheel platform tag.
+        :param requirements: The requirements whose wheels (and the wheels of
+            their dependencies) are downloaded.
+        :returns: The paths of the wheels in the wheelhouse for the
+            requirements (and their dependencies); or ``None`` if wheels
+            couldn't be downloaded for every requirement.
+        """
+        staging_path = self.wheelhouse.staging_path()
+        try:
+            self.subprocess.check_output(
+                [
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "download",
+                    "--only-binary=:all:",
+                    f"--platform={platform_tag}",
+                    f"--python-version={self.python_version_tag}",
+                    "--implementation=cp",
+                    f"--abi=cp{self.python_version_tag.replace('.', '')}",
+                    f"--dest={staging_path}",
+                    # Wheels that have already been downloaded are reused.
+                    f"--find-links={self.wheelhouse.path}",
+                ]
+                + (["--no-index"] if self.offline else self.pip_index_options())
+                + list(requirements),
+            )
+        except subprocess.CalledProcessError:
+            self.wheelhouse.discard(staging_path)
+            self.logger.warning(
+                f"Unable to prefetch wheels for {platform_tag}; "
+                "any missing wheels will be downloaded by the build."
+            )
+            return None
+
+        return self.wheelhouse.add(staging_path)
+
+    @contextmanager
+    def prefetched_wheels(self, app: BaseConfig):
+        """Prefetch the wheels for the platforms targeted by the app while the
+        app's dependencies are installed.
+
+        If the app prefetches wheels, the wheels for the app's requirements
+        are downloaded into the wheelhouse for each of the app's wheel
+        platforms (see ``wheel_platforms()``), in parallel. While the context
+        is active, pip is pointed at the wheelhouse (see
+        ``pip_index_options()``); if wheels were downloaded for every
+        requirement on every platform, the package index isn't used at all.
+
+        Only requirements that are installed from a package index are
+        prefetched.
+
+        :param app: The config object for the app
+        :returns: A context manager that yields the paths of the wheels that
+            were prefetched.
+        """
+        if (
+            not getattr(app, "prefetch_wheels", False)
+            or self.wheelhouse_options is not None
+        ):
+            yield []
+            return
+
+        platform_tags = getattr(app, "wheel_platforms", None)
+        if platform_tags is None:
+            platform_tags = self.wheel_platforms(app)
+        requires = app.requires or []
+        requirements = [
+            requirement for requirement in requires if is_index_requirement(requirement)
+        ]
+        if not (platform_tags and requirements):
+            yield []
+            return
+
+        self.logger.info(
+            f"Prefetching wheels for {', '.join(platform_tags)}...",
+            prefix=app.app_name,
+        )
+        with self.input.wait_bar("Downloading wheels..."):
+            complete = run_tasks(
+                {
+                    platform_tag: Task(
+                        functools.partial(
+                            self._download_wheels, platform_tag, requirements
+                        )
+                    )
+                    for platform_tag in platform_tags
+                }
+            )
+
+        self.wheelhouse_options = [f"--find-links={self.wheelhouse.path}"]
+        if all(wheels is not None for wheels in complete.values()) and len(
+            requirements
+        ) == len(requires):
+            self.wheelhouse_options.append("--no-index")
+        try:
+            yield sorted(
+                {wheel for wheels in complete.values() for wheel in wheels or []}
+            )
+        finally:
+            self.wheelhouse_options = None
+
+    def _pip_install(self, requirements, target, options=()):
+        """Install requirements with pip.
+
+        :param requirements: The requirements to install.
+        :param target: The full path of the folder into which the requirements
+            should be installed.
+        :param options: (Optional) Additional options for ``pip install``.
+        """
+        with self.input.wait_bar("Installing app dependencies..."):
+            try:
+                self.subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "pip",
+                        "install",
+                        "--upgrade",
+                        "--no-user",
+                        f"--target={target}",
+                    ]
+                    + self.pip_index_options()
+                    + list(options)
+                    + list(requirements),
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                raise DependencyInstallError() from e
+
+    def _pip_install_packages(self, packages, target, hashed=False):
+        """Install exact versions of packages with pip, without resolving
+        their dependencies.
+
+        :param packages: The packages to install, as dictionaries with a
+            ``name``, a ``version``, and a list of ``hashes``.
+        :param target: The full path of the folder into which the packages
+            should be installed.
+        :param hashed: If True, the packages are installed from a
+            requirements file, so that pip verifies the hashes of the
+            artefacts that are installed.
+        """
+        if hashed:
+            # The requirements file must be in the bundle, so that it is
+            # visible if dependencies are installed in a container.
+            with requirements_file(packages, Path(target).parent) as path:
+                self._pip_install(["-r", path], target, options=["--no-deps"])
+        else:
+            self._pip_install(
+                [f"{package['name']}=={package['version']}" for package in packages],
+                target,
+                options=["--no-deps"],
+            )
+
+    def distribution_key(self, app: BaseConfig, package):
+        """Compute the key that identifies an installed distribution in the
+        distribution store.
+
+        :param app: The app configuration
+        :param package: The package, as a dictionary with a ``name`` and a
+            ``version``.
+        :returns: The key of the installed distribution.
+        """
+        return self.distribution_store.fingerprint(
+            [f"{canonical_name(package['name'])}=={package['version']}"],
+            **self.dependency_environment(app),
+        )
+
+    def _store_distribution(self, key, path, dist_info_path):
+        """Add an installed distribution to the distribution store.
+
+        :param key: The key of the distribution.
+        :param path: The folder into which the distribution was installed.
+        :param dist_info_path: The ``.dist-info`` folder of the distribution.
+        """
+        files = distribution_files(path, dist_info_path)
+        if files is None:
+            # The files that belong to the distribution aren't known.
+            return
+        path = Path(path).absolute()
+
+        def populate(staging_path):
+            for file_path in files:
+                if file_path.is_file():
+                    target = staging_path / file_path.relative_to(path)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    clone_file(file_path, target)
+
+        try:
+            self.distribution_store.install(key, populate)
+        except OSError as e:
+            # The distribution has been installed; it just won't be reused.
+            self.logger.warning(f"Unable to store {dist_info_path.name} for reuse: {e}")
+
+    def _install_distributions(self, app: BaseConfig, packages, target, hashed=False):
+        """Install exact versions of packages, reusing distributions that
+        have previously been installed (for any app) in the same environment.
+
+        Distributions that are in the distribution store are copied from the
+        store; the others are installed with pip, and added to the store.
+
+        :param app: The app configuration
+        :param packages: The packages to install, as dictionaries with a
+            ``name``, a ``version``, and a list of ``hashes``.
+        :param target: The full path of the (empty) folder into which the
+            packages should be installed.
+        :param hashed: If True, pip verifies the hashes of the artefacts that
+            are installed.
+        :returns: A ``(reused, size)`` tuple, describing the number of
+            distributions that were copied from the store, and their size in
+            bytes.
+        """
+        keys = {
+            canonical_name(package["name"]): self.distribution_key(app, package)
+            for package in packages
+        }
+        stored = [
+            package
+            for package in packages
+            if self.distribution_store.contains(keys[canonical_name(package["name"])])
+        ]
+        pending = [package for package in packages if package not in stored]
+
+        # pip replaces any folder in the target that it installs into, so
+        # pip is run before any stored distributions are copied in.
+        if pending:
+            self._pip_install_packages(pending, target, hashed=hashed)
+            for name, (_, dist_info_path) in installed_distributions(target).items():
+                if name in keys:
+                    self._store_distribution(keys[name], target, dist_info_path)
+
+        size = 0
+        if stored:
+            with self.input.wait_bar("Copying installed distributions..."):
+                for package in stored:
+                    key = keys[canonical_name(package["name"])]
+                    self.distribution_store.materialize(key, target)
+                    size += self.distribution_store.size(key)
+        return len(stored), size
+
+    def _sync_app_dependencies(
+        self,
+        app: BaseConfig,
+        app_packages_path,
+        packages,
+        hashed=False,
+    ):
+        """Bring previously installed dependencies up to date with the app's
+        requirements.
+
+        The resolved (or locked) requirements are compared with the
+        distributions that are already installed;
+        distributions that are no longer needed (or whose version has
+        changed) are removed, and only distributions that aren't already
+        installed are installed. Distributions that have been installed for
+        other apps are copied from the distribution store.
+
+        :param app: The app configuration
+        :param app_packages_path: The full path of the app_packages folder.
+        :param packages: The packages that will be installed for the app's
+            requirements.
+        :param hashed: If True, the packages are locked, and their hashes
+            are verified when they are installed.
+        :returns: True if the dependencies were synchronized; False if they
+            must be reinstalled from scratch (e.g., because the installed
+            distributions can't be removed individually).
+        """
+        resolved = {canonical_name(package["name"]): package for package in packages}
+
+        installed = installed_distributions(app_packages_path)
+        if not installed and app_packages_path.is_dir():
+            # Nothing has been installed; discard anything else in the folder.
+            self.shutil.rmtree(app_packages_path)
+            self.os.mkdir(app_packages_path)
+
+        outdated = [
+            dist_info_path
+            for name, (version, dist_info_path) in installed.items()
+            if version is None
+            or name not in resolved
+            or resolved[name]["version"] != version
+        ]
+        missing = [
+            package
+            for name, package in sorted(resolved.items())
+            if name not in installed or installed[name][0] != package["version"]
+        ]
+
+        # Only remove anything if every outdated distribution can be removed.
+        if any(
+            distribution_files(app_packages_path, dist_info_path) is None
+            for dist_info_path in outdated
+        ):
+            return False
+        for dist_info_path in outdated:
+            remove_distribution(app_packages_path, dist_info_path)
+
+        reused = 0
+        if missing:
+            # Install into an empty folder, and then merge the result, so that
+            # folders shared with installed distributions (e.g., namespace
+            # packages) aren't replaced.
+            staging_path = app_packages_path.parent / f".{app_packages_path.name}-sync"
+            if staging_path.exists():
+                self.shutil.rmtree(staging_path)
+            staging_path.mkdir()
+            try:
+                reused, size = self._install_distributions(
+                    app,
+                    missing,
+                    staging_path,
+                    hashed=hashed,
+                )
+                merge_tree(staging_path, app_packages_path)
+            finally:
+                self.shutil.rmtree(staging_path)
+
+        if outdated or missing:
+            self.logger.info(
+                f"Removed {len(outdated)} and installed {len(missing)} dependencies."
+            )
+            if reused:
+                self.logger.info(
+                    f"Reused {reused} of {len(missing)} dependencies "
+                    f"({format_size(size)}) from previous installs."
+                )
+        else:
+            self.logger.info("Dependencies are up to date.")
+        return True
+
     def _install_app_dependencies(self, app: BaseConfig, app_packages_path):
         """Install dependencies for the app with pip.
 
+        If the same requirements have previously been installed (for any app)
+        in the same environment, the installed packages are copied from the
+        dependency store, without resolving the requirements. Otherwise, the
+        requirements are resolved to the exact packages that will be
+        installed, and the dependencies that are already installed in the app
+        are synchronized with them, reusing any distributions that have been
+        installed for other apps; if that isn't possible, the requirements are
+        installed with pip. The result is then added to the store.
+
+        If the app locks its dependencies, the packages recorded in the
+        project's lock file are used in place of the app's requirements, and
+        are never resolved.
+
         :param app: The app configuration
         :param app_packages_path: The full path of the app_packages folder into which
             dependencies should be installed.
         """
-        # Clear existing dependency directory
-        if app_packages_path.is_dir():
-            self.shutil.rmtree(app_packages_path)
-            self.os.mkdir(app_packages_path)
 
-        # Install dependencies
-        if app.requires:
-            with self.input.wait_bar("Installing app dependencies..."):
-                try:
-                    self.subprocess.run(
-                        [
-                            sys.executable,
-                            "-m",
-                            "pip",
-                            "install",
-                            "--upgrade",
-                            "--no-user",
-                            f"--target={app_packages_path}",
-                        ]
-                        + app.requires,
-                        check=True,
-                    )
-                except subprocess.CalledProcessError as e:
-                    raise DependencyInstallError() from e
-        else:
+        def clear_app_packages():
+            if app_packages_path.is_dir():
+                self.shutil.rmtree(app_packages_path)
+                self.os.mkdir(app_packages_path)
+
+        if not app.requires:
+            clear_app_packages()
             self.logger.info("No application dependencies.")
+            return
+
+        locked = self.locked_app_requirements(app)
+        key = self.app_dependencies_key(app, locked)
+        if key is not None and self.dependency_store.contains(key):
+            self.logger.info("Requirements haven't changed; reusing dependencies.")
+            clear_app_packages()
+            with self.input.wait_bar("Copying app dependencies..."):
+                self.dependency_store.materialize(key, app_packages_path)
+            return
+
+        # Dependencies can only be synchronized if they are installed from
+        # an index; they are always reinstalled if the dependency store is
+        # disabled.
+        packages = locked
+        if packages is None and key is not None and self.dependency_store.enabled:
+            with self.input.wait_bar("Resolving app dependencies..."):
+                packages = self.resolve_requirements(app.requires)
+        if not (
+            packages is not None
+            and self.dependency_store.enabled
+            and self._sync_app_dependencies(
+                app,
+                app_packages_path,
+                packages,
+                hashed=locked is not None,
+            )
+        ):
+            clear_app_packages()
+            if locked is None:
+                self._pip_install(app.requires, app_packages_path)
+            else:
+                self._pip_install_packages(locked, app_packages_path, hashed=True)
+
+        if key is not None:
+            try:
+                self.dependency_store.install(
+                    key,
+                    lambda staging_path: clone_tree(app_packages_path, staging_path),
+                )
+            except OSError as e:
+                # The dependencies have been installed; they just won't be
+                # reused.
+                self.logger.warning(f"Unable to store app dependencies for reuse: {e}")
 
     def install_app_dependencies(self, app: BaseConfig):
         """Handle dependencies for the app.
@@ -469,11 +1149,13 @@ class CreateCommand(BaseCommand):
         """
         try:
             path = self.app_requirements_path(app)
-            self._write_requirements_file(app, path)
+            with self.prefetched_wheels(app) as wheels:
+                self._write_requirements_file(app, path, wheels=wheels)
         except KeyError:
             try:
                 path = self.app_packages_path(app)
-                self._install_app_dependencies(app, path)
+                with self.package_index(app), self.prefetched_wheels(app):
+                    self._install_app_dependencies(app, path)
             except KeyError as e:
                 raise BriefcaseCommandError(
                     "Application path index file does not define "
@@ -644,6 +1326,9 @@ class CreateCommand(BaseCommand):
                     target=self.bundle_path(app) / target,
                 )
 
+    def add_options(self, parser):
+        self.add_jobs_option(parser)
+
     def create_app(self, app: BaseConfig, **options):
         """Create an application bundle.
 
@@ -681,6 +1366,14 @@ class CreateCommand(BaseCommand):
         self.logger.info("Installing application resources...", prefix=app.app_name)
         self.install_app_resources(app=app)
 
+        if getattr(app, "prune_stdlib", False):
+            self.logger.info("Pruning standard library...", prefix=app.app_name)
+            self.prune_app_stdlib(app=app)
+
+        if getattr(app, "precompile", False):
+            self.logger.info("Compiling bytecode...", prefix=app.app_name)
+            self.compile_app_bytecode(app=app)
+
         self.logger.info(
             f"Created {self.bundle_path(app).relative_to(self.base_path)}",
             prefix=app.app_name,
@@ -694,30 +1387,17 @@ class CreateCommand(BaseCommand):
         """
         self.git = self.integrations.git.verify_git_is_installed(self)
 
-    def __call__(self, app: Optional[BaseConfig] = None, **options):
+    def __call__(self, app: Optional[BaseConfig] = None, jobs: int = 1, **options):
         # Confirm all required tools are available
-        self.verify_tools()
+        self.verify_tools_once()
 
         if app:
             state = self.create_app(app, **options)
+        elif jobs != 1 and len(self.apps) > 1:
+            state = self.call_apps_concurrently(jobs, **options)
         else:
             state = None
             for app_name, app in sorted(self.apps.items()):
                 state = self.create_app(app, **full_options(state, options))
 
         return state
-
-
-# Detects any of the URL schemes supported by pip
-# (https://pip.pypa.io/en/stable/topics/vcs-support/).
-def _has_url(requirement):
-    return any(
-        f"{scheme}:" in requirement
-        for scheme in (
-            ["http", "https", "file", "ftp"]
-            + ["git+file", "git+https", "git+ssh", "git+http", "git+git", "git"]
-            + ["hg+file", "hg+http", "hg+https", "hg+ssh", "hg+static-http"]
-            + ["svn", "svn+svn", "svn+http", "svn+https", "svn+ssh"]
-            + ["bzr+http", "bzr+https", "bzr+ssh", "bzr+sftp", "bzr+ftp", "bzr+lp"]
-        )
-    )
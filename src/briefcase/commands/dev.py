@@ -6,6 +6,7 @@ from typing import Optional
 
 from briefcase.config import BaseConfig
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.lockfile import requirements_file
 
 from .base import BaseCommand
 from .create import DependencyInstallError, write_dist_info
@@ -57,27 +58,45 @@ class DevCommand(BaseCommand):
     def install_dev_dependencies(self, app: BaseConfig, **options):
         """Install the dependencies for the app devly.
 
+        If the app locks its dependencies, the packages recorded in the
+        project's lock file are installed, without resolving the app's
+        requirements.
+
         :param app: The config object for the app
         """
         if app.requires:
-            with self.input.wait_bar("Installing dev dependencies..."):
-                try:
-                    self.subprocess.run(
-                        [
-                            sys.executable,
-                            "-m",
-                            "pip",
-                            "install",
-                            "--upgrade",
-                        ]
-                        + app.requires,
-                        check=True,
-                    )
-                except subprocess.CalledProcessError as e:
-                    raise DependencyInstallError() from e
+            with self.package_index(app):
+                locked = self.locked_app_requirements(app)
+                with self.input.wait_bar("Installing dev dependencies..."):
+                    try:
+                        if locked is None:
+                            self._pip_install(app.requires)
+                        else:
+                            with requirements_file(locked) as path:
+                                self._pip_install(["--no-deps", "-r", path])
+                    except subprocess.CalledProcessError as e:
+                        raise DependencyInstallError() from e
         else:
             self.logger.info("No application dependencies.")
 
+    def _pip_install(self, args):
+        """Install requirements into the dev environment with pip.
+
+        :param args: The requirements (and options) to pass to ``pip install``.
+        """
+        self.subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--upgrade",
+            ]
+            + self.pip_index_options()
+            + list(args),
+            check=True,
+        )
+
     def run_dev_app(self, app: BaseConfig, env: dict, **options):
         """Run the app in the dev environment.
 
@@ -0,0 +1,319 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import List, Optional
+
+from cookiecutter.repository import is_repo_url
+
+from briefcase.exceptions import (
+    BriefcaseCommandError,
+    BriefcaseError,
+    InvalidFormatError,
+    NetworkFailure,
+    OfflineModeError,
+    UnsupportedCommandError,
+)
+from briefcase.platforms import get_output_formats, get_platforms
+
+from .base import BaseCommand, cookiecutter_cache_path
+
+# The default number of artifacts that will be fetched at the same time.
+DEFAULT_JOBS = 4
+
+
+class FetchCommand(BaseCommand):
+    cmd_line = "briefcase fetch"
+    command = "fetch"
+    output_format = None
+    description = "Download everything needed to build apps"
+
+    def __init__(self, *args, **options):
+        super().__init__(*args, **options)
+        self.config_filename = None
+
+    @property
+    def platform(self):
+        """The fetch command always reports as the local platform."""
+        return {
+            "darwin": "macOS",
+            "linux": "linux",
+            "win32": "windows",
+        }[sys.platform]
+
+    def bundle_path(self, app):
+        """A placeholder; Fetch command doesn't have a bundle path."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def binary_path(self, app):
+        """A placeholder; Fetch command doesn't have a binary path."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def distribution_path(self, app, packaging_format):
+        """A placeholder; Fetch command doesn't have a distribution path."""
+        raise NotImplementedError()  # pragma: no cover
+
+    def add_options(self, parser):
+        parser.add_argument(
+            "targets",
+            metavar="target",
+            nargs="*",
+            help=(
+                "The platform and output format to fetch for, as <platform> or "
+                "<platform>:<format> (e.g., android, or linux:appimage). If no target "
+                "is named, the default format for the current platform is used."
+            ),
+        )
+        parser.add_argument(
+            "-a",
+            "--app",
+            dest="app_names",
+            action="append",
+            metavar="APP",
+            help="The app to fetch for. Can be used more than once; by default, all apps are used.",
+        )
+        self.add_jobs_option(
+            parser,
+            default=DEFAULT_JOBS,
+            help="The number of artifacts to download at the same time",
+        )
+
+    def parse_config(self, filename):
+        # Each target is configured separately; retain the configuration
+        # file so that it can be parsed for each target.
+        super().parse_config(filename)
+        self.config_filename = filename
+
+    def verify_tools(self):
+        """Git is required to fetch app templates."""
+        self.git = self.integrations.git.verify_git_is_installed(self)
+
+    def target_command(self, target):
+        """Construct the create command for a target.
+
+        :param target: The target, as ``<platform>`` or
+            ``<platform>:<format>``.
+        :returns: A create command for the target's platform and output
+            format, configured with the project's apps.
+        """
+        platform, _, output_format = target.partition(":")
+
+        platforms = get_platforms()
+        platform = {name.lower(): name for name in platforms}.get(
+            platform.lower(), platform
+        )
+        try:
+            platform_module = platforms[platform]
+        except KeyError as e:
+            choices = ", ".join(sorted(platforms))
+            raise BriefcaseCommandError(
+                f"Invalid platform '{platform}'; (choose from: {choices})"
+            ) from e
+
+        output_formats = get_output_formats(platform)
+        if not output_format:
+            output_format = platform_module.DEFAULT_OUTPUT_FORMAT
+        output_format = {name.lower(): name for name in output_formats}.get(
+            output_format.lower(), output_format
+        )
+        try:
+            Command = output_formats[output_format].create
+        except KeyError as e:
+            raise InvalidFormatError(
+                requested=output_format,
+                choices=list(output_formats.keys()),
+            ) from e
+        except AttributeError as e:
+            raise UnsupportedCommandError(
+                platform=platform,
+                output_format=output_format,
+                command="create",
+            ) from e
+
+        command = Command(
+            base_path=self.base_path,
+            home_path=self.home_path,
+            data_path=self.data_path,
+        )
+        # Any format-specific options take their default values; the
+        # default options are shared with this command.
+        command.parse_options(extra=[])
+        BaseCommand.clone_options(command, self)
+        command.git = self.git
+        command.parse_config(self.config_filename)
+        return command
+
+    def artifacts(self, commands, app_names=None):
+        """Determine the artifacts that need to be fetched.
+
+        Artifacts that are needed by more than one app or target are only
+        fetched once.
+
+        :param commands: The create commands for the targets.
+        :param app_names: (Optional) The names of the apps to fetch for. By
+            default, all apps are used.
+        :returns: A list of ``(description, fetch)`` pairs, where ``fetch`` is
+            a callable that downloads the artifact.
+        """
+        fetches = {}
+        templates = {}
+        for command in commands:
+            if app_names:
+                unknown = sorted(set(app_names) - set(command.apps))
+                if unknown:
+                    raise BriefcaseCommandError(
+                        f"Unknown app {unknown[0]!r} (choose from: "
+                        f"{', '.join(sorted(command.apps))})."
+                    )
+                apps = {name: command.apps[name] for name in app_names}
+            else:
+                apps = command.apps
+
+            target = f"{command.platform} {command.output_format}"
+            for app_name, app in sorted(apps.items()):
+                if not app.supported:
+                    self.logger.info(
+                        f"{app_name} isn't supported on {command.platform}; skipping"
+                    )
+                    continue
+
+                template = app.template if app.template else command.app_template_url
+                branch = (
+                    app.template_branch
+                    if app.template_branch
+                    else command.python_version_tag
+                )
+                templates.setdefault(template, set()).add(branch)
+
+                support_package = (
+                    getattr(app, "support_package", command.support_package_url),
+                    getattr(app, "support_revision", None),
+                )
+                fetches.setdefault(
+                    ("support", support_package),
+                    (
+                        f"support package for {app_name} ({target})",
+                        partial(command._download_support_package, app),
+                    ),
+                )
+
+                for tool, kwargs in command.required_tools(app):
+                    description = tool.full_name
+                    if kwargs:
+                        description += f" ({', '.join(map(str, kwargs.values()))})"
+                    fetches.setdefault(
+                        (tool, tuple(sorted(kwargs.items()))),
+                        (description, partial(tool.fetch, command, **kwargs)),
+                    )
+
+        # All branches of a template share a single cached clone, so they
+        # must be fetched one after the other.
+        for template, branches in sorted(templates.items()):
+            fetches[("template", template)] = (
+                f"app template {template}",
+                partial(self.fetch_template, template, sorted(branches)),
+            )
+
+        return list(fetches.values())
+
+    def fetch_template(self, template, branches):
+        """Ensure that the cached copy of a template is up to date.
+
+        If the template is a repository that hasn't been cloned, it is cloned
+        into the location that cookiecutter uses as a cache.
+
+        :param template: The template URL or path.
+        :param branches: The branches of the template that will be used.
+        """
+        with self.template_cache_lock(template):
+            cached_template = cookiecutter_cache_path(template)
+            if is_repo_url(template) and not cached_template.exists():
+                if self.offline:
+                    raise OfflineModeError(url=template, role="app template")
+                self.logger.info(f"Cloning template {template}...")
+                try:
+                    self.git.Repo.clone_from(template, cached_template)
+                except self.git.exc.GitCommandError as e:
+                    raise NetworkFailure("clone template repository") from e
+
+            for branch in branches:
+                self.update_cookiecutter_cache(template=template, branch=branch)
+
+    def fetch(self, artifacts, jobs=DEFAULT_JOBS):
+        """Fetch artifacts concurrently.
+
+        :param artifacts: A list of ``(description, fetch)`` pairs.
+        :param jobs: The maximum number of artifacts to fetch at once; must
+            be at least 1.
+        :returns: A dictionary of description->error for each artifact that
+            couldn't be fetched.
+        """
+        failures = {}
+        # Progress bars can't be displayed for concurrent downloads.
+        with self.input.static_output():
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(fetch): description
+                    for description, fetch in artifacts
+                }
+                for future in as_completed(futures):
+                    description = futures[future]
+                    try:
+                        future.result()
+                    except BriefcaseError as e:
+                        failures[description] = e
+                    else:
+                        self.logger.info(f"Fetched {description}")
+        return failures
+
+    def __call__(
+        self,
+        targets: Optional[List[str]] = None,
+        app_names: Optional[List[str]] = None,
+        jobs=DEFAULT_JOBS,
+        **options,
+    ):
+        jobs = self.resolve_jobs(jobs)
+
+        self.verify_tools()
+
+        commands = [
+            self.target_command(target) for target in (targets or [self.platform])
+        ]
+        artifacts = self.artifacts(commands, app_names=app_names)
+
+        if self.offline:
+            # Nothing can be downloaded; but every artifact can be checked,
+            # so that everything that is missing is reported at once.
+            self.logger.info(
+                f"Checking {len(artifacts)} artifacts...", prefix=self.command
+            )
+        else:
+            self.logger.info(
+                f"Fetching {len(artifacts)} artifacts...", prefix=self.command
+            )
+        failures = self.fetch(artifacts, jobs=jobs)
+
+        # If the only failures are resources that haven't been downloaded,
+        # report all of them together.
+        if failures and all(
+            isinstance(error, OfflineModeError) for error in failures.values()
+        ):
+            raise OfflineModeError(
+                missing=[
+                    resource
+                    for _, error in sorted(failures.items())
+                    for resource in error.missing
+                ]
+            )
+
+        if failures:
+            for description, error in sorted(failures.items()):
+                self.logger.error()
+                self.logger.error(f"Unable to fetch {description}:")
+                self.logger.error(str(error))
+            raise BriefcaseCommandError(
+                f"Unable to fetch {len(failures)} of {len(artifacts)} artifacts."
+            )
+
+        self.logger.info()
+        self.logger.info(f"Fetched {len(artifacts)} artifacts.", prefix=self.command)
@@ -485,33 +485,36 @@ What GUI toolkit do you want to use for this project?""",
         self.logger.info()
         self.logger.info(f"Generating a new application '{context['formal_name']}'")
 
-        cached_template = self.update_cookiecutter_cache(
-            template=template, branch="v0.3"
-        )
-
-        # Make extra sure we won't clobber an existing application.
-        if (self.base_path / context["app_name"]).exists():
-            raise BriefcaseCommandError(
-                f"A directory named '{context['app_name']}' already exists."
+        # Another process may be using the same cached template; hold the
+        # lock on the cache until the template has been rolled out.
+        with self.template_cache_lock(template):
+            cached_template = self.update_cookiecutter_cache(
+                template=template, branch="v0.3"
             )
 
-        try:
-            # Unroll the new app template
-            self.cookiecutter(
-                str(cached_template),
-                no_input=True,
-                output_dir=os.fsdecode(self.base_path),
-                checkout="v0.3",
-                extra_context=context,
-            )
-        except subprocess.CalledProcessError as e:
-            # Computer is offline
-            # status code == 128 - certificate validation error.
-            raise NetworkFailure("clone template repository") from e
-        except cookiecutter_exceptions.RepositoryNotFound as e:
-            # Either the template path is invalid,
-            # or it isn't a cookiecutter template (i.e., no cookiecutter.json)
-            raise InvalidTemplateRepository(template) from e
+            # Make extra sure we won't clobber an existing application.
+            if (self.base_path / context["app_name"]).exists():
+                raise BriefcaseCommandError(
+                    f"A directory named '{context['app_name']}' already exists."
+                )
+
+            try:
+                # Unroll the new app template
+                self.cookiecutter(
+                    str(cached_template),
+                    no_input=True,
+                    output_dir=os.fsdecode(self.base_path),
+                    checkout="v0.3",
+                    extra_context=context,
+                )
+            except subprocess.CalledProcessError as e:
+                # Computer is offline
+                # status code == 128 - certificate validation error.
+                raise NetworkFailure("clone template repository") from e
+            except cookiecutter_exceptions.RepositoryNotFound as e:
+                # Either the template path is invalid,
+                # or it isn't a cookiecutter template (i.e., no cookiecutter.json)
+                raise InvalidTemplateRepository(template) from e
 
         self.logger.info(
             f"""
@@ -62,6 +62,7 @@ class PackageCommand(BaseCommand):
         parser.add_argument(
             "-u", "--update", action="store_true", help="Update the app before building"
         )
+        self.add_jobs_option(parser)
         parser.add_argument(
             "-p",
             "--packaging-format",
@@ -92,14 +93,25 @@ class PackageCommand(BaseCommand):
             required=False,
         )
 
+    def prerequisite_commands(self):
+        """An app may need to be created, updated or built before it is
+        packaged."""
+        return [self.create_command, self.update_command, self.build_command]
+
     def __call__(
-        self, app: Optional[BaseConfig] = None, update: bool = False, **options
+        self,
+        app: Optional[BaseConfig] = None,
+        update: bool = False,
+        jobs: int = 1,
+        **options,
     ):
         # Confirm all required tools are available
-        self.verify_tools()
+        self.verify_tools_once()
 
         if app:
             state = self._package_app(app, update=update, **options)
+        elif jobs != 1 and len(self.apps) > 1:
+            state = self.call_apps_concurrently(jobs, update=update, **options)
         else:
             state = None
             for app_name, app in sorted(self.apps.items()):
@@ -22,6 +22,7 @@ class UpdateCommand(CreateCommand):
             action="store_true",
             help="Update app resources (icons, splash screens, etc)",
         )
+        self.add_jobs_option(parser)
 
     def update_app(
         self,
@@ -57,6 +58,17 @@ class UpdateCommand(CreateCommand):
             )
             self.install_app_resources(app=app)
 
+        if getattr(app, "prune_stdlib", False):
+            # The updated code may import modules that were pruned, so the
+            # standard library is restored before it is pruned again.
+            self.logger.info("Pruning standard library...", prefix=app.app_name)
+            self.install_app_support_package(app=app)
+            self.prune_app_stdlib(app=app)
+
+        if getattr(app, "precompile", False):
+            self.logger.info("Compiling bytecode...", prefix=app.app_name)
+            self.compile_app_bytecode(app=app)
+
         self.logger.info("Application updated.", prefix=app.app_name)
 
     def __call__(
@@ -64,10 +76,11 @@ class UpdateCommand(CreateCommand):
         app: Optional[BaseConfig] = None,
         update_dependencies: bool = False,
         update_resources: bool = False,
+        jobs: int = 1,
         **options,
     ):
         # Confirm all required tools are available
-        self.verify_tools()
+        self.verify_tools_once()
 
         if app:
             state = self.update_app(
@@ -76,6 +89,13 @@ class UpdateCommand(CreateCommand):
                 update_resources=update_resources,
                 **options,
             )
+        elif jobs != 1 and len(self.apps) > 1:
+            state = self.call_apps_concurrently(
+                jobs,
+                update_dependencies=update_dependencies,
+                update_resources=update_resources,
+                **options,
+            )
         else:
             state = None
             for app_name, app in sorted(self.apps.items()):
@@ -4,6 +4,7 @@ import os
 import platform
 import re
 import sys
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -13,10 +14,12 @@ from rich.highlighter import RegexHighlighter
 from rich.markup import escape
 from rich.progress import (
     BarColumn,
+    DownloadColumn,
     Progress,
     SpinnerColumn,
     TextColumn,
     TimeRemainingColumn,
+    TransferSpeedColumn,
 )
 from rich.traceback import Traceback
 
@@ -78,6 +81,9 @@ class Printer:
         soft_wrap=True,
     )
 
+    # The label applied to the output of each thread.
+    _context = threading.local()
+
     @classmethod
     def __call__(cls, *messages, stack_offset=5, show=True, **kwargs):
         """Entry point for all printing to the console and the log.
@@ -93,10 +99,39 @@ class Printer:
             the filename to put in the right column of the Rich log.
             Defaults to 5 since most uses are 5 levels deep from the actual logging.
         """
+        label = getattr(cls._context, "label", None)
+        if label and messages and all(isinstance(m, str) for m in messages):
+            if kwargs.get("markup"):
+                prefix = f"[dim]\\[{escape(label)}][/dim] "
+            else:
+                prefix = f"[{label}] "
+            messages = (prefix + messages[0],) + messages[1:]
+
         if show:
             cls.to_console(*messages, **kwargs)
         cls.to_log(*messages, stack_offset=stack_offset, **kwargs)
 
+    @classmethod
+    @contextlib.contextmanager
+    def labelled(cls, label):
+        """Label everything that is printed by the current thread as a
+        context manager.
+
+        :param label: The label to prepend to each message (e.g., the name of
+            the app that is being processed); or ``None`` for no label.
+        """
+        previous = getattr(cls._context, "label", None)
+        cls._context.label = label
+        try:
+            yield
+        finally:
+            cls._context.label = previous
+
+    @classmethod
+    def current_label(cls):
+        """The label applied to messages printed by the current thread."""
+        return getattr(cls._context, "label", None)
+
     @classmethod
     def to_console(cls, *renderables, **kwargs):
         """Specialized print to the console only omitting the log."""
@@ -159,6 +194,10 @@ class Log:
             if prefix:
                 # insert vertical space before for all messages with a prefix
                 self.print(show=show)
+                if prefix == self.label:
+                    # The output is already labelled with the prefix.
+                    prefix = ""
+            if prefix:
                 if not markup:
                     preface, prefix, message = (
                         escape(text) for text in (preface, prefix, message)
@@ -196,6 +235,23 @@ class Log:
         """Log message at error level; always included in output."""
         self._log(prefix=prefix, message=message, markup=markup, style="bold red")
 
+    def labelled(self, label):
+        """Label all output from the current thread as a context manager.
+
+        This allows the output of tasks that are performed concurrently (e.g.,
+        processing several apps at once) to be distinguished.
+
+        :param label: The label to prepend to each line of output; or
+            ``None`` for no label.
+        """
+        return self.print.labelled(label)
+
+    @property
+    def label(self):
+        """The label applied to the output of the current thread; ``None`` if
+        output isn't labelled."""
+        return self.print.current_label()
+
     def capture_stacktrace(self):
         """Preserve Rich stacktrace from exception while in except block."""
         self.stacktrace = Traceback.extract(*sys.exc_info(), show_locals=True)
@@ -307,6 +363,8 @@ class Console:
         # Therefore, all output must be printed to the screen by Rich to
         # prevent corruption of dynamic elements like the Wait Bar.
         self.is_output_controlled = False
+        # Dynamic elements are disabled while tasks are run concurrently.
+        self._static = False
 
     def prompt(self, *values, markup=False, **kwargs):
         """Print to the screen for soliciting user interaction.
@@ -327,8 +385,42 @@ class Console:
             TextColumn("•", style="default"),
             TimeRemainingColumn(compact=True, elapsed_when_finished=True),
             console=self.print.console,
+            disable=self._static,
+        )
+
+    def transfer_bar(self):
+        """Returns a progress bar for a transfer of unknown size as a context
+        manager.
+
+        Tasks should be added with a total of ``None``; the bar pulses, and
+        the amount of data transferred and the transfer rate are displayed.
+        """
+        return Progress(
+            TextColumn("  "),
+            SpinnerColumn("line", speed=1.5, style="default"),
+            BarColumn(bar_width=50),
+            DownloadColumn(),
+            TextColumn("•", style="default"),
+            TransferSpeedColumn(),
+            console=self.print.console,
+            disable=self._static,
         )
 
+    @contextlib.contextmanager
+    def static_output(self):
+        """Disable dynamic output as a context manager.
+
+        Rich can only display one dynamic element at a time; while tasks are
+        being performed concurrently, progress bars aren't displayed, and Wait
+        Bars only output their messages once they are complete.
+        """
+        static = self._static
+        self._static = True
+        try:
+            yield
+        finally:
+            self._static = static
+
     @contextlib.contextmanager
     def wait_bar(
         self,
@@ -351,6 +443,18 @@ class Console:
         :param markup: whether to interpret Rich styling markup in the message; if True,
             the message must already be escaped; defaults False.
         """
+        if self._static:
+            try:
+                yield
+            except BaseException:
+                if message and not transient:
+                    self.print(message, markup=markup)
+                raise
+            else:
+                if message and not transient:
+                    self.print(f"{message} {done_message}", markup=markup)
+            return
+
         if self._wait_bar is None:
             self._wait_bar = Progress(
                 TextColumn("    "),
@@ -99,6 +99,55 @@ class BadNetworkResourceError(BriefcaseCommandError):
         super().__init__(msg=f"Unable to download {url} (status code {status_code})")
 
 
+class OfflineModeError(BriefcaseCommandError):
+    def __init__(self, url=None, role=None, missing=None):
+        """
+        :param url: The URL of the resource that hasn't been downloaded.
+        :param role: (Optional) A description of the resource.
+        :param missing: (Optional) A list of ``(url, role)`` pairs, if more
+            than one resource hasn't been downloaded; used instead of ``url``
+            and ``role``.
+        """
+        self.missing = missing if missing else [(url, role)]
+        self.url, self.role = self.missing[0]
+        if len(self.missing) == 1:
+            msg = f"""\
+Unable to obtain {self.role if self.role else self.url} in offline mode.
+
+The following resource has not been downloaded:
+
+    {self.url}
+
+Re-run Briefcase without --offline to download it.
+"""
+        else:
+            resources = "\n".join(
+                f"    {url} ({role})" if role else f"    {url}"
+                for url, role in self.missing
+            )
+            msg = f"""\
+Unable to obtain {len(self.missing)} resources in offline mode.
+
+The following resources have not been downloaded:
+
+{resources}
+
+Re-run Briefcase without --offline to download them.
+"""
+        super().__init__(msg=msg)
+
+
+class CorruptNetworkResourceError(BriefcaseCommandError):
+    def __init__(self, url, expected, actual):
+        self.url = url
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            msg=f"Downloaded content of {url} is corrupted "
+            f"(expected SHA256 {expected}, got {actual})"
+        )
+
+
 class MissingToolError(BriefcaseCommandError):
     def __init__(self, tool):
         self.tool = tool
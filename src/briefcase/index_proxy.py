@@ -0,0 +1,299 @@
+import os
+import re
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from html import escape
+from html.parser import HTMLParser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urldefrag, urljoin, urlparse
+
+from briefcase.distributions import canonical_name
+from briefcase.network import NETWORK_ERRORS
+
+# The package index that is used if pip hasn't been configured to use
+# another index.
+DEFAULT_INDEX_URL = "https://pypi.org/simple/"
+
+# The address on which the proxy listens. The proxy is only available to
+# processes on the same machine.
+LOCALHOST = "127.0.0.1"
+
+# The attributes of links on a project page that are passed on to pip:
+# the Python versions supported by a file (PEP 503), whether the file has
+# been yanked (PEP 592), and whether the file's metadata is available
+# separately (PEP 658 and PEP 714).
+LINK_ATTRIBUTES = {
+    "data-requires-python",
+    "data-yanked",
+    "data-dist-info-metadata",
+    "data-core-metadata",
+}
+
+# The attributes that describe a file's separately available metadata.
+METADATA_ATTRIBUTES = ["data-core-metadata", "data-dist-info-metadata"]
+
+# Project names and filenames that can be requested from the proxy.
+VALID_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._+!-]*")
+
+
+class _LinkParser(HTMLParser):
+    """Extract the links from a project page (PEP 503)."""
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "base" and attrs.get("href"):
+            self.url = urljoin(self.url, attrs["href"])
+        elif tag == "a" and attrs.get("href"):
+            url, fragment = urldefrag(urljoin(self.url, attrs["href"]))
+            filename = unquote(urlparse(url).path.rsplit("/", 1)[-1])
+            if VALID_NAME.fullmatch(filename):
+                self.links.append(
+                    {
+                        "filename": filename,
+                        "url": url,
+                        "fragment": fragment,
+                        "attributes": {
+                            name: value
+                            for name, value in attrs.items()
+                            if name in LINK_ATTRIBUTES
+                        },
+                    }
+                )
+
+
+def parse_project_page(content, url):
+    """Extract the links to the files of a project from a project page.
+
+    :param content: The HTML content of the page.
+    :param url: The URL of the page; relative links are resolved against it.
+    :returns: A list of links, as dictionaries with the ``filename``, the
+        absolute ``url`` of the file (without a fragment), the ``fragment``
+        of the link (usually a digest of the file, as
+        ``<algorithm>=<digest>``), and any ``attributes`` of the link that
+        are relevant to pip.
+    """
+    parser = _LinkParser(url)
+    parser.feed(content)
+    parser.close()
+    return parser.links
+
+
+def render_project_page(project, links):
+    """Render a project page whose links refer to files served by the proxy.
+
+    :param project: The canonical name of the project.
+    :param links: The links on the upstream project page.
+    :returns: The HTML content of the page.
+    """
+    lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        f"<head><title>Links for {escape(project)}</title></head>",
+        "<body>",
+        f"<h1>Links for {escape(project)}</h1>",
+    ]
+    for link in links:
+        href = f"/files/{project}/{quote(link['filename'])}"
+        if link["fragment"]:
+            href = f"{href}#{link['fragment']}"
+        attributes = "".join(
+            f" {name}" if value is None else f' {name}="{escape(value)}"'
+            for name, value in sorted(link["attributes"].items())
+        )
+        lines.append(
+            f'<a href="{escape(href)}"{attributes}>{escape(link["filename"])}</a><br>'
+        )
+    lines.extend(["</body>", "</html>", ""])
+    return "\n".join(lines)
+
+
+class IndexProxy:
+    """A local package index that serves the project pages and files of an
+    upstream index from a ``PackageIndexCache``.
+
+    Project pages are requested from the upstream index whenever they are
+    requested from the proxy, so that new releases are visible; if the
+    upstream index can't be reached, the recorded page is served instead.
+    Files are only downloaded from the upstream index the first time they
+    are requested. In offline mode, the upstream index is never contacted.
+    """
+
+    def __init__(self, cache, get, upstream=DEFAULT_INDEX_URL, offline=False):
+        """
+        :param cache: The ``PackageIndexCache`` that stores pages and files.
+        :param get: A function that accepts a URL (and an optional
+            dictionary of ``headers``), and returns a streaming response for
+            the URL.
+        :param upstream: The URL of the upstream index's simple API.
+        :param offline: If True, only cached pages and files are served.
+        """
+        self.cache = cache
+        self.get = get
+        self.upstream = upstream if upstream.endswith("/") else f"{upstream}/"
+        self.offline = offline
+
+    @contextmanager
+    def serve(self):
+        """Serve the index on a free port while the context is active.
+
+        :returns: A context manager that yields the URL of the proxy's simple
+            API, suitable for use as pip's ``--index-url``.
+        """
+        server = _IndexProxyServer((LOCALHOST, 0), _IndexProxyHandler)
+        server.proxy = self
+        thread = threading.Thread(
+            name="package index proxy",
+            target=server.serve_forever,
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield f"http://{LOCALHOST}:{server.server_address[1]}/simple/"
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def project_links(self, project):
+        """Determine the links on a project's page.
+
+        :param project: The canonical name of the project.
+        :returns: The list of links; or ``None`` if the project doesn't exist
+            (or, if the upstream index can't be reached, its page hasn't been
+            recorded).
+        """
+        if not self.offline:
+            try:
+                response = self.get(
+                    urljoin(self.upstream, f"{project}/"),
+                    headers={"Accept": "text/html"},
+                )
+            except NETWORK_ERRORS:
+                response = None
+
+            if response is not None:
+                try:
+                    if response.status_code == 200:
+                        links = parse_project_page(response.text, response.url)
+                        self.cache.save_page(project, links)
+                        return links
+                    elif response.status_code == 404:
+                        return None
+                finally:
+                    response.close()
+
+        return self.cache.load_page(project)
+
+    def project_file(self, project, filename):
+        """Obtain a file for a project, downloading it if it hasn't been
+        downloaded before.
+
+        Files can be any file that is linked from the project's page, or the
+        metadata of one of those files (PEP 658).
+
+        :param project: The canonical name of the project.
+        :param filename: The name of the file.
+        :returns: The path to the stored file; or ``None`` if the file isn't
+            available.
+        """
+        path = self.cache.file_path(project, filename)
+        if path.is_file():
+            self.cache.touch(path)
+            return path
+        if self.offline:
+            return None
+
+        for link in self.cache.load_page(project) or []:
+            if link["filename"] == filename:
+                url, digest = link["url"], link["fragment"]
+                break
+            elif f"{link['filename']}.metadata" == filename:
+                url = f"{link['url']}.metadata"
+                digest = next(
+                    (
+                        link["attributes"][name]
+                        for name in METADATA_ATTRIBUTES
+                        if link["attributes"].get(name)
+                    ),
+                    None,
+                )
+                break
+        else:
+            return None
+
+        response = self.get(url)
+        try:
+            if response.status_code != 200:
+                return None
+            return self.cache.add_file(
+                project,
+                filename,
+                response.iter_content(chunk_size=1024 * 1024),
+                digest=digest,
+            )
+        finally:
+            response.close()
+
+
+class _IndexProxyServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # A client (i.e., pip) that disconnects early isn't an error.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _IndexProxyHandler(BaseHTTPRequestHandler):
+    """Handle requests made to an ``IndexProxy``.
+
+    The proxy serves project pages at ``/simple/<project>/``, and files at
+    ``/files/<project>/<filename>``.
+    """
+
+    def do_GET(self):
+        proxy = self.server.proxy
+        parts = [unquote(part) for part in urlparse(self.path).path.split("/") if part]
+        content = path = None
+        try:
+            if not all(VALID_NAME.fullmatch(part) for part in parts):
+                pass
+            elif len(parts) == 2 and parts[0] == "simple":
+                project = canonical_name(parts[1])
+                links = proxy.project_links(project)
+                if links is not None:
+                    content = render_project_page(project, links).encode("utf-8")
+            elif len(parts) == 3 and parts[0] == "files":
+                path = proxy.project_file(canonical_name(parts[1]), parts[2])
+        except NETWORK_ERRORS + (OSError, ValueError) as e:
+            self.send_error(HTTPStatus.BAD_GATEWAY, explain=str(e))
+            return
+
+        if content is not None:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        elif path is not None:
+            with path.open("rb") as f:
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+                self.end_headers()
+                shutil.copyfileobj(f, self.wfile)
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def log_message(self, format, *args):
+        # pip reports the files it downloads; the requests made to the proxy
+        # aren't of interest.
+        pass
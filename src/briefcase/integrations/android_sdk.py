@@ -6,6 +6,7 @@ import time
 from contextlib import suppress
 from pathlib import Path
 
+from briefcase.archive import unpack_archive
 from briefcase.config import PEP508_NAME_RE
 from briefcase.console import InputDisabled, select_option
 from briefcase.exceptions import (
@@ -130,7 +131,7 @@ class AndroidSDK:
         )
 
     @classmethod
-    def verify(cls, command, install=True, jdk=None):
+    def verify(cls, command, install=True, jdk=None, accept_license=True):
         """Verify an Android SDK is available.
 
         If the ANDROID_SDK_ROOT environment variable is set, that location will
@@ -142,6 +143,9 @@ class AndroidSDK:
         :param command: The command making the verification request.
         :param install: Should the tool be installed if it is not found?
         :param jdk: The JDK instance to use.
+        :param accept_license: Should the user be asked to accept the SDK
+            licenses, if they haven't been accepted? If False, the caller is
+            responsible for calling ``verify_license()``.
         :returns: A valid Android SDK wrapper. If Android SDK is not
             available, and was not installed, raises MissingToolError.
         """
@@ -153,7 +157,8 @@ class AndroidSDK:
             sdk = AndroidSDK(command=command, jdk=jdk, root_path=Path(sdk_root))
 
             if sdk.exists():
-                sdk.verify_license()
+                if accept_license:
+                    sdk.verify_license()
                 return sdk
             else:
                 command.logger.warning(
@@ -183,15 +188,19 @@ class AndroidSDK:
             root_path=sdk_root_path,
         )
 
-        if sdk.exists():
-            # NOTE: For now, all known versions of the cmdline-tools are compatible.
-            # If/when that ever changes, do a verification check here.
-            sdk.verify_license()
-            return sdk
-        elif (sdk_root_path / "tools").exists():
-            # The legacy SDK Tools exist. Delete them.
-            command.logger.warning(
-                f"""
+        # If another process is installing the SDK, wait for it to finish,
+        # and use the SDK it installed.
+        with command.lock(f"tool-{cls.name}", description=f"the {cls.full_name}"):
+            if sdk.exists():
+                # NOTE: For now, all known versions of the cmdline-tools are compatible.
+                # If/when that ever changes, do a verification check here.
+                if accept_license:
+                    sdk.verify_license()
+                return sdk
+            elif (sdk_root_path / "tools").exists():
+                # The legacy SDK Tools exist. Delete them.
+                command.logger.warning(
+                    f"""
 *************************************************************************
 ** WARNING: Upgrading Android SDK tools                                **
 *************************************************************************
@@ -208,18 +217,47 @@ class AndroidSDK:
 
 *************************************************************************
 """
-            )
-            command.shutil.rmtree(sdk_root_path)
+                )
+                command.shutil.rmtree(sdk_root_path)
+
+            if install:
+                command.logger.info(
+                    "The Android SDK was not found; downloading and installing...",
+                    prefix=cls.name,
+                )
+                sdk.install(accept_license=accept_license)
+                return sdk
+            else:
+                raise MissingToolError("Android SDK")
+
+    @classmethod
+    def fetch(cls, command):
+        """Download the Android SDK Command-Line Tools, without installing
+        them.
 
-        if install:
-            command.logger.info(
-                "The Android SDK was not found; downloading and installing...",
-                prefix=cls.name,
+        Nothing is downloaded if ``ANDROID_SDK_ROOT`` points to an SDK, or if
+        the Briefcase-managed SDK has already been installed.
+
+        :param command: The command that will use the SDK.
+        """
+        sdk_root = command.os.environ.get("ANDROID_SDK_ROOT")
+        if (
+            sdk_root
+            and AndroidSDK(command, jdk=None, root_path=Path(sdk_root)).exists()
+        ):
+            return
+
+        sdk = AndroidSDK(
+            command=command,
+            jdk=None,
+            root_path=command.tools_path / "android_sdk",
+        )
+        if not sdk.exists():
+            command.download_file(
+                url=sdk.cmdline_tools_url,
+                download_path=command.tools_path,
+                role="Android SDK Command-Line Tools",
             )
-            sdk.install()
-            return sdk
-        else:
-            raise MissingToolError("Android SDK")
 
     def exists(self):
         """Confirm that the SDK actually exists.
@@ -240,8 +278,12 @@ class AndroidSDK:
         # are managed installs.
         return True
 
-    def install(self):
-        """Download and install the Android SDK."""
+    def install(self, accept_license=True):
+        """Download and install the Android SDK.
+
+        :param accept_license: Should the user be asked to accept the SDK
+            licenses once the SDK is installed?
+        """
         cmdline_tools_zip_path = self.command.download_file(
             url=self.cmdline_tools_url,
             download_path=self.command.tools_path,
@@ -265,16 +307,18 @@ class AndroidSDK:
         ):
             self.cmdline_tools_path.parent.mkdir(parents=True, exist_ok=True)
             try:
-                self.command.shutil.unpack_archive(
+                unpack_archive(
                     cmdline_tools_zip_path, extract_dir=self.cmdline_tools_path.parent
                 )
             except (shutil.ReadError, EOFError) as e:
+                # Discard the download, so that it is downloaded again.
+                self.command.download_cache.evict(self.cmdline_tools_url)
                 raise BriefcaseCommandError(
-                    f"""\
+                    """\
 Unable to unpack Android SDK Command-Line Tools ZIP file. The download may have been interrupted
-or corrupted.
+or corrupted, so it has been discarded.
 
-Delete {cmdline_tools_zip_path} and run briefcase again.
+Run briefcase again to download a fresh copy.
 """
                 ) from e
 
@@ -292,37 +336,36 @@ Delete {cmdline_tools_zip_path} and run briefcase again.
             self.cmdline_tools_version_path.touch()
 
             # Zip file no longer needed once unpacked.
+            # (Briefcase's zip unpacker restores the permissions of the
+            # binaries in the zip file.)
             cmdline_tools_zip_path.unlink()
 
-            # Python zip unpacking ignores permission metadata.
-            # On non-Windows, we manually fix permissions.
-            if self.command.host_os != "Windows":
-                for binpath in (self.cmdline_tools_path / "bin").glob("*"):
-                    if not self.command.os.access(binpath, self.command.os.X_OK):
-                        binpath.chmod(0o755)
-
         # Licences must be accepted.
-        self.verify_license()
+        if accept_license:
+            self.verify_license()
 
     def upgrade(self):
         """Upgrade the Android SDK."""
-        try:
-            # Using subprocess.run() with no I/O redirection so the user sees
-            # the full output and can send input.
-            self.command.subprocess.run(
-                [os.fsdecode(self.sdkmanager_path), "--update"],
-                env=self.env,
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
-            raise BriefcaseCommandError(
-                f"""\
+        with self.command.lock(
+            f"tool-{self.name}", description=f"the {self.full_name}"
+        ):
+            try:
+                # Using subprocess.run() with no I/O redirection so the user sees
+                # the full output and can send input.
+                self.command.subprocess.run(
+                    [os.fsdecode(self.sdkmanager_path), "--update"],
+                    env=self.env,
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                raise BriefcaseCommandError(
+                    f"""\
 Error while updating the Android SDK manager. Please run this command and examine
 its output for errors.
 
     $ {self.sdkmanager_path} --update
 """
-            ) from e
+                ) from e
 
     def list_packages(self):
         """In debug output, list the packages currently managed by the SDK."""
@@ -406,25 +449,29 @@ connection.
         # might be missing.
         (self.root_path / "platforms").mkdir(exist_ok=True)
 
-        if (self.emulator_path).exists():
-            self.command.logger.debug("Android emulator is already installed.")
-            return
+        # If another process is installing the emulator, wait for it to finish.
+        with self.command.lock(
+            f"tool-{self.name}", description=f"the {self.full_name}"
+        ):
+            if (self.emulator_path).exists():
+                self.command.logger.debug("Android emulator is already installed.")
+                return
 
-        self.command.logger.info("Downloading the Android emulator...")
-        try:
-            self.command.subprocess.run(
-                [
-                    os.fsdecode(self.sdkmanager_path),
-                    "platform-tools",
-                    "emulator",
-                ],
-                env=self.env,
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
-            raise BriefcaseCommandError(
-                "Error while installing Android emulator."
-            ) from e
+            self.command.logger.info("Downloading the Android emulator...")
+            try:
+                self.command.subprocess.run(
+                    [
+                        os.fsdecode(self.sdkmanager_path),
+                        "platform-tools",
+                        "emulator",
+                    ],
+                    env=self.env,
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                raise BriefcaseCommandError(
+                    "Error while installing Android emulator."
+                ) from e
 
     def verify_avd(self, avd):
         """Verify that the AVD has the necessary system components to launch.
@@ -533,28 +580,32 @@ connection.
         for part in system_image_parts:
             system_image_path = system_image_path / part
 
-        if system_image_path.exists():
-            # Found the system image.
-            return
+        # If another process is installing the system image, wait for it to finish.
+        with self.command.lock(
+            f"tool-{self.name}", description=f"the {self.full_name}"
+        ):
+            if system_image_path.exists():
+                # Found the system image.
+                return
 
-        # System image not found; download it.
-        self.command.logger.info(
-            f"Downloading the {system_image!r} Android system image...",
-            prefix=self.name,
-        )
-        try:
-            self.command.subprocess.run(
-                [
-                    os.fsdecode(self.sdkmanager_path),
-                    system_image,
-                ],
-                env=self.env,
-                check=True,
+            # System image not found; download it.
+            self.command.logger.info(
+                f"Downloading the {system_image!r} Android system image...",
+                prefix=self.name,
             )
-        except subprocess.CalledProcessError as e:
-            raise BriefcaseCommandError(
-                f"Error while installing the {system_image!r} Android system image."
-            ) from e
+            try:
+                self.command.subprocess.run(
+                    [
+                        os.fsdecode(self.sdkmanager_path),
+                        system_image,
+                    ],
+                    env=self.env,
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                raise BriefcaseCommandError(
+                    f"Error while installing the {system_image!r} Android system image."
+                ) from e
 
     def verify_emulator_skin(self, skin):
         """Verify that an emulator skin is available.
@@ -565,37 +616,45 @@ connection.
 
         :param skin: The name of the skin to obtain
         """
-        # Check for a device skin. If it doesn't exist, download it.
+        # Check for a device skin. If it doesn't exist, download it. If
+        # another process is installing the skin, wait for it to finish.
         skin_path = self.root_path / "skins" / skin
-        if skin_path.exists():
-            self.command.logger.debug(f"Device skin {skin!r} already exists.")
-            return
-
-        self.command.logger.info(f"Obtaining {skin} device skin...", prefix=self.name)
+        with self.command.lock(
+            f"tool-{self.name}", description=f"the {self.full_name}"
+        ):
+            if skin_path.exists():
+                self.command.logger.debug(f"Device skin {skin!r} already exists.")
+                return
 
-        skin_url = (
-            "https://android.googlesource.com/platform/tools/adt/idea/"
-            "+archive/refs/heads/mirror-goog-studio-main/"
-            f"artwork/resources/device-art-resources/{skin}.tar.gz"
-        )
+            self.command.logger.info(
+                f"Obtaining {skin} device skin...", prefix=self.name
+            )
 
-        skin_tgz_path = self.command.download_file(
-            url=skin_url,
-            download_path=self.root_path,
-            role=f"{skin} device skin",
-        )
+            skin_url = (
+                "https://android.googlesource.com/platform/tools/adt/idea/"
+                "+archive/refs/heads/mirror-goog-studio-main/"
+                f"artwork/resources/device-art-resources/{skin}.tar.gz"
+            )
 
-        # Unpack skin archive
-        with self.command.input.wait_bar("Installing device skin..."):
-            try:
-                self.command.shutil.unpack_archive(skin_tgz_path, extract_dir=skin_path)
-            except (shutil.ReadError, EOFError) as err:
-                raise BriefcaseCommandError(
-                    f"Unable to unpack {skin} device skin."
-                ) from err
+            skin_tgz_path = self.command.download_file(
+                url=skin_url,
+                download_path=self.root_path,
+                role=f"{skin} device skin",
+            )
 
-            # Delete the downloaded file.
-            skin_tgz_path.unlink()
+            # Unpack skin archive
+            with self.command.input.wait_bar("Installing device skin..."):
+                try:
+                    self.command.shutil.unpack_archive(
+                        skin_tgz_path, extract_dir=skin_path
+                    )
+                except (shutil.ReadError, EOFError) as err:
+                    raise BriefcaseCommandError(
+                        f"Unable to unpack {skin} device skin."
+                    ) from err
+
+                # Delete the downloaded file.
+                skin_tgz_path.unlink()
 
     def emulators(self):
         """Find the list of emulators that are available."""
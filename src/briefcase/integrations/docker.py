@@ -4,6 +4,11 @@ import sys
 from pathlib import Path
 
 from briefcase.exceptions import BriefcaseCommandError
+from briefcase.index_proxy import LOCALHOST
+
+# The hostname that Docker Desktop provides to reach the host from inside a
+# container.
+DOCKER_HOST_NAME = "host.docker.internal"
 
 
 def docker_install_details(host_os):
@@ -101,9 +106,13 @@ need to restart your terminal session.
 """
     try:
         # Try to get the version of docker that is installed.
-        output = command.subprocess.check_output(
-            ["docker", "--version"],
-            stderr=subprocess.STDOUT,
+        output = command.verification_cache.check(
+            "docker-version",
+            lambda: command.subprocess.check_output(
+                ["docker", "--version"],
+                stderr=subprocess.STDOUT,
+            ),
+            paths=["docker"],
         ).strip("\n")
 
         # Do a simple check that the docker that was invoked
@@ -173,7 +182,9 @@ installation, and try again.
     try:
         # Invoke a docker command to check if the daemon is running,
         # and the user has sufficient permissions.
-        # We don't care about the output, just that it succeeds.
+        # We don't care about the output, just that it succeeds. The result
+        # isn't recorded in the verification cache, as the daemon can stop
+        # (or the user's permissions can change) at any time.
         command.subprocess.check_output(
             ["docker", "info"],
             stderr=subprocess.STDOUT,
@@ -199,6 +210,18 @@ class Docker:
         self._subprocess = command.subprocess
         self.app = app
 
+    @property
+    def _host_network(self):
+        """Whether containers share the host's network.
+
+        Services that are running on the host's loopback interface (e.g., the
+        package index proxy) aren't visible from a container. On Linux, the
+        container can share the host's network, so the services are
+        available at the same address; elsewhere, Docker Desktop provides a
+        hostname that reaches the host from inside a container.
+        """
+        return self.command.host_os == "Linux"
+
     @property
     def docker_data_path(self):
         """The briefcase data directory used inside container."""
@@ -254,6 +277,8 @@ class Docker:
         * any reference to sys.executable into the python executable in the docker container
         * any path in <platform path> into the equivalent stemming from /app
         * any path in <data path> into the equivalent in ~/.cache/briefcase
+        * any URL on the host's loopback interface into the equivalent URL
+          for the host, as seen from the container (see ``_host_network``)
 
         :param arg: The string argument to convert to dockerized paths
         :returns: A string where all convertible paths have been replaced.
@@ -262,6 +287,8 @@ class Docker:
             return f"python{self.command.python_version_tag}"
         arg = arg.replace(os.fsdecode(self.command.platform_path), "/app")
         arg = arg.replace(os.fsdecode(self.command.data_path), self.docker_data_path)
+        if not self._host_network:
+            arg = arg.replace(f"//{LOCALHOST}:", f"//{DOCKER_HOST_NAME}:")
 
         return arg
 
@@ -292,6 +319,11 @@ class Docker:
             "--rm",
         ]
 
+        # If the command refers to a service on the host's loopback interface,
+        # the container must be able to reach the host.
+        if self._host_network and any(f"//{LOCALHOST}:" in str(arg) for arg in args):
+            docker_args.extend(["--network", "host"])
+
         # If any environment variables have been defined, pass them in
         # as --env arguments to Docker.
         if env:
@@ -190,7 +190,7 @@ You must install both flatpak and flatpak-builder.
                 f"and SDK {sdk}/{self.arch}/{runtime_version} from repo {repo_alias}."
             ) from e
 
-    def build(self, bundle, app_name, path):
+    def build(self, bundle, app_name, path, manifest="manifest.yml"):
         """Build a Flatpak manifest.
 
         On success, the app is installed into the user's local Flatpak install,
@@ -202,6 +202,7 @@ You must install both flatpak and flatpak-builder.
         :param app_name: The app name.
         :param path: The path to the folder containing the app's Flatpak
             manifest file.
+        :param manifest: The name of the manifest file to build.
         """
         try:
             self.subprocess.run(
@@ -215,7 +216,7 @@ You must install both flatpak and flatpak-builder.
                     "--install",
                     "--user",
                     "build",
-                    "manifest.yml",
+                    manifest,
                 ],
                 check=True,
                 cwd=path,
@@ -69,9 +69,16 @@ class JDK:
             try:
                 # If no JRE/JDK is installed, /usr/libexec/java_home
                 # raises an error.
-                java_home = command.subprocess.check_output(
-                    ["/usr/libexec/java_home"],
-                    stderr=subprocess.STDOUT,
+                java_home = command.verification_cache.check(
+                    "java_home",
+                    lambda: command.subprocess.check_output(
+                        ["/usr/libexec/java_home"],
+                        stderr=subprocess.STDOUT,
+                    ),
+                    paths=[
+                        "/usr/libexec/java_home",
+                        "/Library/Java/JavaVirtualMachines",
+                    ],
                 ).strip("\n")
             except subprocess.CalledProcessError:
                 # No java on this machine.
@@ -81,12 +88,17 @@ class JDK:
             try:
                 # If JAVA_HOME is defined, try to invoke javac.
                 # This verifies that we have a JDK, not a just a JRE.
-                output = command.subprocess.check_output(
-                    [
-                        os.fsdecode(Path(java_home) / "bin" / "javac"),
-                        "-version",
-                    ],
-                    stderr=subprocess.STDOUT,
+                # The result is reused until the JDK is modified.
+                output = command.verification_cache.check(
+                    f"javac-version:{java_home}",
+                    lambda: command.subprocess.check_output(
+                        [
+                            os.fsdecode(Path(java_home) / "bin" / "javac"),
+                            "-version",
+                        ],
+                        stderr=subprocess.STDOUT,
+                    ),
+                    paths=[Path(java_home) / "bin"],
                 )
                 # This should be a string of the form "javac 1.8.0_144\n"
                 version_str = output.strip("\n").split(" ")[1]
@@ -197,22 +209,45 @@ class JDK:
 
         jdk = JDK(command, java_home=java_home)
 
-        if jdk.exists():
-            # Using briefcase-managed Java version
-            return jdk
-        if install:
-            # We only display the warning messages on the pass where we actually
-            # install the JDK.
-            if install_message:
-                command.logger.warning(install_message)
-            command.logger.info(
-                "The Java JDK was not found; downloading and installing...",
-                prefix=cls.name,
+        # If another process is installing the JDK, wait for it to finish,
+        # and use the JDK it installed.
+        with command.lock(f"tool-{cls.name}", description=f"the {cls.full_name}"):
+            if jdk.exists():
+                # Using briefcase-managed Java version
+                return jdk
+            if install:
+                # We only display the warning messages on the pass where we actually
+                # install the JDK.
+                if install_message:
+                    command.logger.warning(install_message)
+                command.logger.info(
+                    "The Java JDK was not found; downloading and installing...",
+                    prefix=cls.name,
+                )
+                jdk.install()
+                return jdk
+            else:
+                raise MissingToolError("Java")
+
+    @classmethod
+    def fetch(cls, command):
+        """Download the Briefcase-managed JDK, without installing it.
+
+        Nothing is downloaded if the JDK has already been installed.
+
+        :param command: The command that will use the JDK.
+        """
+        java_home = command.tools_path / "java"
+        if command.host_os == "Darwin":
+            java_home = java_home / "Contents" / "Home"
+
+        jdk = JDK(command, java_home=java_home)
+        if not jdk.exists():
+            command.download_file(
+                url=jdk.adoptOpenJDK_download_url,
+                download_path=command.tools_path,
+                role="Java 8 JDK",
             )
-            jdk.install()
-            return jdk
-        else:
-            raise MissingToolError("Java")
 
     def exists(self):
         return (self.java_home / "bin").exists()
@@ -228,31 +263,36 @@ class JDK:
         except ValueError:
             return False
 
-    def install(self):
-        """Download and install a JDK."""
-        jdk_zip_path = self.command.download_file(
-            url=self.adoptOpenJDK_download_url,
-            download_path=self.command.tools_path,
-            role="Java 8 JDK",
-        )
+    def install(self, revalidate=False):
+        """Download and install a JDK.
 
-        with self.command.input.wait_bar("Installing AdoptOpenJDK..."):
-            try:
-                # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-                self.command.shutil.unpack_archive(
-                    os.fsdecode(jdk_zip_path),
-                    extract_dir=os.fsdecode(self.command.tools_path),
-                )
-            except (shutil.ReadError, EOFError) as e:
-                raise BriefcaseCommandError(
-                    f"""\
+        On macOS and Linux, the JDK is a tarball, which is unpacked while it
+        is being downloaded.
+
+        :param revalidate: Should a previously downloaded copy be revalidated
+            with the server?
+        """
+        try:
+            jdk_zip_path = self.command.download_file(
+                url=self.adoptOpenJDK_download_url,
+                download_path=self.command.tools_path,
+                role="Java 8 JDK",
+                revalidate=revalidate,
+                extract_path=self.command.tools_path,
+            )
+        except (shutil.ReadError, EOFError) as e:
+            # Discard the download, so that it is downloaded again.
+            self.command.download_cache.evict(self.adoptOpenJDK_download_url)
+            raise BriefcaseCommandError(
+                """\
 Unable to unpack AdoptOpenJDK ZIP file. The download may have been interrupted
-or corrupted.
+or corrupted, so it has been discarded.
 
-Delete {jdk_zip_path} and run briefcase again.
+Run briefcase again to download a fresh copy.
 """
-                ) from e
+            ) from e
 
+        with self.command.input.wait_bar("Installing AdoptOpenJDK..."):
             jdk_zip_path.unlink()  # Zip file no longer needed once unpacked.
 
             # The tarball will unpack into <briefcase data dir>/tools/jdk8u242-b08
@@ -278,5 +318,8 @@ Delete {jdk_zip_path} and run briefcase again.
         if not self.exists():
             raise MissingToolError("Java")
 
-        self.uninstall()
-        self.install()
+        with self.command.lock(
+            f"tool-{self.name}", description=f"the {self.full_name}"
+        ):
+            self.uninstall()
+            self.install(revalidate=True)
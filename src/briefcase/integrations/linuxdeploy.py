@@ -1,6 +1,7 @@
 import hashlib
 import shlex
 from abc import abstractmethod
+from functools import partial
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -9,6 +10,7 @@ from briefcase.exceptions import (
     CorruptToolError,
     MissingToolError,
 )
+from briefcase.tasks import Task, run_tasks
 
 ELF_HEADER_IDENT = bytes.fromhex("7F454C46")
 ELF_PATCH_OFFSET = 0x08
@@ -43,11 +45,18 @@ class LinuxDeployBase:
         return (self.file_path / self.file_name).exists()
 
     def install(self):
-        """Download and install linuxdeploy or plugin."""
+        """Download and install linuxdeploy or plugin.
+
+        linuxdeploy and its plugins are downloaded from URLs that track
+        continuous builds, so a previously downloaded copy is revalidated
+        with the server, rather than used as-is.
+        """
         self.command.download_file(
             url=self.download_url,
             download_path=self.file_path,
             role=self.full_name,
+            revalidate=True,
+            executable=True,
         )
 
         self.prepare_executable()
@@ -76,18 +85,38 @@ class LinuxDeployBase:
             available, and was not installed, raises MissingToolError.
         """
         tool = cls(command, **kwargs)
-        if not tool.exists():
-            if install:
-                command.logger.info(
-                    cls.install_msg.format(full_name=cls.full_name),
-                    prefix="linuxdeploy",
-                )
-                tool.install()
-            else:
-                raise MissingToolError(cls.name)
+        # If another process is installing the tool, wait for it to finish,
+        # and use the tool it installed.
+        with command.lock(f"tool-{tool.file_name}", description=tool.full_name):
+            if not tool.exists():
+                if install:
+                    command.logger.info(
+                        cls.install_msg.format(full_name=cls.full_name),
+                        prefix="linuxdeploy",
+                    )
+                    tool.install()
+                else:
+                    raise MissingToolError(cls.name)
 
         return tool
 
+    @classmethod
+    def fetch(cls, command, **kwargs):
+        """Download linuxdeploy tool or plugin.
+
+        linuxdeploy and its plugins are single executables, so downloading
+        them installs them. Nothing is downloaded if the tool/plugin has
+        already been installed.
+
+        :param command: The command that will use linuxdeploy.
+        :param kwargs: Any additional keyword arguments that should be passed
+            to the tool at time of construction.
+        """
+        tool = cls(command, **kwargs)
+        with command.lock(f"tool-{tool.file_name}", description=tool.full_name):
+            if not tool.exists():
+                tool.install()
+
     def uninstall(self):
         """Uninstall tool."""
         with self.command.input.wait_bar(f"Removing old {self.full_name} install..."):
@@ -98,8 +127,9 @@ class LinuxDeployBase:
         if not self.exists():
             raise MissingToolError(self.name)
 
-        self.uninstall()
-        self.install()
+        with self.command.lock(f"tool-{self.file_name}", description=self.full_name):
+            self.uninstall()
+            self.install()
 
     def is_elf_file(self):
         """Returns True if the file is an ELF object file.
@@ -339,29 +369,44 @@ class LinuxDeploy(LinuxDeployBase):
             plugins.
         :returns: A dictionary of plugin ID->instantiated plugin instances.
         """
-        plugins = {}
+        tasks = {}
         for plugin_definition in plugin_definitions:
             # Split the plugin definition lexically.
             # The last element is the plugin ID.
-            plugin_definition_parts = shlex.split(plugin_definition)
-            plugin_name = plugin_definition_parts[-1]
+            plugin_name = shlex.split(plugin_definition)[-1]
+            if plugin_name in tasks:
+                continue
 
             try:
                 plugin_klass = self.plugins[plugin_name]
                 self.command.logger.info(f"Using default {plugin_name} plugin")
 
-                plugin = plugin_klass.verify(self.command)
+                verify = partial(plugin_klass.verify, self.command)
             except KeyError:
                 if plugin_name.startswith(("https://", "http://")):
                     self.command.logger.info(f"Using URL plugin {plugin_name}")
-                    plugin = LinuxDeployURLPlugin.verify(self.command, url=plugin_name)
+                    verify = partial(
+                        LinuxDeployURLPlugin.verify, self.command, url=plugin_name
+                    )
                 else:
                     self.command.logger.info(f"Using local file plugin {plugin_name}")
-                    plugin = LinuxDeployLocalFilePlugin.verify(
+                    verify = partial(
+                        LinuxDeployLocalFilePlugin.verify,
                         self.command,
                         plugin_path=Path(plugin_name),
                         bundle_path=bundle_path,
                     )
+            tasks[plugin_name] = Task(verify)
+
+        # Plugins don't depend on each other, so any plugins that need to be
+        # downloaded can be downloaded concurrently.
+        with self.command.input.static_output():
+            verified = run_tasks(tasks)
+
+        plugins = {}
+        for plugin_definition in plugin_definitions:
+            plugin_definition_parts = shlex.split(plugin_definition)
+            plugin = verified[plugin_definition_parts[-1]]
 
             # Preserve the environment declarations required by the plugin.
             for part in plugin_definition_parts[:-1]:
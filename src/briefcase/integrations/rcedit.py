@@ -29,18 +29,35 @@ class RCEdit:
         """
         rcedit = RCEdit(command)
 
-        if not rcedit.exists():
-            if install:
-                command.logger.info(
-                    "RCEdit was not found; downloading and installing...",
-                    prefix=cls.name,
-                )
-                rcedit.install()
-            else:
-                raise MissingToolError("RCEdit")
+        # If another process is installing RCEdit, wait for it to finish, and
+        # use the RCEdit it installed.
+        with command.lock(f"tool-{cls.name}", description=cls.full_name):
+            if not rcedit.exists():
+                if install:
+                    command.logger.info(
+                        "RCEdit was not found; downloading and installing...",
+                        prefix=cls.name,
+                    )
+                    rcedit.install()
+                else:
+                    raise MissingToolError("RCEdit")
 
         return RCEdit(command)
 
+    @classmethod
+    def fetch(cls, command):
+        """Download RCEdit.
+
+        RCEdit is a single executable, so downloading it installs it. Nothing
+        is downloaded if RCEdit has already been installed.
+
+        :param command: The command that will use RCEdit.
+        """
+        rcedit = RCEdit(command)
+        with command.lock(f"tool-{cls.name}", description=cls.full_name):
+            if not rcedit.exists():
+                rcedit.install()
+
     def exists(self):
         return self.rcedit_path.exists()
 
@@ -48,12 +65,17 @@ class RCEdit:
     def managed_install(self):
         return True
 
-    def install(self):
-        """Download and install RCEdit."""
+    def install(self, revalidate=False):
+        """Download and install RCEdit.
+
+        :param revalidate: Should a previously downloaded copy be revalidated
+            with the server?
+        """
         self.command.download_file(
             url=self.download_url,
             download_path=self.command.tools_path,
             role="RCEdit",
+            revalidate=revalidate,
         )
 
     def uninstall(self):
@@ -66,5 +88,6 @@ class RCEdit:
         if not self.exists():
             raise MissingToolError("RCEdit")
 
-        self.uninstall()
-        self.install()
+        with self.command.lock(f"tool-{self.name}", description=self.full_name):
+            self.uninstall()
+            self.install(revalidate=True)
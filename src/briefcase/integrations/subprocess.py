@@ -385,7 +385,9 @@ class Subprocess:
         output_streamer = threading.Thread(
             name=f"{label} output streamer",
             target=self._stream_output_thread,
-            args=(popen_process,),
+            # Output is labelled in the same way as the thread that started
+            # the process.
+            args=(popen_process, self.command.logger.label),
             daemon=True,
         )
         try:
@@ -408,19 +410,21 @@ class Subprocess:
                     "Log stream hasn't terminated; log output may be corrupted."
                 )
 
-    def _stream_output_thread(self, popen_process):
+    def _stream_output_thread(self, popen_process, label=None):
         """Stream output for a Popen process in a Thread.
 
         :param popen_process: popen process to stream stdout
+        :param label: (Optional) The label to apply to the output.
         """
-        while True:
-            # readline should always return at least a newline (ie \n)
-            # UNLESS the underlying process is exiting/gone; then "" is returned
-            output_line = ensure_str(popen_process.stdout.readline())
-            if output_line:
-                self.command.logger.info(output_line)
-            elif output_line == "":
-                return
+        with self.command.logger.labelled(label):
+            while True:
+                # readline should always return at least a newline (ie \n)
+                # UNLESS the underlying process is exiting/gone; then "" is returned
+                output_line = ensure_str(popen_process.stdout.readline())
+                if output_line:
+                    self.command.logger.info(output_line)
+                elif output_line == "":
+                    return
 
     def cleanup(self, label, popen_process):
         """Clean up after a Popen process, gracefully terminating if possible;
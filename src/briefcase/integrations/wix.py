@@ -2,6 +2,7 @@ import os
 import shutil
 from pathlib import Path
 
+from briefcase.archive import unpack_archive
 from briefcase.exceptions import (
     BriefcaseCommandError,
     MissingToolError,
@@ -91,18 +92,38 @@ WiX Toolset. Current value: {wix_home!r}
         else:
             wix = WiX(command=command, bin_install=True)
 
-            if not wix.exists():
-                if install:
-                    command.logger.info(
-                        "The WiX toolset was not found; downloading and installing...",
-                        prefix=cls.name,
-                    )
-                    wix.install()
-                else:
-                    raise MissingToolError("WiX")
+            # If another process is installing WiX, wait for it to finish, and
+            # use the WiX it installed.
+            with command.lock(f"tool-{cls.name}", description=cls.full_name):
+                if not wix.exists():
+                    if install:
+                        command.logger.info(
+                            "The WiX toolset was not found; downloading and installing...",
+                            prefix=cls.name,
+                        )
+                        wix.install()
+                    else:
+                        raise MissingToolError("WiX")
 
         return wix
 
+    @classmethod
+    def fetch(cls, command):
+        """Download WiX, without installing it.
+
+        Nothing is downloaded if the Briefcase-managed WiX has already been
+        installed.
+
+        :param command: The command that will use WiX.
+        """
+        wix = WiX(command=command, bin_install=True)
+        if not wix.exists():
+            command.download_file(
+                url=WIX_DOWNLOAD_URL,
+                download_path=command.tools_path,
+                role="WiX",
+            )
+
     def exists(self):
         return (
             self.heat_exe.exists()
@@ -121,27 +142,34 @@ WiX Toolset. Current value: {wix_home!r}
         except ValueError:
             return False
 
-    def install(self):
-        """Download and install WiX."""
+    def install(self, revalidate=False):
+        """Download and install WiX.
+
+        :param revalidate: Should a previously downloaded copy be revalidated
+            with the server?
+        """
         wix_zip_path = self.command.download_file(
             url=WIX_DOWNLOAD_URL,
             download_path=self.command.tools_path,
             role="WiX",
+            revalidate=revalidate,
         )
 
         try:
             with self.command.input.wait_bar("Installing WiX..."):
                 # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-                self.command.shutil.unpack_archive(
+                unpack_archive(
                     os.fsdecode(wix_zip_path), extract_dir=os.fsdecode(self.wix_home)
                 )
         except (shutil.ReadError, EOFError) as e:
+            # Discard the download, so that it is downloaded again.
+            self.command.download_cache.evict(WIX_DOWNLOAD_URL)
             raise BriefcaseCommandError(
-                f"""\
+                """\
 Unable to unpack WiX ZIP file. The download may have been
-interrupted or corrupted.
+interrupted or corrupted, so it has been discarded.
 
-Delete {wix_zip_path} and run briefcase again.
+Run briefcase again to download a fresh copy.
 """
             ) from e
 
@@ -160,5 +188,6 @@ Delete {wix_zip_path} and run briefcase again.
         if not self.exists():
             raise MissingToolError("WiX")
 
-        self.uninstall()
-        self.install()
+        with self.command.lock(f"tool-{self.name}", description=self.full_name):
+            self.uninstall()
+            self.install(revalidate=True)
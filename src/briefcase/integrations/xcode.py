@@ -6,6 +6,11 @@ from pathlib import Path
 from briefcase.exceptions import BriefcaseCommandError, CommandOutputParseError
 from briefcase.integrations.subprocess import json_parser
 
+# The link to the developer directory of the selected Xcode.
+XCODE_SELECT_LINK = "/var/db/xcode_select_link"
+# The file that records the acceptance of the Xcode license.
+XCODE_LICENSE_PLIST = "/Library/Preferences/com.apple.dt.Xcode.plist"
+
 
 class DeviceState(enum.Enum):
     SHUTDOWN = 0
@@ -136,10 +141,17 @@ def ensure_xcode_is_installed(
     # Check for *any* version of Xcode tools. xcode-select returns:
     #  * The path to the currently active Xcode install; or
     #  * error code 2 - No Xcode installation
+    #
+    # The results of these checks are reused until a different Xcode is
+    # selected, or the selected Xcode is modified.
     try:
-        command.subprocess.check_output(
-            ["xcode-select", "-p"],
-            stderr=subprocess.STDOUT,
+        command.verification_cache.check(
+            "xcode-select",
+            lambda: command.subprocess.check_output(
+                ["xcode-select", "-p"],
+                stderr=subprocess.STDOUT,
+            ),
+            paths=[XCODE_SELECT_LINK],
         )
     except subprocess.CalledProcessError as e:
         raise BriefcaseCommandError(
@@ -162,9 +174,13 @@ you can re-run Briefcase.
         #   xcode-select: error: tool 'xcodebuild' requires Xcode, but active
         #   developer directory '/Library/Developer/CommandLineTools' is a
         #   command line tools instance
-        output = command.subprocess.check_output(
-            ["xcodebuild", "-version"],
-            stderr=subprocess.STDOUT,
+        output = command.verification_cache.check(
+            "xcodebuild-version",
+            lambda: command.subprocess.check_output(
+                ["xcodebuild", "-version"],
+                stderr=subprocess.STDOUT,
+            ),
+            paths=[XCODE_SELECT_LINK],
         )
 
         if min_version is not None:
@@ -273,9 +289,15 @@ def confirm_xcode_license_accepted(command):
     # Lastly, check if the XCode license has been accepted. The command line
     # tools return a status code of 69 (nice...) if the license has not been
     # accepted. In this case, we can prompt the user to accept the license.
+    # Once the license has been accepted, the result is reused until the
+    # Xcode install (or the record of the license acceptance) changes.
     try:
-        command.subprocess.check_output(
-            ["/usr/bin/clang", "--version"], stderr=subprocess.STDOUT
+        command.verification_cache.check(
+            "xcode-license",
+            lambda: command.subprocess.check_output(
+                ["/usr/bin/clang", "--version"], stderr=subprocess.STDOUT
+            ),
+            paths=[XCODE_SELECT_LINK, XCODE_LICENSE_PLIST],
         )
     except subprocess.CalledProcessError as e:
         if e.returncode == 69:
@@ -489,8 +511,17 @@ def get_identities(command, policy):
     :param policy: The identity policy to evaluate (e.g., ``codesigning``)
     """
     try:
-        output = command.subprocess.check_output(
-            ["security", "find-identity", "-v", "-p", policy],
+        # The identities are reused until a keychain is modified.
+        output = command.verification_cache.check(
+            f"identities:{policy}",
+            lambda: command.subprocess.check_output(
+                ["security", "find-identity", "-v", "-p", policy],
+            ),
+            paths=[
+                command.home_path / "Library" / "Keychains",
+                command.home_path / "Library" / "Keychains" / "login.keychain-db",
+                "/Library/Keychains/System.keychain",
+            ],
         )
 
         return dict(
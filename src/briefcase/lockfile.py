@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# The name of the lock file, in the root of a project.
+LOCK_FILENAME = "briefcase.lock"
+
+# The version of the lock file format.
+LOCK_FORMAT_VERSION = 1
+
+# The hash algorithms that pip can verify.
+HASH_ALGORITHMS = {"sha256", "sha384", "sha512"}
+
+
+# Detects any of the URL schemes supported by pip
+# (https://pip.pypa.io/en/stable/topics/vcs-support/).
+def has_url(requirement):
+    return any(
+        f"{scheme}:" in requirement
+        for scheme in (
+            ["http", "https", "file", "ftp"]
+            + ["git+file", "git+https", "git+ssh", "git+http", "git+git", "git"]
+            + ["hg+file", "hg+http", "hg+https", "hg+ssh", "hg+static-http"]
+            + ["svn", "svn+svn", "svn+http", "svn+https", "svn+ssh"]
+            + ["bzr+http", "bzr+https", "bzr+ssh", "bzr+sftp", "bzr+ftp", "bzr+lp"]
+        )
+    )
+
+
+def is_index_requirement(requirement):
+    """Determine if a requirement identifies distributions on a package
+    index.
+
+    Requirements that refer to local paths, URLs or files (e.g., ``-r
+    requirements.txt``) can install different content without the
+    requirement changing.
+
+    :param requirement: A requirement.
+    :returns: True if the requirement is installed from a package index.
+    """
+    separators = [os.sep]
+    if os.altsep:
+        separators.append(os.altsep)
+
+    return not (
+        requirement.lstrip().startswith("-")
+        or has_url(requirement)
+        or any(sep in requirement for sep in separators)
+    )
+
+
+def normalize_requires(requires):
+    """Normalize a list of requirements, so that lists that differ only in
+    order or whitespace compare equal.
+
+    :param requires: A list of requirements.
+    :returns: A sorted list of requirements, without whitespace.
+    """
+    return sorted("".join(requirement.split()) for requirement in requires or [])
+
+
+def requirement_line(package):
+    """Format a locked package as a line of a pip requirements file.
+
+    :param package: A locked package, as a dictionary with a ``name``, a
+        ``version``, and a list of ``hashes`` (as ``<algorithm>:<digest>``).
+    :returns: A requirement pinning the package to the locked version and
+        artifacts.
+    """
+    return " ".join(
+        [f"{package['name']}=={package['version']}"]
+        + [f"--hash={digest}" for digest in package["hashes"]]
+    )
+
+
+@contextmanager
+def requirements_file(packages, directory=None):
+    """Write locked packages to a temporary pip requirements file.
+
+    :param packages: The locked packages.
+    :param directory: (Optional) The folder in which the file is created
+        (e.g., a folder that is visible to a container). Defaults to the
+        system temporary folder.
+    :returns: A context manager that yields the path to the file. The file
+        is removed when the context exits.
+    """
+    fd, path = tempfile.mkstemp(prefix=".requirements-", suffix=".txt", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for package in packages:
+                f.write(f"{requirement_line(package)}\n")
+        yield Path(path)
+    finally:
+        os.unlink(path)
+
+
+class LockFile:
+    """A record of the exact packages that were resolved for the requirements
+    of each app, on each target.
+
+    The file is a JSON document, so that it can be read and written without
+    any additional dependencies, and is written with sorted keys so that it
+    produces minimal diffs when it is committed to version control.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def load(self):
+        """Load the content of the lock file.
+
+        :returns: The lock file content. If the file doesn't exist (or can't
+            be read), an empty lock file is returned.
+        """
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                content = json.load(f)
+            if content.get("version") == LOCK_FORMAT_VERSION:
+                return content
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {"version": LOCK_FORMAT_VERSION, "apps": {}}
+
+    def packages(self, app_name, target, requires):
+        """Retrieve the locked packages for an app.
+
+        :param app_name: The name of the app.
+        :param target: The target for which the packages were resolved
+            (e.g., ``macOS/app/arm64/py3.11``).
+        :param requires: The app's current requirements.
+        :returns: The list of locked packages; or ``None`` if the app's
+            requirements haven't been locked for the target, or have changed
+            since they were locked.
+        """
+        entry = self.load()["apps"].get(app_name, {}).get(target)
+        if entry is None or entry.get("requires") != normalize_requires(requires):
+            return None
+        return entry["packages"]
+
+    def lock(self, app_name, target, requires, packages):
+        """Record the locked packages for an app.
+
+        :param app_name: The name of the app.
+        :param target: The target for which the packages were resolved.
+        :param requires: The requirements that were resolved.
+        :param packages: The resolved packages, as dictionaries with a
+            ``name``, ``version`` and list of ``hashes``.
+        """
+        content = self.load()
+        content["apps"].setdefault(app_name, {})[target] = {
+            "requires": normalize_requires(requires),
+            "packages": sorted(packages, key=lambda package: package["name"].lower()),
+        }
+        # Write to a temporary file and move it into place, so that an
+        # interrupted write doesn't corrupt the lock file.
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(content, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(temp_path, self.path)
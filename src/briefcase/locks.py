@@ -0,0 +1,125 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+# The interval between attempts to acquire a lock held by another process,
+# in seconds.
+POLL_INTERVAL = 0.1
+
+
+class FileLock:
+    """An advisory lock, shared between processes, that is held on a file.
+
+    Only one process can hold the lock at a time; within a process, only one
+    thread can hold the lock at a time. The lock is reentrant, so the thread
+    that holds the lock can acquire it again (e.g., if a locked operation
+    calls another operation protected by the same lock).
+
+    The lock is held by the operating system, so if the process holding the
+    lock exits (or is killed), the lock is released.
+
+    Locks should be obtained with ``FileLock.for_path()``, so that every
+    user of a lock file in a process shares the same lock.
+    """
+
+    _locks = {}
+    _locks_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    @classmethod
+    def for_path(cls, path):
+        """Obtain the lock for a lock file.
+
+        :param path: The lock file. The file (and the folder that contains
+            it) will be created when the lock is first acquired.
+        :returns: The ``FileLock`` for the file.
+        """
+        path = Path(path).absolute()
+        with cls._locks_lock:
+            try:
+                return cls._locks[path]
+            except KeyError:
+                lock = cls(path)
+                cls._locks[path] = lock
+                return lock
+
+    def _try_lock(self):
+        """Make a single attempt to lock the lock file.
+
+        :returns: True if the lock was acquired.
+        """
+        try:
+            if sys.platform == "win32":  # pragma: no cover
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(self):
+        """Unlock the lock file."""
+        if sys.platform == "win32":  # pragma: no cover
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+    def acquire(self, on_wait=None):
+        """Acquire the lock, waiting until it is available.
+
+        :param on_wait: (Optional) A function that will be invoked (once) if
+            the lock is held by another process, before waiting for the lock
+            to be released.
+        """
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a+b")
+                while not self._try_lock():
+                    if on_wait is not None:
+                        on_wait()
+                        on_wait = None
+                    time.sleep(POLL_INTERVAL)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        """Release the lock.
+
+        The lock is only released by the operating system once every
+        acquisition of the lock by the current thread has been released.
+        """
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock()
+            finally:
+                self._file.close()
+                self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
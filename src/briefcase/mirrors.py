@@ -0,0 +1,107 @@
+from pathlib import Path
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    import tomli as tomllib
+
+from briefcase.exceptions import BriefcaseCommandError
+
+
+class Mirrors:
+    """A mapping of URL prefixes to the mirrors that can serve them.
+
+    Each upstream URL prefix is associated with an ordered list of mirror
+    prefixes. A mirror can be an HTTP server, or a ``file://`` directory.
+    """
+
+    def __init__(self, mirrors=None):
+        """
+        :param mirrors: A dictionary of upstream URL prefix->list of mirror
+            prefixes.
+        """
+        self.mirrors = mirrors if mirrors else {}
+
+    def __bool__(self):
+        return bool(self.mirrors)
+
+    @classmethod
+    def load(cls, path):
+        """Load a mirror configuration file.
+
+        The file is a TOML file with a ``mirrors`` table; each key is an
+        upstream URL prefix, and each value is a mirror prefix, or a list of
+        mirror prefixes that will be tried in order::
+
+            [mirrors]
+            "https://github.com/" = [
+                "http://mirror.example.com/github/",
+                "file:///srv/mirror/github/",
+            ]
+
+        :param path: The path to the configuration file.
+        :returns: The ``Mirrors`` described by the file.
+        """
+        try:
+            with Path(path).open("rb") as f:
+                config = tomllib.load(f)
+        except OSError as e:
+            raise BriefcaseCommandError(
+                f"Unable to read mirror configuration {path}."
+            ) from e
+        except tomllib.TOMLDecodeError as e:
+            raise BriefcaseCommandError(
+                f"Mirror configuration {path} is not valid TOML: {e}"
+            ) from e
+
+        mirrors = {}
+        for prefix, urls in config.get("mirrors", {}).items():
+            if isinstance(urls, str):
+                urls = [urls]
+            if not isinstance(urls, list) or not all(
+                isinstance(url, str) for url in urls
+            ):
+                raise BriefcaseCommandError(
+                    f"The mirrors for {prefix!r} in {path} must be a URL, or a "
+                    "list of URLs."
+                )
+            mirrors[prefix] = urls
+        return cls(mirrors)
+
+    def urls(self, url):
+        """The mirror URLs that could serve a URL.
+
+        If more than one upstream prefix matches the URL, the longest prefix
+        is used.
+
+        :param url: The upstream URL.
+        :returns: The list of mirror URLs for the URL, in the order they should
+            be tried. The list will be empty if no mirror serves the URL.
+        """
+        matches = [prefix for prefix in self.mirrors if url.startswith(prefix)]
+        if not matches:
+            return []
+
+        prefix = max(matches, key=len)
+        return [url.replace(prefix, mirror, 1) for mirror in self.mirrors[prefix]]
+
+
+def mirrors_from_environ(environ, data_path):
+    """Load the mirror configuration for the environment.
+
+    The configuration is read from the file named by the
+    ``BRIEFCASE_MIRRORS`` environment variable; if the variable isn't set,
+    the ``mirrors.toml`` file in the Briefcase data directory is used, if it
+    exists.
+
+    :param environ: The environment to inspect.
+    :param data_path: The Briefcase data directory.
+    :returns: A ``Mirrors`` instance.
+    """
+    if environ.get("BRIEFCASE_MIRRORS"):
+        return Mirrors.load(environ["BRIEFCASE_MIRRORS"])
+
+    config_path = Path(data_path) / "mirrors.toml"
+    if config_path.exists():
+        return Mirrors.load(config_path)
+    return Mirrors()
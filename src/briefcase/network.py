@@ -0,0 +1,193 @@
+import io
+import os
+import re
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from briefcase.exceptions import BriefcaseCommandError
+
+# The default (connect, read) timeouts for HTTP requests, in seconds.
+DEFAULT_TIMEOUT = (10, 60)
+# The default number of times a failed HTTP request will be retried.
+DEFAULT_RETRIES = 5
+# The backoff factor for retries. Retries will wait 0.5s, 1s, 2s, 4s, ...
+DEFAULT_BACKOFF_FACTOR = 0.5
+# The maximum number of connections that will be kept alive for each host.
+POOL_SIZE = 10
+
+# The errors that indicate a transient network problem.
+NETWORK_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
+
+class _LimitedReader:
+    """A reader that returns at most a given number of bytes from a file."""
+
+    def __init__(self, f, remaining):
+        self.f = f
+        self.remaining = remaining
+
+    def read(self, size=-1, **kwargs):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.f.close()
+
+
+class FileAdapter(BaseAdapter):
+    """A transport adapter that serves ``file://`` URLs from the local
+    filesystem.
+
+    A single byte range can be requested, so that interrupted and segmented
+    downloads from a local mirror behave in the same way as downloads from
+    an HTTP server.
+    """
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.connection = self
+        response.headers = CaseInsensitiveDict({"Accept-Ranges": "bytes"})
+
+        path = Path(url2pathname(urlparse(request.url).path))
+        try:
+            f = path.open("rb")
+        except OSError:
+            response.status_code = 404
+            response.reason = "Not Found"
+            response.headers["Content-Length"] = "0"
+            response.raw = io.BytesIO()
+            return response
+
+        size = os.fstat(f.fileno()).st_size
+        start, end = 0, size - 1
+        response.status_code = 200
+        response.reason = "OK"
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            if match.group(2):
+                end = min(end, int(match.group(2)))
+            if start > end:
+                f.close()
+                response.status_code = 416
+                response.reason = "Range Not Satisfiable"
+                response.headers["Content-Length"] = "0"
+                response.raw = io.BytesIO()
+                return response
+
+            f.seek(start)
+            response.status_code = 206
+            response.reason = "Partial Content"
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        response.headers["Content-Length"] = str(end - start + 1)
+        response.raw = _LimitedReader(f, end - start + 1)
+        return response
+
+    def close(self):
+        pass
+
+
+class BriefcaseSession(requests.Session):
+    """A requests session that applies a default timeout to every request.
+
+    Any requests made by the session that fail because of a connection
+    error, or a 5xx response, will be retried with an exponential backoff.
+    """
+
+    def __init__(
+        self,
+        timeout=DEFAULT_TIMEOUT,
+        retries=DEFAULT_RETRIES,
+        backoff_factor=DEFAULT_BACKOFF_FACTOR,
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=retries,
+                connect=retries,
+                read=retries,
+                status=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD"],
+                # Return the final response, rather than raising an error, so
+                # that the status code can be reported.
+                raise_on_status=False,
+            ),
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        # Mirrors can be a local directory.
+        self.mount("file://", FileAdapter())
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def session_from_environ(environ):
+    """Construct a session, using any HTTP settings defined in the
+    environment.
+
+    * ``BRIEFCASE_HTTP_TIMEOUT`` sets the request timeout, in seconds. This
+      can be a single value, or a "connect,read" pair of values.
+    * ``BRIEFCASE_HTTP_RETRIES`` sets the number of times a failed request
+      will be retried.
+
+    :param environ: The environment to inspect.
+    :returns: A configured ``BriefcaseSession``.
+    """
+    kwargs = {}
+    if environ.get("BRIEFCASE_HTTP_TIMEOUT"):
+        try:
+            timeout = tuple(
+                float(value) for value in environ["BRIEFCASE_HTTP_TIMEOUT"].split(",")
+            )
+            if len(timeout) == 1:
+                kwargs["timeout"] = timeout[0]
+            elif len(timeout) == 2:
+                kwargs["timeout"] = timeout
+            else:
+                raise ValueError("Too many timeout values")
+        except ValueError as e:
+            raise BriefcaseCommandError(
+                "The value of BRIEFCASE_HTTP_TIMEOUT must be a number of seconds, "
+                "or a pair of 'connect,read' numbers of seconds."
+            ) from e
+
+    if environ.get("BRIEFCASE_HTTP_RETRIES"):
+        try:
+            kwargs["retries"] = int(environ["BRIEFCASE_HTTP_RETRIES"])
+            if kwargs["retries"] < 0:
+                raise ValueError("Retries must be positive")
+        except ValueError as e:
+            raise BriefcaseCommandError(
+                "The value of BRIEFCASE_HTTP_RETRIES must be a positive integer."
+            ) from e
+
+    return BriefcaseSession(**kwargs)
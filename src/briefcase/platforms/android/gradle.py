@@ -1,6 +1,7 @@
 import re
 import subprocess
 import time
+from functools import partial
 
 from briefcase.commands import (
     BuildCommand,
@@ -13,6 +14,17 @@ from briefcase.commands import (
 from briefcase.config import BaseConfig, parsed_version
 from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.android_sdk import AndroidSDK
+from briefcase.integrations.java import JDK
+from briefcase.tasks import Task, run_tasks
+
+# The wheel platforms of the Android ABIs supported by apps, at the minimum
+# API level supported by the Android template.
+WHEEL_PLATFORMS = [
+    "android_21_arm64_v8a",
+    "android_21_armeabi_v7a",
+    "android_21_x86",
+    "android_21_x86_64",
+]
 
 
 def safe_formal_name(name):
@@ -89,10 +101,32 @@ class GradleMixin:
         """Verify that the Android APK tools in `briefcase` will operate on
         this system, downloading tools as needed."""
         super().verify_tools()
-        self.android_sdk = AndroidSDK.verify(self)
+        # The Android SDK needs a JDK; but the SDK can be downloaded while the
+        # JDK is being verified (and installed).
+        with self.input.static_output():
+            tools = run_tasks(
+                {
+                    "jdk": Task(partial(JDK.verify, self)),
+                    "android_sdk_download": Task(partial(AndroidSDK.fetch, self)),
+                    "android_sdk": Task(
+                        partial(AndroidSDK.verify, self, accept_license=False),
+                        requires=["jdk"],
+                        after=["android_sdk_download"],
+                    ),
+                }
+            )
+        self.android_sdk = tools["android_sdk"]
+        # Accepting the licenses is interactive, so it can't be interleaved
+        # with the output of other tasks.
+        self.android_sdk.verify_license()
         if not self.is_clone:
             self.logger.add_log_file_extra(self.android_sdk.list_packages)
 
+    def required_tools(self, app: BaseConfig):
+        """The Android SDK (and the JDK that it requires) are needed to build
+        Android apps."""
+        return super().required_tools(app) + [(JDK, {}), (AndroidSDK, {})]
+
 
 class GradleCreateCommand(GradleMixin, CreateCommand):
     description = "Create and populate an Android APK."
@@ -119,6 +153,10 @@ class GradleCreateCommand(GradleMixin, CreateCommand):
             "safe_formal_name": safe_formal_name(app.formal_name),
         }
 
+    def wheel_platforms(self, app: BaseConfig):
+        """Dependencies are installed by Gradle, for every supported ABI."""
+        return WHEEL_PLATFORMS
+
 
 class GradleUpdateCommand(GradleMixin, UpdateCommand):
     description = "Update an existing Android debug APK."
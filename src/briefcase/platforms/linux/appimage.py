@@ -1,4 +1,5 @@
 import os
+import shlex
 import subprocess
 from contextlib import contextmanager
 
@@ -13,7 +14,7 @@ from briefcase.commands import (
 from briefcase.config import AppConfig
 from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.docker import verify_docker
-from briefcase.integrations.linuxdeploy import LinuxDeploy
+from briefcase.integrations.linuxdeploy import LinuxDeploy, LinuxDeployURLPlugin
 from briefcase.platforms.linux import LinuxMixin
 
 
@@ -56,6 +57,23 @@ class LinuxAppImageMixin(LinuxMixin):
         super().clone_options(command)
         self.use_docker = command.use_docker
 
+    def required_tools(self, app: AppConfig):
+        """linuxdeploy, and any of the linuxdeploy plugins used by the app,
+        are needed to build AppImages.
+
+        Plugins provided as local files are copied from the project, so they
+        aren't included.
+        """
+        tools = super().required_tools(app) + [(LinuxDeploy, {})]
+        known_plugins = LinuxDeploy(self).plugins
+        for plugin_definition in getattr(app, "linuxdeploy_plugins", []):
+            plugin_name = shlex.split(plugin_definition)[-1]
+            if plugin_name in known_plugins:
+                tools.append((known_plugins[plugin_name], {}))
+            elif plugin_name.startswith(("https://", "http://")):
+                tools.append((LinuxDeployURLPlugin, {"url": plugin_name}))
+        return tools
+
     def docker_image_tag(self, app):
         """The Docker image tag for an app."""
         return (
@@ -121,17 +139,32 @@ class LinuxAppImageCreateCommand(LinuxAppImageMixin, CreateCommand):
             ("arch", self.host_arch),
         ]
 
+    def dependency_environment(self, app: AppConfig):
+        """Dependencies installed in Docker are only reused in Docker."""
+        environment = super().dependency_environment(app)
+        environment["use_docker"] = self.use_docker
+        return environment
+
+    def wheel_platforms(self, app: AppConfig):
+        """Dependencies that are installed in Docker are installed for the
+        manylinux platform of the container."""
+        if self.use_docker:
+            return [f"manylinux2014_{self.host_arch}"]
+        return []
+
     def install_app_dependencies(self, app: AppConfig):
         """Install application dependencies.
 
         This will be containerized in Docker to ensure that the right
-        binary versions are installed.
+        binary versions are installed. Wheels are prefetched on the host,
+        before entering the Docker context.
         """
-        with self.dockerize(app=app) as docker:
-            docker.prepare()
+        with self.package_index(app), self.prefetched_wheels(app):
+            with self.dockerize(app=app) as docker:
+                docker.prepare()
 
-            # Install dependencies. This will run inside a Docker container.
-            super().install_app_dependencies(app=app)
+                # Install dependencies. This will run inside a Docker container.
+                super().install_app_dependencies(app=app)
 
 
 class LinuxAppImageUpdateCommand(LinuxAppImageMixin, UpdateCommand):
@@ -1,3 +1,7 @@
+import json
+import re
+from contextlib import contextmanager
+
 from briefcase.commands import (
     BuildCommand,
     CreateCommand,
@@ -128,6 +132,9 @@ class LinuxFlatpakUpdateCommand(LinuxFlatpakMixin, UpdateCommand):
 class LinuxFlatpakBuildCommand(LinuxFlatpakMixin, BuildCommand):
     description = "Build a Linux Flatpak."
 
+    # The copy of the manifest that is built when the app uses an index proxy.
+    INDEX_MANIFEST = "manifest-index.yml"
+
     def build_app(self, app: AppConfig, **kwargs):
         """Build an application.
 
@@ -156,12 +163,61 @@ class LinuxFlatpakBuildCommand(LinuxFlatpakMixin, BuildCommand):
         )
 
         self.logger.info("Building Flatpak...", prefix=app.app_name)
-        with self.input.wait_bar("Building..."):
-            self.flatpak.build(
-                bundle=app.bundle,
-                app_name=app.app_name,
-                path=self.bundle_path(app),
+        with self.package_index(app) as index_url:
+            with self.index_manifest(app, index_url) as manifest:
+                with self.input.wait_bar("Building..."):
+                    self.flatpak.build(
+                        bundle=app.bundle,
+                        app_name=app.app_name,
+                        path=self.bundle_path(app),
+                        manifest=manifest,
+                    )
+
+    @contextmanager
+    def index_manifest(self, app: AppConfig, index_url):
+        """Write a copy of the app's manifest that installs requirements from
+        a package index.
+
+        Flatpak installs the app's requirements with pip when the app is
+        built, inside a sandbox that doesn't receive Briefcase's pip options
+        or environment. The copy adds the index to the build environment of
+        every module as ``PIP_INDEX_URL``; the manifest and requirements file
+        that were generated for the app are not modified. The copy is deleted
+        once the build is complete.
+
+        :param app: The application being built
+        :param index_url: The URL of the package index; or ``None`` to use
+            the default index.
+        :returns: A context manager that yields the name of the manifest to
+            build.
+        """
+        manifest_path = self.bundle_path(app) / "manifest.yml"
+        if index_url is None or not manifest_path.exists():
+            yield manifest_path.name
+            return
+
+        manifest = manifest_path.read_text(encoding="utf-8")
+        if re.search(r"^build-options\s*:", manifest, flags=re.MULTILINE):
+            self.logger.warning(
+                "The Flatpak manifest declares its own build-options; "
+                "requirements will be installed from the default index.",
+                prefix=app.app_name,
             )
+            yield manifest_path.name
+            return
+
+        index_manifest_path = manifest_path.with_name(self.INDEX_MANIFEST)
+        index_manifest_path.write_text(
+            f"{manifest.rstrip()}\n"
+            "build-options:\n"
+            "  env:\n"
+            f"    PIP_INDEX_URL: {json.dumps(index_url)}\n",
+            encoding="utf-8",
+        )
+        try:
+            yield index_manifest_path.name
+        finally:
+            index_manifest_path.unlink()
 
 
 class LinuxFlatpakRunCommand(LinuxFlatpakMixin, RunCommand):
@@ -1,7 +1,3 @@
-import os
-import tempfile
-from pathlib import Path
-
 from briefcase.commands import (
     BuildCommand,
     CreateCommand,
@@ -38,26 +34,25 @@ class macOSAppMixin(macOSMixin):
 class macOSAppCreateCommand(macOSAppMixin, CreateCommand):
     description = "Create and populate a macOS app."
 
+    # Only the Python standard library is needed from the support package.
+    support_package_include = ["Python/Resources/lib"]
+
     def install_app_support_package(self, app: BaseConfig):
         """Install the application support package.
 
         :param app: The config object for the app
         """
-        super().install_app_support_package(app)
-
-        # keep only Python lib from support package
-        lib_path = (
-            self.support_path(app).parent / "Support" / "Python" / "Resources" / "lib"
-        )
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # TODO: Py3.8 compatibility; os.fsdecode not required in Py3.9
-            self.shutil.move(os.fsdecode(lib_path), os.fsdecode(tmpdir))
-            self.shutil.rmtree(self.support_path(app))
+        # The support folder should only contain the Python standard library;
+        # remove anything else that has been put there.
+        try:
+            support_path = self.support_path(app)
+        except KeyError:
+            pass
+        else:
+            if support_path.exists():
+                self.shutil.rmtree(support_path)
 
-            self.os.makedirs(Path(lib_path).parent)
-            # TODO: Py3.8 compatibility; os.fsdecode not required in Py3.9
-            self.shutil.move(os.fsdecode(Path(tmpdir) / "lib"), os.fsdecode(lib_path))
+        super().install_app_support_package(app)
 
 
 class macOSAppUpdateCommand(macOSAppMixin, UpdateCommand):
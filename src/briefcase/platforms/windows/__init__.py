@@ -20,6 +20,10 @@ class WindowsMixin:
     def distribution_path(self, app, packaging_format):
         return self.platform_path / f"{app.formal_name}-{app.version}.msi"
 
+    def required_tools(self, app: BaseConfig):
+        """WiX is needed to package Windows apps as MSI installers."""
+        return super().required_tools(app) + [(WiX, {})]
+
 
 class WindowsCreateCommand(CreateCommand):
     @property
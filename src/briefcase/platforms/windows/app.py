@@ -17,6 +17,10 @@ class WindowsAppMixin(WindowsMixin):
     output_format = "app"
     packaging_root = Path("src")
 
+    def required_tools(self, app: BaseConfig):
+        """RCEdit is needed to set the details of the stub app binary."""
+        return super().required_tools(app) + [(RCEdit, {})]
+
 
 class WindowsAppCreateCommand(WindowsAppMixin, WindowsCreateCommand):
     description = "Create and populate a Windows app."
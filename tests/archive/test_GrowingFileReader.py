@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from briefcase.archive import GrowingFileReader
+
+
+def test_read_complete_file(tmp_path):
+    """A file that has been completely written can be read."""
+    path = tmp_path / "content.bin"
+    path.write_bytes(b"all the content")
+
+    reader = GrowingFileReader(path)
+    reader.complete.set()
+
+    assert reader.read() == b"all the content"
+
+
+def test_read_growing_file(tmp_path):
+    """Reads wait for content that hasn't been written yet."""
+    path = tmp_path / "content.bin"
+
+    def writer():
+        with path.open("wb") as f:
+            for chunk in [b"chunk-1;", b"chunk-2;", b"chunk-3;"]:
+                time.sleep(0.02)
+                f.write(chunk)
+                f.flush()
+        reader.complete.set()
+
+    reader = GrowingFileReader(path)
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        assert reader.read() == b"chunk-1;chunk-2;chunk-3;"
+    finally:
+        thread.join()
+        reader.close()
+
+
+def test_abandoned(tmp_path):
+    """If writing is abandoned, reading raises an error."""
+    path = tmp_path / "content.bin"
+    path.write_bytes(b"partial")
+
+    reader = GrowingFileReader(path)
+    assert reader.read(7) == b"partial"
+
+    reader.abandoned.set()
+    with pytest.raises(OSError, match=r"Writing of content.bin was abandoned"):
+        reader.read(1)
+
+
+def test_missing_complete_file(tmp_path):
+    """If a file is complete, but doesn't exist, reading raises an error."""
+    reader = GrowingFileReader(tmp_path / "content.bin")
+    reader.complete.set()
+
+    with pytest.raises(FileNotFoundError):
+        reader.read()
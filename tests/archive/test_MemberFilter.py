@@ -0,0 +1,64 @@
+import pytest
+
+from briefcase.archive import MemberFilter
+
+
+@pytest.mark.parametrize(
+    "name, selected",
+    [
+        ("Python/Resources/lib", True),
+        ("Python/Resources/lib/", True),
+        ("Python/Resources/lib/os.py", True),
+        ("./Python/Resources/lib/os.py", True),
+        ("Python/Resources/lib/encodings/utf_8.py", True),
+        ("Python/Resources/lib-dynload/foo.so", False),
+        ("Python/Resources/include/Python.h", False),
+        ("Python/Resources", False),
+        ("VERSIONS", False),
+    ],
+)
+def test_include(name, selected):
+    """Only members in an included folder are selected."""
+    members = MemberFilter(include=["Python/Resources/lib"])
+    assert members(name) == selected
+
+
+@pytest.mark.parametrize(
+    "name, selected",
+    [
+        ("lib/os.py", True),
+        ("lib/test/test_os.py", False),
+        ("lib/test", False),
+        ("lib/idlelib/test/test_x.py", True),
+        ("lib/module.pyc", False),
+        ("lib/__pycache__/module.cpython-310.pyc", False),
+    ],
+)
+def test_exclude(name, selected):
+    """Members matching an exclude pattern aren't selected."""
+    members = MemberFilter(exclude=["lib/test", "*.pyc", "*/__pycache__"])
+    assert members(name) == selected
+
+
+def test_include_and_exclude():
+    """Exclusions are applied to included members."""
+    members = MemberFilter(include=["lib"], exclude=["lib/test"])
+
+    assert members("lib/os.py")
+    assert not members("lib/test/test_os.py")
+    assert not members("bin/python3")
+
+
+def test_root():
+    """The root of the archive is never selected."""
+    members = MemberFilter(exclude=["test"])
+
+    assert not members(".")
+    assert not members("./")
+
+
+def test_key():
+    """Filters with the same patterns have the same key."""
+    assert MemberFilter(include=["lib"]).key == MemberFilter(include=["lib"]).key
+    assert MemberFilter(include=["lib"]).key != MemberFilter(exclude=["lib"]).key
+    assert MemberFilter(include=["lib"]).key != MemberFilter(include=["bin"]).key
@@ -0,0 +1,21 @@
+import pytest
+
+from briefcase.archive import is_tar_archive
+
+
+@pytest.mark.parametrize(
+    "filename, result",
+    [
+        ("support.tar", True),
+        ("support.tar.gz", True),
+        ("Support.TGZ", True),
+        ("support.tar.bz2", True),
+        ("support.tar.xz", True),
+        ("support.zip", False),
+        ("support.gz", False),
+        ("linuxdeploy-x86_64.AppImage", False),
+    ],
+)
+def test_is_tar_archive(filename, result):
+    """Tar archives are identified by their extension."""
+    assert is_tar_archive(filename) is result
@@ -0,0 +1,84 @@
+import io
+import shutil
+import tarfile
+
+import pytest
+
+from briefcase.archive import MemberFilter, StreamingTarExtractor, unpack_archive
+
+from ..utils import create_zip_file
+
+CONTENT = [
+    ("Python/Resources/lib/os.py", "# os"),
+    ("Python/Resources/lib/test/test_os.py", "# test"),
+    ("Python/Resources/include/Python.h", "/* header */"),
+    ("VERSIONS", "3.X"),
+]
+
+MEMBERS = MemberFilter(include=["Python/Resources/lib"], exclude=["*/test"])
+
+
+def create_tar_file(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in content:
+            info = tarfile.TarInfo(name)
+            info.size = len(data.encode())
+            tar.addfile(info, io.BytesIO(data.encode()))
+    return path
+
+
+def assert_selected(extract_path):
+    assert (extract_path / "Python" / "Resources" / "lib" / "os.py").exists()
+    assert not (extract_path / "Python" / "Resources" / "lib" / "test").exists()
+    assert not (extract_path / "Python" / "Resources" / "include").exists()
+    assert not (extract_path / "VERSIONS").exists()
+
+
+def test_unpack_zip_members(tmp_path):
+    """Selected members of a zip archive can be unpacked."""
+    archive = create_zip_file(tmp_path / "support.zip", CONTENT)
+
+    unpack_archive(archive, extract_dir=tmp_path / "out", members=MEMBERS)
+
+    assert_selected(tmp_path / "out")
+
+
+def test_unpack_tar_members(tmp_path):
+    """Selected members of a tar archive can be unpacked."""
+    archive = create_tar_file(tmp_path / "support.tar.gz", CONTENT)
+
+    unpack_archive(archive, extract_dir=tmp_path / "out", members=MEMBERS)
+
+    assert_selected(tmp_path / "out")
+
+
+def test_unpack_all(tmp_path):
+    """Without a filter, the entire archive is unpacked."""
+    archive = create_tar_file(tmp_path / "support.tar.gz", CONTENT)
+
+    unpack_archive(archive, extract_dir=tmp_path / "out")
+
+    assert (tmp_path / "out" / "VERSIONS").exists()
+    assert (tmp_path / "out" / "Python" / "Resources" / "lib" / "test").exists()
+
+
+def test_unpack_invalid(tmp_path):
+    """A file that isn't an archive raises an error."""
+    archive = tmp_path / "support.tar.gz"
+    archive.write_text("not an archive")
+
+    with pytest.raises(shutil.ReadError):
+        unpack_archive(archive, extract_dir=tmp_path / "out", members=MEMBERS)
+
+
+def test_streaming_members(tmp_path):
+    """Selected members of a tar archive can be unpacked as it is written."""
+    archive = create_tar_file(tmp_path / "support.tar.gz", CONTENT)
+
+    extractor = StreamingTarExtractor(tmp_path / "out", members=MEMBERS)
+    extractor.start(archive)
+    extractor.finish()
+    extractor.raise_for_error()
+
+    assert_selected(tmp_path / "out")
@@ -0,0 +1,130 @@
+import os
+import shutil
+import stat
+import sys
+import zipfile
+
+import pytest
+
+from briefcase.archive import MemberFilter, unpack_archive, unpack_zip
+
+
+def create_zip(path, content):
+    """Create a zip file with members that have Unix permissions.
+
+    :param path: The zip file to create.
+    :param content: A list of (name, data, mode) tuples. A name ending in
+        ``/`` is a folder.
+    """
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data, mode in content:
+            info = zipfile.ZipInfo(name)
+            info.create_system = 3
+            info.external_attr = mode << 16
+            archive.writestr(info, data)
+    return path
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return create_zip(
+        tmp_path / "tools.zip",
+        [
+            ("cmdline-tools/", "", stat.S_IFDIR | 0o755),
+            ("cmdline-tools/bin/sdkmanager", "#!/bin/sh", stat.S_IFREG | 0o755),
+            ("cmdline-tools/lib/sdkmanager.jar", "x" * 100000, stat.S_IFREG | 0o644),
+            ("cmdline-tools/empty/", "", stat.S_IFDIR | 0o755),
+            ("NOTICE.txt", "notice", stat.S_IFREG | 0o644),
+        ],
+    )
+
+
+def test_unpack(archive, tmp_path):
+    """A zip file can be unpacked."""
+    unpack_zip(archive, tmp_path / "out")
+
+    out = tmp_path / "out"
+    assert (out / "cmdline-tools" / "bin" / "sdkmanager").read_text() == "#!/bin/sh"
+    assert (out / "cmdline-tools" / "lib" / "sdkmanager.jar").read_text() == (
+        "x" * 100000
+    )
+    assert (out / "cmdline-tools" / "empty").is_dir()
+    assert (out / "NOTICE.txt").read_text() == "notice"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Permissions are POSIX specific")
+def test_executable_permissions(archive, tmp_path):
+    """Executable permissions are restored."""
+    unpack_zip(archive, tmp_path / "out")
+
+    out = tmp_path / "out"
+    assert os.access(out / "cmdline-tools" / "bin" / "sdkmanager", os.X_OK)
+    assert not os.access(out / "cmdline-tools" / "lib" / "sdkmanager.jar", os.X_OK)
+
+
+def test_members(archive, tmp_path):
+    """Selected members can be unpacked."""
+    unpack_zip(archive, tmp_path / "out", members=MemberFilter(include=["*/bin"]))
+
+    out = tmp_path / "out"
+    assert (out / "cmdline-tools" / "bin" / "sdkmanager").exists()
+    assert not (out / "cmdline-tools" / "lib").exists()
+    assert not (out / "NOTICE.txt").exists()
+
+
+def test_unsafe_members(tmp_path):
+    """Members with absolute paths, or paths outside the folder, are
+    skipped."""
+    archive = create_zip(
+        tmp_path / "unsafe.zip",
+        [
+            ("../escape.txt", "escaped", stat.S_IFREG | 0o644),
+            ("safe.txt", "safe", stat.S_IFREG | 0o644),
+        ],
+    )
+
+    unpack_zip(archive, tmp_path / "out")
+
+    assert (tmp_path / "out" / "safe.txt").exists()
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_not_a_zip_file(tmp_path):
+    """A file that isn't a zip file raises an error."""
+    archive = tmp_path / "bad.zip"
+    archive.write_text("This isn't a zip file")
+
+    with pytest.raises(shutil.ReadError):
+        unpack_zip(archive, tmp_path / "out")
+
+
+def test_corrupted_member(archive, tmp_path):
+    """A corrupted member raises an error."""
+    # Corrupt the content of a member
+    content = bytearray(archive.read_bytes())
+    offset = content.index(b"#!/bin/sh")
+    content[offset] ^= 0xFF
+    corrupted = tmp_path / "corrupted.zip"
+    corrupted.write_bytes(bytes(content))
+
+    with pytest.raises(shutil.ReadError):
+        unpack_zip(corrupted, tmp_path / "out")
+
+
+def test_unpack_archive(archive, tmp_path):
+    """unpack_archive() unpacks zip archives with the Briefcase zip
+    unpacker."""
+    unpack_archive(archive, extract_dir=tmp_path / "out")
+
+    sdkmanager = tmp_path / "out" / "cmdline-tools" / "bin" / "sdkmanager"
+    assert sdkmanager.exists()
+    if sys.platform != "win32":
+        assert os.access(sdkmanager, os.X_OK)
+
+
+def test_shutil_unchanged():
+    """The zip unpacker used by shutil isn't replaced."""
+    formats = {
+        name: description for name, _, description in shutil.get_unpack_formats()
+    }
+    assert formats["zip"] == "ZIP file"
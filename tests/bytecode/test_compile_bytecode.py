@@ -0,0 +1,88 @@
+import importlib.util
+import marshal
+
+import pytest
+
+from briefcase.bytecode import CHECKED_HASH_FLAGS, bytecode_path, compile_bytecode
+
+
+@pytest.fixture
+def sources(tmp_path):
+    app_path = tmp_path / "app"
+    (app_path / "my_app").mkdir(parents=True)
+    (app_path / "my_app" / "__init__.py").write_text("")
+    (app_path / "my_app" / "__main__.py").write_text("print('hello')\n")
+    (app_path / "my_app" / "legacy.py").write_text("print 'hello'\n")
+    return app_path
+
+
+def test_bytecode_path(tmp_path):
+    """The bytecode path depends on the optimization level and mode."""
+    source = tmp_path / "module.py"
+    tag = importlib.util.cache_from_source(str(source)).split(".")[-2]
+
+    assert bytecode_path(source) == tmp_path / "__pycache__" / f"module.{tag}.pyc"
+    assert (
+        bytecode_path(source, optimize=2)
+        == tmp_path / "__pycache__" / f"module.{tag}.opt-2.pyc"
+    )
+    assert bytecode_path(source, optimize=2, sourceless=True) == tmp_path / "module.pyc"
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_compile(sources, max_workers):
+    """Source files are compiled to checked hash-based bytecode."""
+    compiled, failed = compile_bytecode([sources], max_workers=max_workers)
+
+    # The file with a syntax error can't be compiled.
+    assert (compiled, failed) == (2, 1)
+
+    main_path = sources / "my_app" / "__main__.py"
+    content = bytecode_path(main_path).read_bytes()
+    assert content[:4] == importlib.util.MAGIC_NUMBER
+    assert int.from_bytes(content[4:8], "little") == CHECKED_HASH_FLAGS
+    assert content[8:16] == importlib.util.source_hash(main_path.read_bytes())
+    # The filename in the bytecode is relative to the folder
+    assert marshal.loads(content[16:]).co_filename == "my_app/__main__.py"
+
+    # The source is retained
+    assert main_path.exists()
+    assert not bytecode_path(sources / "my_app" / "legacy.py").exists()
+
+
+def test_current_bytecode_not_recompiled(sources):
+    """Bytecode that is up to date isn't recompiled."""
+    compile_bytecode([sources], max_workers=1)
+    main_pyc = bytecode_path(sources / "my_app" / "__main__.py")
+    init_pyc = bytecode_path(sources / "my_app" / "__init__.py")
+    main_pyc.write_bytes(main_pyc.read_bytes() + b"marker")
+    (sources / "my_app" / "__init__.py").write_text("x = 1\n")
+    init_content = init_pyc.read_bytes()
+
+    compile_bytecode([sources], max_workers=1)
+
+    # The unchanged file wasn't recompiled; the changed file was.
+    assert main_pyc.read_bytes().endswith(b"marker")
+    assert init_pyc.read_bytes() != init_content
+
+
+def test_sourceless(sources):
+    """In sourceless mode, sources are replaced by bytecode."""
+    stale_pyc = bytecode_path(sources / "my_app" / "__main__.py")
+    stale_pyc.parent.mkdir()
+    stale_pyc.write_bytes(b"stale")
+
+    compiled, failed = compile_bytecode(
+        [sources],
+        optimize=2,
+        sourceless=True,
+        max_workers=1,
+    )
+
+    assert (compiled, failed) == (2, 1)
+    assert (sources / "my_app" / "__main__.pyc").exists()
+    assert not (sources / "my_app" / "__main__.py").exists()
+    assert not stale_pyc.exists()
+    # A file that can't be compiled is retained.
+    assert (sources / "my_app" / "legacy.py").exists()
+    assert not (sources / "my_app" / "legacy.pyc").exists()
@@ -0,0 +1,28 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.cache import DownloadCache
+
+# The time at which tests are running, as a timestamp.
+NOW = 1_000_000_000.0
+
+
+@pytest.fixture
+def download_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "briefcase.cache.time", mock.Mock(time=mock.Mock(return_value=NOW))
+    )
+    return DownloadCache(tmp_path / "cache")
+
+
+def create_file(path, content):
+    """Create a file with the given binary content.
+
+    :param path: The path of the file to create.
+    :param content: The content for the file.
+    :returns: The path of the created file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
@@ -0,0 +1,97 @@
+import pytest
+
+from briefcase.cache import DependencyStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DependencyStore(tmp_path / "dependencies")
+
+
+def install_package(path):
+    (path / "package").mkdir()
+    (path / "package" / "__init__.py").write_text("package")
+
+
+def test_fingerprint():
+    """The fingerprint ignores order and whitespace, but not the
+    environment."""
+    key = DependencyStore.fingerprint(["a", "b>=1"], python="3.11")
+
+    assert DependencyStore.fingerprint(["b >= 1", "a"], python="3.11") == key
+    assert DependencyStore.fingerprint(["a", "b>=2"], python="3.11") != key
+    assert DependencyStore.fingerprint(["a", "b>=1"], python="3.12") != key
+
+
+def test_install_and_materialize(store, tmp_path):
+    """Installed requirements can be copied out of the store."""
+    assert not store.contains("key")
+
+    entry_path = store.install("key", install_package)
+
+    assert store.contains("key")
+    assert entry_path == store.entry_path("key")
+    # No staging folders remain
+    assert [path.name for path in store.path.iterdir() if path.is_dir()] == ["key"]
+
+    store.materialize("key", tmp_path / "app_packages")
+    assert (tmp_path / "app_packages" / "package" / "__init__.py").read_text() == (
+        "package"
+    )
+
+
+def test_size(store):
+    """The size of installed requirements can be determined."""
+    store.install("key", install_package)
+
+    assert store.size("key") == len("package")
+
+
+def test_install_existing(store):
+    """Requirements that are already stored aren't reinstalled."""
+    store.install("key", install_package)
+
+    def fail(path):
+        pytest.fail("Requirements should not be reinstalled")
+
+    store.install("key", fail)
+
+
+def test_install_failure(store):
+    """If the install fails, nothing is stored."""
+
+    def fail(path):
+        (path / "partial").write_text("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        store.install("key", fail)
+
+    assert not store.contains("key")
+    assert [path for path in store.path.iterdir() if path.is_dir()] == []
+
+
+def test_disabled(store):
+    """If the store is disabled, stored requirements aren't reused, and are
+    replaced by a fresh install."""
+    store.install("key", install_package)
+    store.enabled = False
+
+    assert not store.contains("key")
+
+    def install_other(path):
+        (path / "other.py").write_text("other")
+
+    store.install("key", install_other)
+
+    assert (store.entry_path("key") / "other.py").exists()
+    assert not (store.entry_path("key") / "package").exists()
+
+
+def test_staging_permissions(store):
+    """Staging folders have the permissions of the store, rather than being
+    private to the owner."""
+    store.path.mkdir(mode=0o755)
+    store.path.chmod(0o755)
+
+    assert store.staging_path().stat().st_mode & 0o777 == 0o755
@@ -0,0 +1,138 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from .conftest import NOW, create_file
+
+DIGEST = hashlib.sha256(b"content").hexdigest()
+
+
+def test_add(download_cache, tmp_path):
+    """Newly downloaded content is moved into the store, and linked into
+    place."""
+    download = create_file(tmp_path / "downloads" / "file.zip.part", b"content")
+    target = tmp_path / "downloads" / "file.zip"
+
+    digest = download_cache.add("https://example.com/file.zip", download, target)
+
+    assert digest == DIGEST
+
+    # The download has been consumed, and the blob is in the store.
+    assert not download.exists()
+    blob_path = tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST
+    assert blob_path.read_bytes() == b"content"
+
+    # The target is a read-only link to the blob.
+    assert target.read_bytes() == b"content"
+    assert target.samefile(blob_path)
+    assert blob_path.stat().st_mode & 0o222 == 0
+
+    # The URL has been recorded in the index.
+    with (tmp_path / "cache" / "index.json").open() as f:
+        assert json.load(f) == {
+            "urls": {
+                "https://example.com/file.zip": {
+                    "digest": DIGEST,
+                    "filename": "file.zip",
+                    "paths": [str(target)],
+                    "stat": [7, blob_path.stat().st_mtime_ns],
+                    "last_used": NOW,
+                }
+            }
+        }
+
+
+def test_add_metadata(download_cache, tmp_path):
+    """Additional metadata can be recorded for a URL."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+
+    download_cache.add(
+        "https://example.com/file.zip",
+        download,
+        tmp_path / "file.zip",
+        digest=DIGEST,
+        etag="abc123",
+    )
+
+    assert download_cache.load_index()["https://example.com/file.zip"] == {
+        "digest": DIGEST,
+        "etag": "abc123",
+        "filename": "file.zip",
+        "paths": [str(tmp_path / "file.zip")],
+        "stat": [7, (tmp_path / "file.zip").stat().st_mtime_ns],
+        "last_used": NOW,
+    }
+
+
+def test_add_duplicate_content(download_cache, tmp_path):
+    """If different URLs serve identical content, only one copy is stored."""
+    first = create_file(tmp_path / "first" / "file.zip.part", b"content")
+    second = create_file(tmp_path / "second" / "other.zip.part", b"content")
+
+    download_cache.add(
+        "https://example.com/file.zip", first, tmp_path / "first" / "file.zip"
+    )
+    download_cache.add(
+        "https://example.org/other.zip", second, tmp_path / "second" / "other.zip"
+    )
+
+    # Both downloads were consumed; there is only one blob.
+    assert not first.exists()
+    assert not second.exists()
+    assert len(list((tmp_path / "cache" / "blobs").glob("*/*"))) == 1
+
+    # Both targets are links to the same content.
+    assert (tmp_path / "first" / "file.zip").samefile(tmp_path / "second" / "other.zip")
+
+    # Both URLs are recorded.
+    assert download_cache.digest("https://example.com/file.zip") == DIGEST
+    assert download_cache.digest("https://example.org/other.zip") == DIGEST
+
+
+def test_add_in_place(download_cache, tmp_path):
+    """A file can be adopted into the store without moving it."""
+    path = create_file(tmp_path / "file.zip", b"content")
+
+    download_cache.add("https://example.com/file.zip", path, path)
+
+    # The file still exists, but is now a link to the blob.
+    assert path.read_bytes() == b"content"
+    assert path.samefile(tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST)
+
+
+def test_add_link_unavailable(download_cache, tmp_path, monkeypatch):
+    """If the content can't be linked into place, it is copied."""
+
+    def no_link(source, target):
+        raise OSError("Cross-device link")
+
+    monkeypatch.setattr("briefcase.cache.os.link", no_link)
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    target = tmp_path / "file.zip"
+
+    download_cache.add("https://example.com/file.zip", download, target)
+
+    assert target.read_bytes() == b"content"
+    assert not target.samefile(tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST)
+
+
+def test_add_concurrent(download_cache, tmp_path):
+    """Content can be added from multiple threads without losing updates to the
+    index."""
+    downloads = [
+        create_file(tmp_path / f"file{i}.zip.part", f"content {i}".encode())
+        for i in range(20)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for i, download in enumerate(downloads):
+            executor.submit(
+                download_cache.add,
+                f"https://example.com/file{i}.zip",
+                download,
+                tmp_path / f"file{i}.zip",
+            )
+
+    # Every URL has been recorded.
+    assert sorted(download_cache.load_index()) == sorted(
+        f"https://example.com/file{i}.zip" for i in range(20)
+    )
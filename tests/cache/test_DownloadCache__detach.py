@@ -0,0 +1,93 @@
+import hashlib
+
+from .conftest import create_file
+
+DIGEST = hashlib.sha256(b"content").hexdigest()
+
+
+def test_detach(download_cache, tmp_path):
+    """A placed file can be replaced by a private copy, which can be modified
+    without modifying the cache."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    target = tmp_path / "file.zip"
+
+    download_cache.detach("https://example.com/file.zip", target, mode=0o755)
+
+    blob_path = tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST
+    assert not target.samefile(blob_path)
+    assert target.stat().st_mode & 0o777 == 0o755
+    assert download_cache.record("https://example.com/file.zip")["private"] == [
+        str(target)
+    ]
+
+    # The private copy can be modified; the cached content isn't changed.
+    target.write_bytes(b"modified")
+    assert blob_path.read_bytes() == b"content"
+    assert blob_path.stat().st_mode & 0o222 == 0
+
+    # The private copy belongs to its owner, so it is still accepted.
+    assert download_cache.verify("https://example.com/file.zip", target)
+
+
+def test_detach_default_mode(download_cache, tmp_path):
+    """By default, a private copy is writable by its owner."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    target = tmp_path / "file.zip"
+
+    download_cache.detach("https://example.com/file.zip", target)
+
+    assert target.stat().st_mode & 0o200
+
+
+def test_detach_private(download_cache, tmp_path):
+    """A file that is already a private copy is left as-is."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    target = tmp_path / "file.zip"
+    download_cache.detach("https://example.com/file.zip", target)
+    target.write_bytes(b"modified")
+
+    download_cache.detach("https://example.com/file.zip", target)
+
+    assert target.read_bytes() == b"modified"
+
+
+def test_detach_unknown(download_cache, tmp_path):
+    """Detaching a file from a URL that isn't cached is a no-op."""
+    target = create_file(tmp_path / "file.zip", b"content")
+
+    download_cache.detach("https://example.com/file.zip", target)
+
+    assert target.read_bytes() == b"content"
+    assert download_cache.load_index() == {}
+
+
+def test_materialize_private(download_cache, tmp_path):
+    """If content is restored over a private copy, the restored file is a link
+    to the cached content again."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    target = tmp_path / "file.zip"
+    download_cache.detach("https://example.com/file.zip", target)
+
+    assert download_cache.materialize("https://example.com/file.zip", target)
+
+    assert target.samefile(tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST)
+    assert download_cache.record("https://example.com/file.zip")["private"] == []
+
+
+def test_evict_private(download_cache, tmp_path):
+    """A private copy is removed when its content is evicted, even if it has
+    been modified."""
+    download = create_file(tmp_path / "first" / "file.zip.part", b"content")
+    target = tmp_path / "first" / "file.zip"
+    download_cache.add("https://example.com/file.zip", download, target)
+    download_cache.detach("https://example.com/file.zip", target)
+    target.write_bytes(b"modified")
+
+    download_cache.evict("https://example.com/file.zip")
+
+    assert not target.exists()
+    assert download_cache.blobs() == []
@@ -0,0 +1,179 @@
+import hashlib
+
+from .conftest import NOW, create_file
+
+DIGEST = hashlib.sha256(b"content").hexdigest()
+
+
+def add(download_cache, url, path, content=b"content", last_used=NOW):
+    """Add content to the cache, as if it had been downloaded.
+
+    :param url: The URL that was downloaded.
+    :param path: The location where the content was placed.
+    :param content: The content that was downloaded.
+    :param last_used: The time at which the content was last used.
+    """
+    download = create_file(path.parent / f"{path.name}.part", content)
+    download_cache.add(url, download, path)
+
+    index = download_cache.load_index()
+    index[url]["last_used"] = last_used
+    download_cache.save_index(index)
+
+
+def test_entries(download_cache, tmp_path):
+    """The entries of the cache are listed in least recently used order."""
+    add(download_cache, "https://example.com/new.zip", tmp_path / "new.zip", b"new")
+    add(
+        download_cache,
+        "https://example.com/old.zip",
+        tmp_path / "old.zip",
+        b"old content",
+        last_used=NOW - 100,
+    )
+
+    entries = download_cache.entries()
+
+    assert [entry["url"] for entry in entries] == [
+        "https://example.com/old.zip",
+        "https://example.com/new.zip",
+    ]
+    assert entries[0]["size"] == 11
+    assert entries[0]["paths"] == [tmp_path / "old.zip"]
+    assert download_cache.size() == 14
+
+
+def test_evict(download_cache, tmp_path):
+    """Evicting a URL removes the placed files and the stored content."""
+    add(download_cache, "https://example.com/file.zip", tmp_path / "dl" / "file.zip")
+
+    assert download_cache.evict("https://example.com/file.zip") == 7
+
+    assert download_cache.record("https://example.com/file.zip") is None
+    assert not (tmp_path / "dl" / "file.zip").exists()
+    # The empty download folder has also been removed
+    assert not (tmp_path / "dl").exists()
+    assert download_cache.blobs() == []
+
+
+def test_evict_shared_content(download_cache, tmp_path):
+    """Content that is shared with another URL isn't removed."""
+    add(download_cache, "https://example.com/file.zip", tmp_path / "file.zip")
+    add(download_cache, "https://example.org/other.zip", tmp_path / "other.zip")
+
+    assert download_cache.evict("https://example.com/file.zip") == 0
+
+    assert not (tmp_path / "file.zip").exists()
+    assert (tmp_path / "other.zip").read_bytes() == b"content"
+    assert download_cache.blob_path(DIGEST).exists()
+
+
+def test_evict_modified_file(download_cache, tmp_path):
+    """A placed file that has been replaced isn't removed."""
+    add(download_cache, "https://example.com/file.zip", tmp_path / "file.zip")
+    (tmp_path / "file.zip").unlink()
+    (tmp_path / "file.zip").write_bytes(b"something else")
+
+    download_cache.evict("https://example.com/file.zip")
+
+    assert (tmp_path / "file.zip").read_bytes() == b"something else"
+    assert download_cache.blobs() == []
+
+
+def test_evict_unknown(download_cache):
+    """Evicting a URL that isn't cached is a no-op."""
+    assert download_cache.evict("https://example.com/file.zip") == 0
+
+
+def test_remove_orphans(download_cache, tmp_path):
+    """Content that isn't used by any URL can be removed."""
+    add(download_cache, "https://example.com/file.zip", tmp_path / "file.zip")
+    download_cache.forget("https://example.com/file.zip")
+
+    assert download_cache.remove_orphans() == 7
+    assert download_cache.blobs() == []
+
+
+def test_prune(download_cache, tmp_path):
+    """Content that hasn't been used recently can be pruned."""
+    add(
+        download_cache,
+        "https://example.com/old.zip",
+        tmp_path / "old.zip",
+        b"old",
+        last_used=NOW - 100,
+    )
+    add(
+        download_cache,
+        "https://example.com/kept.zip",
+        tmp_path / "kept.zip",
+        b"kept",
+        last_used=NOW - 100,
+    )
+    add(download_cache, "https://example.com/new.zip", tmp_path / "new.zip", b"new")
+
+    evicted = download_cache.prune(
+        NOW - 50,
+        keep=lambda entry: entry["url"] == "https://example.com/kept.zip",
+    )
+
+    assert [entry["url"] for entry in evicted] == ["https://example.com/old.zip"]
+    assert not (tmp_path / "old.zip").exists()
+    assert (tmp_path / "kept.zip").exists()
+    assert (tmp_path / "new.zip").exists()
+
+
+def test_gc(download_cache, tmp_path):
+    """The least recently used content is removed until the cache fits a
+    budget."""
+    for age, name in enumerate(["newest", "newer", "older", "oldest"]):
+        add(
+            download_cache,
+            f"https://example.com/{name}.zip",
+            tmp_path / f"{name}.zip",
+            name.encode() * 10,
+            last_used=NOW - age,
+        )
+
+    # The cache has 60, 50, 50 and 60 bytes of content.
+    evicted = download_cache.gc(120)
+
+    assert [entry["url"] for entry in evicted] == [
+        "https://example.com/oldest.zip",
+        "https://example.com/older.zip",
+    ]
+    assert download_cache.size() == 110
+    assert (tmp_path / "newest.zip").exists()
+    assert (tmp_path / "newer.zip").exists()
+
+
+def test_gc_keep(download_cache, tmp_path):
+    """Content that must be kept is skipped by garbage collection."""
+    add(
+        download_cache,
+        "https://example.com/tool.zip",
+        tmp_path / "tool.zip",
+        b"tool",
+        last_used=NOW - 100,
+    )
+    add(download_cache, "https://example.com/file.zip", tmp_path / "file.zip")
+
+    evicted = download_cache.gc(
+        0,
+        keep=lambda entry: entry["url"] == "https://example.com/tool.zip",
+    )
+
+    assert [entry["url"] for entry in evicted] == ["https://example.com/file.zip"]
+    assert (tmp_path / "tool.zip").exists()
+    assert download_cache.size() == 4
+
+
+def test_gc_orphans(download_cache, tmp_path):
+    """Unused content is removed before any URLs are evicted."""
+    add(download_cache, "https://example.com/file.zip", tmp_path / "file.zip")
+    add(download_cache, "https://example.com/old.zip", tmp_path / "old.zip", b"old")
+    download_cache.forget("https://example.com/old.zip")
+
+    assert download_cache.gc(10) == []
+    assert (tmp_path / "file.zip").exists()
+    assert download_cache.size() == 7
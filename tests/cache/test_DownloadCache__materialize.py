@@ -0,0 +1,53 @@
+import hashlib
+
+from .conftest import create_file
+
+DIGEST = hashlib.sha256(b"content").hexdigest()
+
+
+def test_materialize(download_cache, tmp_path):
+    """Content in the store can be restored into a new location."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+
+    target = tmp_path / "elsewhere" / "file.zip"
+    assert download_cache.materialize("https://example.com/file.zip", target)
+
+    assert target.read_bytes() == b"content"
+
+
+def test_materialize_unknown_url(download_cache, tmp_path):
+    """A URL that hasn't been downloaded can't be restored."""
+    target = tmp_path / "file.zip"
+    assert not download_cache.materialize("https://example.com/file.zip", target)
+
+    assert not target.exists()
+
+
+def test_materialize_missing_blob(download_cache, tmp_path):
+    """If the blob has been deleted, the URL is forgotten."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    (tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST).unlink()
+
+    target = tmp_path / "elsewhere" / "file.zip"
+    assert not download_cache.materialize("https://example.com/file.zip", target)
+
+    assert not target.exists()
+    assert download_cache.digest("https://example.com/file.zip") is None
+
+
+def test_materialize_corrupted_blob(download_cache, tmp_path):
+    """If the blob has been corrupted, it is discarded."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    blob_path = tmp_path / "cache" / "blobs" / DIGEST[:2] / DIGEST
+    blob_path.chmod(0o644)
+    blob_path.write_bytes(b"corrupted")
+
+    target = tmp_path / "elsewhere" / "file.zip"
+    assert not download_cache.materialize("https://example.com/file.zip", target)
+
+    assert not target.exists()
+    assert not blob_path.exists()
+    assert download_cache.digest("https://example.com/file.zip") is None
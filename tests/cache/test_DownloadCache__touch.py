@@ -0,0 +1,49 @@
+from .conftest import NOW, create_file
+
+
+def test_touch(download_cache, tmp_path):
+    """Using content updates the time it was last used."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+
+    # Time passes, and the content is used again.
+    download_cache.touch("https://example.com/file.zip")
+
+    record = download_cache.record("https://example.com/file.zip")
+    assert record["last_used"] == NOW
+    assert record["paths"] == [str(tmp_path / "file.zip")]
+
+
+def test_touch_new_path(download_cache, tmp_path):
+    """If content is placed in a new location, the location is recorded."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+
+    download_cache.touch(
+        "https://example.com/file.zip", tmp_path / "other" / "file.zip"
+    )
+
+    assert download_cache.record("https://example.com/file.zip")["paths"] == [
+        str(tmp_path / "file.zip"),
+        str(tmp_path / "other" / "file.zip"),
+    ]
+
+
+def test_touch_unknown(download_cache, tmp_path):
+    """Touching a URL that isn't cached is a no-op."""
+    download_cache.touch("https://example.com/file.zip")
+
+    assert download_cache.record("https://example.com/file.zip") is None
+
+
+def test_materialize_recorded(download_cache, tmp_path):
+    """Restoring content records the location, and the use of the content."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    (tmp_path / "file.zip").unlink()
+
+    download_cache.materialize("https://example.com/file.zip", tmp_path / "new.zip")
+
+    record = download_cache.record("https://example.com/file.zip")
+    assert record["last_used"] == NOW
+    assert str(tmp_path / "new.zip") in record["paths"]
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from .conftest import create_file
+
+
+def test_verify_match(download_cache, tmp_path):
+    """A file that matches the recorded digest is verified."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+
+    assert download_cache.verify("https://example.com/file.zip", tmp_path / "file.zip")
+
+
+def test_verify_link(download_cache, tmp_path, monkeypatch):
+    """A link to unmodified cached content is verified without reading it."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    file_sha256 = mock.Mock()
+    monkeypatch.setattr("briefcase.cache.file_sha256", file_sha256)
+
+    assert download_cache.verify("https://example.com/file.zip", tmp_path / "file.zip")
+
+    file_sha256.assert_not_called()
+
+
+def test_verify_modified_link(download_cache, tmp_path):
+    """If the cached content has been modified through a link, the
+    modification is detected."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    (tmp_path / "file.zip").chmod(0o644)
+    (tmp_path / "file.zip").write_bytes(b"modified")
+
+    assert (
+        download_cache.verify("https://example.com/file.zip", tmp_path / "file.zip")
+        is False
+    )
+
+
+def test_verify_mismatch(download_cache, tmp_path):
+    """A file that doesn't match the recorded digest fails verification."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+    other = create_file(tmp_path / "other.zip", b"other content")
+
+    assert download_cache.verify("https://example.com/file.zip", other) is False
+
+
+def test_verify_unknown(download_cache, tmp_path):
+    """A file from an unrecorded URL can't be verified."""
+    other = create_file(tmp_path / "other.zip", b"other content")
+
+    assert download_cache.verify("https://example.com/file.zip", other) is None
+
+
+def test_corrupted_index(download_cache, tmp_path):
+    """A corrupted index is treated as empty."""
+    create_file(tmp_path / "cache" / "index.json", b"this isn't JSON")
+
+    assert download_cache.load_index() == {}
+    assert download_cache.digest("https://example.com/file.zip") is None
+
+
+def test_forget(download_cache, tmp_path):
+    """A URL can be removed from the index."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add("https://example.com/file.zip", download, tmp_path / "file.zip")
+
+    download_cache.forget("https://example.com/file.zip")
+
+    assert download_cache.digest("https://example.com/file.zip") is None
+    # The cached file isn't affected.
+    assert (tmp_path / "file.zip").exists()
+
+
+def test_conditional_headers(download_cache, tmp_path):
+    """Recorded cache validators are converted into conditional headers."""
+    download = create_file(tmp_path / "file.zip.part", b"content")
+    download_cache.add(
+        "https://example.com/file.zip",
+        download,
+        tmp_path / "file.zip",
+        etag='"abc123"',
+        last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+    )
+
+    assert download_cache.conditional_headers("https://example.com/file.zip") == {
+        "If-None-Match": '"abc123"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+    }
+
+
+def test_conditional_headers_unknown(download_cache):
+    """A URL that hasn't been downloaded has no conditional headers."""
+    assert download_cache.conditional_headers("https://example.com/file.zip") == {}
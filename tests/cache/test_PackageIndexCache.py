@@ -0,0 +1,106 @@
+import hashlib
+import os
+
+import pytest
+
+from briefcase.cache import PackageIndexCache
+
+LINKS = [
+    {
+        "filename": "package-1.0.tar.gz",
+        "url": "https://files.example.com/package-1.0.tar.gz",
+        "fragment": "sha256=abcd",
+        "attributes": {},
+    }
+]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PackageIndexCache(tmp_path / "packages")
+
+
+def test_page(cache):
+    """The links on a project page can be recorded and loaded."""
+    assert cache.load_page("package") is None
+
+    cache.save_page("package", LINKS)
+
+    assert cache.load_page("package") == LINKS
+    # No temporary files remain
+    assert [path.name for path in cache.pages_path.iterdir()] == ["package.json"]
+
+
+def test_corrupt_page(cache):
+    """A page that can't be read is treated as missing."""
+    cache.pages_path.mkdir(parents=True)
+    (cache.pages_path / "package.json").write_text("not JSON", encoding="utf-8")
+
+    assert cache.load_page("package") is None
+
+
+def test_add_file(cache):
+    """A file can be stored, verifying its digest."""
+    digest = hashlib.sha256(b"content").hexdigest()
+
+    path = cache.add_file(
+        "package",
+        "package-1.0.tar.gz",
+        [b"con", b"tent"],
+        digest=f"sha256={digest}",
+    )
+
+    assert path == cache.file_path("package", "package-1.0.tar.gz")
+    assert path.read_bytes() == b"content"
+    assert [entry["name"] for entry in cache.entries()] == [
+        "package/package-1.0.tar.gz"
+    ]
+
+
+def test_add_file_unknown_algorithm(cache):
+    """A digest that uses an unknown algorithm isn't verified."""
+    path = cache.add_file(
+        "package",
+        "package-1.0.tar.gz",
+        [b"content"],
+        digest="unknown=1234",
+    )
+
+    assert path.read_bytes() == b"content"
+
+
+def test_add_file_bad_digest(cache):
+    """A file that doesn't match its digest isn't stored."""
+    with pytest.raises(ValueError, match=r"doesn't match sha256 digest"):
+        cache.add_file(
+            "package",
+            "package-1.0.tar.gz",
+            [b"content"],
+            digest="sha256=1234",
+        )
+
+    assert not cache.file_path("package", "package-1.0.tar.gz").exists()
+    # No temporary files remain
+    assert list((cache.files_path / "package").iterdir()) == []
+
+
+def test_prune(cache):
+    """Files that haven't been used recently are removed; pages are
+    retained."""
+    cache.save_page("package", LINKS)
+    old_path = cache.add_file("package", "package-1.0.tar.gz", [b"old"])
+    new_path = cache.add_file("package", "package-2.0.tar.gz", [b"new!"])
+    os.utime(old_path, (1000, 1000))
+
+    removed = cache.prune(older_than=2000)
+
+    assert removed == [
+        {"name": "package/package-1.0.tar.gz", "size": 3, "last_used": 1000}
+    ]
+    assert not old_path.exists()
+    assert new_path.exists()
+    assert cache.load_page("package") == LINKS
+
+    # Using a file records the time it was used.
+    cache.touch(new_path)
+    assert cache.prune(older_than=2000) == []
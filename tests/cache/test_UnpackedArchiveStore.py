@@ -0,0 +1,156 @@
+import os
+import shutil
+from unittest import mock
+
+import pytest
+
+from briefcase.archive import MemberFilter
+from briefcase.cache import UnpackedArchiveStore, file_sha256
+
+from ..utils import create_zip_file
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UnpackedArchiveStore(tmp_path / "unpacked")
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return create_zip_file(
+        tmp_path / "support.zip",
+        [("lib/module.py", "# module"), ("README", "readme")],
+    )
+
+
+def test_unpack(store, archive, tmp_path):
+    """An archive can be unpacked into the store, and copied from the store."""
+    digest = file_sha256(archive)
+    assert not store.contains(digest)
+
+    assert store.unpack(archive) == tmp_path / "unpacked" / digest
+    assert store.contains(digest)
+
+    target = tmp_path / "target"
+    store.materialize(digest, target)
+    assert (target / "lib" / "module.py").read_text() == "# module"
+    assert (target / "README").read_text() == "readme"
+
+
+def test_unpack_once(store, archive):
+    """An archive that has already been unpacked isn't unpacked again."""
+    unpack_archive = mock.MagicMock(side_effect=shutil.unpack_archive)
+
+    store.unpack(archive, unpack_archive=unpack_archive)
+    store.unpack(archive, unpack_archive=unpack_archive)
+
+    unpack_archive.assert_called_once()
+
+
+def test_unpack_failure(store, tmp_path):
+    """If an archive can't be unpacked, nothing is added to the store."""
+    bad_archive = tmp_path / "bad.zip"
+    bad_archive.write_text("not a zip file")
+
+    with pytest.raises(shutil.ReadError):
+        store.unpack(bad_archive)
+
+    assert not store.contains(file_sha256(bad_archive))
+    assert [path.suffix for path in (tmp_path / "unpacked").iterdir()] == [".lock"]
+
+
+def test_adopt(store, archive):
+    """A staging folder can be added to the store."""
+    staging_path = store.staging_path()
+    shutil.unpack_archive(archive, extract_dir=staging_path)
+
+    assert store.adopt(staging_path, "abc123") == store.entry_path("abc123")
+    assert (store.entry_path("abc123") / "README").read_text() == "readme"
+    assert not staging_path.exists()
+
+
+def test_adopt_existing(store, archive):
+    """If the archive is already in the store, the staging folder is
+    discarded."""
+    store.unpack(archive, digest="abc123")
+
+    staging_path = store.staging_path()
+    (staging_path / "other").write_text("other")
+
+    store.adopt(staging_path, "abc123")
+
+    assert not staging_path.exists()
+    assert not (store.entry_path("abc123") / "other").exists()
+
+
+def test_materialize_is_a_copy(store, archive, tmp_path):
+    """Modifying the copied content doesn't modify the store."""
+    digest = file_sha256(archive)
+    store.unpack(archive, digest=digest)
+    target = tmp_path / "target"
+    store.materialize(digest, target)
+
+    (target / "README").write_text("modified")
+
+    assert (store.entry_path(digest) / "README").read_text() == "readme"
+
+
+def test_entries(store, archive, tmp_path):
+    """The content of the store can be listed, least recently used first."""
+    other = create_zip_file(tmp_path / "other.zip", [("file.txt", "1234567890")])
+    store.unpack(archive, digest="first")
+    store.unpack(other, digest="second")
+    os.utime(store.entry_path("first"), (2_000_000_000, 2_000_000_000))
+    os.utime(store.entry_path("second"), (1_000_000_000, 1_000_000_000))
+
+    assert store.entries() == [
+        {
+            "name": "second",
+            "digest": "second",
+            "size": 10,
+            "last_used": 1_000_000_000,
+        },
+        {
+            "name": "first",
+            "digest": "first",
+            "size": 14,
+            "last_used": 2_000_000_000,
+        },
+    ]
+
+
+def test_remove_unused(store, archive, tmp_path):
+    """Unpacked archives that aren't needed can be removed."""
+    store.unpack(archive, digest="first")
+    store.unpack(archive, digest="second")
+
+    removed = store.remove_unused(keep_digests={"second"})
+
+    assert [entry["digest"] for entry in removed] == ["first"]
+    assert not store.contains("first")
+    assert store.contains("second")
+
+
+def test_unpack_members(store, archive, tmp_path):
+    """Selected members of an archive are stored separately from the entire
+    archive."""
+    digest = file_sha256(archive)
+    members = MemberFilter(include=["lib"])
+
+    store.unpack(archive, digest=digest, members=members)
+
+    assert store.contains(digest, members=members)
+    assert not store.contains(digest)
+    entry_path = store.entry_path(digest, members=members)
+    assert entry_path.name == f"{digest}-{members.key}"
+    assert (entry_path / "lib" / "module.py").exists()
+    assert not (entry_path / "README").exists()
+
+    target = tmp_path / "target"
+    store.materialize(digest, target, members=members)
+    assert (target / "lib" / "module.py").exists()
+    assert not (target / "README").exists()
+
+    # The entry is reported against the digest of the archive.
+    assert [entry["digest"] for entry in store.entries()] == [digest]
+    assert store.remove_unused(keep_digests={digest}) == []
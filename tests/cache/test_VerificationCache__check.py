@@ -0,0 +1,171 @@
+import sys
+from unittest import mock
+
+import pytest
+
+from briefcase import __version__
+from briefcase.cache import VerificationCache
+
+from .conftest import NOW, create_file
+
+
+@pytest.fixture
+def verification_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "briefcase.cache.time", mock.Mock(time=mock.Mock(return_value=NOW))
+    )
+    return VerificationCache(tmp_path / "verification.json", ttl=100)
+
+
+@pytest.fixture
+def tool_path(tmp_path):
+    return create_file(tmp_path / "tool" / "bin" / "tool", b"tool v1")
+
+
+def test_first_check(verification_cache, tool_path):
+    """The first time a check is performed, it is run, and the result is
+    recorded."""
+    check = mock.Mock(return_value="v1")
+
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v1"
+
+    check.assert_called_once_with()
+    record = verification_cache.load()["tool"]
+    assert record["result"] == "v1"
+    assert record["version"] == __version__
+    assert record["checked"] == NOW
+
+
+def test_reused(verification_cache, tool_path):
+    """If a check has been performed before, the result is reused."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    check = mock.Mock(return_value="v2")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v1"
+    check.assert_not_called()
+
+
+def test_different_key(verification_cache, tool_path):
+    """Results are recorded for each check."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    assert (
+        verification_cache.check(
+            "other", mock.Mock(return_value="other"), paths=[tool_path]
+        )
+        == "other"
+    )
+    assert verification_cache.load()["tool"]["result"] == "v1"
+
+
+def test_modified(verification_cache, tool_path):
+    """If a file that affects the check is modified, the check is re-run."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    tool_path.write_bytes(b"tool version 2")
+
+    check = mock.Mock(return_value="v2")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v2"
+    check.assert_called_once_with()
+
+
+def test_removed(verification_cache, tool_path):
+    """If a file that affects the check is removed, the check is re-run."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    tool_path.unlink()
+
+    check = mock.Mock(side_effect=FileNotFoundError)
+    with pytest.raises(FileNotFoundError):
+        verification_cache.check("tool", check, paths=[tool_path])
+
+
+def test_extra_changed(verification_cache, tool_path):
+    """If a value that affects the check changes, the check is re-run."""
+    verification_cache.check(
+        "tool", mock.Mock(return_value="v1"), paths=[tool_path], extra=["a"]
+    )
+
+    check = mock.Mock(return_value="v2")
+    assert (
+        verification_cache.check("tool", check, paths=[tool_path], extra=["b"]) == "v2"
+    )
+
+
+def test_expired(verification_cache, tool_path, monkeypatch):
+    """If a result is older than the TTL, the check is re-run."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    monkeypatch.setattr(
+        "briefcase.cache.time", mock.Mock(time=mock.Mock(return_value=NOW + 101))
+    )
+
+    check = mock.Mock(return_value="v2")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v2"
+    assert verification_cache.load()["tool"]["checked"] == NOW + 101
+
+
+def test_briefcase_version_changed(verification_cache, tool_path, monkeypatch):
+    """If the result was recorded by a different version of Briefcase, the
+    check is re-run."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    monkeypatch.setattr("briefcase.cache.__version__", "0.0.1")
+
+    check = mock.Mock(return_value="v2")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v2"
+
+
+def test_disabled(verification_cache, tool_path):
+    """If the cache is disabled, the check is re-run, and the new result is
+    recorded."""
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=[tool_path])
+
+    verification_cache.enabled = False
+    check = mock.Mock(return_value="v2")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v2"
+    check.assert_called_once_with()
+
+    # The new result is used once the cache is enabled.
+    verification_cache.enabled = True
+    assert verification_cache.check("tool", mock.Mock(), paths=[tool_path]) == "v2"
+
+
+def test_failure_not_recorded(verification_cache, tool_path):
+    """If a check fails, the failure isn't recorded."""
+    with pytest.raises(ValueError):
+        verification_cache.check(
+            "tool", mock.Mock(side_effect=ValueError), paths=[tool_path]
+        )
+
+    assert verification_cache.load() == {}
+
+    # The check is run again.
+    check = mock.Mock(return_value="v1")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v1"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires a POSIX executable")
+def test_executable(verification_cache, tool_path, monkeypatch):
+    """A bare executable name is found on the path."""
+    tool_path.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tool_path.parent))
+
+    verification_cache.check("tool", mock.Mock(return_value="v1"), paths=["tool"])
+
+    fingerprint = verification_cache.load()["tool"]["fingerprint"]
+    assert fingerprint[0][0] == str(tool_path)
+
+    # If the executable is modified, the check is re-run.
+    tool_path.write_bytes(b"tool version 2")
+    check = mock.Mock(return_value="v2")
+    assert verification_cache.check("tool", check, paths=["tool"]) == "v2"
+
+
+def test_corrupted(verification_cache, tool_path):
+    """If the record of results is corrupted, the check is re-run."""
+    verification_cache.path.write_text("not JSON", encoding="utf-8")
+
+    check = mock.Mock(return_value="v1")
+    assert verification_cache.check("tool", check, paths=[tool_path]) == "v1"
+    check.assert_called_once_with()
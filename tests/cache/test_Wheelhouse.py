@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from briefcase.cache import Wheelhouse
+
+
+@pytest.fixture
+def wheelhouse(tmp_path):
+    return Wheelhouse(tmp_path / "wheelhouse")
+
+
+def test_add(wheelhouse):
+    """Wheels in a staging folder are moved into the wheelhouse."""
+    staging_path = wheelhouse.staging_path()
+    (staging_path / "package-1.0-py3-none-any.whl").write_bytes(b"wheel")
+
+    paths = wheelhouse.add(staging_path)
+
+    assert paths == [wheelhouse.path / "package-1.0-py3-none-any.whl"]
+    assert paths[0].read_bytes() == b"wheel"
+    # The staging folder is removed
+    assert not staging_path.exists()
+    assert [entry["name"] for entry in wheelhouse.entries()] == [
+        "package-1.0-py3-none-any.whl"
+    ]
+
+
+def test_add_existing(wheelhouse):
+    """Adding a wheel that is already in the wheelhouse records that it has
+    been used."""
+    staging_path = wheelhouse.staging_path()
+    (staging_path / "package-1.0-py3-none-any.whl").write_bytes(b"wheel")
+    (path,) = wheelhouse.add(staging_path)
+    os.utime(path, (1000, 1000))
+
+    staging_path = wheelhouse.staging_path()
+    (staging_path / "package-1.0-py3-none-any.whl").write_bytes(b"wheel")
+    wheelhouse.add(staging_path)
+
+    assert wheelhouse.prune(older_than=2000) == []
+
+
+def test_discard(wheelhouse):
+    """A staging folder can be discarded without adding its content."""
+    staging_path = wheelhouse.staging_path()
+    (staging_path / "package-1.0-py3-none-any.whl").write_bytes(b"partial")
+
+    wheelhouse.discard(staging_path)
+
+    assert not staging_path.exists()
+    assert wheelhouse.entries() == []
+
+
+def test_prune(wheelhouse):
+    """Wheels that haven't been used recently are removed."""
+    staging_path = wheelhouse.staging_path()
+    (staging_path / "old-1.0-py3-none-any.whl").write_bytes(b"old")
+    (staging_path / "new-1.0-py3-none-any.whl").write_bytes(b"new!")
+    wheelhouse.add(staging_path)
+    os.utime(wheelhouse.path / "old-1.0-py3-none-any.whl", (1000, 1000))
+
+    removed = wheelhouse.prune(older_than=2000)
+
+    assert removed == [
+        {"name": "old-1.0-py3-none-any.whl", "size": 3, "last_used": 1000}
+    ]
+    assert not (wheelhouse.path / "old-1.0-py3-none-any.whl").exists()
+    assert (wheelhouse.path / "new-1.0-py3-none-any.whl").exists()
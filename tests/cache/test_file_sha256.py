@@ -0,0 +1,19 @@
+import hashlib
+
+from briefcase.cache import file_sha256
+
+from .conftest import create_file
+
+
+def test_file_sha256(tmp_path):
+    """The digest of a file's content can be computed."""
+    path = create_file(tmp_path / "file.txt", b"hello world" * 100000)
+
+    assert file_sha256(path) == hashlib.sha256(b"hello world" * 100000).hexdigest()
+
+
+def test_empty_file_sha256(tmp_path):
+    """The digest of an empty file can be computed."""
+    path = create_file(tmp_path / "file.txt", b"")
+
+    assert file_sha256(path) == hashlib.sha256(b"").hexdigest()
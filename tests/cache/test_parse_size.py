@@ -0,0 +1,44 @@
+import pytest
+
+from briefcase.cache import format_size, parse_size
+
+
+@pytest.mark.parametrize(
+    "value, size",
+    [
+        ("1234", 1234),
+        ("10B", 10),
+        ("2K", 2048),
+        ("2kb", 2048),
+        ("1.5M", 1536 * 1024),
+        ("10G", 10 * 1024**3),
+        (" 1 TB ", 1024**4),
+    ],
+)
+def test_parse_size(value, size):
+    """Sizes can be described with a binary unit."""
+    assert parse_size(value) == size
+
+
+@pytest.mark.parametrize("value", ["", "big", "10Q", "-1G", "G10"])
+def test_parse_bad_size(value):
+    """An invalid size raises an error."""
+    with pytest.raises(ValueError, match=r"is not a valid size"):
+        parse_size(value)
+
+
+@pytest.mark.parametrize(
+    "size, description",
+    [
+        (0, "0 bytes"),
+        (1023, "1023 bytes"),
+        (1536, "1.5 KB"),
+        (10 * 1024**2, "10.0 MB"),
+        (3 * 1024**3, "3.0 GB"),
+        (2 * 1024**4, "2.0 TB"),
+        (2048 * 1024**4, "2048.0 TB"),
+    ],
+)
+def test_format_size(size, description):
+    """Sizes are described in the largest sensible unit."""
+    assert format_size(size) == description
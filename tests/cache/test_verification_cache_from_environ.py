@@ -0,0 +1,33 @@
+import pytest
+
+from briefcase.cache import DEFAULT_VERIFICATION_TTL, verification_cache_from_environ
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def test_default(tmp_path):
+    """By default, the cache is stored in the data path, with the default
+    TTL."""
+    cache = verification_cache_from_environ({}, tmp_path)
+
+    assert cache.path == tmp_path / "verification.json"
+    assert cache.ttl == DEFAULT_VERIFICATION_TTL
+    assert cache.enabled
+
+
+def test_ttl(tmp_path):
+    """The TTL can be set in the environment."""
+    cache = verification_cache_from_environ(
+        {"BRIEFCASE_VERIFICATION_TTL": "3600"}, tmp_path
+    )
+
+    assert cache.ttl == 3600
+
+
+@pytest.mark.parametrize("value", ["forever", "-1"])
+def test_bad_ttl(tmp_path, value):
+    """An invalid TTL raises an error."""
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"BRIEFCASE_VERIFICATION_TTL must be a positive number of seconds",
+    ):
+        verification_cache_from_environ({"BRIEFCASE_VERIFICATION_TTL": value}, tmp_path)
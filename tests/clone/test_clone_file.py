@@ -0,0 +1,108 @@
+import errno
+import os
+import sys
+
+import pytest
+
+from briefcase import clone
+
+
+@pytest.fixture(autouse=True)
+def reset_unsupported(monkeypatch):
+    # Each test starts without any knowledge of unsupported copies.
+    monkeypatch.setattr(
+        clone, "_unsupported", {"reflink": set(), "copy_file_range": set()}
+    )
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source" / "file.txt"
+    path.parent.mkdir()
+    path.write_text("hello world")
+    path.chmod(0o755)
+    return path
+
+
+def test_clone_file(source, tmp_path):
+    """A file can be cloned, preserving its permissions."""
+    target = tmp_path / "target.txt"
+    assert clone.clone_file(source, target) == target
+
+    assert target.read_text() == "hello world"
+    if sys.platform != "win32":
+        assert target.stat().st_mode & 0o777 == 0o755
+    assert target.stat().st_mtime == pytest.approx(source.stat().st_mtime)
+
+
+def test_clone_is_independent(source, tmp_path):
+    """Modifying a cloned file doesn't modify the original."""
+    target = tmp_path / "target.txt"
+    clone.clone_file(source, target)
+
+    with target.open("a") as f:
+        f.write("; goodbye")
+
+    assert source.read_text() == "hello world"
+    assert not os.path.samefile(source, target)
+
+
+def test_replace_existing(source, tmp_path):
+    """An existing file at the target path is replaced."""
+    target = tmp_path / "target.txt"
+    target.write_text("old content, which is longer than the new content")
+
+    clone.clone_file(source, target)
+
+    assert target.read_text() == "hello world"
+
+
+def test_fallback_to_copy(source, tmp_path, monkeypatch):
+    """If the filesystem can't clone or copy in the kernel, the file is
+    copied, and the unsupported methods aren't attempted again."""
+
+    def unsupported(source, target):
+        unsupported.calls += 1
+        return False
+
+    unsupported.calls = 0
+    monkeypatch.setattr(clone, "_reflink", unsupported)
+    monkeypatch.setattr(clone, "_copy_file_range", unsupported)
+
+    clone.clone_file(source, tmp_path / "first.txt")
+    clone.clone_file(source, tmp_path / "second.txt")
+
+    assert (tmp_path / "first.txt").read_text() == "hello world"
+    assert (tmp_path / "second.txt").read_text() == "hello world"
+    # Each method was only tried for the first file.
+    assert unsupported.calls == 2
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Linux specific test")
+def test_reflink_unsupported(source, tmp_path, monkeypatch):
+    """If the filesystem doesn't support reflinks, the partial target is
+    removed."""
+
+    def ioctl(fd, request, arg):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(clone.fcntl, "ioctl", ioctl)
+
+    target = tmp_path / "target.txt"
+    assert not clone._reflink(source, target)
+    assert not target.exists()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Linux specific test")
+def test_reflink_error(source, tmp_path, monkeypatch):
+    """An error that doesn't indicate a lack of support is raised."""
+
+    def ioctl(fd, request, arg):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(clone.fcntl, "ioctl", ioctl)
+
+    target = tmp_path / "target.txt"
+    with pytest.raises(OSError):
+        clone._reflink(source, target)
+    assert not target.exists()
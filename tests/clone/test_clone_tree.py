@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+from briefcase.clone import clone_tree
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source"
+    (path / "lib" / "python").mkdir(parents=True)
+    (path / "lib" / "python" / "module.py").write_text("# module")
+    (path / "README").write_text("readme")
+    (path / "empty").mkdir()
+    return path
+
+
+def test_clone_tree(source, tmp_path):
+    """A directory tree can be cloned."""
+    target = tmp_path / "target"
+    clone_tree(source, target)
+
+    assert (target / "lib" / "python" / "module.py").read_text() == "# module"
+    assert (target / "README").read_text() == "readme"
+    assert (target / "empty").is_dir()
+
+
+def test_merge(source, tmp_path):
+    """If the target exists, the content of the source is merged into it."""
+    target = tmp_path / "target"
+    (target / "lib").mkdir(parents=True)
+    (target / "lib" / "other.py").write_text("# other")
+    (target / "README").write_text("old readme")
+
+    clone_tree(source, target)
+
+    assert (target / "lib" / "python" / "module.py").read_text() == "# module"
+    assert (target / "lib" / "other.py").read_text() == "# other"
+    assert (target / "README").read_text() == "readme"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need privileges")
+def test_symlinks(source, tmp_path):
+    """Symbolic links are copied as links."""
+    (source / "lib" / "current").symlink_to("python")
+    (source / "LINK").symlink_to("README")
+
+    target = tmp_path / "target"
+    clone_tree(source, target)
+
+    assert os.readlink(target / "lib" / "current") == "python"
+    assert os.readlink(target / "LINK") == "README"
+    assert (target / "lib" / "current" / "module.py").read_text() == "# module"
+
+
+def test_directory_mtime(source, tmp_path):
+    """The modification times of directories are preserved."""
+    os.utime(source / "lib", (1_000_000_000, 1_000_000_000))
+
+    target = tmp_path / "target"
+    clone_tree(source, target)
+
+    assert (target / "lib").stat().st_mtime == 1_000_000_000
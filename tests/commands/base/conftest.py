@@ -32,7 +32,7 @@ class DummyCommand(BaseCommand):
 
 @pytest.fixture
 def base_command(tmp_path):
-    command = DummyCommand(base_path=tmp_path)
+    command = DummyCommand(base_path=tmp_path, data_path=tmp_path / "data")
     command.parse_options(["-r", "default"])
     return command
 
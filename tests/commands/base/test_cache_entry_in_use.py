@@ -0,0 +1,28 @@
+def entry(*paths):
+    return {"url": "https://example.com/file", "paths": list(paths)}
+
+
+def test_tool_in_use(base_command):
+    """Content that has been placed in the tools folder is in use."""
+    tool = base_command.tools_path / "tool.AppImage"
+    tool.parent.mkdir(parents=True)
+    tool.write_bytes(b"tool")
+
+    assert base_command.cache_entry_in_use(entry(tool))
+
+
+def test_tool_removed(base_command):
+    """Content that was placed in the tools folder, but has since been
+    removed, is not in use."""
+    assert not base_command.cache_entry_in_use(
+        entry(base_command.tools_path / "jdk.tar.gz")
+    )
+
+
+def test_support_package(base_command):
+    """Content outside the tools folder is not in use."""
+    support = base_command.data_path / "support" / "support.zip"
+    support.parent.mkdir(parents=True)
+    support.write_bytes(b"support")
+
+    assert not base_command.cache_entry_in_use(entry(support))
@@ -0,0 +1,224 @@
+import threading
+
+import pytest
+
+from briefcase.config import AppConfig
+from briefcase.exceptions import BriefcaseCommandError
+
+from .conftest import DummyCommand
+
+
+class ConcurrentCommand(DummyCommand):
+    command = "dummy"
+
+    # Every app that was processed, with the command and options used.
+    processed = {}
+
+    def __call__(self, app, **options):
+        self.processed[app.app_name] = {
+            "command": self,
+            "input_enabled": self.input.enabled,
+            "output_controlled": self.input.is_output_controlled,
+            "label": self.logger.label,
+            "options": options,
+            "thread": threading.current_thread(),
+        }
+        self.logger.info(f"Processing {app.app_name}")
+        if app.app_name == "second":
+            raise BriefcaseCommandError("Something went wrong.")
+        elif app.app_name == "fourth":
+            raise ValueError("Something unexpected.")
+
+
+def make_app(app_name):
+    return AppConfig(
+        app_name=app_name,
+        bundle="com.example",
+        version="0.0.1",
+        description=f"The {app_name} app",
+        sources=[f"src/{app_name}"],
+    )
+
+
+@pytest.fixture
+def concurrent_command(tmp_path):
+    ConcurrentCommand.processed = {}
+    command = ConcurrentCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+        apps={"first": make_app("first"), "third": make_app("third")},
+    )
+    command.parse_options(["-r", "default"])
+    return command
+
+
+def test_all_apps(concurrent_command, capsys):
+    """Every app is processed by a separate command, with labelled output."""
+    concurrent_command.call_apps_concurrently(2, extra="value")
+
+    assert sorted(concurrent_command.processed) == ["first", "third"]
+    for app_name, processed in concurrent_command.processed.items():
+        assert processed["command"] is not concurrent_command
+        assert processed["command"].input is concurrent_command.input
+        assert processed["label"] == app_name
+        assert processed["options"] == {"extra": "value"}
+        # Input is disabled while apps are processed, and subprocess output
+        # is printed by the console, so that it can be labelled.
+        assert not processed["input_enabled"]
+        assert processed["output_controlled"]
+
+    # Input and output are restored afterwards
+    assert concurrent_command.input.enabled
+    assert not concurrent_command.input.is_output_controlled
+
+    output = capsys.readouterr().out
+    assert "[first] Processing first\n" in output
+    assert "[third] Processing third\n" in output
+    assert "[dummy] Summary:\n" in output
+    assert "  first  done  " in output
+    assert "  third  done  " in output
+
+
+def test_failure(concurrent_command, capsys):
+    """If an app can't be processed, the other apps are still processed, and
+    the failure is reported."""
+    concurrent_command.apps["second"] = make_app("second")
+
+    with pytest.raises(BriefcaseCommandError) as excinfo:
+        concurrent_command.call_apps_concurrently(0)
+
+    assert str(excinfo.value) == (
+        "Unable to dummy 1 of 3 apps:\n\n    second: Something went wrong."
+    )
+
+    assert sorted(concurrent_command.processed) == ["first", "second", "third"]
+
+    output = capsys.readouterr().out
+    assert "[second] Something went wrong.\n" in output
+    assert "  first   done    " in output
+    assert "  second  failed  " in output
+    assert "  third   done    " in output
+
+
+def test_unexpected_failure(concurrent_command, capsys):
+    """If an app raises an unexpected error, the other apps are still
+    processed, and every failure is reported."""
+    concurrent_command.apps["second"] = make_app("second")
+    concurrent_command.apps["fourth"] = make_app("fourth")
+
+    with pytest.raises(BriefcaseCommandError) as excinfo:
+        concurrent_command.call_apps_concurrently(2)
+
+    assert sorted(concurrent_command.processed) == [
+        "first",
+        "fourth",
+        "second",
+        "third",
+    ]
+    assert str(excinfo.value) == (
+        "Unable to dummy 2 of 4 apps:\n\n"
+        "    fourth: ValueError: Something unexpected.\n"
+        "    second: Something went wrong."
+    )
+    # The stack trace of the unexpected error is preserved for the log.
+    assert concurrent_command.logger.stacktrace is not None
+
+    output = capsys.readouterr().out
+    assert "[fourth] ValueError: Something unexpected.\n" in output
+    assert "  first   done    " in output
+    assert "  fourth  failed  " in output
+
+
+class VerifyingCommand(DummyCommand):
+    """A command that verifies a tool, and may first invoke a prerequisite
+    command."""
+
+    command = "verifying"
+    # The number of times each type of command verified its tools, and the
+    # tool used to process each app.
+    verified = {}
+    used = {}
+
+    def verify_tools(self):
+        super().verify_tools()
+        self.verified[type(self).__name__] = (
+            self.verified.get(type(self).__name__, 0) + 1
+        )
+        # Interactive checks (e.g., accepting a license) need input.
+        assert self.input.enabled
+        self.tool = f"{type(self).__name__} tool"
+
+    def prerequisite_commands(self):
+        return [self.prerequisite_command]
+
+    @property
+    def prerequisite_command(self):
+        command = PrerequisiteCommand(
+            base_path=self.base_path, data_path=self.data_path, apps=self.apps
+        )
+        command.clone_options(self)
+        return command
+
+    def __call__(self, app=None, **options):
+        self.verify_tools_once()
+        if app is None:
+            return self.call_apps_concurrently(2, **options)
+        self.prerequisite_command(app)
+        self.used[app.app_name] = self.tool
+
+
+class PrerequisiteCommand(VerifyingCommand):
+    command = "prerequisite"
+
+    def prerequisite_commands(self):
+        return []
+
+    def __call__(self, app, **options):
+        self.verify_tools_once()
+        self.used[f"{app.app_name} prerequisite"] = self.tool
+
+
+def test_tools_verified_once(tmp_path):
+    """Tools are verified once, with input enabled, before apps are processed
+    concurrently; each app reuses the verified tools."""
+    VerifyingCommand.verified = {}
+    VerifyingCommand.used = {}
+    command = VerifyingCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+        apps={"first": make_app("first"), "second": make_app("second")},
+    )
+    command.parse_options(["-r", "default"])
+
+    command()
+
+    assert VerifyingCommand.verified == {
+        "VerifyingCommand": 1,
+        "PrerequisiteCommand": 1,
+    }
+    assert VerifyingCommand.used == {
+        "first": "VerifyingCommand tool",
+        "first prerequisite": "PrerequisiteCommand tool",
+        "second": "VerifyingCommand tool",
+        "second prerequisite": "PrerequisiteCommand tool",
+    }
+    # The verified tools are only shared while apps are processed.
+    assert command.verified_tools is None
+
+
+def test_threads(concurrent_command):
+    """Apps are processed on worker threads."""
+    concurrent_command.call_apps_concurrently(2)
+
+    assert all(
+        processed["thread"] is not threading.current_thread()
+        for processed in concurrent_command.processed.values()
+    )
+
+
+def test_invalid_jobs(concurrent_command):
+    """The number of jobs can't be negative."""
+    with pytest.raises(BriefcaseCommandError, match=r"--jobs must be at least 0\."):
+        concurrent_command.call_apps_concurrently(-1)
+
+    assert concurrent_command.processed == {}
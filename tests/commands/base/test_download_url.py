@@ -1,3 +1,9 @@
+import hashlib
+import io
+import shutil
+import tarfile
+import threading
+import zipfile
 from unittest import mock
 
 import pytest
@@ -6,9 +12,14 @@ from urllib3._collections import HTTPHeaderDict
 
 from briefcase.exceptions import (
     BadNetworkResourceError,
+    BriefcaseCommandError,
+    CorruptNetworkResourceError,
     MissingNetworkResourceError,
     NetworkFailure,
+    OfflineModeError,
 )
+from briefcase.locks import FileLock
+from briefcase.mirrors import Mirrors
 
 
 @pytest.mark.parametrize(
@@ -59,7 +70,10 @@ def test_new_download_oneshot(base_command, url, content_disposition):
             else {}
         )
     )
-    response.content = b"all content"
+    response.iter_content.return_value = iter([b"all ", b"content"])
+    type(response).content = mock.PropertyMock(
+        side_effect=AssertionError("content should be streamed")
+    )
     base_command.requests.get.return_value = response
 
     # Download the file
@@ -68,13 +82,14 @@ def test_new_download_oneshot(base_command, url, content_disposition):
         download_path=base_command.base_path / "downloads",
     )
 
-    # requests.get has been invoked, but content isn't iterated
+    # requests.get has been invoked; even though the content length isn't
+    # known, the content is streamed in chunks.
     base_command.requests.get.assert_called_with(
         "https://example.com/support?useful=Yes",
         stream=True,
     )
     response.headers.get.assert_called_with("content-length")
-    response.iter_content.assert_not_called()
+    response.iter_content.assert_called_once_with(chunk_size=1024 * 1024)
 
     # The filename is derived from the URL or header
     assert filename == base_command.base_path / "downloads" / "something.zip"
@@ -235,6 +250,7 @@ def test_get_connection_error(base_command):
 def test_iter_content_connection_error(base_command):
     """NetworkFailure raised if response.iter_content() errors."""
     base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 0
 
     response = mock.MagicMock()
     response.url = "https://example.com/support?useful=Yes"
@@ -262,16 +278,15 @@ def test_iter_content_connection_error(base_command):
 
 
 def test_content_connection_error(base_command):
-    """NetworkFailure raised if response.content errors."""
+    """NetworkFailure raised if streaming content of unknown length errors."""
     base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 0
 
     response = mock.MagicMock()
     response.url = "https://example.com/support?useful=Yes"
     response.headers = mock.Mock(wraps=HTTPHeaderDict())
     response.status_code = 200
-    type(response).content = mock.PropertyMock(
-        side_effect=requests.exceptions.ConnectionError
-    )
+    response.iter_content.side_effect = requests.exceptions.ConnectionError
     base_command.requests.get.return_value = response
 
     # Download the file
@@ -290,3 +305,1375 @@ def test_content_connection_error(base_command):
 
     # The file doesn't exist as a result of the download failure
     assert not (base_command.base_path / "something.zip").exists()
+
+
+def test_resume_download(base_command):
+    """An interrupted download is resumed with a range request."""
+    # Create a partial download from a previous attempt
+    partial_file = base_command.base_path / "something.zip.part"
+    with partial_file.open("wb") as f:
+        f.write(b"chunk-1;")
+    validator_file = base_command.base_path / "something.zip.part.validator"
+    validator_file.write_text('"abcd1234"', encoding="utf-8")
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "ETag": '"abcd1234"'})
+    )
+
+    ranged_response = mock.MagicMock()
+    ranged_response.url = "https://example.com/path/to/something.zip"
+    ranged_response.status_code = 206
+    ranged_response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "16"}))
+    ranged_response.iter_content.return_value = iter([b"chunk-2;", b"chunk-3;"])
+    base_command.requests.get.side_effect = [response, ranged_response]
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The second request asked for the content after the partial download.
+    assert base_command.requests.get.mock_calls == [
+        mock.call("https://example.com/support?useful=Yes", stream=True),
+        mock.call(
+            "https://example.com/path/to/something.zip",
+            stream=True,
+            headers={"Range": "bytes=8-", "If-Range": '"abcd1234"'},
+        ),
+    ]
+    # The original response was abandoned.
+    response.close.assert_called_once_with()
+    response.iter_content.assert_not_called()
+
+    # The partial file has been moved into place, with the full content.
+    assert filename == base_command.base_path / "something.zip"
+    assert not partial_file.exists()
+    assert not validator_file.exists()
+    with filename.open() as f:
+        assert f.read() == "chunk-1;chunk-2;chunk-3;"
+
+
+def test_resume_download_unsupported(base_command):
+    """If the server won't honor a range request, the download restarts."""
+    # Create a partial download from a previous attempt
+    partial_file = base_command.base_path / "something.zip.part"
+    with partial_file.open("wb") as f:
+        f.write(b"stale content")
+    validator_file = base_command.base_path / "something.zip.part.validator"
+    validator_file.write_text('"abcd1234"', encoding="utf-8")
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "ETag": '"abcd1234"'})
+    )
+    response.iter_content.return_value = iter([b"chunk-1;", b"chunk-2;", b"chunk-3;"])
+
+    ranged_response = mock.MagicMock()
+    ranged_response.status_code = 416
+    base_command.requests.get.side_effect = [response, ranged_response]
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The range request was abandoned; the original response was used.
+    ranged_response.close.assert_called_once_with()
+    ranged_response.iter_content.assert_not_called()
+    response.iter_content.assert_called_once_with(chunk_size=1048576)
+
+    # The stale partial content has been replaced.
+    assert not partial_file.exists()
+    with filename.open() as f:
+        assert f.read() == "chunk-1;chunk-2;chunk-3;"
+
+
+def test_resume_download_no_validator(base_command):
+    """If the version of a partial download isn't known, it isn't resumed."""
+    # Create a partial download from a previous attempt, with no record of
+    # the version of the resource it came from.
+    partial_file = base_command.base_path / "something.zip.part"
+    with partial_file.open("wb") as f:
+        f.write(b"stale content")
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "ETag": '"abcd1234"'})
+    )
+    response.iter_content.return_value = iter([b"chunk-1;", b"chunk-2;", b"chunk-3;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # No range request was made.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+
+    # The stale partial content has been replaced.
+    assert not partial_file.exists()
+    with filename.open() as f:
+        assert f.read() == "chunk-1;chunk-2;chunk-3;"
+
+
+def test_resume_download_changed(base_command):
+    """If the resource has changed since the partial download was made, the
+    download restarts."""
+    # Create a partial download from a previous attempt
+    partial_file = base_command.base_path / "something.zip.part"
+    with partial_file.open("wb") as f:
+        f.write(b"stale content")
+    validator_file = base_command.base_path / "something.zip.part.validator"
+    validator_file.write_text('"old-etag"', encoding="utf-8")
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "ETag": '"new-etag"'})
+    )
+    response.iter_content.return_value = iter([b"chunk-1;", b"chunk-2;", b"chunk-3;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # No range request was made.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+
+    # The stale partial content has been replaced.
+    assert not partial_file.exists()
+    assert not validator_file.exists()
+    with filename.open() as f:
+        assert f.read() == "chunk-1;chunk-2;chunk-3;"
+
+
+def test_resume_download_if_range_failed(base_command):
+    """If the server returns the full content in response to a conditional
+    range request, the download restarts."""
+    # Create a partial download from a previous attempt
+    partial_file = base_command.base_path / "something.zip.part"
+    with partial_file.open("wb") as f:
+        f.write(b"stale content")
+    validator_file = base_command.base_path / "something.zip.part.validator"
+    validator_file.write_text("Wed, 21 Oct 2015 07:28:00 GMT", encoding="utf-8")
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict(
+            {
+                "content-length": "24",
+                # A weak ETag can't be used to validate a range request.
+                "ETag": 'W/"abcd1234"',
+                "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+            }
+        )
+    )
+    response.iter_content.return_value = iter([b"chunk-1;", b"chunk-2;", b"chunk-3;"])
+
+    ranged_response = mock.MagicMock()
+    ranged_response.status_code = 200
+    base_command.requests.get.side_effect = [response, ranged_response]
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The range request was conditional on the modification date.
+    assert base_command.requests.get.mock_calls[-1] == mock.call(
+        "https://example.com/path/to/something.zip",
+        stream=True,
+        headers={"Range": "bytes=13-", "If-Range": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+
+    # The range request was abandoned; the original response was used.
+    ranged_response.close.assert_called_once_with()
+    ranged_response.iter_content.assert_not_called()
+
+    # The stale partial content has been replaced.
+    assert not partial_file.exists()
+    with filename.open() as f:
+        assert f.read() == "chunk-1;chunk-2;chunk-3;"
+
+
+def test_resume_download_no_ranges(base_command):
+    """If the server declares it doesn't accept ranges, no range request is
+    made."""
+    # Create a partial download from a previous attempt
+    partial_file = base_command.base_path / "something.zip.part"
+    with partial_file.open("wb") as f:
+        f.write(b"chunk-1;")
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "Accept-Ranges": "none"})
+    )
+    response.iter_content.return_value = iter([b"chunk-1;", b"chunk-2;", b"chunk-3;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # Only one request was made.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+
+    with filename.open() as f:
+        assert f.read() == "chunk-1;chunk-2;chunk-3;"
+
+
+def test_incomplete_download(base_command):
+    """If the content ends early, the partial download is retained."""
+    base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 0
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "100"}))
+    response.iter_content.return_value = iter([b"chunk-1;", b"chunk-2;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    with pytest.raises(NetworkFailure, match="Unable to download something.zip"):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+        )
+
+    # The final file doesn't exist, but the partial content is retained.
+    assert not (base_command.base_path / "something.zip").exists()
+    with (base_command.base_path / "something.zip.part").open() as f:
+        assert f.read() == "chunk-1;chunk-2;"
+
+
+def test_checksum_verified(base_command):
+    """If a checksum is provided, and it matches, the download succeeds."""
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        checksum=hashlib.sha256(b"chunk-1;").hexdigest().upper(),
+    )
+
+    assert filename == base_command.base_path / "something.zip"
+    assert filename.exists()
+
+
+def test_checksum_mismatch(base_command):
+    """If a checksum is provided, and it doesn't match, the download is
+    discarded."""
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    with pytest.raises(
+        CorruptNetworkResourceError,
+        match=r"Downloaded content of https://example.com/support\?useful=Yes is corrupted",
+    ):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+            checksum="0" * 64,
+        )
+
+    # Neither the final file nor the partial download exist.
+    assert not (base_command.base_path / "something.zip").exists()
+    assert not (base_command.base_path / "something.zip.part").exists()
+
+
+def segmented_get(content, status_code=206, fail_range=None):
+    """Build a mock `requests.get` that serves byte ranges of content.
+
+    :param content: The full content being served.
+    :param status_code: The status code to return for range requests.
+    :param fail_range: A range start that should raise a connection error.
+    """
+
+    def _get(url, stream, headers=None):
+        response = mock.MagicMock()
+        response.url = "https://example.com/path/to/something.zip"
+        if headers is None:
+            response.status_code = 200
+            response.headers = mock.Mock(
+                wraps=HTTPHeaderDict(
+                    {"content-length": str(len(content)), "Accept-Ranges": "bytes"}
+                )
+            )
+            response.iter_content.return_value = iter([content])
+        else:
+            start, end = headers["Range"].split("=")[1].split("-")
+            start, end = int(start), int(end)
+            response.status_code = status_code
+            response.headers = mock.Mock(
+                wraps=HTTPHeaderDict({"content-length": str(end - start + 1)})
+            )
+            if start == fail_range:
+                response.iter_content.side_effect = requests.exceptions.ConnectionError
+            else:
+                segment = content[start:]
+                response.iter_content.return_value = iter([segment[: end - start + 1]])
+        return response
+
+    return _get
+
+
+def test_segmented_download(base_command, monkeypatch):
+    """If requested, content can be downloaded in concurrent segments."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "4")
+    monkeypatch.setattr("briefcase.commands.base.MIN_DOWNLOAD_SEGMENT_SIZE", 10)
+    content = bytes(range(256)) * 4
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content)
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The initial request is followed by a request for each segment.
+    assert base_command.requests.get.call_count == 5
+    assert sorted(
+        call.kwargs["headers"]["Range"]
+        for call in base_command.requests.get.mock_calls[1:]
+    ) == [
+        "bytes=0-255",
+        "bytes=256-511",
+        "bytes=512-767",
+        "bytes=768-1023",
+    ]
+
+    # The segments have been reassembled into the final file.
+    assert filename == base_command.base_path / "something.zip"
+    assert not (base_command.base_path / "something.zip.part").exists()
+    assert filename.read_bytes() == content
+
+
+def test_segmented_download_small_content(base_command, monkeypatch):
+    """Content that is too small to split is downloaded as a single stream."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "4")
+    content = b"chunk-1;chunk-2;chunk-3;"
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content)
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # Only the initial request was made.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+    assert filename.read_bytes() == content
+
+
+def test_segmented_download_unsupported(base_command, monkeypatch):
+    """If the server doesn't honor range requests, the download falls back to
+    a single stream."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "2")
+    monkeypatch.setattr("briefcase.commands.base.MIN_DOWNLOAD_SEGMENT_SIZE", 10)
+    content = bytes(range(256))
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content, status_code=200)
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The initial request, 2 segment requests, and a fallback request.
+    assert base_command.requests.get.call_count == 4
+    assert base_command.requests.get.mock_calls[-1] == mock.call(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+    assert filename.read_bytes() == content
+
+
+def test_segmented_download_connection_error(base_command, monkeypatch):
+    """If a segment fails, the partial download is discarded."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "2")
+    monkeypatch.setattr("briefcase.commands.base.MIN_DOWNLOAD_SEGMENT_SIZE", 10)
+    content = bytes(range(256))
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content, fail_range=128)
+
+    # Download the file
+    with pytest.raises(NetworkFailure, match="Unable to download something.zip"):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+        )
+
+    # Neither the final file nor the partial download exist.
+    assert not (base_command.base_path / "something.zip").exists()
+    assert not (base_command.base_path / "something.zip.part").exists()
+
+
+def test_segmented_download_bad_configuration(base_command, monkeypatch):
+    """A non-integer segment count raises an error."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "many")
+    content = bytes(range(256))
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content)
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"The value of BRIEFCASE_DOWNLOAD_SEGMENTS must be an integer.",
+    ):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+        )
+
+
+def test_already_downloaded_verified(base_command):
+    """A previously downloaded file is verified against the download cache."""
+    # Download the file into the cache.
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # Download the file again.
+    response.iter_content.reset_mock()
+    second_filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The content wasn't downloaded a second time; in fact, no request was
+    # made at all.
+    response.iter_content.assert_not_called()
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+    assert second_filename == filename
+    assert filename.read_bytes() == b"chunk-1;"
+
+
+def test_already_downloaded_corrupted(base_command, monkeypatch):
+    """A previously downloaded file that has been modified is downloaded
+    again."""
+    # Disable hard links, so the cached file can be modified independently
+    # of the cached content.
+    monkeypatch.setattr(
+        "briefcase.cache.os.link", mock.Mock(side_effect=OSError("No links"))
+    )
+
+    # Download the file into the cache.
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # Corrupt the downloaded file. The copy is read-only, like the cached
+    # content.
+    filename.chmod(0o644)
+    filename.write_bytes(b"corrupt")
+
+    # Download the file again.
+    response.iter_content.reset_mock()
+    second_filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The content was restored from the cache, rather than downloaded.
+    response.iter_content.assert_not_called()
+    assert second_filename == filename
+    assert filename.read_bytes() == b"chunk-1;"
+
+
+def test_executable(base_command):
+    """An executable download is a private copy of the cached content, which
+    can be modified without modifying the cache."""
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/tool.AppImage"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    base_command.requests.get.return_value = response
+
+    filename = base_command.download_file(
+        url="https://example.com/tool",
+        download_path=base_command.base_path,
+        executable=True,
+    )
+
+    assert filename.stat().st_mode & 0o777 == 0o755
+    assert filename.stat().st_nlink == 1
+
+    # Modify the tool, then download it again.
+    filename.write_bytes(b"patched;")
+    response.iter_content.reset_mock()
+    second_filename = base_command.download_file(
+        url="https://example.com/tool",
+        download_path=base_command.base_path,
+        executable=True,
+    )
+
+    # The modified tool is used as-is; the cached content is unchanged.
+    response.iter_content.assert_not_called()
+    assert second_filename == filename
+    assert filename.read_bytes() == b"patched;"
+    digest = base_command.download_cache.digest("https://example.com/tool")
+    assert base_command.download_cache.blob_path(digest).read_bytes() == b"chunk-1;"
+
+
+def test_restored_from_download_cache(base_command):
+    """A file that has been downloaded to a different location is restored
+    from the download cache."""
+    # Download the file into the cache.
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    base_command.requests.get.return_value = response
+
+    base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path / "first",
+    )
+
+    # Download the file into a different location
+    response.iter_content.reset_mock()
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path / "second",
+    )
+
+    # The content was restored from the cache, rather than downloaded.
+    response.iter_content.assert_not_called()
+    assert filename == base_command.base_path / "second" / "something.zip"
+    assert filename.read_bytes() == b"chunk-1;"
+
+
+def cached_download(base_command, headers=None):
+    """Download a file into the cache of the base command.
+
+    :param base_command: The command performing the download.
+    :param headers: Any additional headers to include in the response.
+    :returns: The filename of the cached download.
+    """
+    requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict(dict({"content-length": "8"}, **(headers or {})))
+    )
+    response.iter_content.return_value = iter([b"chunk-1;"])
+    requests.get.return_value = response
+
+    base_command.requests = requests
+    return base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+
+def test_revalidate_not_modified(base_command):
+    """If revalidation is requested, and the content hasn't changed, the
+    cached file is used."""
+    filename = cached_download(base_command, headers={"ETag": '"abc123"'})
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.status_code = 304
+    base_command.requests.get.return_value = response
+
+    # Download the file again
+    second_filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        revalidate=True,
+    )
+
+    # A conditional request was made.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+        headers={"If-None-Match": '"abc123"'},
+    )
+    response.iter_content.assert_not_called()
+
+    assert second_filename == filename
+    assert filename.read_bytes() == b"chunk-1;"
+
+
+def test_revalidate_modified(base_command):
+    """If revalidation is requested, and the content has changed, the content
+    is downloaded again."""
+    filename = cached_download(
+        base_command,
+        headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "8", "ETag": '"def456"'})
+    )
+    response.iter_content.return_value = iter([b"chunk-2;"])
+    base_command.requests.get.return_value = response
+
+    # Download the file again
+    second_filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        revalidate=True,
+    )
+
+    # A conditional request was made.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+        headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+
+    # The new content has replaced the old content
+    assert second_filename == filename
+    assert filename.read_bytes() == b"chunk-2;"
+
+    # The new validators have been recorded.
+    assert base_command.download_cache.conditional_headers(
+        "https://example.com/support?useful=Yes"
+    ) == {"If-None-Match": '"def456"'}
+
+
+def test_revalidate_no_validators(base_command):
+    """If the server didn't provide validators, revalidation re-requests the
+    URL."""
+    filename = cached_download(base_command)
+
+    base_command.requests = mock.MagicMock()
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "8"}))
+    base_command.requests.get.return_value = response
+
+    # Download the file again
+    second_filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        revalidate=True,
+    )
+
+    # An unconditional request was made; but the same file was served, so the
+    # content wasn't downloaded.
+    base_command.requests.get.assert_called_once_with(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+    response.iter_content.assert_not_called()
+    assert second_filename == filename
+
+
+def test_offline_cached(base_command):
+    """In offline mode, cached content can be used."""
+    filename = cached_download(base_command, headers={"ETag": '"abc123"'})
+
+    base_command.offline = True
+    base_command.requests = mock.MagicMock()
+
+    # Download the file again, requesting revalidation.
+    second_filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        revalidate=True,
+    )
+
+    # No request was made.
+    base_command.requests.get.assert_not_called()
+    assert second_filename == filename
+
+
+def test_offline_restored(base_command):
+    """In offline mode, content can be restored from the download cache."""
+    cached_download(base_command)
+
+    base_command.offline = True
+    base_command.requests = mock.MagicMock()
+
+    # Download the file into a different location
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path / "elsewhere",
+    )
+
+    # No request was made.
+    base_command.requests.get.assert_not_called()
+    assert filename == base_command.base_path / "elsewhere" / "something.zip"
+    assert filename.read_bytes() == b"chunk-1;"
+
+
+def test_offline_missing(base_command):
+    """In offline mode, content that hasn't been downloaded raises an
+    error."""
+    base_command.offline = True
+    base_command.requests = mock.MagicMock()
+
+    with pytest.raises(
+        OfflineModeError,
+        match=r"Unable to obtain support package in offline mode.",
+    ):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+            role="support package",
+        )
+
+    # No request was made.
+    base_command.requests.get.assert_not_called()
+
+
+def test_interrupted_download_resumed(base_command):
+    """If the connection drops during a download, the download is resumed."""
+    base_command.sleep = mock.Mock()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 2
+
+    def interrupted_content(chunk_size):
+        yield b"chunk-1;"
+        raise requests.exceptions.ChunkedEncodingError("Connection reset")
+
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict(
+            {"content-length": "24", "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+    )
+    response.iter_content.side_effect = interrupted_content
+
+    ranged_response = mock.MagicMock()
+    ranged_response.url = "https://example.com/path/to/something.zip"
+    ranged_response.status_code = 206
+    ranged_response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "16"}))
+    ranged_response.iter_content.return_value = iter([b"chunk-2;", b"chunk-3;"])
+    base_command.requests.get.side_effect = [response, ranged_response]
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # There was a pause, then the download was resumed.
+    base_command.sleep.assert_called_once_with(0.5)
+    assert base_command.requests.get.mock_calls[-1] == mock.call(
+        "https://example.com/path/to/something.zip",
+        stream=True,
+        headers={"Range": "bytes=8-", "If-Range": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+    assert filename.read_bytes() == b"chunk-1;chunk-2;chunk-3;"
+
+
+def test_interrupted_download_restarted(base_command):
+    """If an interrupted download can't be resumed, it is restarted."""
+    base_command.sleep = mock.Mock()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 2
+
+    def interrupted_content(chunk_size):
+        yield b"chunk-1;"
+        raise requests.exceptions.ConnectionError("Connection reset")
+
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "ETag": '"abcd1234"'})
+    )
+    response.iter_content.side_effect = interrupted_content
+
+    ranged_response = mock.MagicMock()
+    ranged_response.status_code = 200
+
+    new_response = mock.MagicMock()
+    new_response.url = "https://example.com/path/to/something.zip"
+    new_response.status_code = 200
+    new_response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "24"}))
+    new_response.iter_content.return_value = iter(
+        [b"chunk-1;", b"chunk-2;", b"chunk-3;"]
+    )
+    base_command.requests.get.side_effect = [response, ranged_response, new_response]
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+
+    # The download was restarted with a new request
+    assert base_command.requests.get.mock_calls[-1] == mock.call(
+        "https://example.com/support?useful=Yes",
+        stream=True,
+    )
+    assert filename.read_bytes() == b"chunk-1;chunk-2;chunk-3;"
+
+
+def test_interrupted_download_retries_exhausted(base_command):
+    """If a download keeps failing, it eventually fails with an error."""
+    base_command.sleep = mock.Mock()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 3
+
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(wraps=HTTPHeaderDict({"content-length": "24"}))
+    response.iter_content.side_effect = requests.exceptions.ReadTimeout
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    with pytest.raises(NetworkFailure, match="Unable to download something.zip"):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+        )
+
+    # There were 3 retries, with an exponential backoff.
+    assert base_command.sleep.mock_calls == [
+        mock.call(0.5),
+        mock.call(1.0),
+        mock.call(2.0),
+    ]
+
+
+def test_interrupted_download_validator_retained(base_command):
+    """If a download fails, the version of the partial content is retained
+    so the download can be resumed later."""
+    base_command.sleep = mock.Mock()
+    base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 0
+
+    def interrupted_content(chunk_size):
+        yield b"chunk-1;"
+        raise requests.exceptions.ConnectionError("Connection reset")
+
+    response = mock.MagicMock()
+    response.url = "https://example.com/path/to/something.zip"
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": "24", "ETag": '"abcd1234"'})
+    )
+    response.iter_content.side_effect = interrupted_content
+    base_command.requests.get.return_value = response
+
+    # Download the file
+    with pytest.raises(NetworkFailure, match="Unable to download something.zip"):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+        )
+
+    # The partial content, and its validator, have been retained.
+    partial_file = base_command.base_path / "something.zip.part"
+    validator_file = base_command.base_path / "something.zip.part.validator"
+    assert partial_file.read_bytes() == b"chunk-1;"
+    assert validator_file.read_text(encoding="utf-8") == '"abcd1234"'
+
+
+def tar_gz_content(files):
+    """Create the content of a .tar.gz archive containing some files.
+
+    :param files: A list of (name, content) pairs.
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def archive_response(url, content, chunk_size=64):
+    """Create a mock response that serves some content in small chunks."""
+    response = mock.MagicMock()
+    response.url = url
+    response.status_code = 200
+    response.headers = mock.Mock(
+        wraps=HTTPHeaderDict({"content-length": str(len(content))})
+    )
+    chunks = []
+    for start in range(0, len(content), chunk_size):
+        chunks.append(content[start:][:chunk_size])
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+def test_streaming_extract(base_command, tmp_path):
+    """A tar archive is unpacked while it is downloaded."""
+    content = tar_gz_content(
+        [("pkg/first.txt", b"first file"), ("pkg/second.txt", b"second file")]
+    )
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/something.tar.gz", content
+    )
+    base_command.shutil = mock.MagicMock()
+
+    # Download the file
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        extract_path=tmp_path / "unpacked",
+    )
+
+    # The archive was downloaded, and unpacked without re-reading the archive
+    assert filename.read_bytes() == content
+    assert (tmp_path / "unpacked" / "pkg" / "first.txt").read_text() == "first file"
+    assert (tmp_path / "unpacked" / "pkg" / "second.txt").read_text() == "second file"
+    base_command.shutil.unpack_archive.assert_not_called()
+
+    # The partial file has been moved into the cache
+    assert not (base_command.base_path / "something.tar.gz.part").exists()
+
+
+def test_streaming_extract_invalid_archive(base_command, tmp_path):
+    """If a streamed archive can't be unpacked, an error is raised, but the
+    download is retained."""
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/something.tar.gz", b"not a tarball" * 20
+    )
+
+    with pytest.raises(shutil.ReadError):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+            extract_path=tmp_path / "unpacked",
+        )
+
+    # The download completed
+    assert (base_command.base_path / "something.tar.gz").exists()
+
+
+def test_streaming_extract_interrupted(base_command, tmp_path):
+    """If a streamed download fails, extraction is abandoned."""
+    base_command.requests = mock.MagicMock()
+    base_command.requests.retries = 0
+    response = archive_response(
+        "https://example.com/path/to/something.tar.gz",
+        tar_gz_content([("pkg/first.txt", b"first file")]),
+    )
+    response.iter_content.side_effect = requests.exceptions.ConnectionError
+    base_command.requests.get.return_value = response
+
+    with pytest.raises(NetworkFailure):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+            extract_path=tmp_path / "unpacked",
+        )
+
+    # Nothing was unpacked
+    assert not (tmp_path / "unpacked" / "pkg").exists()
+
+
+def test_streaming_extract_corrupt(base_command, tmp_path):
+    """If a streamed download doesn't match its checksum, nothing is put in
+    the extract path."""
+    # Some content from a previous install is already in place.
+    (tmp_path / "unpacked" / "pkg").mkdir(parents=True)
+    (tmp_path / "unpacked" / "pkg" / "first.txt").write_text("old file")
+
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/something.tar.gz",
+        tar_gz_content([("pkg/first.txt", b"first file")]),
+    )
+
+    with pytest.raises(CorruptNetworkResourceError):
+        base_command.download_file(
+            url="https://example.com/support?useful=Yes",
+            download_path=base_command.base_path,
+            checksum="0" * 64,
+            extract_path=tmp_path / "unpacked",
+        )
+
+    # The unpacked content was discarded; the existing content is untouched.
+    assert list(tmp_path.glob(".unpacking-*")) == []
+    assert (tmp_path / "unpacked" / "pkg" / "first.txt").read_text() == "old file"
+
+
+def test_extract_replaces_content(base_command, tmp_path):
+    """Once a download is verified, its content replaces any existing
+    content in the extract path."""
+    (tmp_path / "unpacked" / "pkg").mkdir(parents=True)
+    (tmp_path / "unpacked" / "pkg" / "stale.txt").write_text("stale file")
+    (tmp_path / "unpacked" / "other.txt").write_text("other file")
+
+    content = tar_gz_content([("pkg/first.txt", b"first file")])
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/something.tar.gz", content
+    )
+
+    base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        checksum=hashlib.sha256(content).hexdigest(),
+        extract_path=tmp_path / "unpacked",
+    )
+
+    # The unpacked folder replaced the existing folder of the same name;
+    # other content is retained, and the staging folder has been removed.
+    assert list(tmp_path.glob(".unpacking-*")) == []
+    assert (tmp_path / "unpacked" / "pkg" / "first.txt").read_text() == "first file"
+    assert not (tmp_path / "unpacked" / "pkg" / "stale.txt").exists()
+    assert (tmp_path / "unpacked" / "other.txt").read_text() == "other file"
+
+
+def test_extract_zip(base_command, tmp_path):
+    """An archive that can't be streamed is unpacked once it is
+    downloaded."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("pkg/first.txt", "first file")
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/something.zip", buffer.getvalue()
+    )
+
+    base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        extract_path=tmp_path / "unpacked",
+    )
+
+    assert (tmp_path / "unpacked" / "pkg" / "first.txt").read_text() == "first file"
+
+
+def test_extract_cached(base_command, tmp_path):
+    """A cached archive is unpacked without a download."""
+    content = tar_gz_content([("pkg/first.txt", b"first file")])
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/something.tar.gz", content
+    )
+    base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+    )
+    base_command.requests.get.reset_mock()
+
+    filename = base_command.download_file(
+        url="https://example.com/support?useful=Yes",
+        download_path=base_command.base_path,
+        extract_path=tmp_path / "unpacked",
+    )
+
+    # No request was made; the cached file was unpacked.
+    base_command.requests.get.assert_not_called()
+    assert filename == base_command.base_path / "something.tar.gz"
+    assert (tmp_path / "unpacked" / "pkg" / "first.txt").read_text() == "first file"
+
+
+def test_cache_budget(base_command, monkeypatch):
+    """If a cache budget is set, the least recently used downloads are removed
+    when new content is downloaded."""
+    monkeypatch.setenv("BRIEFCASE_CACHE_MAX_SIZE", "20")
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = [
+        archive_response("https://example.com/path/to/old.zip", b"old content"),
+        archive_response("https://example.com/path/to/new.zip", b"new content"),
+    ]
+
+    old = base_command.download_file(
+        url="https://example.com/old",
+        download_path=base_command.base_path,
+    )
+    new = base_command.download_file(
+        url="https://example.com/new",
+        download_path=base_command.base_path,
+    )
+
+    # The old content was removed to make room for the new content.
+    assert not old.exists()
+    assert new.read_bytes() == b"new content"
+    assert base_command.download_cache.record("https://example.com/old") is None
+
+
+def test_cache_budget_exceeded(base_command, monkeypatch):
+    """Newly downloaded content is retained, even if it exceeds the cache
+    budget on its own."""
+    monkeypatch.setenv("BRIEFCASE_CACHE_MAX_SIZE", "1")
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/new.zip", b"new content"
+    )
+
+    new = base_command.download_file(
+        url="https://example.com/new",
+        download_path=base_command.base_path,
+    )
+
+    assert new.read_bytes() == b"new content"
+
+
+def test_cache_budget_bad_size(base_command, monkeypatch):
+    """An invalid cache budget raises an error."""
+    monkeypatch.setenv("BRIEFCASE_CACHE_MAX_SIZE", "lots")
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://example.com/path/to/new.zip", b"new content"
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"The value of BRIEFCASE_CACHE_MAX_SIZE must be a size",
+    ):
+        base_command.download_file(
+            url="https://example.com/new",
+            download_path=base_command.base_path,
+        )
+
+
+def test_mirror(base_command):
+    """If a mirror is configured, it is used to download content."""
+    base_command.mirrors = Mirrors(
+        {"https://example.com/": ["https://mirror.local/example/"]}
+    )
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.return_value = archive_response(
+        "https://mirror.local/example/path/to/something.zip", b"mirrored content"
+    )
+
+    filename = base_command.download_file(
+        url="https://example.com/path/to/something.zip",
+        download_path=base_command.base_path,
+    )
+
+    base_command.requests.get.assert_called_once_with(
+        "https://mirror.local/example/path/to/something.zip",
+        stream=True,
+    )
+    assert filename.read_bytes() == b"mirrored content"
+
+    # The content is cached against the upstream URL.
+    assert base_command.download_cache.record(
+        "https://example.com/path/to/something.zip"
+    )
+
+
+def test_mirror_segmented_download(base_command, monkeypatch):
+    """Segments of a segmented download are requested from a mirror."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "2")
+    monkeypatch.setattr("briefcase.commands.base.MIN_DOWNLOAD_SEGMENT_SIZE", 10)
+    base_command.mirrors = Mirrors(
+        {"https://example.com/": ["https://mirror.local/example/"]}
+    )
+    content = bytes(range(256))
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content)
+
+    filename = base_command.download_file(
+        url="https://example.com/path/to/something.zip",
+        download_path=base_command.base_path,
+    )
+
+    assert {call.args[0] for call in base_command.requests.get.mock_calls} == {
+        "https://mirror.local/example/path/to/something.zip"
+    }
+    assert filename.read_bytes() == content
+
+
+def test_mirror_segmented_download_unsupported(base_command, monkeypatch):
+    """If a segmented download falls back to a single stream, the stream is
+    requested from a mirror."""
+    monkeypatch.setenv("BRIEFCASE_DOWNLOAD_SEGMENTS", "2")
+    monkeypatch.setattr("briefcase.commands.base.MIN_DOWNLOAD_SEGMENT_SIZE", 10)
+    base_command.mirrors = Mirrors(
+        {"https://example.com/": ["https://mirror.local/example/"]}
+    )
+    content = bytes(range(256))
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = segmented_get(content, status_code=200)
+
+    filename = base_command.download_file(
+        url="https://example.com/path/to/something.zip",
+        download_path=base_command.base_path,
+    )
+
+    assert base_command.requests.get.mock_calls[-1] == mock.call(
+        "https://mirror.local/example/path/to/something.zip",
+        stream=True,
+    )
+    assert filename.read_bytes() == content
+
+
+def test_mirror_failover(base_command):
+    """If mirrors can't provide content, the next mirror (and ultimately, the
+    upstream URL) is used."""
+    base_command.mirrors = Mirrors(
+        {
+            "https://example.com/": [
+                "https://down.local/",
+                "https://incomplete.local/",
+            ]
+        }
+    )
+    missing = mock.MagicMock(status_code=404)
+    base_command.requests = mock.MagicMock()
+    base_command.requests.get.side_effect = [
+        requests.exceptions.ConnectionError,
+        missing,
+        archive_response("https://example.com/something.zip", b"upstream content"),
+    ]
+
+    filename = base_command.download_file(
+        url="https://example.com/something.zip",
+        download_path=base_command.base_path,
+    )
+
+    assert base_command.requests.get.mock_calls == [
+        mock.call("https://down.local/something.zip", stream=True),
+        mock.call("https://incomplete.local/something.zip", stream=True),
+        mock.call("https://example.com/something.zip", stream=True),
+    ]
+    missing.close.assert_called_once_with()
+    assert filename.read_bytes() == b"upstream content"
+
+
+def test_file_mirror(base_command, tmp_path):
+    """A local directory can be used as a mirror."""
+    mirror_path = tmp_path / "mirror" / "path" / "to" / "something.tar.gz"
+    mirror_path.parent.mkdir(parents=True)
+    mirror_path.write_bytes(tar_gz_content([("pkg/first.txt", b"first file")]))
+    base_command.mirrors = Mirrors(
+        {"https://example.com/": [(tmp_path / "mirror").as_uri() + "/"]}
+    )
+
+    filename = base_command.download_file(
+        url="https://example.com/path/to/something.tar.gz",
+        download_path=base_command.base_path,
+        extract_path=tmp_path / "unpacked",
+    )
+
+    assert filename == base_command.base_path / "something.tar.gz"
+    assert filename.read_bytes() == mirror_path.read_bytes()
+    assert (tmp_path / "unpacked" / "pkg" / "first.txt").read_text() == "first file"
+
+
+def test_concurrent_download(base_command):
+    """If a URL is already being downloaded, the download waits for the other
+    download to complete, then uses the downloaded content."""
+    url = "https://example.com/support?useful=Yes"
+    url_digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    lock = FileLock.for_path(
+        base_command.data_path / "locks" / f"download-{url_digest[:16]}.lock"
+    )
+
+    results = []
+    with lock:
+        # Start a second download of the URL; it can't proceed until the
+        # lock is released.
+        waiter = threading.Thread(
+            target=lambda: results.append(
+                base_command.download_file(
+                    url=url,
+                    download_path=base_command.base_path / "elsewhere",
+                )
+            )
+        )
+        waiter.start()
+        waiter.join(0.2)
+        assert waiter.is_alive()
+
+        # Complete the first download.
+        cached_download(base_command)
+        base_command.requests = mock.MagicMock()
+
+    waiter.join(5)
+
+    # The second download used the downloaded content, without a request.
+    base_command.requests.get.assert_not_called()
+    assert results == [base_command.base_path / "elsewhere" / "something.zip"]
+    assert results[0].read_bytes() == b"chunk-1;"
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+from unittest import mock
+
+# A script that holds a lock until it is told to release it.
+HOLD_LOCK = """
+import sys
+from briefcase.locks import FileLock
+
+with FileLock.for_path(sys.argv[1]):
+    print("locked", flush=True)
+    sys.stdin.readline()
+"""
+
+
+def test_lock(base_command, monkeypatch):
+    """A lock can be held on a named resource."""
+    monkeypatch.setattr(base_command.logger, "info", mock.Mock())
+
+    with base_command.lock("thing", description="the thing"):
+        assert (base_command.data_path / "locks" / "thing.lock").exists()
+
+    # The lock was available, so no message was displayed.
+    base_command.logger.info.assert_not_called()
+
+
+def test_lock_wait(base_command, monkeypatch):
+    """If another process holds a lock, a message is displayed while
+    waiting."""
+    lock_path = base_command.data_path / "locks" / "thing.lock"
+    other_process = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(lock_path)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert other_process.stdout.readline() == "locked\n"
+
+    # When the message is displayed, tell the other process to release the
+    # lock.
+    messages = []
+
+    def release(message):
+        messages.append(message)
+        other_process.stdin.close()
+
+    monkeypatch.setattr(base_command.logger, "info", release)
+
+    try:
+        with base_command.lock("thing", description="the thing"):
+            pass
+    finally:
+        other_process.stdin.close()
+        other_process.wait()
+
+    assert messages == [
+        "Waiting for another Briefcase process to finish with the thing..."
+    ]
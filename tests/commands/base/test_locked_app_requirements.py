@@ -0,0 +1,182 @@
+import json
+from unittest import mock
+
+import pytest
+
+from briefcase.config import AppConfig
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def pip_report(*packages):
+    """The JSON report of a pip dry run that would install the given
+    ``(name, version, sha256)`` packages."""
+    return json.dumps(
+        {
+            "install": [
+                {
+                    "metadata": {"name": name, "version": version},
+                    "download_info": {
+                        "archive_info": {"hashes": {"sha256": digest}} if digest else {}
+                    },
+                }
+                for name, version, digest in packages
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def myapp():
+    return AppConfig(
+        app_name="my-app",
+        bundle="com.example",
+        version="1.2.3",
+        description="This is a simple app",
+        sources=["src/my_app"],
+        requires=["first", "second>=2"],
+        lock_dependencies=True,
+    )
+
+
+@pytest.fixture
+def command(base_command):
+    base_command.subprocess = mock.MagicMock()
+    base_command.subprocess.check_output.return_value = pip_report(
+        ("first", "1.0", "1111"),
+        ("second", "2.0", "2222"),
+        ("third", "3.0", "3333"),
+    )
+    return base_command
+
+
+def test_not_locked(command, myapp):
+    """If the app doesn't lock its dependencies, nothing is locked."""
+    myapp.lock_dependencies = False
+
+    assert command.locked_app_requirements(myapp) is None
+    command.subprocess.check_output.assert_not_called()
+    assert not (command.base_path / "briefcase.lock").exists()
+
+
+def test_lock(command, myapp, capsys):
+    """The app's requirements are resolved and locked; once locked, they
+    aren't resolved again."""
+    packages = command.locked_app_requirements(myapp)
+
+    assert packages == [
+        {"name": "first", "version": "1.0", "hashes": ["sha256:1111"]},
+        {"name": "second", "version": "2.0", "hashes": ["sha256:2222"]},
+        {"name": "third", "version": "3.0", "hashes": ["sha256:3333"]},
+    ]
+    assert "Locked 3 dependencies in briefcase.lock." in capsys.readouterr().out
+    content = json.loads((command.base_path / "briefcase.lock").read_text())
+    target = f"tester/dumdum/{command.host_arch}/py{command.python_version_tag}"
+    assert content["apps"]["my-app"][target]["packages"] == packages
+
+    # The locked packages are reused, without resolving the requirements.
+    command.subprocess.check_output.reset_mock()
+    assert command.locked_app_requirements(myapp) == packages
+    command.subprocess.check_output.assert_not_called()
+
+    # If the requirements change, they are locked again.
+    myapp.requires = ["first"]
+    command.subprocess.check_output.return_value = pip_report(
+        ("first", "1.1", "1112"),
+    )
+    assert command.locked_app_requirements(myapp) == [
+        {"name": "first", "version": "1.1", "hashes": ["sha256:1112"]},
+    ]
+
+
+def test_lock_other_arch(command, myapp):
+    """Packages locked on one architecture aren't used to install on
+    another; each architecture locks its own packages."""
+    command.host_arch = "arm64"
+    arm64_packages = command.locked_app_requirements(myapp)
+
+    # On another architecture, pip picks wheels with different hashes.
+    command.host_arch = "x86_64"
+    command.subprocess.check_output.reset_mock()
+    command.subprocess.check_output.return_value = pip_report(
+        ("first", "1.0", "aaaa"),
+        ("second", "2.0", "bbbb"),
+        ("third", "3.0", "cccc"),
+    )
+    x86_64_packages = command.locked_app_requirements(myapp)
+
+    command.subprocess.check_output.assert_called_once()
+    assert x86_64_packages == [
+        {"name": "first", "version": "1.0", "hashes": ["sha256:aaaa"]},
+        {"name": "second", "version": "2.0", "hashes": ["sha256:bbbb"]},
+        {"name": "third", "version": "3.0", "hashes": ["sha256:cccc"]},
+    ]
+
+    # Both architectures are recorded in the lock file; neither replaces the
+    # other.
+    content = json.loads((command.base_path / "briefcase.lock").read_text())
+    python = f"py{command.python_version_tag}"
+    assert content["apps"]["my-app"][f"tester/dumdum/arm64/{python}"] == {
+        "requires": ["first", "second>=2"],
+        "packages": arm64_packages,
+    }
+    assert content["apps"]["my-app"][f"tester/dumdum/x86_64/{python}"] == {
+        "requires": ["first", "second>=2"],
+        "packages": x86_64_packages,
+    }
+
+    # Returning to the first architecture uses its locked packages.
+    command.host_arch = "arm64"
+    command.subprocess.check_output.reset_mock()
+    assert command.locked_app_requirements(myapp) == arm64_packages
+    command.subprocess.check_output.assert_not_called()
+
+
+def test_lock_other_python(command, myapp):
+    """Packages are locked separately for each Python version."""
+    command.locked_app_requirements(myapp)
+
+    command.sys = mock.MagicMock()
+    command.sys.version_info = mock.MagicMock(major=3, minor=99)
+    command.subprocess.check_output.reset_mock()
+    command.locked_app_requirements(myapp)
+
+    command.subprocess.check_output.assert_called_once()
+    content = json.loads((command.base_path / "briefcase.lock").read_text())
+    assert f"tester/dumdum/{command.host_arch}/py3.99" in content["apps"]["my-app"]
+
+
+def test_lock_without_hashes(command, myapp, capsys):
+    """If some packages don't have hashes, only versions are locked."""
+    command.subprocess.check_output.return_value = pip_report(
+        ("first", "1.0", "1111"),
+        ("second", "2.0", None),
+    )
+
+    assert command.locked_app_requirements(myapp) == [
+        {"name": "first", "version": "1.0", "hashes": []},
+        {"name": "second", "version": "2.0", "hashes": []},
+    ]
+    assert "only the versions of the dependencies" in capsys.readouterr().out
+
+
+def test_unlockable_requirements(command, myapp):
+    """Requirements that aren't installed from an index can't be locked."""
+    myapp.requires = ["first", "./local/package"]
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to lock the dependencies of my-app",
+    ):
+        command.locked_app_requirements(myapp)
+
+
+def test_unresolvable(command, myapp):
+    """If the requirements can't be resolved, an error is raised."""
+    command.subprocess.check_output.return_value = "Not JSON"
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to resolve the requirements of my-app",
+    ):
+        command.locked_app_requirements(myapp)
+    assert not (command.base_path / "briefcase.lock").exists()
@@ -0,0 +1,71 @@
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def proxy_app(my_app):
+    my_app.index_proxy = True
+    return my_app
+
+
+def test_no_index_proxy(base_command, my_app):
+    """If the app doesn't use the index proxy, pip isn't redirected."""
+    with base_command.package_index(my_app) as index_url:
+        assert index_url is None
+        assert base_command.pip_index_options() == []
+
+
+def test_index_proxy(base_command, proxy_app, monkeypatch):
+    """If the app uses the index proxy, pip uses it while it is running."""
+    monkeypatch.setattr(base_command, "os", mock.MagicMock(environ={}))
+
+    with mock.patch("briefcase.commands.base.IndexProxy") as IndexProxy:
+        IndexProxy.return_value.serve.return_value.__enter__.return_value = (
+            "http://127.0.0.1:4242/simple/"
+        )
+        with base_command.package_index(proxy_app) as index_url:
+            assert index_url == "http://127.0.0.1:4242/simple/"
+            assert base_command.pip_index_options() == [
+                "--index-url=http://127.0.0.1:4242/simple/"
+            ]
+
+            # Nested uses share the running proxy.
+            with base_command.package_index(proxy_app) as nested_url:
+                assert nested_url == index_url
+
+    IndexProxy.assert_called_once_with(
+        base_command.package_index_cache,
+        base_command._request_download,
+        upstream="https://pypi.org/simple/",
+        offline=False,
+    )
+    assert base_command.pip_index_options() == []
+
+
+def test_index_proxy_configured_upstream(base_command, proxy_app, monkeypatch):
+    """The proxy uses the index that pip has been configured to use, and
+    respects offline mode."""
+    monkeypatch.setattr(
+        base_command,
+        "os",
+        mock.MagicMock(environ={"PIP_INDEX_URL": "https://index.example.com/"}),
+    )
+    base_command.offline = True
+
+    with mock.patch("briefcase.commands.base.IndexProxy") as IndexProxy:
+        with base_command.package_index(proxy_app):
+            pass
+
+    IndexProxy.assert_called_once_with(
+        base_command.package_index_cache,
+        base_command._request_download,
+        upstream="https://index.example.com/",
+        offline=True,
+    )
+
+
+def test_index_proxy_serves(base_command, proxy_app):
+    """The proxy is running while the context is active."""
+    with base_command.package_index(proxy_app) as index_url:
+        assert index_url.startswith("http://127.0.0.1:")
@@ -12,6 +12,19 @@ def test_parse_options(base_command):
     }
     assert base_command.input.enabled
     assert base_command.logger.verbosity == 1
+    assert not base_command.offline
+
+
+def test_parse_offline(base_command):
+    """The offline option is consumed by the command."""
+    options = base_command.parse_options(extra=("--offline", "-r", "important"))
+
+    assert options == {
+        "extra": None,
+        "mystery": None,
+        "required": "important",
+    }
+    assert base_command.offline
 
 
 def test_missing_option(base_command, capsys):
@@ -48,3 +61,17 @@ def test_no_options(other_command, capsys):
     # Error message about unknown option is displayed
     err = capsys.readouterr().err
     assert "unrecognized arguments: -x wibble" in err
+
+
+def test_parse_no_cache(base_command):
+    """The no-cache option is consumed by the command."""
+    assert base_command.verification_cache.enabled
+
+    options = base_command.parse_options(extra=("--no-cache", "-r", "important"))
+
+    assert options == {
+        "extra": None,
+        "mystery": None,
+        "required": "important",
+    }
+    assert not base_command.verification_cache.enabled
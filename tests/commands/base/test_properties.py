@@ -49,3 +49,42 @@ def test_input_state_transferred(tmp_path):
     assert not command.run_command.input.enabled
     assert not command.package_command.input.enabled
     assert not command.publish_command.input.enabled
+
+
+def test_offline_state_transferred(tmp_path):
+    """If offline mode is enabled, that status is transferred to created
+    subcommands."""
+    command = DummyCommand(base_path=tmp_path)
+    command.offline = True
+
+    # Check the offline state of subcommands
+    assert command.create_command.offline
+    assert command.update_command.offline
+    assert command.build_command.offline
+    assert command.run_command.offline
+    assert command.package_command.offline
+    assert command.publish_command.offline
+
+
+def test_session_shared(tmp_path):
+    """Subcommands share the HTTP session of the command that created them."""
+    command = DummyCommand(base_path=tmp_path)
+
+    # Check the session of subcommands
+    assert command.create_command.requests is command.requests
+    assert command.update_command.requests is command.requests
+    assert command.build_command.requests is command.requests
+    assert command.run_command.requests is command.requests
+    assert command.package_command.requests is command.requests
+    assert command.publish_command.requests is command.requests
+
+
+def test_verification_cache_shared(tmp_path):
+    """Subcommands share the verification cache of the command that created
+    them."""
+    command = DummyCommand(base_path=tmp_path)
+    command.verification_cache.enabled = False
+
+    assert command.create_command.verification_cache is command.verification_cache
+    assert command.build_command.verification_cache is command.verification_cache
+    assert not command.run_command.verification_cache.enabled
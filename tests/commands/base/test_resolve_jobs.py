@@ -0,0 +1,56 @@
+import argparse
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def test_jobs(base_command):
+    """A positive number of jobs is used as provided."""
+    assert base_command.resolve_jobs(3) == 3
+
+
+def test_cpu_count(base_command):
+    """A value of 0 uses one job per CPU."""
+    base_command.os = mock.MagicMock()
+    base_command.os.cpu_count.return_value = 6
+
+    assert base_command.resolve_jobs(0) == 6
+
+
+def test_unknown_cpu_count(base_command):
+    """If the number of CPUs can't be determined, a single job is used."""
+    base_command.os = mock.MagicMock()
+    base_command.os.cpu_count.return_value = None
+
+    assert base_command.resolve_jobs(0) == 1
+
+
+def test_invalid_jobs(base_command):
+    """The number of jobs can't be negative."""
+    with pytest.raises(BriefcaseCommandError, match=r"--jobs must be at least 0\."):
+        base_command.resolve_jobs(-1)
+
+
+def test_jobs_option(base_command):
+    """The jobs option has a default of 1."""
+    parser = argparse.ArgumentParser()
+    base_command.add_jobs_option(parser)
+
+    assert parser.parse_args([]).jobs == 1
+    assert parser.parse_args(["-j", "0"]).jobs == 0
+    assert "0 uses one job per CPU (default: 1)" in " ".join(
+        parser.format_help().split()
+    )
+
+
+def test_jobs_option_default(base_command):
+    """The default number of jobs, and the description, can be customized."""
+    parser = argparse.ArgumentParser()
+    base_command.add_jobs_option(parser, default=4, help="Things to do at once")
+
+    assert parser.parse_args([]).jobs == 4
+    assert "Things to do at once; 0 uses one job per CPU (default: 4)" in " ".join(
+        parser.format_help().split()
+    )
@@ -0,0 +1,79 @@
+import json
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+
+def test_resolve(base_command):
+    """Requirements are resolved with a pip dry run, reporting the hashes of
+    the artefacts that would be installed."""
+    base_command.subprocess = mock.MagicMock()
+    base_command.subprocess.check_output.return_value = json.dumps(
+        {
+            "install": [
+                {
+                    "metadata": {"name": "first", "version": "1.0"},
+                    "download_info": {
+                        "archive_info": {
+                            "hashes": {"md5": "0000", "sha256": "1111"},
+                        }
+                    },
+                },
+                {
+                    # Older versions of pip report a single hash
+                    "metadata": {"name": "second", "version": "2.0"},
+                    "download_info": {"archive_info": {"hash": "sha256=2222"}},
+                },
+                {
+                    "metadata": {"name": "third", "version": "3.0"},
+                    "download_info": {"dir_info": {}},
+                },
+            ]
+        }
+    )
+
+    packages = base_command.resolve_requirements(["first", "second>=2", "third"])
+
+    assert packages == [
+        {"name": "first", "version": "1.0", "hashes": ["sha256:1111"]},
+        {"name": "second", "version": "2.0", "hashes": ["sha256:2222"]},
+        {"name": "third", "version": "3.0", "hashes": []},
+    ]
+    base_command.subprocess.check_output.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--dry-run",
+            "--ignore-installed",
+            "--no-user",
+            "--quiet",
+            "--report",
+            "-",
+            "first",
+            "second>=2",
+            "third",
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        subprocess.CalledProcessError(cmd=["pip"], returncode=2),
+        "Not JSON",
+        json.dumps({"install": [{"metadata": {}}]}),
+    ],
+)
+def test_unresolvable(base_command, output):
+    """If the requirements can't be resolved, None is returned."""
+    base_command.subprocess = mock.MagicMock()
+    if isinstance(output, Exception):
+        base_command.subprocess.check_output.side_effect = output
+    else:
+        base_command.subprocess.check_output.return_value = output
+
+    assert base_command.resolve_requirements(["first"]) is None
@@ -4,6 +4,7 @@ import pytest
 from git import exc as git_exceptions
 
 from briefcase.commands.base import TemplateUnsupportedVersion, cookiecutter_cache_path
+from briefcase.exceptions import OfflineModeError
 
 
 def test_non_url(base_command, mock_git):
@@ -163,3 +164,55 @@ def test_cached_missing_branch_template(base_command, mock_git):
 
     # An attempt to access the branch was made
     mock_remote.refs.__getitem__.assert_called_once_with("invalid")
+
+
+def test_offline_mode_cached_repo_template(base_command, mock_git):
+    """In offline mode, a cached template is used without being updated."""
+    base_command.git = mock_git
+    base_command.offline = True
+
+    mock_repo = mock.MagicMock()
+    mock_remote = mock.MagicMock()
+    mock_remote_head = mock.MagicMock()
+
+    base_command.git.Repo.return_value = mock_repo
+    mock_repo.remote.return_value = mock_remote
+    mock_remote.refs.__getitem__.return_value = mock_remote_head
+
+    cached_path = cookiecutter_cache_path(
+        "https://example.com/magic/special-template.git"
+    )
+
+    # Update the cache
+    cached_template = base_command.update_cookiecutter_cache(
+        template="https://example.com/magic/special-template.git",
+        branch="special",
+    )
+
+    # The origin of the repo was not fetched
+    mock_remote.fetch.assert_not_called()
+
+    # The right branch was checked out
+    mock_remote.refs.__getitem__.assert_called_once_with("special")
+    mock_remote_head.checkout.assert_called_once_with()
+
+    # The template that will be used is the cached path
+    assert cached_template == cached_path
+
+
+def test_offline_mode_new_repo_template(base_command, mock_git):
+    """In offline mode, a template that hasn't been cached raises an
+    error."""
+    base_command.git = mock_git
+    base_command.offline = True
+
+    base_command.git.Repo.side_effect = git_exceptions.NoSuchPathError
+
+    with pytest.raises(
+        OfflineModeError,
+        match=r"Unable to obtain app template in offline mode.",
+    ):
+        base_command.update_cookiecutter_cache(
+            template="https://example.com/magic/special-template.git",
+            branch="special",
+        )
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from briefcase.commands import CacheCommand
+
+
+def add_download(cache_command, url, path, content, age=0):
+    """Add content to the download cache, as if it had been downloaded.
+
+    :param cache_command: The command whose cache should be populated.
+    :param url: The URL that was downloaded.
+    :param path: The location where the content was placed.
+    :param content: The content that was downloaded.
+    :param age: The number of days since the content was last used.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    download = path.parent / f"{path.name}.part"
+    download.write_bytes(content)
+    cache_command.download_cache.add(url, download, path)
+
+    index = cache_command.download_cache.load_index()
+    index[url]["last_used"] = time.time() - age * 24 * 60 * 60
+    cache_command.download_cache.save_index(index)
+
+
+@pytest.fixture
+def cache_command(tmp_path):
+    command = CacheCommand(base_path=tmp_path, data_path=tmp_path / "data")
+
+    add_download(
+        command,
+        "https://example.com/old-support.zip",
+        tmp_path / "data" / "support" / "old-support.zip",
+        b"old support" * 100,
+        age=60,
+    )
+    add_download(
+        command,
+        "https://example.com/tool.AppImage",
+        tmp_path / "data" / "tools" / "tool.AppImage",
+        b"tool" * 100,
+        age=90,
+    )
+    add_download(
+        command,
+        "https://example.com/support.zip",
+        tmp_path / "data" / "support" / "support.zip",
+        b"support" * 100,
+    )
+    return command
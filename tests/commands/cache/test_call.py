@@ -0,0 +1,194 @@
+import os
+import time
+
+import pytest
+
+from briefcase.commands import CacheCommand
+from briefcase.commands.cache import DAY
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def test_stats(cache_command, capsys):
+    """The cache statistics can be displayed."""
+    cache_command(action="stats")
+
+    out = capsys.readouterr().out
+    assert "Cached downloads: 3" in out
+    assert "Stored content: 2.1 KB in 3 files" in out
+    assert "Used by installed tools: 1" in out
+
+
+def test_list(cache_command, capsys):
+    """The cached downloads are listed, from least to most recently used."""
+    cache_command(action="list")
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert lines[0].endswith("https://example.com/tool.AppImage (in use)")
+    assert lines[1].endswith("https://example.com/old-support.zip")
+    assert lines[2].endswith("https://example.com/support.zip")
+
+
+def test_list_empty(tmp_path, capsys):
+    """An empty cache can be listed."""
+    command = CacheCommand(base_path=tmp_path, data_path=tmp_path / "data")
+    command(action="list")
+
+    assert "The download cache is empty." in capsys.readouterr().out
+
+
+def test_prune(cache_command, tmp_path, capsys):
+    """Downloads that haven't been used recently are pruned, but tools in use
+    are retained."""
+    cache_command(action="prune", older_than=30)
+
+    assert not (tmp_path / "data" / "support" / "old-support.zip").exists()
+    assert (tmp_path / "data" / "support" / "support.zip").exists()
+    assert (tmp_path / "data" / "tools" / "tool.AppImage").exists()
+    assert "Removed https://example.com/old-support.zip" in capsys.readouterr().out
+
+
+def test_prune_nothing(cache_command, capsys):
+    """If nothing is old enough, nothing is pruned."""
+    cache_command(action="prune", older_than=365)
+
+    assert "Nothing to remove" in capsys.readouterr().out
+
+
+def test_prune_bad_age(cache_command):
+    """A negative age is rejected."""
+    with pytest.raises(BriefcaseCommandError, match=r"must be a positive number"):
+        cache_command(action="prune", older_than=-1)
+
+
+def test_gc(cache_command, tmp_path):
+    """Least recently used downloads are removed until the cache fits the
+    budget, but tools in use are retained."""
+    cache_command(action="gc", max_size="1.5K")
+
+    assert not (tmp_path / "data" / "support" / "old-support.zip").exists()
+    assert (tmp_path / "data" / "support" / "support.zip").exists()
+    assert (tmp_path / "data" / "tools" / "tool.AppImage").exists()
+    assert cache_command.download_cache.size() == 1100
+
+
+def test_gc_environment(cache_command, tmp_path, monkeypatch):
+    """The size budget can be provided by the environment."""
+    monkeypatch.setenv("BRIEFCASE_CACHE_MAX_SIZE", "0")
+
+    cache_command(action="gc")
+
+    # Only the tool that is in use remains.
+    assert cache_command.download_cache.size() == 400
+
+
+def test_gc_no_size(cache_command, monkeypatch):
+    """If no size budget is provided, an error is raised."""
+    monkeypatch.delenv("BRIEFCASE_CACHE_MAX_SIZE", raising=False)
+
+    with pytest.raises(BriefcaseCommandError, match=r"A maximum cache size must be"):
+        cache_command(action="gc")
+
+
+def test_gc_bad_size(cache_command):
+    """An invalid size budget raises an error."""
+    with pytest.raises(
+        BriefcaseCommandError, match=r"'lots' is not a valid cache size"
+    ):
+        cache_command(action="gc", max_size="lots")
+
+
+def test_prune_unpacked_archives(cache_command, capsys):
+    """The unpacked content of pruned downloads is also removed."""
+    index = cache_command.download_cache.load_index()
+    old_digest = index["https://example.com/old-support.zip"]["digest"]
+    digest = index["https://example.com/support.zip"]["digest"]
+    for unpacked in [old_digest, digest]:
+        staging_path = cache_command.unpacked_archives.staging_path()
+        (staging_path / "file.txt").write_text("unpacked")
+        cache_command.unpacked_archives.adopt(staging_path, unpacked)
+
+    cache_command(action="prune", older_than=30)
+
+    assert not cache_command.unpacked_archives.contains(old_digest)
+    assert cache_command.unpacked_archives.contains(digest)
+    assert "Removed 1 unpacked archives (8 bytes)." in capsys.readouterr().out
+
+
+def test_prune_dependencies(cache_command, capsys):
+    """Installed dependencies that haven't been used recently are removed."""
+    store = cache_command.dependency_store
+    for key in ["old", "new"]:
+        store.install(key, lambda path: (path / "package.py").write_text("package"))
+    old_time = time.time() - 60 * DAY
+    os.utime(store.entry_path("old"), (old_time, old_time))
+
+    cache_command(action="stats")
+    assert "Installed dependencies: 2 (14 bytes)" in capsys.readouterr().out
+
+    cache_command(action="prune", older_than=30)
+
+    assert not store.contains("old")
+    assert store.contains("new")
+    assert "Removed 1 sets of installed dependencies (7 bytes)." in (
+        capsys.readouterr().out
+    )
+
+
+def test_prune_distributions(cache_command, capsys):
+    """Installed distributions that haven't been used recently are
+    removed."""
+    store = cache_command.distribution_store
+    for key in ["old", "new"]:
+        store.install(key, lambda path: (path / "package.py").write_text("package"))
+    old_time = time.time() - 60 * DAY
+    os.utime(store.entry_path("old"), (old_time, old_time))
+
+    cache_command(action="stats")
+    assert "Installed distributions: 2 (14 bytes)" in capsys.readouterr().out
+
+    cache_command(action="prune", older_than=30)
+
+    assert not store.contains("old")
+    assert store.contains("new")
+    assert "Removed 1 installed distributions (7 bytes)." in capsys.readouterr().out
+
+
+def test_prune_package_files(cache_command, capsys):
+    """Cached package files that haven't been used recently are removed."""
+    cache = cache_command.package_index_cache
+    for filename in ["old-1.0.tar.gz", "new-1.0.tar.gz"]:
+        cache.add_file("package", filename, [b"package"])
+    old_path = cache.file_path("package", "old-1.0.tar.gz")
+    old_time = time.time() - 60 * DAY
+    os.utime(old_path, (old_time, old_time))
+
+    cache_command(action="stats")
+    assert "Cached package files: 2 (14 bytes)" in capsys.readouterr().out
+
+    cache_command(action="prune", older_than=30)
+
+    assert not old_path.exists()
+    assert cache.file_path("package", "new-1.0.tar.gz").exists()
+    assert "Removed 1 cached package files (7 bytes)." in capsys.readouterr().out
+
+
+def test_prune_wheels(cache_command, capsys):
+    """Prefetched wheels that haven't been used recently are removed."""
+    wheelhouse = cache_command.wheelhouse
+    staging_path = wheelhouse.staging_path()
+    for filename in ["old-1.0-py3-none-any.whl", "new-1.0-py3-none-any.whl"]:
+        (staging_path / filename).write_bytes(b"package")
+    wheelhouse.add(staging_path)
+    old_path = wheelhouse.path / "old-1.0-py3-none-any.whl"
+    old_time = time.time() - 60 * DAY
+    os.utime(old_path, (old_time, old_time))
+
+    cache_command(action="stats")
+    assert "Prefetched wheels: 2 (14 bytes)" in capsys.readouterr().out
+
+    cache_command(action="prune", older_than=30)
+
+    assert not old_path.exists()
+    assert (wheelhouse.path / "new-1.0-py3-none-any.whl").exists()
+    assert "Removed 1 prefetched wheels (7 bytes)." in capsys.readouterr().out
@@ -99,6 +99,12 @@ class TrackingCreateCommand(DummyCreateCommand):
     def install_app_resources(self, app):
         self.actions.append(("resources", app))
 
+    def prune_app_stdlib(self, app):
+        self.actions.append(("prune", app))
+
+    def compile_app_bytecode(self, app):
+        self.actions.append(("compile", app))
+
 
 @pytest.fixture
 def create_command(tmp_path, mock_git):
@@ -68,3 +68,31 @@ def test_create_single(tracking_create_command):
     assert not (
         tracking_create_command.platform_path / "second.bundle" / "new"
     ).exists()
+
+
+def test_create_concurrently(tracking_create_command):
+    """If more than one job is requested, apps are created concurrently."""
+    tracking_create_command.call_apps_concurrently = mock.MagicMock()
+
+    tracking_create_command(jobs=2)
+
+    # Tools are verified, and the apps are handed to the concurrent runner.
+    assert tracking_create_command.actions == [("verify",)]
+    tracking_create_command.call_apps_concurrently.assert_called_once_with(2)
+
+
+def test_create_single_jobs(tracking_create_command):
+    """A single app is created directly, regardless of the number of jobs."""
+    tracking_create_command.call_apps_concurrently = mock.MagicMock()
+
+    tracking_create_command(app=tracking_create_command.apps["first"], jobs=2)
+
+    tracking_create_command.call_apps_concurrently.assert_not_called()
+    assert tracking_create_command.actions == [
+        ("verify",),
+        ("generate", tracking_create_command.apps["first"]),
+        ("support", tracking_create_command.apps["first"]),
+        ("dependencies", tracking_create_command.apps["first"]),
+        ("code", tracking_create_command.apps["first"]),
+        ("resources", tracking_create_command.apps["first"]),
+    ]
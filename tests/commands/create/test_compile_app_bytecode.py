@@ -0,0 +1,92 @@
+import pytest
+
+from briefcase.bytecode import bytecode_path
+from briefcase.exceptions import BriefcaseConfigError
+
+
+@pytest.fixture
+def app_sources(app_path, app_packages_path, support_path):
+    (app_path / "my_app").mkdir()
+    (app_path / "my_app" / "__main__.py").write_text("import json\n")
+    (app_packages_path / "dependency.py").write_text("")
+    stdlib_path = support_path / "python" / "lib" / "python3.X"
+    (stdlib_path / "encodings").mkdir(parents=True)
+    (stdlib_path / "encodings" / "__init__.py").write_text("")
+    (stdlib_path / "os.py").write_text("")
+    return [
+        app_path / "my_app" / "__main__.py",
+        app_packages_path / "dependency.py",
+        stdlib_path / "encodings" / "__init__.py",
+        stdlib_path / "os.py",
+    ]
+
+
+def test_not_enabled(create_command, myapp, app_packages_path_index, app_sources):
+    """If the app doesn't request compilation, nothing is compiled."""
+    create_command.compile_app_bytecode(myapp)
+
+    assert not any(bytecode_path(source).exists() for source in app_sources)
+
+
+def test_compile(
+    create_command,
+    myapp,
+    app_packages_path_index,
+    app_sources,
+    capsys,
+):
+    """The app, its dependencies and the standard library are compiled."""
+    myapp.precompile = True
+
+    create_command.compile_app_bytecode(myapp)
+
+    assert all(bytecode_path(source).exists() for source in app_sources)
+    assert "Compiled 4 files to bytecode." in capsys.readouterr().out
+
+
+def test_compile_sourceless(
+    create_command,
+    myapp,
+    app_packages_path_index,
+    app_sources,
+):
+    """Sources can be replaced with optimized bytecode."""
+    myapp.precompile = True
+    myapp.precompile_optimize = 2
+    myapp.precompile_sourceless = True
+
+    create_command.compile_app_bytecode(myapp)
+
+    for source in app_sources:
+        assert source.with_suffix(".pyc").exists()
+        assert not source.exists()
+
+
+def test_requirements_file(
+    create_command,
+    myapp,
+    app_requirements_path_index,
+    app_path,
+    capsys,
+):
+    """If dependencies are installed when the app is built, the app's code is
+    still compiled."""
+    myapp.precompile = True
+    (app_path / "app.py").write_text("")
+    (app_path / "broken.py").write_text("def\n")
+
+    create_command.compile_app_bytecode(myapp)
+
+    assert bytecode_path(app_path / "app.py").exists()
+    output = capsys.readouterr().out
+    assert "Compiled 1 files to bytecode." in output
+    assert "1 files couldn't be compiled" in output
+
+
+def test_invalid_optimize(create_command, myapp, app_packages_path_index):
+    """An invalid optimization level raises an error."""
+    myapp.precompile = True
+    myapp.precompile_optimize = 3
+
+    with pytest.raises(BriefcaseConfigError, match=r"must be 0, 1 or 2"):
+        create_command.compile_app_bytecode(myapp)
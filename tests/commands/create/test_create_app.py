@@ -155,3 +155,39 @@ def test_create_app_not_supported(tracking_create_command):
 
     # No actions carried out
     assert tracking_create_command.actions == []
+
+
+def test_create_app_prune_stdlib(tracking_create_command):
+    """If the app prunes the standard library, pruning is the last step."""
+    tracking_create_command.apps["first"].prune_stdlib = True
+
+    tracking_create_command.create_app(tracking_create_command.apps["first"])
+
+    # The right sequence of things will be done
+    assert tracking_create_command.actions == [
+        ("generate", tracking_create_command.apps["first"]),
+        ("support", tracking_create_command.apps["first"]),
+        ("dependencies", tracking_create_command.apps["first"]),
+        ("code", tracking_create_command.apps["first"]),
+        ("resources", tracking_create_command.apps["first"]),
+        ("prune", tracking_create_command.apps["first"]),
+    ]
+
+
+def test_create_app_precompile(tracking_create_command):
+    """If the app is precompiled, compilation is the last step."""
+    tracking_create_command.apps["first"].prune_stdlib = True
+    tracking_create_command.apps["first"].precompile = True
+
+    tracking_create_command.create_app(tracking_create_command.apps["first"])
+
+    # The right sequence of things will be done
+    assert tracking_create_command.actions == [
+        ("generate", tracking_create_command.apps["first"]),
+        ("support", tracking_create_command.apps["first"]),
+        ("dependencies", tracking_create_command.apps["first"]),
+        ("code", tracking_create_command.apps["first"]),
+        ("resources", tracking_create_command.apps["first"]),
+        ("prune", tracking_create_command.apps["first"]),
+        ("compile", tracking_create_command.apps["first"]),
+    ]
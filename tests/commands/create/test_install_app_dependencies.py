@@ -1,6 +1,8 @@
+import json
 import os
 import subprocess
 import sys
+from pathlib import Path
 
 import pytest
 import tomli_w
@@ -483,3 +485,595 @@ def test_app_requirements_paths_windows(
         tmp_path,
         requirement,
     )
+
+
+def test_app_packages_reuse_dependencies(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+    capsys,
+):
+    """If the requirements have been installed before, the installed
+    dependencies are reused, without resolving the requirements."""
+    myapp.requires = ["first", "second"]
+    create_command.subprocess.check_output.return_value = pip_report(
+        first="1.0", second="1.0"
+    )
+    create_command.subprocess.run.side_effect = create_installation_artefacts(
+        app_packages_path, myapp.requires
+    )
+    create_command.install_app_dependencies(myapp)
+    create_command.subprocess.run.reset_mock()
+
+    create_command.subprocess.check_output.reset_mock()
+
+    # Install again, with the same requirements in a different order.
+    myapp.requires = ["second", "first"]
+    create_command.install_app_dependencies(myapp)
+
+    # pip wasn't invoked, but the dependencies were installed.
+    create_command.subprocess.check_output.assert_not_called()
+    create_command.subprocess.run.assert_not_called()
+    assert (app_packages_path / "first" / "__main__.py").exists()
+    assert (app_packages_path / "second" / "__main__.py").exists()
+    assert "reusing dependencies" in capsys.readouterr().out
+
+
+def test_app_packages_new_release(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If an unpinned requirement has a new release, the stored dependencies
+    are reused until the dependency store is bypassed; the new release then
+    replaces the stored dependencies."""
+    myapp.requires = ["first"]
+    create_command.subprocess.check_output.return_value = pip_report(first="1.0")
+    create_command.subprocess.run.side_effect = mock_pip_install
+    create_command.install_app_dependencies(myapp)
+
+    # A new release of the requirement is published
+    create_command.subprocess.check_output.return_value = pip_report(first="2.0")
+    create_command.install_app_dependencies(myapp)
+
+    assert create_command.subprocess.run.call_count == 1
+    assert (app_packages_path / "first-1.0.dist-info").exists()
+
+    # With --no-cache, the requirements are installed again.
+    create_command.dependency_store.enabled = False
+    create_command.subprocess.run.side_effect = (
+        lambda *args, **kwargs: install_distribution(app_packages_path, "first", "2.0")
+    )
+    create_command.install_app_dependencies(myapp)
+
+    assert create_command.subprocess.run.call_count == 2
+    assert not (app_packages_path / "first-1.0.dist-info").exists()
+    assert (app_packages_path / "first-2.0.dist-info").exists()
+
+    # The stored dependencies have been replaced by the new release.
+    create_command.dependency_store.enabled = True
+    create_command.shutil.rmtree(app_packages_path)
+    create_command.install_app_dependencies(myapp)
+
+    assert create_command.subprocess.run.call_count == 2
+    assert (app_packages_path / "first-2.0.dist-info").exists()
+    assert len(create_command.dependency_store.entries()) == 1
+
+
+def test_app_packages_changed_dependencies(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If the requirements have changed, dependencies are reinstalled."""
+    myapp.requires = ["first"]
+    create_command.subprocess.run.side_effect = create_installation_artefacts(
+        app_packages_path, ["first"]
+    )
+    create_command.install_app_dependencies(myapp)
+
+    myapp.requires = ["first", "second"]
+    create_command.subprocess.run.side_effect = create_installation_artefacts(
+        app_packages_path, ["first", "second"]
+    )
+    create_command.install_app_dependencies(myapp)
+
+    assert create_command.subprocess.run.call_count == 2
+    assert (app_packages_path / "second" / "__main__.py").exists()
+
+
+def test_app_packages_no_cache(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If the dependency store is disabled, dependencies are always
+    reinstalled."""
+    myapp.requires = ["first"]
+    create_command.subprocess.run.side_effect = create_installation_artefacts(
+        app_packages_path, ["first"]
+    )
+    create_command.install_app_dependencies(myapp)
+
+    create_command.dependency_store.enabled = False
+    create_command.install_app_dependencies(myapp)
+
+    assert create_command.subprocess.run.call_count == 2
+    assert (app_packages_path / "first" / "__main__.py").exists()
+
+
+@pytest.mark.parametrize(
+    "requirement",
+    [
+        "./local/package",
+        "git+https://github.com/example/package.git",
+        "-r requirements.txt",
+    ],
+)
+def test_app_packages_unstorable_dependencies(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+    requirement,
+):
+    """Requirements whose content can change without the requirement
+    changing are always reinstalled."""
+    myapp.requires = ["first", requirement]
+    create_command.subprocess.run.side_effect = create_installation_artefacts(
+        app_packages_path, ["first"]
+    )
+    create_command.install_app_dependencies(myapp)
+    create_command.subprocess.run.side_effect = None
+    create_command.install_app_dependencies(myapp)
+
+    assert create_command.subprocess.run.call_count == 2
+    assert create_command.dependency_store.entries() == []
+
+
+def test_app_dependencies_key(create_command, myapp, monkeypatch):
+    """The key for an app's dependencies depends on the requirements (or the
+    locked packages) and the environment."""
+    myapp.requires = ["first", "second>=2"]
+    key = create_command.app_dependencies_key(myapp)
+
+    # Order and whitespace don't matter
+    myapp.requires = ["second >= 2", "first"]
+    assert create_command.app_dependencies_key(myapp) == key
+
+    # The requirements do
+    myapp.requires = ["first", "second>=3"]
+    assert create_command.app_dependencies_key(myapp) != key
+    myapp.requires = ["first", "second>=2"]
+
+    # The host architecture does
+    create_command.host_arch = "other"
+    assert create_command.app_dependencies_key(myapp) != key
+
+    # pip configuration does
+    create_command.os.environ = {"PIP_INDEX_URL": "https://example.com/simple"}
+    assert create_command.app_dependencies_key(myapp) != key
+
+    # If the requirements can change without the requirement changing, the
+    # dependencies can't be stored
+    myapp.requires = ["first", "./local/package"]
+    assert create_command.app_dependencies_key(myapp) is None
+
+
+def test_app_dependencies_key_locked(create_command, myapp):
+    """If the app's dependencies are locked, the key depends on the locked
+    packages."""
+    myapp.requires = ["first"]
+    first = {"name": "first", "version": "1.0", "hashes": ["sha256:1111"]}
+    second = {"name": "second", "version": "2.0", "hashes": ["sha256:2222"]}
+    key = create_command.app_dependencies_key(myapp, [first, second])
+
+    # Order doesn't matter
+    assert create_command.app_dependencies_key(myapp, [second, first]) == key
+
+    # Versions do
+    assert (
+        create_command.app_dependencies_key(myapp, [first, dict(second, version="2.1")])
+        != key
+    )
+
+    # Hashes do
+    assert (
+        create_command.app_dependencies_key(
+            myapp, [first, dict(second, hashes=["sha256:3333"])]
+        )
+        != key
+    )
+
+    # The key differs from the key of the unlocked requirements
+    assert create_command.app_dependencies_key(myapp) != key
+
+
+def install_distribution(path, name, version):
+    """Create an installed distribution, with a RECORD."""
+    (path / name).mkdir(parents=True)
+    (path / name / "__init__.py").write_text(f"{name} {version}")
+    dist_info = path / f"{name}-{version}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Name: {name}\nVersion: {version}\n")
+    (dist_info / "RECORD").write_text(
+        f"{name}/__init__.py,,\n{dist_info.name}/METADATA,,\n{dist_info.name}/RECORD,,\n"
+    )
+
+
+def pip_report(**versions):
+    """The JSON report of a pip dry run that would install the given
+    versions."""
+    return json.dumps(
+        {
+            "install": [
+                {"metadata": {"name": name, "version": version}}
+                for name, version in versions.items()
+            ]
+        }
+    )
+
+
+def mock_pip_install(args, **kwargs):
+    """Install pinned requirements into the target folder."""
+    target = Path(
+        next(arg for arg in args if arg.startswith("--target=")).split("=", 1)[1]
+    )
+    start = args.index("--no-deps") + 1
+    for requirement in args[start:]:
+        name, version = requirement.split("==")
+        install_distribution(target, name, version)
+
+
+def test_app_packages_sync_dependencies(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+    capsys,
+):
+    """If dependencies are already installed, only the distributions that have
+    changed are removed and installed."""
+    for name, version in [("first", "1.0"), ("second", "1.0"), ("third", "1.0")]:
+        install_distribution(app_packages_path, name, version)
+    # The app's own content in the folder is retained.
+    (app_packages_path / "first" / "data.txt").write_text("data")
+
+    myapp.requires = ["first", "second>=2", "fourth"]
+    create_command.subprocess.check_output.return_value = pip_report(
+        first="1.0", second="2.0", fourth="1.0"
+    )
+    create_command.subprocess.run.side_effect = mock_pip_install
+
+    create_command.install_app_dependencies(myapp)
+
+    # Requirements were resolved
+    create_command.subprocess.check_output.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--dry-run",
+            "--ignore-installed",
+            "--no-user",
+            "--quiet",
+            "--report",
+            "-",
+            "first",
+            "second>=2",
+            "fourth",
+        ],
+    )
+    # Only the changed distributions were installed
+    create_command.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "--no-user",
+            f"--target={app_packages_path.parent / '.app_packages-sync'}",
+            "--no-deps",
+            "fourth==1.0",
+            "second==2.0",
+        ],
+        check=True,
+    )
+
+    assert (app_packages_path / "first" / "data.txt").exists()
+    assert (app_packages_path / "first-1.0.dist-info").exists()
+    assert (app_packages_path / "second" / "__init__.py").read_text() == "second 2.0"
+    assert not (app_packages_path / "second-1.0.dist-info").exists()
+    assert (app_packages_path / "second-2.0.dist-info").exists()
+    assert not (app_packages_path / "third").exists()
+    assert not (app_packages_path / "third-1.0.dist-info").exists()
+    assert (app_packages_path / "fourth-1.0.dist-info").exists()
+    # The staging folder has been removed
+    assert not (app_packages_path.parent / ".app_packages-sync").exists()
+
+    assert "Removed 2 and installed 2 dependencies." in capsys.readouterr().out
+
+
+def test_app_packages_sync_up_to_date(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+    capsys,
+):
+    """If the installed dependencies match the requirements, nothing is
+    installed."""
+    install_distribution(app_packages_path, "first", "1.0")
+    myapp.requires = ["first"]
+    create_command.subprocess.check_output.return_value = pip_report(first="1.0")
+
+    create_command.install_app_dependencies(myapp)
+
+    create_command.subprocess.run.assert_not_called()
+    assert (app_packages_path / "first-1.0.dist-info").exists()
+    assert "Dependencies are up to date." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "resolution",
+    [
+        subprocess.CalledProcessError(cmd=["pip"], returncode=2),
+        "Not JSON",
+    ],
+)
+def test_app_packages_sync_unresolvable(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+    resolution,
+):
+    """If the requirements can't be resolved (e.g., with an old version of
+    pip), dependencies are reinstalled."""
+    install_distribution(app_packages_path, "first", "1.0")
+    myapp.requires = ["first"]
+    if isinstance(resolution, Exception):
+        create_command.subprocess.check_output.side_effect = resolution
+    else:
+        create_command.subprocess.check_output.return_value = resolution
+
+    create_command.install_app_dependencies(myapp)
+
+    # The existing dependencies were removed, and all requirements installed.
+    assert not (app_packages_path / "first-1.0.dist-info").exists()
+    create_command.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "--no-user",
+            f"--target={app_packages_path}",
+            "first",
+        ],
+        check=True,
+    )
+
+
+def test_app_packages_sync_no_record(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If an outdated distribution can't be removed individually, dependencies
+    are reinstalled."""
+    install_distribution(app_packages_path, "first", "1.0")
+    install_distribution(app_packages_path, "second", "1.0")
+    (app_packages_path / "second-1.0.dist-info" / "RECORD").unlink()
+    myapp.requires = ["first"]
+    create_command.subprocess.check_output.return_value = pip_report(first="2.0")
+
+    create_command.install_app_dependencies(myapp)
+
+    # Nothing was removed individually; everything was reinstalled.
+    assert not (app_packages_path / "first").exists()
+    assert not (app_packages_path / "second").exists()
+    create_command.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "--no-user",
+            f"--target={app_packages_path}",
+            "first",
+        ],
+        check=True,
+    )
+
+
+def lock_app(create_command, myapp, **versions):
+    """Lock the app's dependencies to the given versions."""
+    myapp.lock_dependencies = True
+    create_command.base_path.mkdir(parents=True, exist_ok=True)
+    create_command.subprocess.check_output.return_value = json.dumps(
+        {
+            "install": [
+                {
+                    "metadata": {"name": name, "version": version},
+                    "download_info": {
+                        "archive_info": {"hashes": {"sha256": f"{name}-hash"}}
+                    },
+                }
+                for name, version in versions.items()
+            ]
+        }
+    )
+
+
+def mock_locked_pip_install(requirements_files):
+    """Install the requirements in a requirements file into the target
+    folder, recording the content of the file."""
+
+    def _mock_locked_pip_install(args, **kwargs):
+        target = Path(
+            next(arg for arg in args if arg.startswith("--target=")).split("=", 1)[1]
+        )
+        content = Path(args[args.index("-r") + 1]).read_text(encoding="utf-8")
+        requirements_files.append(content)
+        for line in content.splitlines():
+            name, version = line.split()[0].split("==")
+            install_distribution(target, name, version)
+
+    return _mock_locked_pip_install
+
+
+def test_app_packages_locked(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If the app locks its dependencies, the locked packages are installed
+    with their hashes, without resolving their dependencies."""
+    myapp.requires = ["first", "second>=2"]
+    lock_app(create_command, myapp, first="1.0", second="2.0", third="3.0")
+    requirements_files = []
+    create_command.subprocess.run.side_effect = mock_locked_pip_install(
+        requirements_files
+    )
+
+    create_command.install_app_dependencies(myapp)
+
+    assert (create_command.base_path / "briefcase.lock").exists()
+    args = create_command.subprocess.run.call_args[0][0]
+    assert args[:-1] == [
+        sys.executable,
+        "-m",
+        "pip",
+        "install",
+        "--upgrade",
+        "--no-user",
+        f"--target={app_packages_path.parent / '.app_packages-sync'}",
+        "--no-deps",
+        "-r",
+    ]
+    assert requirements_files == [
+        "first==1.0 --hash=sha256:first-hash\n"
+        "second==2.0 --hash=sha256:second-hash\n"
+        "third==3.0 --hash=sha256:third-hash\n"
+    ]
+    # The requirements file was written in the bundle, and then removed.
+    assert Path(args[-1]).parent == app_packages_path.parent
+    assert not Path(args[-1]).exists()
+    assert (app_packages_path / "third-3.0.dist-info").exists()
+
+
+def test_app_packages_locked_sync(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If the app locks its dependencies, installed dependencies are
+    synchronized with the lock file, without resolving the requirements."""
+    install_distribution(app_packages_path, "first", "1.0")
+    install_distribution(app_packages_path, "second", "1.0")
+    myapp.requires = ["first", "second>=2"]
+    lock_app(create_command, myapp, first="1.0", second="2.0")
+    # Lock the app's dependencies in advance.
+    create_command.locked_app_requirements(myapp)
+    create_command.subprocess.check_output.reset_mock()
+    requirements_files = []
+    create_command.subprocess.run.side_effect = mock_locked_pip_install(
+        requirements_files
+    )
+
+    create_command.install_app_dependencies(myapp)
+
+    create_command.subprocess.check_output.assert_not_called()
+    assert requirements_files == ["second==2.0 --hash=sha256:second-hash\n"]
+    assert (app_packages_path / "first-1.0.dist-info").exists()
+    assert not (app_packages_path / "second-1.0.dist-info").exists()
+    assert (app_packages_path / "second-2.0.dist-info").exists()
+
+
+def test_app_packages_shared_distributions(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+    capsys,
+):
+    """Distributions that have been installed for another set of requirements
+    are copied from the distribution store, rather than being reinstalled."""
+    myapp.requires = ["first", "second"]
+    create_command.subprocess.check_output.return_value = pip_report(
+        first="1.0", second="2.0"
+    )
+    create_command.subprocess.run.side_effect = mock_pip_install
+    create_command.install_app_dependencies(myapp)
+    assert len(create_command.distribution_store.entries()) == 2
+
+    # Another app, with different requirements, and nothing installed
+    create_command.shutil.rmtree(app_packages_path)
+    myapp.requires = ["second", "third"]
+    create_command.subprocess.check_output.return_value = pip_report(
+        second="2.0", third="3.0"
+    )
+    create_command.subprocess.run.reset_mock()
+    capsys.readouterr()
+
+    create_command.install_app_dependencies(myapp)
+
+    # Only the distribution that hadn't been installed was installed.
+    create_command.subprocess.run.assert_called_once_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "--no-user",
+            f"--target={app_packages_path.parent / '.app_packages-sync'}",
+            "--no-deps",
+            "third==3.0",
+        ],
+        check=True,
+    )
+    assert not (app_packages_path / "first").exists()
+    assert (app_packages_path / "second" / "__init__.py").read_text() == "second 2.0"
+    assert (app_packages_path / "second-2.0.dist-info" / "RECORD").exists()
+    assert (app_packages_path / "third-3.0.dist-info").exists()
+    assert len(create_command.distribution_store.entries()) == 3
+
+    output = capsys.readouterr().out
+    assert "Removed 0 and installed 2 dependencies." in output
+    assert "Reused 1 of 2 dependencies (" in output
+
+
+def test_app_packages_index_proxy(
+    create_command,
+    myapp,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If the app uses the index proxy, pip installs dependencies from the
+    proxy."""
+    myapp.requires = ["first"]
+    myapp.index_proxy = True
+
+    create_command.install_app_dependencies(myapp)
+
+    pip_args = create_command.subprocess.run.call_args[0][0]
+    index_options = [arg for arg in pip_args if arg.startswith("--index-url=")]
+    assert len(index_options) == 1
+    assert index_options[0].startswith("--index-url=http://127.0.0.1:")
+    assert pip_args[-1] == "first"
+
+    # The proxy is stopped once the dependencies are installed.
+    assert create_command.index_url is None
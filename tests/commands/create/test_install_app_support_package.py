@@ -1,10 +1,11 @@
 import os
-import shutil
 from unittest import mock
 
 import pytest
 from requests import exceptions as requests_exceptions
 
+from briefcase import archive
+from briefcase.cache import file_sha256
 from briefcase.commands.create import InvalidSupportPackage, MissingSupportPackage
 from briefcase.exceptions import MissingNetworkResourceError, NetworkFailure
 
@@ -28,11 +29,6 @@ def test_install_app_support_package(
         )
     )
 
-    # Mock shutil so we can confirm that unpack is called,
-    # but we still want the side effect of calling it
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.unpack_archive.side_effect = shutil.unpack_archive
-
     # Install the support package
     create_command.install_app_support_package(myapp)
 
@@ -41,13 +37,20 @@ def test_install_app_support_package(
         download_path=create_command.data_path / "support",
         url="https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic",
         role="support package",
+        revalidate=True,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
-    # Confirm the right file was unpacked
-    create_command.shutil.unpack_archive.assert_called_with(
-        tmp_path / "data" / "support" / "Python-3.X-OS-support.zip",
-        extract_dir=support_path,
+    # The support package was unpacked into the unpacked archive store as it
+    # was downloaded; the store now holds the unpacked content.
+    staging_path = create_command.download_file.call_args[1]["extract_path"]
+    assert staging_path.parent == create_command.data_path / "cache" / "unpacked"
+    assert not staging_path.exists()
+    digest = file_sha256(
+        create_command.data_path / "support" / "Python-3.X-OS-support.zip"
     )
+    assert create_command.unpacked_archives.contains(digest)
 
     # Confirm that the full path to the support file
     # has been unpacked.
@@ -74,11 +77,6 @@ def test_install_pinned_app_support_package(
         )
     )
 
-    # Mock shutil so we can confirm that unpack is called,
-    # but we still want the side effect of calling it
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.unpack_archive.side_effect = shutil.unpack_archive
-
     # Install the support package
     create_command.install_app_support_package(myapp)
 
@@ -87,12 +85,9 @@ def test_install_pinned_app_support_package(
         download_path=create_command.data_path / "support",
         url="https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic&revision=42",
         role="support package",
-    )
-
-    # Confirm the right file was unpacked
-    create_command.shutil.unpack_archive.assert_called_with(
-        tmp_path / "data" / "support" / "Python-3.X-OS-support.zip",
-        extract_dir=support_path,
+        revalidate=False,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
     # Confirm that the full path to the support file
@@ -106,6 +101,7 @@ def test_install_custom_app_support_package_file(
     tmp_path,
     support_path,
     app_requirements_path_index,
+    monkeypatch,
 ):
     """A custom support package can be specified as a local file."""
     # Provide an app-specific override of the package URL
@@ -120,10 +116,10 @@ def test_install_custom_app_support_package_file(
     # Modify download_file to return the temp zipfile
     create_command.download_file = mock.MagicMock()
 
-    # Mock shutil so we can confirm that unpack is called,
+    # Wrap the zip unpacker so we can confirm that unpack is called,
     # but we still want the side effect of calling it
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.unpack_archive.side_effect = shutil.unpack_archive
+    unpack_zip = mock.MagicMock(side_effect=archive.unpack_zip)
+    monkeypatch.setattr(archive, "unpack_zip", unpack_zip)
 
     # Install the support package
     create_command.install_app_support_package(myapp)
@@ -133,10 +129,7 @@ def test_install_custom_app_support_package_file(
     create_command.download_file.assert_not_called()
 
     # Confirm the right file was unpacked
-    create_command.shutil.unpack_archive.assert_called_with(
-        support_file,
-        extract_dir=support_path,
-    )
+    unpack_zip.assert_called_with(support_file, mock.ANY)
 
     # Confirm that the full path to the support file
     # has been unpacked.
@@ -146,6 +139,7 @@ def test_install_custom_app_support_package_file(
 def test_support_package_url_with_invalid_custom_support_packge_url(
     create_command,
     myapp,
+    support_path,
     app_requirements_path_index,
 ):
     """Invalid URL for a custom support package raises
@@ -173,12 +167,16 @@ def test_support_package_url_with_invalid_custom_support_packge_url(
         ),
         url=url,
         role="support package",
+        revalidate=True,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
 
 def test_support_package_url_with_unsupported_platform(
     create_command,
     myapp,
+    support_path,
     app_requirements_path_index,
 ):
     """An unsupported platform raises MissingSupportPackage."""
@@ -201,6 +199,9 @@ def test_support_package_url_with_unsupported_platform(
         download_path=create_command.data_path / "support",
         url="https://briefcase-support.org/python?platform=tester&version=3.X&arch=unknown",
         role="support package",
+        revalidate=True,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
 
@@ -223,11 +224,6 @@ def test_install_custom_app_support_package_url(
         )
     )
 
-    # Mock shutil so we can confirm that unpack is called,
-    # but we still want the side effect of calling it
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.unpack_archive.side_effect = shutil.unpack_archive
-
     # Install the support package
     create_command.install_app_support_package(myapp)
 
@@ -240,16 +236,9 @@ def test_install_custom_app_support_package_url(
         ),
         url="https://example.com/custom/custom-support.zip",
         role="support package",
-    )
-
-    # Confirm the right file was unpacked into the hashed location
-    create_command.shutil.unpack_archive.assert_called_with(
-        tmp_path
-        / "data"
-        / "support"
-        / "1d3ac0e09eb22abc63c4e7b699b6ab5d58e277015eeae61070e3f9f11512e6b3"
-        / "custom-support.zip",
-        extract_dir=support_path,
+        revalidate=True,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
     # Confirm that the full path to the support file
@@ -280,11 +269,6 @@ def test_install_pinned_custom_app_support_package_url(
         )
     )
 
-    # Mock shutil so we can confirm that unpack is called,
-    # but we still want the side effect of calling it
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.unpack_archive.side_effect = shutil.unpack_archive
-
     # Install the support package
     create_command.install_app_support_package(myapp)
 
@@ -297,16 +281,9 @@ def test_install_pinned_custom_app_support_package_url(
         ),
         url="https://example.com/custom/custom-support.zip?revision=42",
         role="support package",
-    )
-
-    # Confirm the right file was unpacked
-    create_command.shutil.unpack_archive.assert_called_with(
-        tmp_path
-        / "data"
-        / "support"
-        / "6390bc0eb3eca03218604f6072094d44f44d82eacefc21975cc5b9b7b1720a0d"
-        / "custom-support.zip",
-        extract_dir=support_path,
+        revalidate=False,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
     # Confirm that the full path to the support file
@@ -336,11 +313,6 @@ def test_install_pinned_custom_app_support_package_url_with_args(
             [("internal/file.txt", "hello world")],
         )
     )
-    # Mock shutil so we can confirm that unpack is called,
-    # but we still want the side effect of calling it
-    create_command.shutil = mock.MagicMock()
-    create_command.shutil.unpack_archive.side_effect = shutil.unpack_archive
-
     # Install the support package
     create_command.install_app_support_package(myapp)
 
@@ -351,16 +323,9 @@ def test_install_pinned_custom_app_support_package_url_with_args(
         / "1a7054ce49ce29aeec90591be2d69cd655bd5414f4a9017425026760a375847b",
         url="https://example.com/custom/custom-support.zip?cool=Yes&revision=42",
         role="support package",
-    )
-
-    # Confirm the right file was unpacked
-    create_command.shutil.unpack_archive.assert_called_with(
-        tmp_path
-        / "data"
-        / "support"
-        / "1a7054ce49ce29aeec90591be2d69cd655bd5414f4a9017425026760a375847b"
-        / "custom-support.zip",
-        extract_dir=support_path,
+        revalidate=False,
+        extract_path=mock.ANY,
+        extract_members=None,
     )
 
     # Confirm that the full path to the support file
@@ -399,11 +364,20 @@ def test_invalid_support_package(
             "This isn't a zip file",
         )
     )
+    create_command.download_cache.evict = mock.MagicMock()
 
     # Installing the bad support package raises an error
     with pytest.raises(InvalidSupportPackage):
         create_command.install_app_support_package(myapp)
 
+    # The staging folder for the support package has been removed.
+    assert list((create_command.data_path / "cache" / "unpacked").iterdir()) == []
+
+    # The download was discarded, so that it will be downloaded again
+    create_command.download_cache.evict.assert_called_once_with(
+        "https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic"
+    )
+
 
 def test_missing_support_package(
     create_command,
@@ -428,3 +402,46 @@ def test_no_support_path(create_command, myapp, no_support_path_index):
     create_command.download_file = mock.MagicMock()
     create_command.install_app_support_package(myapp)
     create_command.download_file.assert_not_called()
+
+
+def test_unpacked_support_package_reused(
+    create_command,
+    myapp,
+    tmp_path,
+    support_path,
+    app_requirements_path_index,
+    monkeypatch,
+):
+    """If a support package has been unpacked before, the unpacked content is
+    copied into place, rather than unpacking the package again."""
+    # Unpack a support package into the store
+    support_file = create_zip_file(
+        tmp_path / "unpacked" / "support.zip",
+        [("internal/file.txt", "hello world")],
+    )
+    digest = file_sha256(support_file)
+    create_command.unpacked_archives.unpack(support_file)
+
+    # The download cache has a record of the support package
+    create_command.download_cache = mock.MagicMock()
+    create_command.download_cache.digest.return_value = digest
+    create_command.download_file = mock.MagicMock(return_value=support_file)
+    unpack_zip = mock.MagicMock()
+    monkeypatch.setattr(archive, "unpack_zip", unpack_zip)
+
+    # Install the support package
+    create_command.install_app_support_package(myapp)
+
+    # The support package wasn't unpacked
+    create_command.download_file.assert_called_with(
+        download_path=create_command.data_path / "support",
+        url="https://briefcase-support.org/python?platform=tester&version=3.X&arch=gothic",
+        role="support package",
+        revalidate=True,
+        extract_path=None,
+        extract_members=None,
+    )
+    unpack_zip.assert_not_called()
+
+    # ... but the content is in place
+    assert (support_path / "internal" / "file.txt").read_text() == "hello world"
@@ -0,0 +1,216 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def download_wheels(args, **kwargs):
+    """A fake ``pip download`` that downloads a wheel for the platform."""
+    if "download" not in args:
+        # Any other use of pip (e.g., resolving requirements) is unavailable.
+        raise subprocess.CalledProcessError(returncode=1, cmd=args)
+    platform_tag = next(arg for arg in args if arg.startswith("--platform="))
+    platform_tag = platform_tag.split("=", 1)[1]
+    if platform_tag == "broken":
+        raise subprocess.CalledProcessError(returncode=1, cmd=args)
+    dest = next(arg for arg in args if arg.startswith("--dest="))
+    (
+        Path(dest.split("=", 1)[1]) / f"first-1.0-cp311-cp311-{platform_tag}.whl"
+    ).write_bytes(b"wheel")
+    return ""
+
+
+@pytest.fixture
+def prefetching_app(create_command, myapp):
+    myapp.requires = ["first"]
+    myapp.prefetch_wheels = True
+    myapp.wheel_platforms = ["platform_a", "platform_b"]
+    create_command.subprocess.check_output.side_effect = download_wheels
+    return myapp
+
+
+def test_not_enabled(create_command, myapp):
+    """Wheels aren't prefetched unless the app prefetches wheels."""
+    myapp.requires = ["first"]
+    myapp.wheel_platforms = ["platform_a"]
+
+    with create_command.prefetched_wheels(myapp):
+        assert create_command.pip_index_options() == []
+
+    create_command.subprocess.check_output.assert_not_called()
+
+
+def test_no_platforms(create_command, myapp):
+    """If the output format doesn't install dependencies for another
+    platform, no wheels are prefetched."""
+    myapp.requires = ["first"]
+    myapp.prefetch_wheels = True
+
+    with create_command.prefetched_wheels(myapp):
+        assert create_command.pip_index_options() == []
+
+    create_command.subprocess.check_output.assert_not_called()
+
+
+def test_prefetch(create_command, prefetching_app):
+    """Wheels are downloaded into the wheelhouse for every platform, and pip
+    only uses the wheelhouse."""
+    wheelhouse_path = create_command.wheelhouse.path
+
+    with create_command.prefetched_wheels(prefetching_app) as wheels:
+        assert create_command.pip_index_options() == [
+            f"--find-links={wheelhouse_path}",
+            "--no-index",
+        ]
+        # The context provides the wheels that were prefetched.
+        assert wheels == [
+            wheelhouse_path / "first-1.0-cp311-cp311-platform_a.whl",
+            wheelhouse_path / "first-1.0-cp311-cp311-platform_b.whl",
+        ]
+
+        # Entering the context again doesn't prefetch again.
+        with create_command.prefetched_wheels(prefetching_app):
+            pass
+
+    assert create_command.wheelhouse_options is None
+    assert sorted(entry["name"] for entry in create_command.wheelhouse.entries()) == [
+        "first-1.0-cp311-cp311-platform_a.whl",
+        "first-1.0-cp311-cp311-platform_b.whl",
+    ]
+    assert create_command.subprocess.check_output.call_count == 2
+    args = create_command.subprocess.check_output.call_args[0][0]
+    assert args[:4] == [sys.executable, "-m", "pip", "download"]
+    assert "--only-binary=:all:" in args
+    assert f"--python-version={create_command.python_version_tag}" in args
+    assert f"--find-links={wheelhouse_path}" in args
+    assert "--no-index" not in args
+    assert args[-1] == "first"
+
+
+def test_prefetch_failure(create_command, prefetching_app, capsys):
+    """If the wheels for a platform can't be downloaded, the package index is
+    still used."""
+    prefetching_app.wheel_platforms = ["platform_a", "broken"]
+
+    with create_command.prefetched_wheels(prefetching_app):
+        assert create_command.pip_index_options() == [
+            f"--find-links={create_command.wheelhouse.path}"
+        ]
+
+    assert "Unable to prefetch wheels for broken" in capsys.readouterr().out
+    assert [entry["name"] for entry in create_command.wheelhouse.entries()] == [
+        "first-1.0-cp311-cp311-platform_a.whl"
+    ]
+
+
+def test_prefetch_local_requirements(create_command, prefetching_app, tmp_path):
+    """Only index requirements are prefetched; if the app has other
+    requirements, the package index is still used."""
+    prefetching_app.requires = ["first", str(tmp_path / "local")]
+
+    with create_command.prefetched_wheels(prefetching_app):
+        assert create_command.pip_index_options() == [
+            f"--find-links={create_command.wheelhouse.path}"
+        ]
+
+    args = create_command.subprocess.check_output.call_args[0][0]
+    assert args[-1] == "first"
+
+
+def test_prefetch_offline(create_command, prefetching_app):
+    """In offline mode, wheels are only taken from the wheelhouse."""
+    create_command.offline = True
+
+    with create_command.prefetched_wheels(prefetching_app):
+        pass
+
+    args = create_command.subprocess.check_output.call_args[0][0]
+    assert "--no-index" in args
+
+
+def test_requirements_file(
+    create_command,
+    prefetching_app,
+    app_requirements_path,
+    app_requirements_path_index,
+):
+    """If the app's dependencies are installed by the template's build system,
+    the prefetched wheels are copied into the bundle, and the requirements
+    file refers to them with a relative path."""
+    create_command.install_app_dependencies(prefetching_app)
+
+    assert create_command.subprocess.check_output.call_count == 2
+    assert app_requirements_path.read_text(encoding="utf-8") == (
+        "--find-links wheels\n--no-index\nfirst\n"
+    )
+    wheels_path = app_requirements_path.parent / "wheels"
+    assert sorted(path.name for path in wheels_path.iterdir()) == [
+        "first-1.0-cp311-cp311-platform_a.whl",
+        "first-1.0-cp311-cp311-platform_b.whl",
+    ]
+    # The bundle doesn't refer to the host's wheelhouse.
+    assert str(create_command.wheelhouse.path) not in (
+        app_requirements_path.read_text(encoding="utf-8")
+    )
+    assert create_command.pip_index_options() == []
+
+
+def test_requirements_file_incomplete(
+    create_command,
+    prefetching_app,
+    app_requirements_path,
+    app_requirements_path_index,
+):
+    """If wheels couldn't be prefetched for every platform, the requirements
+    file still allows the package index to be used."""
+    prefetching_app.wheel_platforms = ["platform_a", "broken"]
+
+    create_command.install_app_dependencies(prefetching_app)
+
+    assert app_requirements_path.read_text(encoding="utf-8") == (
+        "--find-links wheels\nfirst\n"
+    )
+    wheels_path = app_requirements_path.parent / "wheels"
+    assert [path.name for path in wheels_path.iterdir()] == [
+        "first-1.0-cp311-cp311-platform_a.whl"
+    ]
+
+
+def test_requirements_file_not_prefetched(
+    create_command,
+    prefetching_app,
+    app_requirements_path,
+    app_requirements_path_index,
+):
+    """If wheels aren't prefetched, any previously copied wheels are removed
+    from the bundle."""
+    wheels_path = app_requirements_path.parent / "wheels"
+    wheels_path.mkdir(parents=True)
+    (wheels_path / "old-1.0-py3-none-any.whl").write_bytes(b"wheel")
+    prefetching_app.prefetch_wheels = False
+
+    create_command.install_app_dependencies(prefetching_app)
+
+    create_command.subprocess.check_output.assert_not_called()
+    assert app_requirements_path.read_text(encoding="utf-8") == "first\n"
+    assert not wheels_path.exists()
+
+
+def test_app_packages(
+    create_command,
+    prefetching_app,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """If pip installs the app's dependencies, the wheelhouse is passed on
+    the pip command line."""
+    create_command.install_app_dependencies(prefetching_app)
+
+    pip_args = create_command.subprocess.run.call_args[0][0]
+    assert f"--find-links={create_command.wheelhouse.path}" in pip_args
+    assert "--no-index" in pip_args
+    assert pip_args[-1] == "first"
+
+    # The wheelhouse is only used while the dependencies are installed.
+    assert create_command.pip_index_options() == []
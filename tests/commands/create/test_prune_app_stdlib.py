@@ -0,0 +1,107 @@
+def create_stdlib(support_path):
+    """Create a minimal uncompiled standard library in a support package."""
+    stdlib_path = support_path / "python" / "lib" / "python3.X"
+    (stdlib_path / "encodings").mkdir(parents=True)
+    (stdlib_path / "encodings" / "__init__.py").write_text("import codecs\n")
+    for name in ["os", "codecs", "json", "tkinter"]:
+        (stdlib_path / f"{name}.py").write_text("")
+    return stdlib_path
+
+
+def test_not_enabled(create_command, myapp, support_path, app_packages_path_index):
+    """If the app doesn't request pruning, the standard library is retained."""
+    stdlib_path = create_stdlib(support_path)
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert (stdlib_path / "tkinter.py").exists()
+
+
+def test_prune(
+    create_command,
+    myapp,
+    support_path,
+    app_path,
+    app_packages_path,
+    app_packages_path_index,
+    capsys,
+):
+    """Modules that aren't imported by the app or its packages are removed."""
+    myapp.prune_stdlib = True
+    stdlib_path = create_stdlib(support_path)
+    (app_path / "my_app").mkdir()
+    (app_path / "my_app" / "__main__.py").write_text("import json\n")
+
+    create_command.prune_app_stdlib(myapp)
+
+    # Imported and required modules are retained; others are removed.
+    assert (stdlib_path / "json.py").exists()
+    assert (stdlib_path / "os.py").exists()
+    assert (stdlib_path / "encodings" / "__init__.py").exists()
+    assert not (stdlib_path / "tkinter.py").exists()
+
+    assert "Removed 1 unused standard library modules (0 bytes)." in (
+        capsys.readouterr().out
+    )
+
+
+def test_prune_keep(
+    create_command,
+    myapp,
+    support_path,
+    app_path,
+    app_packages_path,
+    app_packages_path_index,
+):
+    """Modules in the keep list are retained."""
+    myapp.prune_stdlib = True
+    myapp.stdlib_keep = ["tk*"]
+    stdlib_path = create_stdlib(support_path)
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert (stdlib_path / "tkinter.py").exists()
+    assert not (stdlib_path / "json.py").exists()
+
+
+def test_compiled_stdlib(
+    create_command,
+    myapp,
+    support_path,
+    app_packages_path_index,
+    capsys,
+):
+    """If the standard library isn't uncompiled, a warning is displayed."""
+    myapp.prune_stdlib = True
+    (support_path / "python311.zip").write_bytes(b"")
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert "it can't be pruned" in capsys.readouterr().out
+
+
+def test_no_support_path(create_command, myapp, no_support_path_index, capsys):
+    """If the app doesn't have a support package, a warning is displayed."""
+    myapp.prune_stdlib = True
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert "it can't be pruned" in capsys.readouterr().out
+
+
+def test_requirements_file(
+    create_command,
+    myapp,
+    support_path,
+    app_requirements_path_index,
+    capsys,
+):
+    """If dependencies are installed when the app is built, the standard
+    library isn't pruned."""
+    myapp.prune_stdlib = True
+    stdlib_path = create_stdlib(support_path)
+
+    create_command.prune_app_stdlib(myapp)
+
+    assert "the standard library can't be pruned" in capsys.readouterr().out
+    assert (stdlib_path / "tkinter.py").exists()
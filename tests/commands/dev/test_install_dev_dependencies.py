@@ -1,4 +1,6 @@
+import json
 import sys
+from pathlib import Path
 from subprocess import CalledProcessError
 
 import pytest
@@ -61,3 +63,65 @@ def test_no_dependencies(dev_command, first_app):
     dev_command.install_dev_dependencies(app=first_app)
 
     dev_command.subprocess.run.assert_not_called()
+
+
+def test_install_locked_dependencies(dev_command, first_app, tmp_path):
+    """If the app locks its dependencies, the locked packages are installed
+    with their hashes."""
+    dev_command.data_path = tmp_path / "data"
+    first_app.requires = ["package-one"]
+    first_app.lock_dependencies = True
+    dev_command.subprocess.check_output.return_value = json.dumps(
+        {
+            "install": [
+                {
+                    "metadata": {"name": name, "version": "1.0"},
+                    "download_info": {
+                        "archive_info": {"hashes": {"sha256": f"{name}-hash"}}
+                    },
+                }
+                for name in ["package-one", "package-two"]
+            ]
+        }
+    )
+    requirements_files = []
+    dev_command.subprocess.run.side_effect = lambda args, **kwargs: (
+        requirements_files.append(Path(args[-1]).read_text(encoding="utf-8"))
+    )
+
+    dev_command.install_dev_dependencies(app=first_app)
+
+    args = dev_command.subprocess.run.call_args[0][0]
+    assert args[:-1] == [
+        sys.executable,
+        "-m",
+        "pip",
+        "install",
+        "--upgrade",
+        "--no-deps",
+        "-r",
+    ]
+    assert requirements_files == [
+        "package-one==1.0 --hash=sha256:package-one-hash\n"
+        "package-two==1.0 --hash=sha256:package-two-hash\n"
+    ]
+    # The dependencies were locked for the dev environment.
+    content = json.loads((tmp_path / "briefcase.lock").read_text(encoding="utf-8"))
+    assert list(content["apps"]["first"]) == [
+        f"{dev_command.platform}/dev/{dev_command.host_arch}"
+        f"/py{dev_command.python_version_tag}"
+    ]
+
+
+def test_install_dependencies_index_proxy(dev_command, first_app):
+    """If the app uses the index proxy, dev dependencies are installed from
+    the proxy."""
+    first_app.requires = ["package-one"]
+    first_app.index_proxy = True
+
+    dev_command.install_dev_dependencies(app=first_app)
+
+    pip_args = dev_command.subprocess.run.call_args[0][0]
+    assert pip_args[:5] == [sys.executable, "-m", "pip", "install", "--upgrade"]
+    assert pip_args[5].startswith("--index-url=http://127.0.0.1:")
+    assert pip_args[6:] == ["package-one"]
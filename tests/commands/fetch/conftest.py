@@ -0,0 +1,42 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.commands import FetchCommand
+
+PYPROJECT = """\
+[tool.briefcase]
+project_name = "Hello"
+bundle = "com.example"
+version = "0.0.1"
+
+[tool.briefcase.app.first]
+formal_name = "First"
+description = "The first app"
+sources = ["src/first"]
+
+[tool.briefcase.app.second]
+formal_name = "Second"
+description = "The second app"
+sources = ["src/second"]
+template = "https://example.com/custom-template.git"
+template_branch = "custom"
+
+[tool.briefcase.app.second.linux]
+linuxdeploy_plugins = ["gtk", "DEPLOY_QT=1 https://example.com/plugin.sh"]
+"""
+
+
+@pytest.fixture
+def fetch_command(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(PYPROJECT, encoding="utf-8")
+
+    command = FetchCommand(
+        base_path=tmp_path,
+        home_path=tmp_path / "home",
+        data_path=tmp_path / "data",
+    )
+    command.integrations = mock.MagicMock()
+    command.parse_config(tmp_path / "pyproject.toml")
+    command.verify_tools()
+    return command
@@ -0,0 +1,90 @@
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+
+
+def descriptions(artifacts):
+    return sorted(description for description, fetch in artifacts)
+
+
+def test_artifacts(fetch_command):
+    """The artifacts for all apps and targets are collected, without
+    duplicates."""
+    commands = [
+        fetch_command.target_command("linux:appimage"),
+        fetch_command.target_command("android"),
+    ]
+
+    artifacts = fetch_command.artifacts(commands)
+
+    assert descriptions(artifacts) == sorted(
+        [
+            "Android SDK",
+            "Java JDK",
+            f"app template {commands[0].app_template_url}",
+            f"app template {commands[1].app_template_url}",
+            "app template https://example.com/custom-template.git",
+            "linuxdeploy",
+            "linuxdeploy GTK plugin",
+            "support package for first (android gradle)",
+            "support package for first (linux appimage)",
+            "user-provided linuxdeploy plugin from URL (https://example.com/plugin.sh)",
+        ]
+    )
+
+
+def test_artifacts_fetch(fetch_command, monkeypatch):
+    """Each artifact is fetched with the command for its target."""
+    command = fetch_command.target_command("linux:appimage")
+    artifacts = dict(fetch_command.artifacts([command]))
+
+    fetch = artifacts["support package for first (linux appimage)"]
+    assert fetch.func == command._download_support_package
+    assert fetch.args == (command.apps["first"],)
+
+    fetch = artifacts[
+        "user-provided linuxdeploy plugin from URL (https://example.com/plugin.sh)"
+    ]
+    assert fetch.args == (command,)
+    assert fetch.keywords == {"url": "https://example.com/plugin.sh"}
+
+    fetch = artifacts["app template https://example.com/custom-template.git"]
+    assert fetch.func == fetch_command.fetch_template
+    assert fetch.args == ("https://example.com/custom-template.git", ["custom"])
+
+
+def test_artifacts_app_names(fetch_command):
+    """The artifacts can be limited to specific apps."""
+    command = fetch_command.target_command("linux:appimage")
+
+    artifacts = fetch_command.artifacts([command], app_names=["first"])
+
+    assert descriptions(artifacts) == [
+        f"app template {command.app_template_url}",
+        "linuxdeploy",
+        "support package for first (linux appimage)",
+    ]
+
+
+def test_artifacts_unknown_app(fetch_command):
+    """An unknown app name raises an error."""
+    command = fetch_command.target_command("linux:appimage")
+
+    with pytest.raises(BriefcaseCommandError, match=r"Unknown app 'third'"):
+        fetch_command.artifacts([command], app_names=["first", "third"])
+
+
+def test_artifacts_unsupported_app(fetch_command):
+    """Apps that aren't supported on a platform are skipped."""
+    command = fetch_command.target_command("android")
+    command.apps["first"].supported = False
+    command.apps["second"].support_package = "https://example.com/support.tar.gz"
+
+    artifacts = fetch_command.artifacts([command])
+
+    assert descriptions(artifacts) == [
+        "Android SDK",
+        "Java JDK",
+        "app template https://example.com/custom-template.git",
+        "support package for second (android gradle)",
+    ]
@@ -0,0 +1,145 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from briefcase.exceptions import (
+    BriefcaseCommandError,
+    NetworkFailure,
+    OfflineModeError,
+)
+
+
+@pytest.fixture
+def artifacts(fetch_command, monkeypatch):
+    artifacts = [
+        ("first artifact", mock.MagicMock()),
+        ("second artifact", mock.MagicMock()),
+    ]
+    monkeypatch.setattr(fetch_command, "target_command", mock.MagicMock())
+    monkeypatch.setattr(
+        fetch_command, "artifacts", mock.MagicMock(return_value=artifacts)
+    )
+    return artifacts
+
+
+def test_fetch(fetch_command, artifacts, capsys):
+    """All the artifacts for the targets are fetched."""
+    fetch_command(targets=["android", "linux"], app_names=["first"])
+
+    assert fetch_command.target_command.mock_calls == [
+        mock.call("android"),
+        mock.call("linux"),
+    ]
+    fetch_command.artifacts.assert_called_once_with(
+        [fetch_command.target_command.return_value] * 2,
+        app_names=["first"],
+    )
+    for description, fetch in artifacts:
+        fetch.assert_called_once_with()
+
+    out = capsys.readouterr().out
+    assert "Fetched first artifact" in out
+    assert "Fetched second artifact" in out
+    assert "Fetched 2 artifacts." in out
+
+
+def test_default_target(fetch_command, artifacts):
+    """If no target is provided, the current platform is used."""
+    fetch_command()
+
+    fetch_command.target_command.assert_called_once_with(fetch_command.platform)
+
+
+def test_concurrent(fetch_command, artifacts):
+    """Artifacts are fetched concurrently."""
+    # Each fetch waits for the other; if the fetches weren't concurrent,
+    # the barrier would time out.
+    barrier = threading.Barrier(2, timeout=5)
+    for description, fetch in artifacts:
+        fetch.side_effect = barrier.wait
+
+    fetch_command(jobs=2)
+
+
+def test_failure(fetch_command, artifacts, capsys):
+    """If an artifact can't be fetched, the other artifacts are still fetched,
+    and the failures are reported."""
+    artifacts[0][1].side_effect = NetworkFailure("download first artifact")
+
+    with pytest.raises(
+        BriefcaseCommandError, match=r"Unable to fetch 1 of 2 artifacts."
+    ):
+        fetch_command()
+
+    artifacts[1][1].assert_called_once_with()
+
+    out = capsys.readouterr().out
+    assert "Unable to fetch first artifact:" in out
+    assert "Unable to download first artifact; is your computer offline?" in out
+    assert "Fetched second artifact" in out
+
+
+def test_offline(fetch_command, artifacts, capsys):
+    """In offline mode, artifacts that have been downloaded are checked."""
+    fetch_command.offline = True
+
+    fetch_command()
+
+    for description, fetch in artifacts:
+        fetch.assert_called_once_with()
+    assert "Checking 2 artifacts..." in capsys.readouterr().out
+
+
+def test_offline_missing(fetch_command, artifacts):
+    """In offline mode, every artifact that hasn't been downloaded is
+    reported at once."""
+    fetch_command.offline = True
+    artifacts[0][1].side_effect = OfflineModeError(
+        url="https://example.com/first.zip", role="first artifact"
+    )
+    artifacts[1][1].side_effect = OfflineModeError(url="https://example.com/second.zip")
+
+    with pytest.raises(OfflineModeError) as excinfo:
+        fetch_command()
+
+    assert excinfo.value.missing == [
+        ("https://example.com/first.zip", "first artifact"),
+        ("https://example.com/second.zip", None),
+    ]
+    assert "Unable to obtain 2 resources in offline mode." in str(excinfo.value)
+    assert "    https://example.com/first.zip (first artifact)\n" in str(excinfo.value)
+
+
+def test_offline_other_failure(fetch_command, artifacts, capsys):
+    """In offline mode, other failures are reported as usual."""
+    fetch_command.offline = True
+    artifacts[0][1].side_effect = OfflineModeError(url="https://example.com/first.zip")
+    artifacts[1][1].side_effect = NetworkFailure("download second artifact")
+
+    with pytest.raises(
+        BriefcaseCommandError, match=r"Unable to fetch 2 of 2 artifacts."
+    ):
+        fetch_command()
+
+
+def test_cpu_jobs(fetch_command, artifacts):
+    """A value of 0 uses one job per CPU."""
+    fetch_command.os = mock.MagicMock()
+    fetch_command.os.cpu_count.return_value = 2
+    # Each fetch waits for the other; if the fetches weren't concurrent,
+    # the barrier would time out.
+    barrier = threading.Barrier(2, timeout=5)
+    for description, fetch in artifacts:
+        fetch.side_effect = barrier.wait
+
+    fetch_command(jobs=0)
+
+
+def test_invalid_jobs(fetch_command, artifacts):
+    """The number of jobs can't be negative."""
+    with pytest.raises(BriefcaseCommandError, match=r"--jobs must be at least 0\."):
+        fetch_command(jobs=-1)
+
+    for description, fetch in artifacts:
+        fetch.assert_not_called()
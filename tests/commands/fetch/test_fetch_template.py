@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+from git import exc as git_exceptions
+
+from briefcase.exceptions import NetworkFailure, OfflineModeError
+
+
+@pytest.fixture
+def cache_path(fetch_command, tmp_path, monkeypatch):
+    cache_path = tmp_path / "home" / ".cookiecutters" / "template"
+    monkeypatch.setattr(
+        "briefcase.commands.fetch.cookiecutter_cache_path", lambda template: cache_path
+    )
+    fetch_command.git.exc.GitCommandError = git_exceptions.GitCommandError
+    fetch_command.update_cookiecutter_cache = mock.MagicMock()
+    return cache_path
+
+
+def test_clone(fetch_command, cache_path):
+    """A template that hasn't been cached is cloned, and each branch is
+    checked."""
+    fetch_command.fetch_template("https://example.com/template.git", ["3.9", "3.10"])
+
+    fetch_command.git.Repo.clone_from.assert_called_once_with(
+        "https://example.com/template.git", cache_path
+    )
+    assert fetch_command.update_cookiecutter_cache.mock_calls == [
+        mock.call(template="https://example.com/template.git", branch="3.9"),
+        mock.call(template="https://example.com/template.git", branch="3.10"),
+    ]
+
+
+def test_cached(fetch_command, cache_path):
+    """A template that has been cached is updated, rather than cloned."""
+    cache_path.mkdir(parents=True)
+
+    fetch_command.fetch_template("https://example.com/template.git", ["3.10"])
+
+    fetch_command.git.Repo.clone_from.assert_not_called()
+    fetch_command.update_cookiecutter_cache.assert_called_once_with(
+        template="https://example.com/template.git", branch="3.10"
+    )
+
+
+def test_local_template(fetch_command, cache_path, tmp_path):
+    """A local template isn't cloned."""
+    fetch_command.fetch_template(str(tmp_path / "template"), ["3.10"])
+
+    fetch_command.git.Repo.clone_from.assert_not_called()
+
+
+def test_clone_failure(fetch_command, cache_path):
+    """If the template can't be cloned, an error is raised."""
+    fetch_command.git.Repo.clone_from.side_effect = git_exceptions.GitCommandError(
+        "git", 128
+    )
+
+    with pytest.raises(NetworkFailure):
+        fetch_command.fetch_template("https://example.com/template.git", ["3.10"])
+
+    fetch_command.update_cookiecutter_cache.assert_not_called()
+
+
+def test_offline_missing(fetch_command, cache_path):
+    """In offline mode, a template that hasn't been cached is reported as
+    missing."""
+    fetch_command.offline = True
+
+    with pytest.raises(OfflineModeError, match=r"Unable to obtain app template"):
+        fetch_command.fetch_template("https://example.com/template.git", ["3.10"])
+
+    fetch_command.git.Repo.clone_from.assert_not_called()
@@ -0,0 +1,62 @@
+import pytest
+
+from briefcase.exceptions import (
+    BriefcaseCommandError,
+    InvalidFormatError,
+    UnsupportedCommandError,
+)
+from briefcase.platforms.android.gradle import GradleCreateCommand
+from briefcase.platforms.linux.appimage import LinuxAppImageCreateCommand
+from briefcase.platforms.linux.flatpak import LinuxFlatpakCreateCommand
+
+
+def test_platform(fetch_command, tmp_path):
+    """A platform target uses the default output format of the platform."""
+    command = fetch_command.target_command("android")
+
+    assert isinstance(command, GradleCreateCommand)
+    assert command.data_path == tmp_path / "data"
+    assert command.git == fetch_command.git
+    assert command.is_clone
+
+    # The apps have been configured for the platform.
+    assert sorted(command.apps) == ["first", "second"]
+
+
+@pytest.mark.parametrize("target", ["linux:flatpak", "LINUX:Flatpak"])
+def test_platform_and_format(fetch_command, target):
+    """A target can name an output format; names are case insensitive."""
+    command = fetch_command.target_command(target)
+
+    assert isinstance(command, LinuxFlatpakCreateCommand)
+
+
+def test_format_options(fetch_command):
+    """Format-specific options use their default values."""
+    command = fetch_command.target_command("linux:appimage")
+
+    assert isinstance(command, LinuxAppImageCreateCommand)
+    assert command.use_docker
+    # Platform-specific app configuration is used.
+    assert command.apps["second"].linuxdeploy_plugins == [
+        "gtk",
+        "DEPLOY_QT=1 https://example.com/plugin.sh",
+    ]
+
+
+def test_invalid_platform(fetch_command):
+    """An unknown platform raises an error."""
+    with pytest.raises(BriefcaseCommandError, match=r"Invalid platform 'atari'"):
+        fetch_command.target_command("atari")
+
+
+def test_invalid_format(fetch_command):
+    """An unknown output format raises an error."""
+    with pytest.raises(InvalidFormatError):
+        fetch_command.target_command("linux:atari")
+
+
+def test_unsupported_format(fetch_command):
+    """An output format that can't create apps raises an error."""
+    with pytest.raises(UnsupportedCommandError):
+        fetch_command.target_command("macOS:homebrew")
@@ -30,4 +30,4 @@ class DummyNewCommand(NewCommand):
 
 @pytest.fixture
 def new_command(tmp_path):
-    return DummyNewCommand(base_path=tmp_path)
+    return DummyNewCommand(base_path=tmp_path, data_path=tmp_path / "data")
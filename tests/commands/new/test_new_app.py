@@ -9,7 +9,7 @@ from briefcase.exceptions import BriefcaseCommandError
 
 @pytest.fixture
 def new_command(tmp_path):
-    return NewCommand(base_path=tmp_path)
+    return NewCommand(base_path=tmp_path, data_path=tmp_path / "data")
 
 
 def test_new_app(new_command, tmp_path):
@@ -49,6 +49,15 @@ class DummyUpdateCommand(UpdateCommand):
         with (self.bundle_path(app) / "resources").open("w") as f:
             f.write("app resources")
 
+    def install_app_support_package(self, app):
+        self.actions.append(("support", app))
+
+    def prune_app_stdlib(self, app):
+        self.actions.append(("prune", app))
+
+    def compile_app_bytecode(self, app):
+        self.actions.append(("compile", app))
+
 
 @pytest.fixture
 def update_command(tmp_path):
@@ -71,3 +71,33 @@ def test_update_app_with_resources(update_command, first_app):
     assert not (update_command.platform_path / "first.dummy" / "dependencies").exists()
     # ... and the app still exists
     assert (update_command.platform_path / "first.dummy" / "Content").exists()
+
+
+def test_update_app_prune_stdlib(update_command, first_app):
+    """If the app prunes the standard library, the support package is
+    reinstalled and pruned again after the code is updated."""
+    update_command.apps["first"].prune_stdlib = True
+
+    update_command.update_app(update_command.apps["first"])
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("code", update_command.apps["first"]),
+        ("support", update_command.apps["first"]),
+        ("prune", update_command.apps["first"]),
+    ]
+
+
+def test_update_app_precompile(update_command, first_app):
+    """If the app is precompiled, it is compiled after the code is
+    updated."""
+    update_command.apps["first"].precompile = True
+
+    update_command.update_app(update_command.apps["first"], update_dependencies=True)
+
+    # The right sequence of things will be done
+    assert update_command.actions == [
+        ("dependencies", update_command.apps["first"]),
+        ("code", update_command.apps["first"]),
+        ("compile", update_command.apps["first"]),
+    ]
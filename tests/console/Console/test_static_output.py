@@ -0,0 +1,50 @@
+import pytest
+
+
+def test_wait_bar(console, capsys):
+    """In static output mode, a wait bar only prints its done message."""
+    with console.static_output():
+        with console.wait_bar("Wait message...", done_message="finished"):
+            assert console._wait_bar is None
+
+    assert capsys.readouterr().out == "Wait message... finished\n"
+    assert not console.is_output_controlled
+
+
+def test_wait_bar_error(console, capsys):
+    """In static output mode, a wait bar prints its message if an error
+    occurs."""
+    with console.static_output():
+        with pytest.raises(ValueError):
+            with console.wait_bar("Wait message..."):
+                raise ValueError()
+
+    assert capsys.readouterr().out == "Wait message...\n"
+
+
+def test_progress_bar(console):
+    """In static output mode, progress bars are disabled."""
+    with console.static_output():
+        assert console.progress_bar().disable
+        assert console.transfer_bar().disable
+
+    # Once static output mode is exited, progress bars are displayed.
+    assert not console.progress_bar().disable
+    assert not console.transfer_bar().disable
+
+
+def test_nested(console):
+    """Static output mode can be nested."""
+    with console.static_output():
+        with console.static_output():
+            pass
+        assert console.progress_bar().disable
+
+    assert not console.progress_bar().disable
+
+
+def test_output_not_controlled(console):
+    """Static output mode doesn't take control of subprocess output, so
+    interactive subprocesses can still prompt the user."""
+    with console.static_output():
+        assert not console.is_output_controlled
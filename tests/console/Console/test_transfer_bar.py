@@ -0,0 +1,9 @@
+def test_transfer_bar(console, capsys):
+    """A transfer bar reports the amount transferred when the total size isn't
+    known."""
+    transfer_bar = console.transfer_bar()
+    task_id = transfer_bar.add_task("Downloader", total=None)
+    with transfer_bar:
+        transfer_bar.update(task_id, advance=2 * 1000 * 1000)
+
+    assert "2.0/? MB" in capsys.readouterr().out
@@ -179,3 +179,17 @@ def test_save_log_to_file_fail_to_write_file(capsys):
 
     last_line_of_output = capsys.readouterr().out.strip().splitlines()[-1]
     assert last_line_of_output.startswith("Failed to save log to ")
+
+
+def test_labelled_prefix(capsys):
+    """A prefix that matches the label of the output isn't repeated."""
+    logger = Log()
+    with logger.labelled("first-app"):
+        assert logger.label == "first-app"
+        logger.info("a message", prefix="first-app")
+        logger.info("another message", prefix="other")
+
+    assert logger.label is None
+    assert capsys.readouterr().out == (
+        "\n" "[first-app] a message\n" "\n" "[first-app] [other] another message\n"
+    )
@@ -52,3 +52,25 @@ def test_very_long_line(capsys, printer):
     assert len(log.splitlines()) == 2
     assert (" " + "A very long line of output!! " * 5 + "A very    console.py:") in log
     assert (" long line of output!!" + " " * 148) in log
+
+
+def test_labelled(capsys, printer):
+    """Output printed inside a labelled context is prefixed with the label."""
+    with printer.labelled("first-app"):
+        assert printer.current_label() == "first-app"
+        printer("a line of output", markup=False, stack_offset=1)
+        with printer.labelled(None):
+            printer("an unlabelled line", markup=False, stack_offset=1)
+        printer("[bold]marked up[/bold]", markup=True, stack_offset=1)
+
+    assert printer.current_label() is None
+    printer("a final line", stack_offset=1)
+
+    assert capsys.readouterr().out == (
+        "[first-app] a line of output\n"
+        "an unlabelled line\n"
+        "[first-app] marked up\n"
+        "a final line\n"
+    )
+    log = printer.export_log()
+    assert " [first-app] a line of output " in log
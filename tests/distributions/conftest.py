@@ -0,0 +1,26 @@
+import pytest
+
+
+def install_distribution(path, name, version, files):
+    """Create the files of an installed distribution, including its metadata
+    and RECORD."""
+    dist_info = f"{name}-{version}.dist-info"
+    for filename in files:
+        (path / filename).parent.mkdir(parents=True, exist_ok=True)
+        (path / filename).write_text(f"# {filename}\n")
+    (path / dist_info).mkdir(parents=True)
+    (path / dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    )
+    records = [*files, f"{dist_info}/METADATA", f"{dist_info}/RECORD"]
+    (path / dist_info / "RECORD").write_text(
+        "".join(f"{record},,\n" for record in records)
+    )
+    return path / dist_info
+
+
+@pytest.fixture
+def app_packages(tmp_path):
+    path = tmp_path / "app_packages"
+    path.mkdir()
+    return path
@@ -0,0 +1,29 @@
+from briefcase.distributions import canonical_name, installed_distributions
+
+from .conftest import install_distribution
+
+
+def test_canonical_name():
+    """Names that differ in case and punctuation are equivalent."""
+    assert canonical_name("Foo.Bar_baz--Qux") == "foo-bar-baz-qux"
+
+
+def test_installed_distributions(app_packages):
+    """Installed distributions are found, with their versions."""
+    first = install_distribution(app_packages, "First_Package", "1.2.3", [])
+    second = install_distribution(app_packages, "second", "4.5", [])
+    # A distribution with unreadable metadata
+    (app_packages / "third-6.0.dist-info").mkdir()
+
+    assert installed_distributions(app_packages) == {
+        "first-package": ("1.2.3", first),
+        "second": ("4.5", second),
+        "third": (None, app_packages / "third-6.0.dist-info"),
+    }
+
+
+def test_no_distributions(tmp_path):
+    """A folder without distributions (or a missing folder) has no
+    distributions."""
+    assert installed_distributions(tmp_path) == {}
+    assert installed_distributions(tmp_path / "missing") == {}
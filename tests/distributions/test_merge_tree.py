@@ -0,0 +1,19 @@
+from briefcase.distributions import merge_tree
+
+
+def test_merge_tree(tmp_path):
+    """Content is moved into the target, merging shared folders."""
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    (source / "namespace" / "new").mkdir(parents=True)
+    (source / "namespace" / "new" / "__init__.py").write_text("new")
+    (source / "top.py").write_text("top")
+    (target / "namespace" / "old").mkdir(parents=True)
+    (target / "namespace" / "old" / "__init__.py").write_text("old")
+
+    merge_tree(source, target)
+
+    assert (target / "namespace" / "new" / "__init__.py").read_text() == "new"
+    assert (target / "namespace" / "old" / "__init__.py").read_text() == "old"
+    assert (target / "top.py").read_text() == "top"
+    assert not (source / "top.py").exists()
@@ -0,0 +1,50 @@
+from briefcase.distributions import distribution_files, remove_distribution
+
+from .conftest import install_distribution
+
+
+def test_remove_distribution(app_packages):
+    """The files of a distribution, and folders left empty, are removed."""
+    dist_info = install_distribution(
+        app_packages,
+        "first",
+        "1.0",
+        ["first/__init__.py", "first/sub/module.py", "shared/first.py"],
+    )
+    install_distribution(app_packages, "second", "1.0", ["shared/second.py"])
+    # Bytecode compiled after installation
+    (app_packages / "first" / "__pycache__").mkdir()
+    (app_packages / "first" / "__pycache__" / "__init__.cpython-311.pyc").write_bytes(
+        b""
+    )
+    (app_packages / "shared" / "first.pyc").write_bytes(b"")
+
+    assert remove_distribution(app_packages, dist_info)
+
+    assert not (app_packages / "first").exists()
+    assert not dist_info.exists()
+    assert not (app_packages / "shared" / "first.pyc").exists()
+    # Files of the other distribution in a shared folder are retained
+    assert (app_packages / "shared" / "second.py").exists()
+    assert (app_packages / "second-1.0.dist-info").exists()
+
+
+def test_files_outside_folder(app_packages, tmp_path):
+    """Files recorded outside the install folder aren't removed."""
+    dist_info = install_distribution(app_packages, "first", "1.0", [])
+    (tmp_path / "outside.txt").write_text("outside")
+    with (dist_info / "RECORD").open("a") as f:
+        f.write("../outside.txt,,\n")
+
+    assert remove_distribution(app_packages, dist_info)
+    assert (tmp_path / "outside.txt").exists()
+
+
+def test_no_record(app_packages):
+    """A distribution without a RECORD file can't be removed."""
+    dist_info = install_distribution(app_packages, "first", "1.0", ["first.py"])
+    (dist_info / "RECORD").unlink()
+
+    assert distribution_files(app_packages, dist_info) is None
+    assert not remove_distribution(app_packages, dist_info)
+    assert (app_packages / "first.py").exists()
@@ -0,0 +1,162 @@
+import hashlib
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+import requests
+
+from briefcase.cache import PackageIndexCache
+from briefcase.index_proxy import IndexProxy
+
+CONTENT = b"wheel content"
+DIGEST = hashlib.sha256(CONTENT).hexdigest()
+METADATA = b"Metadata-Version: 2.1\nName: Package\nVersion: 1.0\n"
+METADATA_DIGEST = hashlib.sha256(METADATA).hexdigest()
+
+PAGE = f"""<!DOCTYPE html>
+<html><body>
+<a href="/files/package-1.0-py3-none-any.whl#sha256={DIGEST}"
+   data-dist-info-metadata="sha256={METADATA_DIGEST}">package-1.0-py3-none-any.whl</a>
+</body></html>
+"""
+
+UPSTREAM = {
+    "https://index.example.com/simple/package/": PAGE.encode("utf-8"),
+    "https://index.example.com/files/package-1.0-py3-none-any.whl": CONTENT,
+    "https://index.example.com/files/package-1.0-py3-none-any.whl.metadata": (METADATA),
+}
+
+
+def upstream_get(url, headers=None):
+    """A fake upstream index."""
+    response = mock.MagicMock()
+    response.url = url
+    if url in UPSTREAM:
+        response.status_code = 200
+        response.text = UPSTREAM[url].decode("utf-8")
+        response.iter_content.return_value = [UPSTREAM[url]]
+    else:
+        response.status_code = 404
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PackageIndexCache(tmp_path / "packages")
+
+
+@pytest.fixture
+def proxy(cache):
+    return IndexProxy(
+        cache,
+        mock.MagicMock(side_effect=upstream_get),
+        upstream="https://index.example.com/simple",
+    )
+
+
+def test_project_links(proxy, cache):
+    """Project pages are requested from the upstream index, and recorded."""
+    links = proxy.project_links("package")
+
+    proxy.get.assert_called_once_with(
+        "https://index.example.com/simple/package/",
+        headers={"Accept": "text/html"},
+    )
+    assert [link["filename"] for link in links] == ["package-1.0-py3-none-any.whl"]
+    assert cache.load_page("package") == links
+
+
+def test_project_links_unknown(proxy):
+    """A project that doesn't exist upstream has no links."""
+    assert proxy.project_links("unknown") is None
+
+
+def test_project_links_unavailable(proxy, cache):
+    """If the upstream index can't be reached, the recorded page is used."""
+    proxy.project_links("package")
+    proxy.get.side_effect = requests.exceptions.ConnectionError()
+
+    assert proxy.project_links("package") == cache.load_page("package")
+
+
+def test_project_links_offline(proxy, cache):
+    """In offline mode, the upstream index isn't contacted."""
+    cache.save_page("package", [])
+    proxy.offline = True
+
+    assert proxy.project_links("package") == []
+    assert proxy.project_links("unknown") is None
+    proxy.get.assert_not_called()
+
+
+def test_project_file(proxy, cache):
+    """Files are downloaded the first time they are requested."""
+    proxy.project_links("package")
+
+    path = proxy.project_file("package", "package-1.0-py3-none-any.whl")
+    assert path.read_bytes() == CONTENT
+
+    proxy.get.reset_mock()
+    assert proxy.project_file("package", "package-1.0-py3-none-any.whl") == path
+    proxy.get.assert_not_called()
+
+
+def test_project_file_metadata(proxy):
+    """The metadata of a file can be requested."""
+    proxy.project_links("package")
+
+    path = proxy.project_file("package", "package-1.0-py3-none-any.whl.metadata")
+
+    assert path.read_bytes() == METADATA
+
+
+def test_project_file_unknown(proxy):
+    """Files that aren't linked from the project page aren't available."""
+    proxy.project_links("package")
+
+    assert proxy.project_file("package", "package-2.0-py3-none-any.whl") is None
+    assert proxy.project_file("other", "other-1.0-py3-none-any.whl") is None
+
+
+def test_project_file_offline(proxy):
+    """In offline mode, only stored files are available."""
+    proxy.project_links("package")
+    proxy.offline = True
+
+    assert proxy.project_file("package", "package-1.0-py3-none-any.whl") is None
+
+
+def test_serve(proxy, cache):
+    """The proxy serves project pages and files over HTTP."""
+    with proxy.serve() as index_url:
+        assert index_url.startswith("http://127.0.0.1:")
+        base_url = index_url[: -len("simple/")]
+
+        with urlopen(f"{index_url}Package/") as response:
+            page = response.read().decode("utf-8")
+        assert (
+            f'<a href="/files/package/package-1.0-py3-none-any.whl#sha256={DIGEST}"'
+        ) in page
+
+        with urlopen(
+            f"{base_url}files/package/package-1.0-py3-none-any.whl"
+        ) as response:
+            assert response.read() == CONTENT
+
+        for path in ["simple/unknown/", "files/package/.hidden", "other"]:
+            with pytest.raises(HTTPError) as excinfo:
+                urlopen(f"{base_url}{path}")
+            assert excinfo.value.code == 404
+
+
+def test_serve_upstream_failure(proxy, cache):
+    """If a file can't be downloaded, the proxy reports an error."""
+    proxy.project_links("package")
+    proxy.get.side_effect = requests.exceptions.ConnectionError("no network")
+
+    with proxy.serve() as index_url:
+        base_url = index_url[: -len("simple/")]
+        with pytest.raises(HTTPError) as excinfo:
+            urlopen(f"{base_url}files/package/package-1.0-py3-none-any.whl")
+        assert excinfo.value.code == 502
@@ -0,0 +1,63 @@
+from briefcase.index_proxy import parse_project_page, render_project_page
+
+PAGE = """<!DOCTYPE html>
+<html>
+  <body>
+    <h1>Links for package</h1>
+    <a href="../../packages/package-1.0.tar.gz#sha256=abcd">package-1.0.tar.gz</a>
+    <a href="https://files.example.com/package-2.0-py3-none-any.whl#sha256=ef01"
+       data-requires-python="&gt;=3.8" data-dist-info-metadata="sha256=2345"
+       data-yanked>package-2.0-py3-none-any.whl</a>
+    <a href="/">Not a file</a>
+  </body>
+</html>
+"""
+
+
+def test_parse():
+    """Links are resolved against the page, with their relevant
+    attributes."""
+    links = parse_project_page(PAGE, "https://index.example.com/simple/package/")
+
+    assert links == [
+        {
+            "filename": "package-1.0.tar.gz",
+            "url": "https://index.example.com/packages/package-1.0.tar.gz",
+            "fragment": "sha256=abcd",
+            "attributes": {},
+        },
+        {
+            "filename": "package-2.0-py3-none-any.whl",
+            "url": "https://files.example.com/package-2.0-py3-none-any.whl",
+            "fragment": "sha256=ef01",
+            "attributes": {
+                "data-requires-python": ">=3.8",
+                "data-dist-info-metadata": "sha256=2345",
+                "data-yanked": None,
+            },
+        },
+    ]
+
+
+def test_render():
+    """Rendered pages link to the files served by the proxy."""
+    links = parse_project_page(PAGE, "https://index.example.com/simple/package/")
+
+    page = render_project_page("package", links)
+
+    assert (
+        '<a href="/files/package/package-1.0.tar.gz#sha256=abcd">'
+        "package-1.0.tar.gz</a><br>"
+    ) in page
+    assert (
+        '<a href="/files/package/package-2.0-py3-none-any.whl#sha256=ef01"'
+        ' data-dist-info-metadata="sha256=2345"'
+        ' data-requires-python="&gt;=3.8"'
+        " data-yanked>package-2.0-py3-none-any.whl</a><br>"
+    ) in page
+
+    # A rendered page can be parsed again
+    assert [
+        link["attributes"]
+        for link in parse_project_page(page, "http://127.0.0.1:4242/simple/package/")
+    ] == [link["attributes"] for link in links]
@@ -0,0 +1,69 @@
+import os
+from unittest import mock
+
+import pytest
+
+from briefcase.integrations.android_sdk import AndroidSDK
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = mock.MagicMock()
+    command.host_os = "Linux"
+    command.tools_path = tmp_path / "tools"
+    command.os.access = os.access
+    command.os.X_OK = os.X_OK
+    command.os.environ = {}
+    return command
+
+
+def test_fetch(mock_command, tmp_path):
+    """If the SDK isn't installed, the Command-Line Tools are downloaded, but
+    not installed."""
+    AndroidSDK.fetch(mock_command)
+
+    mock_command.download_file.assert_called_once_with(
+        url="https://dl.google.com/android/repository/"
+        "commandlinetools-linux-8092744_latest.zip",
+        download_path=tmp_path / "tools",
+        role="Android SDK Command-Line Tools",
+    )
+
+
+def test_fetch_installed(mock_command, tmp_path):
+    """If the SDK is already installed, nothing is downloaded."""
+    sdkmanager = (
+        tmp_path / "tools" / "android_sdk" / "cmdline-tools" / "latest" / "bin"
+    ) / "sdkmanager"
+    sdkmanager.parent.mkdir(parents=True)
+    sdkmanager.touch(mode=0o755)
+
+    AndroidSDK.fetch(mock_command)
+
+    mock_command.download_file.assert_not_called()
+
+
+def test_fetch_android_sdk_root(mock_command, tmp_path):
+    """If ANDROID_SDK_ROOT points to an SDK, nothing is downloaded."""
+    sdkmanager = (
+        tmp_path / "android_sdk" / "cmdline-tools" / "latest" / "bin" / "sdkmanager"
+    )
+    sdkmanager.parent.mkdir(parents=True)
+    sdkmanager.touch(mode=0o755)
+    mock_command.os.environ = {
+        "ANDROID_SDK_ROOT": os.fsdecode(tmp_path / "android_sdk")
+    }
+
+    AndroidSDK.fetch(mock_command)
+
+    mock_command.download_file.assert_not_called()
+
+
+def test_fetch_invalid_android_sdk_root(mock_command, tmp_path):
+    """If ANDROID_SDK_ROOT doesn't point to an SDK, the Briefcase-managed SDK
+    is downloaded."""
+    mock_command.os.environ = {"ANDROID_SDK_ROOT": os.fsdecode(tmp_path / "other")}
+
+    AndroidSDK.fetch(mock_command)
+
+    mock_command.download_file.assert_called_once()
@@ -44,6 +44,16 @@ def mock_command(tmp_path):
     return command
 
 
+@pytest.fixture(autouse=True)
+def unpack_archive(monkeypatch):
+    """Mock the unpacking of the Command-Line Tools archive."""
+    unpack_archive = MagicMock()
+    monkeypatch.setattr(
+        "briefcase.integrations.android_sdk.unpack_archive", unpack_archive
+    )
+    return unpack_archive
+
+
 @pytest.fixture
 def jdk():
     jdk = MagicMock()
@@ -53,10 +63,11 @@ def jdk():
 
 def mock_unpack(filename, extract_dir):
     # Create a file that would have been created by unpacking the archive
-    # This includes the duplicated "cmdline-tools" folder name
+    # This includes the duplicated "cmdline-tools" folder name. The zip
+    # unpacker restores the permissions of the binaries.
     (extract_dir / "cmdline-tools" / "bin").mkdir(parents=True)
-    (extract_dir / "cmdline-tools" / "bin" / "sdkmanager").touch(mode=0o644)
-    (extract_dir / "cmdline-tools" / "bin" / "avdmanager").touch(mode=0o644)
+    (extract_dir / "cmdline-tools" / "bin" / "sdkmanager").touch(mode=0o755)
+    (extract_dir / "cmdline-tools" / "bin" / "avdmanager").touch(mode=0o755)
 
 
 def accept_license(android_sdk_root_path):
@@ -70,7 +81,9 @@ def accept_license(android_sdk_root_path):
     return _side_effect
 
 
-def test_succeeds_immediately_in_happy_path(mock_command, tmp_path, jdk):
+def test_succeeds_immediately_in_happy_path(
+    mock_command, tmp_path, jdk, unpack_archive
+):
     """If verify is invoked on a path containing an Android SDK, it does
     nothing."""
     # If `sdkmanager` exists and has the right permissions, and
@@ -101,13 +114,15 @@ def test_succeeds_immediately_in_happy_path(mock_command, tmp_path, jdk):
     # No calls to download, run or unpack anything.
     mock_command.download_file.assert_not_called()
     mock_command.subprocess.run.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
 
 
-def test_succeeds_immediately_in_happy_path_with_debug(mock_command, tmp_path, jdk):
+def test_succeeds_immediately_in_happy_path_with_debug(
+    mock_command, tmp_path, jdk, unpack_archive
+):
     """If debug is enabled, a verify call will display the installed
     packages."""
     # Increase the log level.
@@ -140,13 +155,13 @@ def test_succeeds_immediately_in_happy_path_with_debug(mock_command, tmp_path, j
 
     # No calls to download or unpack anything.
     mock_command.download_file.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
 
 
-def test_user_provided_sdk(mock_command, tmp_path, jdk):
+def test_user_provided_sdk(mock_command, tmp_path, jdk, unpack_archive):
     """If the user specifies a valid ANDROID_SDK_ROOT, it is used."""
     # Increase the log level.
     mock_command.logger.verbosity = 2
@@ -175,13 +190,13 @@ def test_user_provided_sdk(mock_command, tmp_path, jdk):
 
     # No calls to download or unpack anything.
     mock_command.download_file.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == existing_android_sdk_root_path
 
 
-def test_user_provided_sdk_with_debug(mock_command, tmp_path, jdk):
+def test_user_provided_sdk_with_debug(mock_command, tmp_path, jdk, unpack_archive):
     """If the has debug with a user-specified ANDROID_SDK_ROOT, the packages
     are listed."""
     # Create `sdkmanager` and the license file.
@@ -209,13 +224,13 @@ def test_user_provided_sdk_with_debug(mock_command, tmp_path, jdk):
     # No calls to download, run or unpack anything.
     mock_command.download_file.assert_not_called()
     mock_command.subprocess.run.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == existing_android_sdk_root_path
 
 
-def test_invalid_user_provided_sdk(mock_command, tmp_path, jdk):
+def test_invalid_user_provided_sdk(mock_command, tmp_path, jdk, unpack_archive):
     """If the user specifies an invalid ANDROID_SDK_ROOT, it is ignored."""
 
     # Create `sdkmanager` and the license file
@@ -242,13 +257,13 @@ def test_invalid_user_provided_sdk(mock_command, tmp_path, jdk):
     # No calls to download, run or unpack anything.
     mock_command.download_file.assert_not_called()
     mock_command.subprocess.run.assert_not_called()
-    mock_command.shutil.unpack_archive.assert_not_called()
+    unpack_archive.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
 
 
-def test_download_sdk(mock_command, tmp_path):
+def test_download_sdk(mock_command, tmp_path, unpack_archive):
     """If an SDK is not available, one will be downloaded."""
     android_sdk_root_path = tmp_path / "tools" / "android_sdk"
     cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
@@ -258,7 +273,7 @@ def test_download_sdk(mock_command, tmp_path):
     mock_command.download_file.return_value = cache_file
 
     # Calling unpack will create files
-    mock_command.shutil.unpack_archive.side_effect = mock_unpack
+    unpack_archive.side_effect = mock_unpack
 
     # Set up a side effect for accepting the license
     mock_command.subprocess.run.side_effect = accept_license(android_sdk_root_path)
@@ -277,7 +292,7 @@ def test_download_sdk(mock_command, tmp_path):
         role="Android SDK Command-Line Tools",
     )
 
-    mock_command.shutil.unpack_archive.assert_called_once_with(
+    unpack_archive.assert_called_once_with(
         cache_file, extract_dir=cmdline_tools_base_path
     )
 
@@ -293,7 +308,7 @@ def test_download_sdk(mock_command, tmp_path):
     assert sdk.cmdline_tools_version_path.is_file()
 
     if platform.system() != "Windows":
-        # On non-Windows, ensure the unpacked binary was made executable
+        # On non-Windows, ensure the unpacked binary is executable
         assert os.access(
             cmdline_tools_base_path / "latest" / "bin" / "sdkmanager", os.X_OK
         )
@@ -305,7 +320,7 @@ def test_download_sdk(mock_command, tmp_path):
     assert sdk.root_path == android_sdk_root_path
 
 
-def test_download_sdk_legacy_install(mock_command, tmp_path):
+def test_download_sdk_legacy_install(mock_command, tmp_path, unpack_archive):
     """If the legacy SDK tools are present, they will be deleted."""
     android_sdk_root_path = tmp_path / "tools" / "android_sdk"
     cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
@@ -327,7 +342,7 @@ def test_download_sdk_legacy_install(mock_command, tmp_path):
     mock_command.download_file.return_value = cache_file
 
     # Calling unpack will create files
-    mock_command.shutil.unpack_archive.side_effect = mock_unpack
+    unpack_archive.side_effect = mock_unpack
 
     # Set up a side effect for accepting the license
     mock_command.subprocess.run.side_effect = accept_license(android_sdk_root_path)
@@ -346,7 +361,7 @@ def test_download_sdk_legacy_install(mock_command, tmp_path):
         role="Android SDK Command-Line Tools",
     )
 
-    mock_command.shutil.unpack_archive.assert_called_once_with(
+    unpack_archive.assert_called_once_with(
         cache_file, extract_dir=cmdline_tools_base_path
     )
 
@@ -362,7 +377,7 @@ def test_download_sdk_legacy_install(mock_command, tmp_path):
     assert sdk.cmdline_tools_version_path.is_file()
 
     if platform.system() != "Windows":
-        # On non-Windows, ensure the unpacked binary was made executable
+        # On non-Windows, ensure the unpacked binary is executable
         assert os.access(
             cmdline_tools_base_path / "latest" / "bin" / "sdkmanager", os.X_OK
         )
@@ -393,7 +408,9 @@ def test_no_install(mock_command, tmp_path):
     sys.platform == "win32",
     reason="executable permission doesn't make sense on Windows",
 )
-def test_download_sdk_if_sdkmanager_not_executable(mock_command, tmp_path):
+def test_download_sdk_if_sdkmanager_not_executable(
+    mock_command, tmp_path, unpack_archive
+):
     """An SDK will be downloaded and unpackged if `tools/bin/sdkmanager` exists
     but does not have its permissions set properly."""
     android_sdk_root_path = tmp_path / "tools" / "android_sdk"
@@ -409,7 +426,7 @@ def test_download_sdk_if_sdkmanager_not_executable(mock_command, tmp_path):
     mock_command.download_file.return_value = cache_file
 
     # Calling unpack will create files
-    mock_command.shutil.unpack_archive.side_effect = mock_unpack
+    unpack_archive.side_effect = mock_unpack
 
     # Set up a side effect for accepting the license
     mock_command.subprocess.run.side_effect = accept_license(android_sdk_root_path)
@@ -428,7 +445,7 @@ def test_download_sdk_if_sdkmanager_not_executable(mock_command, tmp_path):
         role="Android SDK Command-Line Tools",
     )
 
-    mock_command.shutil.unpack_archive.assert_called_once_with(
+    unpack_archive.assert_called_once_with(
         cache_file, extract_dir=cmdline_tools_base_path
     )
 
@@ -442,7 +459,7 @@ def test_download_sdk_if_sdkmanager_not_executable(mock_command, tmp_path):
     assert sdk.root_path == android_sdk_root_path
 
 
-def test_raises_networkfailure_on_connectionerror(mock_command):
+def test_raises_networkfailure_on_connectionerror(mock_command, unpack_archive):
     """If an error occurs downloading the ZIP file, and error is raised."""
     mock_command.download_file.side_effect = NetworkFailure("mock")
 
@@ -460,10 +477,10 @@ def test_raises_networkfailure_on_connectionerror(mock_command):
         role="Android SDK Command-Line Tools",
     )
     # But no unpack occurred
-    assert mock_command.shutil.unpack_archive.call_count == 0
+    assert unpack_archive.call_count == 0
 
 
-def test_detects_bad_zipfile(mock_command, tmp_path):
+def test_detects_bad_zipfile(mock_command, tmp_path, unpack_archive):
     """If the ZIP file is corrupted, an error is raised."""
     android_sdk_root_path = tmp_path / "tools" / "android_sdk"
 
@@ -471,7 +488,7 @@ def test_detects_bad_zipfile(mock_command, tmp_path):
     mock_command.download_file.return_value = cache_file
 
     # But the unpack will fail.
-    mock_command.shutil.unpack_archive.side_effect = shutil.ReadError
+    unpack_archive.side_effect = shutil.ReadError
 
     with pytest.raises(BriefcaseCommandError):
         AndroidSDK.verify(mock_command, jdk=MagicMock())
@@ -486,6 +503,27 @@ def test_detects_bad_zipfile(mock_command, tmp_path):
         download_path=mock_command.tools_path,
         role="Android SDK Command-Line Tools",
     )
-    mock_command.shutil.unpack_archive.assert_called_once_with(
+    unpack_archive.assert_called_once_with(
         cache_file, extract_dir=android_sdk_root_path / "cmdline-tools"
     )
+
+    # The download was discarded, so that it will be downloaded again
+    mock_command.download_cache.evict.assert_called_once_with(url)
+
+
+def test_defer_license(mock_command, tmp_path, jdk):
+    """If license acceptance is deferred, the user isn't asked to accept the
+    licenses."""
+    android_sdk_root_path = tmp_path / "tools" / "android_sdk"
+    tools_bin = android_sdk_root_path / "cmdline-tools" / "latest" / "bin"
+    tools_bin.mkdir(parents=True, mode=0o755)
+    if platform.system() == "Windows":
+        (tools_bin / "sdkmanager.bat").touch()
+    else:
+        (tools_bin / "sdkmanager").touch(mode=0o755)
+
+    sdk = AndroidSDK.verify(mock_command, jdk=jdk, accept_license=False)
+
+    # The license hasn't been accepted, but sdkmanager wasn't invoked.
+    mock_command.subprocess.run.assert_not_called()
+    assert sdk.root_path == android_sdk_root_path
@@ -146,3 +146,55 @@ def test_simple_verbose_call(mock_docker, tmp_path, capsys):
         f">>>     {Path.cwd()}\n"
         ">>> Return code: 3\n"
     )
+
+
+def test_call_with_host_service_linux(mock_docker, tmp_path, capsys):
+    """On Linux, a command that refers to a service on the host's loopback
+    interface shares the host's network."""
+    mock_docker.command.host_os = "Linux"
+
+    mock_docker.run(["pip", "--index-url=http://127.0.0.1:4242/simple/"])
+
+    mock_docker._subprocess._subprocess.run.assert_called_with(
+        [
+            "docker",
+            "run",
+            "--volume",
+            f"{tmp_path / 'platform'}:/app:z",
+            "--volume",
+            f"{tmp_path / 'briefcase'}:/home/brutus/.cache/briefcase:z",
+            "--rm",
+            "--network",
+            "host",
+            "briefcase/com.example.myapp:py3.X",
+            "pip",
+            "--index-url=http://127.0.0.1:4242/simple/",
+        ],
+        text=True,
+        encoding=ANY,
+    )
+
+
+def test_call_with_host_service_macos(mock_docker, tmp_path, capsys):
+    """On macOS, references to a service on the host's loopback interface are
+    converted to the hostname that Docker provides for the host."""
+    mock_docker.command.host_os = "Darwin"
+
+    mock_docker.run(["pip", "--index-url=http://127.0.0.1:4242/simple/"])
+
+    mock_docker._subprocess._subprocess.run.assert_called_with(
+        [
+            "docker",
+            "run",
+            "--volume",
+            f"{tmp_path / 'platform'}:/app:z",
+            "--volume",
+            f"{tmp_path / 'briefcase'}:/home/brutus/.cache/briefcase:z",
+            "--rm",
+            "briefcase/com.example.myapp:py3.X",
+            "pip",
+            "--index-url=http://host.docker.internal:4242/simple/",
+        ],
+        text=True,
+        encoding=ANY,
+    )
@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+from briefcase.cache import VerificationCache
 from briefcase.console import Log
 from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.docker import Docker, _verify_docker_can_run, verify_docker
@@ -12,6 +13,7 @@ from briefcase.integrations.docker import Docker, _verify_docker_can_run, verify
 def test_command(tmp_path):
     command = mock.MagicMock()
     command.logger = Log()
+    command.verification_cache = VerificationCache(tmp_path / "verification.json")
 
     return command
 
@@ -208,3 +210,42 @@ def test_docker_exists_but_unknown_error_when_running_command(test_command):
         _verify_docker_can_run(command=test_command)
 
     assert "Check your Docker\ninstallation, and try again" in exc_info.value.msg
+
+
+def test_docker_verified_before(test_command):
+    """If Docker has been verified before, the version check isn't repeated,
+    but the daemon is always checked."""
+    test_command.subprocess.check_output.return_value = (
+        "Docker version 19.03.8, build afacb8b\n"
+    )
+    verify_docker(command=test_command)
+    assert test_command.subprocess.check_output.call_count == 2
+
+    # Verify docker again; the previous version is used, but the daemon is
+    # checked again.
+    test_command.subprocess.check_output.reset_mock()
+    assert verify_docker(command=test_command) == Docker
+    test_command.subprocess.check_output.assert_called_once_with(
+        ["docker", "info"],
+        stderr=subprocess.STDOUT,
+    )
+
+
+def test_docker_daemon_stopped(test_command):
+    """If the daemon stops after Docker has been verified, the next
+    verification reports it."""
+    test_command.subprocess.check_output.return_value = (
+        "Docker version 19.03.8, build afacb8b\n"
+    )
+    verify_docker(command=test_command)
+
+    test_command.subprocess.check_output.side_effect = [
+        subprocess.CalledProcessError(
+            returncode=1,
+            cmd="docker info",
+            output="Cannot connect to the Docker daemon at "
+            "unix:///var/run/docker.sock. Is the docker daemon running?\n",
+        ),
+    ]
+    with pytest.raises(BriefcaseCommandError, match=r"the Docker\s+daemon"):
+        verify_docker(command=test_command)
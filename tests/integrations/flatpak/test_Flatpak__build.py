@@ -34,6 +34,31 @@ def test_build(flatpak, tmp_path):
     flatpak.os.chmod.assert_called_once_with(tmp_path / "com.example.my-app", 0o755)
 
 
+def test_build_manifest(flatpak, tmp_path):
+    """A Flatpak project can be built from an alternate manifest."""
+    flatpak.build(
+        bundle="com.example",
+        app_name="my-app",
+        path=tmp_path,
+        manifest="manifest-index.yml",
+    )
+
+    flatpak.subprocess.run.assert_called_once_with(
+        [
+            "flatpak-builder",
+            "--force-clean",
+            "--repo",
+            "repo",
+            "--install",
+            "--user",
+            "build",
+            "manifest-index.yml",
+        ],
+        check=True,
+        cwd=tmp_path,
+    )
+
+
 def test_build_fail(flatpak, tmp_path):
     """If the build fails, an error is raised."""
     flatpak.subprocess.run.side_effect = subprocess.CalledProcessError(
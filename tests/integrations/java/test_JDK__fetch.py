@@ -0,0 +1,43 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.integrations.java import JDK
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = mock.MagicMock()
+    command.host_os = "Linux"
+    command.tools_path = tmp_path / "tools"
+    return command
+
+
+def test_fetch(mock_command, tmp_path):
+    """If the JDK isn't installed, the archive is downloaded, but not
+    unpacked."""
+    JDK.fetch(mock_command)
+
+    mock_command.download_file.assert_called_once_with(
+        url="https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
+        "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
+        download_path=tmp_path / "tools",
+        role="Java 8 JDK",
+    )
+
+
+@pytest.mark.parametrize(
+    "host_os, java_home",
+    [
+        ("Linux", ("java",)),
+        ("Darwin", ("java", "Contents", "Home")),
+    ],
+)
+def test_fetch_installed(mock_command, tmp_path, host_os, java_home):
+    """If the JDK is already installed, nothing is downloaded."""
+    mock_command.host_os = host_os
+    (tmp_path / "tools").joinpath(*java_home, "bin").mkdir(parents=True)
+
+    JDK.fetch(mock_command)
+
+    mock_command.download_file.assert_not_called()
@@ -7,6 +7,7 @@ from unittest import mock
 
 import pytest
 
+from briefcase.cache import VerificationCache
 from briefcase.console import Log
 from briefcase.exceptions import BriefcaseCommandError, MissingToolError, NetworkFailure
 from briefcase.integrations.java import JDK
@@ -17,6 +18,7 @@ from tests.utils import FsPathMock
 def test_command(tmp_path):
     command = mock.MagicMock()
     command.logger = Log()
+    command.verification_cache = VerificationCache(tmp_path / "verification.json")
     command.tools_path = tmp_path / "tools"
 
     # Mock environ.get returning no explicit JAVA_HOME
@@ -306,6 +308,8 @@ def test_successful_jdk_download(
     # Mock a JAVA_HOME that won't exist
     # This is only needed to make macOS *not* run /usr/libexec/java_home
     test_command.os.environ.get = mock.MagicMock(return_value="/does/not/exist")
+    # ... that contains a JDK that isn't Java 8
+    test_command.subprocess.check_output.return_value = "javac 17.0.2\n"
 
     # Mock the cached download path
     # Consider to remove if block when we drop py3.7 support, only keep statements from else.
@@ -335,11 +339,8 @@ def test_successful_jdk_download(
         url=jdk_url,
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
-    )
-    # The archive was unpacked
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip", extract_dir=os.fsdecode(tmp_path / "tools")
+        revalidate=False,
+        extract_path=tmp_path / "tools",
     )
     # The original archive was deleted
     archive.unlink.assert_called_once_with()
@@ -377,6 +378,8 @@ def test_jdk_download_failure(test_command, tmp_path):
         "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
+        revalidate=False,
+        extract_path=tmp_path / "tools",
     )
     # No attempt was made to unpack the archive
     assert test_command.shutil.unpack_archive.call_count == 0
@@ -398,7 +401,7 @@ def test_invalid_jdk_archive(test_command, tmp_path):
     test_command.download_file.return_value = archive
 
     # Mock an unpack failure due to an invalid archive
-    test_command.shutil.unpack_archive.side_effect = shutil.ReadError
+    test_command.download_file.side_effect = shutil.ReadError
 
     with pytest.raises(BriefcaseCommandError):
         JDK.verify(command=test_command)
@@ -409,11 +412,34 @@ def test_invalid_jdk_archive(test_command, tmp_path):
         "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
-    )
-    # An attempt was made to unpack the archive.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip", extract_dir=os.fsdecode(tmp_path / "tools")
+        revalidate=False,
+        extract_path=tmp_path / "tools",
     )
     # The original archive was not deleted
     assert archive.unlink.call_count == 0
+    # ... but the download was discarded, so that it will be downloaded again
+    test_command.download_cache.evict.assert_called_once_with(
+        "https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
+        "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz"
+    )
+
+
+def test_installed_while_waiting(test_command, tmp_path):
+    """If another process installs the JDK while waiting for the install lock,
+    the JDK that was installed is used."""
+    # Mock host OS
+    test_command.host_os = "Linux"
+
+    # When the lock is acquired, the other process has installed the JDK.
+    def installed():
+        (tmp_path / "tools" / "java" / "bin").mkdir(parents=True)
+
+    test_command.lock.return_value.__enter__.side_effect = installed
+
+    jdk = JDK.verify(command=test_command)
+
+    assert jdk.java_home == tmp_path / "tools" / "java"
+    test_command.lock.assert_called_once_with("tool-java", description="the Java JDK")
+
+    # Download was not invoked
+    test_command.download_file.assert_not_called()
@@ -1,4 +1,3 @@
-import os
 import shutil
 import sys
 from unittest.mock import MagicMock
@@ -92,13 +91,10 @@ def test_existing_install(test_command, tmp_path):
         "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
+        revalidate=True,
+        extract_path=tmp_path / "tools",
     )
 
-    # The archive was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip", extract_dir=os.fsdecode(tmp_path / "tools")
-    )
     # The original archive was deleted
     archive.unlink.assert_called_once_with()
 
@@ -147,13 +143,10 @@ def test_macOS_existing_install(test_command, tmp_path):
         "jdk8u242-b08/OpenJDK8U-jdk_x64_mac_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
+        revalidate=True,
+        extract_path=tmp_path / "tools",
     )
 
-    # The archive was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip", extract_dir=os.fsdecode(tmp_path / "tools")
-    )
     # The original archive was deleted
     archive.unlink.assert_called_once_with()
 
@@ -190,6 +183,8 @@ def test_download_fail(test_command, tmp_path):
         "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
+        revalidate=True,
+        extract_path=tmp_path / "tools",
     )
 
     # No attempt was made to unpack the archive
@@ -220,7 +215,7 @@ def test_unpack_fail(test_command, tmp_path):
     test_command.download_file.return_value = archive
 
     # Mock an unpack failure due to an invalid archive
-    test_command.shutil.unpack_archive.side_effect = shutil.ReadError
+    test_command.download_file.side_effect = shutil.ReadError
 
     # Create an SDK wrapper
     jdk = JDK(test_command, java_home=java_home)
@@ -238,12 +233,15 @@ def test_unpack_fail(test_command, tmp_path):
         "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz",
         download_path=tmp_path / "tools",
         role="Java 8 JDK",
+        revalidate=True,
+        extract_path=tmp_path / "tools",
     )
 
-    # The archive was unpacked.
-    # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    test_command.shutil.unpack_archive.assert_called_with(
-        "/path/to/download.zip", extract_dir=os.fsdecode(tmp_path / "tools")
-    )
     # The original archive was not deleted
     assert archive.unlink.call_count == 0
+
+    # ... but the download was discarded, so that it will be downloaded again
+    test_command.download_cache.evict.assert_called_once_with(
+        "https://github.com/AdoptOpenJDK/openjdk8-binaries/releases/download/"
+        "jdk8u242-b08/OpenJDK8U-jdk_x64_linux_hotspot_8u242b08.tar.gz"
+    )
@@ -0,0 +1,50 @@
+from briefcase.integrations.linuxdeploy import LinuxDeploy, LinuxDeployURLPlugin
+from tests.integrations.linuxdeploy.utils import side_effect_create_mock_appimage
+
+
+def test_fetch(mock_command, tmp_path):
+    """If linuxdeploy isn't installed, it is downloaded and made executable."""
+    appimage_path = tmp_path / "tools" / "linuxdeploy-wonky.AppImage"
+    mock_command.download_file.side_effect = side_effect_create_mock_appimage(
+        appimage_path
+    )
+
+    LinuxDeploy.fetch(mock_command)
+
+    mock_command.download_file.assert_called_once_with(
+        url="https://github.com/linuxdeploy/linuxdeploy/"
+        "releases/download/continuous/linuxdeploy-wonky.AppImage",
+        download_path=tmp_path / "tools",
+        role="linuxdeploy",
+        revalidate=True,
+        executable=True,
+    )
+    mock_command.os.chmod.assert_called_once_with(appimage_path, 0o755)
+
+
+def test_fetch_plugin(mock_command, tmp_path):
+    """Plugins can be constructed with keyword arguments."""
+
+    def mock_download(url, download_path, role, revalidate=False, executable=False):
+        download_path.mkdir(parents=True)
+        (download_path / "linuxdeploy-plugin-sample.sh").touch()
+
+    mock_command.download_file.side_effect = mock_download
+
+    LinuxDeployURLPlugin.fetch(
+        mock_command, url="https://example.com/path/to/linuxdeploy-plugin-sample.sh"
+    )
+
+    assert (
+        mock_command.download_file.call_args.kwargs["url"]
+        == "https://example.com/path/to/linuxdeploy-plugin-sample.sh"
+    )
+
+
+def test_fetch_installed(mock_command, tmp_path):
+    """If linuxdeploy is already installed, nothing is downloaded."""
+    (tmp_path / "tools" / "linuxdeploy-wonky.AppImage").touch()
+
+    LinuxDeploy.fetch(mock_command)
+
+    mock_command.download_file.assert_not_called()
@@ -62,6 +62,8 @@ def test_upgrade_exists(linuxdeploy, mock_command, tmp_path):
         url="https://example.com/path/to/linuxdeploy-dummy-wonky.AppImage",
         download_path=tmp_path / "plugin",
         role="Dummy plugin",
+        revalidate=True,
+        executable=True,
     )
     # The downloaded file will be made executable
     mock_command.os.chmod.assert_called_with(appimage_path, 0o755)
@@ -99,4 +101,6 @@ def test_upgrade_linuxdeploy_download_failure(linuxdeploy, mock_command, tmp_pat
         url="https://example.com/path/to/linuxdeploy-dummy-wonky.AppImage",
         download_path=tmp_path / "plugin",
         role="Dummy plugin",
+        revalidate=True,
+        executable=True,
     )
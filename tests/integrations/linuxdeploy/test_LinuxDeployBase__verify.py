@@ -90,6 +90,8 @@ def test_verify_does_not_exist(mock_command, tmp_path):
         url="https://example.com/path/to/linuxdeploy-dummy-wonky.AppImage",
         download_path=tmp_path / "tools" / "somewhere",
         role="Dummy plugin",
+        revalidate=True,
+        executable=True,
     )
     # The downloaded file will be made executable
     mock_command.os.chmod.assert_called_with(appimage_path, 0o755)
@@ -114,6 +116,8 @@ def test_verify_does_not_exist_non_appimage(mock_command, tmp_path):
         url="https://example.com/path/to/linuxdeploy-dummy.sh",
         download_path=tmp_path / "tools" / "somewhere",
         role="Dummy plugin",
+        revalidate=True,
+        executable=True,
     )
     # The downloaded file will be made executable
     mock_command.os.chmod.assert_called_with(tool_path, 0o755)
@@ -139,4 +143,6 @@ def test_verify_linuxdeploy_download_failure(mock_command, tmp_path):
         url="https://example.com/path/to/linuxdeploy-dummy-wonky.AppImage",
         download_path=tmp_path / "tools" / "somewhere",
         role="Dummy plugin",
+        revalidate=True,
+        executable=True,
     )
@@ -31,6 +31,8 @@ def test_verify(mock_command, tmp_path):
         / "sometool"
         / "f3355f8e631ffc1abbb7afd37b36315f7846182ca2276c481fb9a43a7f4d239f",
         role="user-provided linuxdeploy plugin from URL",
+        revalidate=True,
+        executable=True,
     )
 
 
@@ -53,6 +55,8 @@ def test_download_failure(mock_command, tmp_path):
         / "sometool"
         / "f3355f8e631ffc1abbb7afd37b36315f7846182ca2276c481fb9a43a7f4d239f",
         role="user-provided linuxdeploy plugin from URL",
+        revalidate=True,
+        executable=True,
     )
 
 
@@ -51,6 +51,8 @@ def test_gtk_plugin(linuxdeploy, mock_command, tmp_path):
         url="https://raw.githubusercontent.com/linuxdeploy/linuxdeploy-plugin-gtk/master/linuxdeploy-plugin-gtk.sh",
         download_path=tmp_path / "tools" / "linuxdeploy_plugins" / "gtk",
         role="linuxdeploy GTK plugin",
+        revalidate=True,
+        executable=True,
     )
 
 
@@ -78,6 +80,8 @@ def test_qt_plugin(linuxdeploy, mock_command, tmp_path):
         ),
         download_path=tmp_path / "tools" / "linuxdeploy_plugins" / "qt",
         role="linuxdeploy Qt plugin",
+        revalidate=True,
+        executable=True,
     )
 
 
@@ -110,6 +114,8 @@ def test_custom_url_plugin(linuxdeploy, mock_command, tmp_path):
         / "sometool"
         / "f3355f8e631ffc1abbb7afd37b36315f7846182ca2276c481fb9a43a7f4d239f",
         role="user-provided linuxdeploy plugin from URL",
+        revalidate=True,
+        executable=True,
     )
 
 
@@ -205,7 +211,7 @@ def test_complex_plugin_config(linuxdeploy, mock_command, tmp_path):
     # Three tools are obtained by downloading.
     # We don't want the side effects to occur until the function is invoked;
     # so we need to wrap the side effect callables in another callable.
-    def mock_downloads(url, download_path, role):
+    def mock_downloads(url, download_path, role, revalidate=False, executable=False):
         if "linuxdeploy_plugins/gtk" in str(download_path):
             return side_effect_create_mock_tool(
                 tmp_path
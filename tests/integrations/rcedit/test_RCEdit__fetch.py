@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.integrations.rcedit import RCEdit
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = MagicMock()
+    command.tools_path = tmp_path / "tools"
+    command.tools_path.mkdir()
+    return command
+
+
+def test_fetch(mock_command, tmp_path):
+    """If RCEdit isn't installed, it is downloaded."""
+    RCEdit.fetch(mock_command)
+
+    mock_command.download_file.assert_called_once_with(
+        url="https://github.com/electron/rcedit/releases/download/v1.1.1/rcedit-x64.exe",
+        download_path=tmp_path / "tools",
+        role="RCEdit",
+        revalidate=False,
+    )
+
+
+def test_fetch_installed(mock_command, tmp_path):
+    """If RCEdit is already installed, nothing is downloaded."""
+    (tmp_path / "tools" / "rcedit-x64.exe").touch()
+
+    RCEdit.fetch(mock_command)
+
+    mock_command.download_file.assert_not_called()
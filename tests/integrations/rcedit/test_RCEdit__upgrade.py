@@ -43,6 +43,7 @@ def test_upgrade_exists(mock_command, tmp_path):
         "releases/download/v1.1.1/rcedit-x64.exe",
         download_path=tmp_path / "tools",
         role="RCEdit",
+        revalidate=True,
     )
 
 
@@ -81,4 +82,5 @@ def test_upgrade_rcedit_download_failure(mock_command, tmp_path):
         "releases/download/v1.1.1/rcedit-x64.exe",
         download_path=tmp_path / "tools",
         role="RCEdit",
+        revalidate=True,
     )
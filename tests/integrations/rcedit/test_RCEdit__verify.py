@@ -69,6 +69,7 @@ def test_verify_does_not_exist(mock_command, tmp_path):
         "releases/download/v1.1.1/rcedit-x64.exe",
         download_path=tmp_path / "tools",
         role="RCEdit",
+        revalidate=False,
     )
 
     # The build command retains the path to the downloaded file.
@@ -89,4 +90,5 @@ def test_verify_rcedit_download_failure(mock_command, tmp_path):
         "releases/download/v1.1.1/rcedit-x64.exe",
         download_path=tmp_path / "tools",
         role="RCEdit",
+        revalidate=False,
     )
@@ -0,0 +1,11 @@
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def unpack_archive(monkeypatch):
+    """Mock the unpacking of the WiX archive."""
+    unpack_archive = mock.MagicMock()
+    monkeypatch.setattr("briefcase.integrations.wix.unpack_archive", unpack_archive)
+    return unpack_archive
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from briefcase.integrations.wix import WIX_DOWNLOAD_URL, WiX
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = MagicMock()
+    command.host_os = "Windows"
+    command.tools_path = tmp_path / "tools"
+    return command
+
+
+def test_fetch(mock_command, tmp_path):
+    """If WiX isn't installed, the archive is downloaded, but not unpacked."""
+    WiX.fetch(mock_command)
+
+    mock_command.download_file.assert_called_once_with(
+        url=WIX_DOWNLOAD_URL,
+        download_path=tmp_path / "tools",
+        role="WiX",
+    )
+
+
+def test_fetch_installed(mock_command, tmp_path):
+    """If WiX is already installed, nothing is downloaded."""
+    wix_path = tmp_path / "tools" / "wix"
+    wix_path.mkdir(parents=True)
+    for exe in ["heat.exe", "light.exe", "candle.exe"]:
+        (wix_path / exe).touch()
+
+    WiX.fetch(mock_command)
+
+    mock_command.download_file.assert_not_called()
@@ -50,7 +50,7 @@ def test_non_existing_wix_install(mock_command, tmp_path):
     assert mock_command.download_file.call_count == 0
 
 
-def test_existing_wix_install(mock_command, tmp_path):
+def test_existing_wix_install(mock_command, tmp_path, unpack_archive):
     """If there's an existing managed WiX install, it is deleted and
     redownloaded."""
     # Create a mock of a previously installed WiX version.
@@ -88,11 +88,12 @@ def test_existing_wix_install(mock_command, tmp_path):
         url=WIX_DOWNLOAD_URL,
         download_path=tmp_path / "tools",
         role="WiX",
+        revalidate=True,
     )
 
     # The download was unpacked
     # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_with(
+    unpack_archive.assert_called_with(
         os.fsdecode(wix_zip_path), extract_dir=os.fsdecode(wix_path)
     )
 
@@ -100,7 +101,7 @@ def test_existing_wix_install(mock_command, tmp_path):
     wix_zip.unlink.assert_called_with()
 
 
-def test_download_fail(mock_command, tmp_path):
+def test_download_fail(mock_command, tmp_path, unpack_archive):
     """If the download doesn't complete, the upgrade fails."""
     # Create a mock of a previously installed WiX version.
     wix_path = tmp_path / "tools" / "wix"
@@ -124,13 +125,14 @@ def test_download_fail(mock_command, tmp_path):
         url=WIX_DOWNLOAD_URL,
         download_path=tmp_path / "tools",
         role="WiX",
+        revalidate=True,
     )
 
     # ... but the unpack didn't happen
-    assert mock_command.shutil.unpack_archive.call_count == 0
+    assert unpack_archive.call_count == 0
 
 
-def test_unpack_fail(mock_command, tmp_path):
+def test_unpack_fail(mock_command, tmp_path, unpack_archive):
     """If the download archive is corrupted, the validator fails."""
     # Create a mock of a previously installed WiX version.
     wix_path = tmp_path / "tools" / "wix"
@@ -152,7 +154,7 @@ def test_unpack_fail(mock_command, tmp_path):
     mock_command.download_file.return_value = wix_zip
 
     # Mock an unpack failure
-    mock_command.shutil.unpack_archive.side_effect = EOFError
+    unpack_archive.side_effect = EOFError
 
     # Create an SDK wrapper
     wix = WiX(mock_command, wix_home=wix_path, bin_install=True)
@@ -167,13 +169,17 @@ def test_unpack_fail(mock_command, tmp_path):
         url=WIX_DOWNLOAD_URL,
         download_path=tmp_path / "tools",
         role="WiX",
+        revalidate=True,
     )
 
     # The download was unpacked.
     # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_with(
+    unpack_archive.assert_called_with(
         os.fsdecode(wix_zip_path), extract_dir=os.fsdecode(wix_path)
     )
 
     # The zip file was not removed
     assert wix_zip.unlink.call_count == 0
+
+    # ... but the download was discarded, so that it will be downloaded again
+    mock_command.download_cache.evict.assert_called_once_with(WIX_DOWNLOAD_URL)
@@ -91,7 +91,7 @@ def test_existing_wix_install(mock_command, tmp_path):
     assert wix.candle_exe == tmp_path / "tools" / "wix" / "candle.exe"
 
 
-def test_download_wix(mock_command, tmp_path):
+def test_download_wix(mock_command, tmp_path, unpack_archive):
     """If there's no existing managed WiX install, it is downloaded and
     unpacked."""
     # Mock the environment as if there is not WiX variable
@@ -122,11 +122,12 @@ def test_download_wix(mock_command, tmp_path):
         url=WIX_DOWNLOAD_URL,
         download_path=tmp_path / "tools",
         role="WiX",
+        revalidate=False,
     )
 
     # The download was unpacked.
     # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_with(
+    unpack_archive.assert_called_with(
         os.fsdecode(wix_zip_path), extract_dir=os.fsdecode(wix_path)
     )
 
@@ -156,7 +157,7 @@ def test_dont_install(mock_command, tmp_path):
     mock_command.download_file.assert_not_called()
 
 
-def test_download_fail(mock_command, tmp_path):
+def test_download_fail(mock_command, tmp_path, unpack_archive):
     """If the download doesn't complete, the validator fails."""
     # Mock the environment as if there is not WiX variable
     mock_command.os.environ.get.return_value = None
@@ -176,13 +177,14 @@ def test_download_fail(mock_command, tmp_path):
         url=WIX_DOWNLOAD_URL,
         download_path=tmp_path / "tools",
         role="WiX",
+        revalidate=False,
     )
 
     # ... but the unpack didn't happen
-    assert mock_command.shutil.unpack_archive.call_count == 0
+    assert unpack_archive.call_count == 0
 
 
-def test_unpack_fail(mock_command, tmp_path):
+def test_unpack_fail(mock_command, tmp_path, unpack_archive):
     """If the download archive is corrupted, the validator fails."""
     # Mock the environment as if there is not WiX variable
     mock_command.os.environ.get.return_value = None
@@ -202,7 +204,7 @@ def test_unpack_fail(mock_command, tmp_path):
     mock_command.download_file.return_value = wix_zip
 
     # Mock an unpack failure
-    mock_command.shutil.unpack_archive.side_effect = EOFError
+    unpack_archive.side_effect = EOFError
 
     # Verify the install. This will trigger a download,
     # but the unpack will fail
@@ -217,13 +219,17 @@ def test_unpack_fail(mock_command, tmp_path):
         url=WIX_DOWNLOAD_URL,
         download_path=tmp_path / "tools",
         role="WiX",
+        revalidate=False,
     )
 
     # The download was unpacked.
     # TODO: Py3.6 compatibility; os.fsdecode not required in Py3.7
-    mock_command.shutil.unpack_archive.assert_called_with(
+    unpack_archive.assert_called_with(
         os.fsdecode(wix_zip_path), extract_dir=os.fsdecode(wix_path)
     )
 
     # The zip file was not removed
     assert wix_zip.unlink.call_count == 0
+
+    # ... but the download was discarded, so that it will be downloaded again
+    mock_command.download_cache.evict.assert_called_once_with(WIX_DOWNLOAD_URL)
@@ -0,0 +1,13 @@
+from unittest import mock
+
+import pytest
+
+from briefcase.cache import VerificationCache
+
+
+@pytest.fixture
+def mock_command(tmp_path):
+    command = mock.MagicMock()
+    command.home_path = tmp_path / "home"
+    command.verification_cache = VerificationCache(tmp_path / "verification.json")
+    return command
@@ -1,5 +1,4 @@
 import subprocess
-from unittest import mock
 
 import pytest
 
@@ -8,10 +7,11 @@ from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.xcode import confirm_xcode_license_accepted
 
 
-def test_license_accepted(capsys):
+def test_license_accepted(mock_command, capsys):
     """If the Xcode license has been accepted, pass without comment."""
-    command = mock.MagicMock()
+    command = mock_command
     command.logger = Log()
+    command.subprocess.check_output.return_value = "Apple clang version 14.0.0\n"
 
     # Check passes without an error...
     confirm_xcode_license_accepted(command)
@@ -27,10 +27,10 @@ def test_license_accepted(capsys):
     assert len(out) == 0
 
 
-def test_unknown_error(capsys):
+def test_unknown_error(mock_command, capsys):
     """If an unexpected problem occurred accepting the license, warn the
     user."""
-    command = mock.MagicMock()
+    command = mock_command
     command.logger = Log()
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["/usr/bin/clang", "--version"], returncode=1
@@ -50,9 +50,9 @@ def test_unknown_error(capsys):
     assert "************" in out
 
 
-def test_accept_license():
+def test_accept_license(mock_command):
     """If the user accepts the license, continue without error."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["/usr/bin/clang", "--version"], returncode=69
     )
@@ -71,9 +71,9 @@ def test_accept_license():
     )
 
 
-def test_sudo_fail():
+def test_sudo_fail(mock_command):
     """If the sudo call fails, an exception is raised."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["/usr/bin/clang", "--version"], returncode=69
     )
@@ -99,9 +99,9 @@ def test_sudo_fail():
     )
 
 
-def test_license_not_accepted():
+def test_license_not_accepted(mock_command):
     """If the sudo call fails, an exception is raised."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["/usr/bin/clang", "--version"], returncode=69
     )
@@ -126,9 +126,9 @@ def test_license_not_accepted():
     )
 
 
-def test_license_status_unknown(capsys):
+def test_license_status_unknown(mock_command, capsys):
     """If we get an unusual response from the license, warn but continue."""
-    command = mock.MagicMock()
+    command = mock_command
     command.logger = Log()
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["/usr/bin/clang", "--version"], returncode=69
@@ -21,9 +21,9 @@ def xcode(default_xcode_install_path):
     return os.fsdecode(default_xcode_install_path)
 
 
-def test_not_installed(tmp_path):
+def test_not_installed(mock_command, tmp_path):
     """If No Xcode is installed, raise an error."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["xcode-select", "-p"], returncode=2
     )
@@ -44,13 +44,13 @@ def test_not_installed(tmp_path):
     )
 
 
-def test_custom_install_location(default_xcode_install_path, tmp_path):
+def test_custom_install_location(mock_command, default_xcode_install_path, tmp_path):
     """If Xcode is in a non-default location, that's fine."""
     # Create a custom Xcode location
     custom_xcode_location = tmp_path / "custom" / "Xcode.app"
     custom_xcode_location.mkdir(parents=True, exist_ok=True)
 
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         os.fsdecode(custom_xcode_location) + "\n",  # xcode-select -p
         "Xcode 13.3.1\nBuild version 11B500\n",  # xcodebuild -version
@@ -74,9 +74,9 @@ def test_custom_install_location(default_xcode_install_path, tmp_path):
     )
 
 
-def test_command_line_tools_only(default_xcode_install_path):
+def test_command_line_tools_only(mock_command, default_xcode_install_path):
     """If the cmdline tools are installed, but Xcode isn't, raise an error."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         "/Library/Developer/CommandLineTools\n",  # xcode-select -p
         subprocess.CalledProcessError(
@@ -110,10 +110,12 @@ def test_command_line_tools_only(default_xcode_install_path):
     )
 
 
-def test_installed_but_command_line_tools_selected(default_xcode_install_path, xcode):
+def test_installed_but_command_line_tools_selected(
+    mock_command, default_xcode_install_path, xcode
+):
     """If Xcode is installed, but the cmdline tools are selected raise an
     error."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         xcode + "\n",  # xcode-select -p
         subprocess.CalledProcessError(
@@ -147,14 +149,16 @@ def test_installed_but_command_line_tools_selected(default_xcode_install_path, x
     )
 
 
-def test_custom_install_with_command_line_tools(default_xcode_install_path, tmp_path):
+def test_custom_install_with_command_line_tools(
+    mock_command, default_xcode_install_path, tmp_path
+):
     """If the cmdline tools are installed, and Xcode is in a non-default
     location, raise an error."""
     # Create a custom Xcode location
     custom_xcode_location = tmp_path / "custom" / "Xcode.app"
     custom_xcode_location.mkdir(parents=True, exist_ok=True)
 
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         "/Library/Developer/CommandLineTools\n",  # xcode-select -p
         subprocess.CalledProcessError(
@@ -188,9 +192,9 @@ def test_custom_install_with_command_line_tools(default_xcode_install_path, tmp_
     )
 
 
-def test_installed_but_corrupted(xcode):
+def test_installed_but_corrupted(mock_command, xcode):
     """If the Xcode folder exists, but xcodebuild breaks, raise an error."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         xcode + "\n",  # xcode-select -p
         subprocess.CalledProcessError(
@@ -221,10 +225,10 @@ def test_installed_but_corrupted(xcode):
     )
 
 
-def test_installed_no_minimum_version(xcode):
+def test_installed_no_minimum_version(mock_command, xcode):
     """If Xcode is installed, but there's no minimum version, check is
     satisfied."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         xcode + "\n",  # xcode-select -p
         "Xcode 11.2.1\nBuild version 11B500\n",  # xcodebuild -version
@@ -249,10 +253,10 @@ def test_installed_no_minimum_version(xcode):
     )
 
 
-def test_installed_extra_output(capsys, xcode):
+def test_installed_extra_output(mock_command, capsys, xcode):
     """If Xcode but outputs extra content, the check is still satisfied."""
     # This specific output was seen in the wild with Xcode 13.2.1; see #668
-    command = mock.MagicMock()
+    command = mock_command
     command.logger = Log()
     command.subprocess.check_output.side_effect = [
         xcode + "\n",  # xcode-select -p
@@ -320,7 +324,9 @@ def test_installed_extra_output(capsys, xcode):
         ((11,), "11.2"),  # Exact match, implied minor version.
     ],
 )
-def test_installed_with_minimum_version_success(min_version, version, capsys, xcode):
+def test_installed_with_minimum_version_success(
+    mock_command, min_version, version, capsys, xcode
+):
     """Check XCode can meet a minimum version requirement."""
 
     def check_output_mock(cmd_list, *args, **kwargs):
@@ -332,7 +338,7 @@ def test_installed_with_minimum_version_success(min_version, version, capsys, xc
 
         return mock.DEFAULT
 
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = check_output_mock
 
     # Check passes without an error.
@@ -372,9 +378,11 @@ def test_installed_with_minimum_version_success(min_version, version, capsys, xc
         ((9,), "8.2.1"),  # Insufficient major version
     ],
 )
-def test_installed_with_minimum_version_failure(min_version, version, xcode):
+def test_installed_with_minimum_version_failure(
+    mock_command, min_version, version, xcode
+):
     """Check XCode fail to meet a minimum version requirement."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = [
         xcode + "\n",  # xcode-select -p
         f"Xcode {version}\nBuild version 11B500\n",  # xcodebuild -version
@@ -404,9 +412,9 @@ def test_installed_with_minimum_version_failure(min_version, version, xcode):
     )
 
 
-def test_unexpected_version_output(capsys, xcode):
+def test_unexpected_version_output(mock_command, capsys, xcode):
     """If xcodebuild returns unexpected output, assume it's ok..."""
-    command = mock.MagicMock()
+    command = mock_command
     command.logger = Log()
     command.subprocess.check_output.side_effect = [
         xcode + "\n",  # xcode-select -p
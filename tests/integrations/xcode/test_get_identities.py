@@ -1,6 +1,5 @@
 import subprocess
 from pathlib import Path
-from unittest import mock
 
 import pytest
 
@@ -16,9 +15,9 @@ def security_result(name):
         return f.read()
 
 
-def test_security_missing():
+def test_security_missing(mock_command):
     """If security is missing or fails to start, an exception is raised."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["security", "find-identities", "-v", "-p", "codesigning"], returncode=1
     )
@@ -27,9 +26,9 @@ def test_security_missing():
         get_identities(command, "codesigning")
 
 
-def test_invalid_profile():
+def test_invalid_profile(mock_command):
     """If the requested profile is invalid, an exception is raised."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.side_effect = subprocess.CalledProcessError(
         cmd=["security", "find-identities", "-v", "-p", "jabberwock"], returncode=2
     )
@@ -38,9 +37,9 @@ def test_invalid_profile():
         get_identities(command, "codesigning")
 
 
-def test_no_identities():
+def test_no_identities(mock_command):
     """If there are no identities available, no simulators will be found."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.return_value = security_result("no-identities")
 
     simulators = get_identities(command, "codesigning")
@@ -48,9 +47,9 @@ def test_no_identities():
     assert simulators == {}
 
 
-def test_one_identity():
+def test_one_identity(mock_command):
     """If there is one identity available, it is returned."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.return_value = security_result("one-identity")
 
     simulators = get_identities(command, "codesigning")
@@ -60,9 +59,9 @@ def test_one_identity():
     }
 
 
-def test_multiple_identities():
+def test_multiple_identities(mock_command):
     """If there are multiple identities available, they are all returned."""
-    command = mock.MagicMock()
+    command = mock_command
     command.subprocess.check_output.return_value = security_result(
         "multiple-identities"
     )
@@ -74,3 +73,25 @@ def test_multiple_identities():
         "11E77FB58F13F6108B38110D5D92233C58ED38C5": "iPhone Developer: Jane Smith (BXAH5H869S)",
         "F8903EC63C238B04C1067833814CE47CA338EBD6": "Developer ID Application: Other Corporation Ltd (83DLZ2K43E)",
     }
+
+
+def test_keychain_modified(mock_command):
+    """The identities are reused until the user's keychain is modified."""
+    command = mock_command
+    keychain = command.home_path / "Library" / "Keychains" / "login.keychain-db"
+    keychain.parent.mkdir(parents=True)
+    keychain.write_bytes(b"keychain")
+    command.subprocess.check_output.return_value = security_result("one-identity")
+
+    first = get_identities(command, "codesigning")
+    assert get_identities(command, "codesigning") == first
+    command.subprocess.check_output.assert_called_once()
+
+    # Add an identity to the keychain
+    keychain.write_bytes(b"modified keychain")
+    command.subprocess.check_output.return_value = security_result(
+        "multiple-identities"
+    )
+
+    assert len(get_identities(command, "codesigning")) == 3
+    assert command.subprocess.check_output.call_count == 2
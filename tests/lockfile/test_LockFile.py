@@ -0,0 +1,65 @@
+import json
+
+from briefcase.lockfile import LockFile
+
+PACKAGES = [
+    {"name": "second", "version": "2.0", "hashes": ["sha256:2222"]},
+    {"name": "First", "version": "1.0", "hashes": ["sha256:1111"]},
+]
+
+
+def test_missing(tmp_path):
+    """If the lock file doesn't exist, nothing is locked."""
+    lock_file = LockFile(tmp_path / "briefcase.lock")
+
+    assert lock_file.packages("first", "macOS/app", ["first"]) is None
+
+
+def test_lock(tmp_path):
+    """Locked packages can be retrieved for the same app, target and
+    requirements."""
+    lock_file = LockFile(tmp_path / "briefcase.lock")
+    lock_file.lock("myapp", "macOS/app", ["second", "first >= 1"], PACKAGES)
+
+    # The packages are sorted by name
+    assert lock_file.packages("myapp", "macOS/app", ["first>=1", "second"]) == [
+        PACKAGES[1],
+        PACKAGES[0],
+    ]
+    # A different target, app, or set of requirements isn't locked.
+    assert lock_file.packages("myapp", "linux/appimage", ["first>=1", "second"]) is None
+    assert lock_file.packages("other", "macOS/app", ["first>=1", "second"]) is None
+    assert lock_file.packages("myapp", "macOS/app", ["first>=2", "second"]) is None
+
+    # The content is stable, so it can be committed to version control.
+    content = json.loads((tmp_path / "briefcase.lock").read_text(encoding="utf-8"))
+    assert content["apps"]["myapp"]["macOS/app"]["requires"] == ["first>=1", "second"]
+    assert not (tmp_path / ".briefcase.lock.tmp").exists()
+
+
+def test_lock_retains_targets(tmp_path):
+    """Locking packages for one target retains the packages of other targets
+    and apps."""
+    lock_file = LockFile(tmp_path / "briefcase.lock")
+    lock_file.lock("myapp", "macOS/app", ["first"], PACKAGES[1:])
+    lock_file.lock("myapp", "linux/appimage", ["first"], PACKAGES[1:])
+    lock_file.lock("other", "macOS/app", ["second"], PACKAGES[:1])
+
+    assert lock_file.packages("myapp", "macOS/app", ["first"]) == PACKAGES[1:]
+    assert lock_file.packages("myapp", "linux/appimage", ["first"]) == PACKAGES[1:]
+    assert lock_file.packages("other", "macOS/app", ["second"]) == PACKAGES[:1]
+
+
+def test_unreadable(tmp_path):
+    """A lock file that can't be read (or is from a different version of
+    Briefcase) is replaced."""
+    (tmp_path / "briefcase.lock").write_text("not JSON", encoding="utf-8")
+    lock_file = LockFile(tmp_path / "briefcase.lock")
+
+    assert lock_file.packages("myapp", "macOS/app", ["first"]) is None
+
+    (tmp_path / "briefcase.lock").write_text('{"version": 99}', encoding="utf-8")
+    assert lock_file.packages("myapp", "macOS/app", ["first"]) is None
+
+    lock_file.lock("myapp", "macOS/app", ["first"], PACKAGES[1:])
+    assert lock_file.packages("myapp", "macOS/app", ["first"]) == PACKAGES[1:]
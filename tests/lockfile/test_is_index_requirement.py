@@ -0,0 +1,22 @@
+import pytest
+
+from briefcase.lockfile import is_index_requirement
+
+
+@pytest.mark.parametrize(
+    "requirement, expected",
+    [
+        ("first", True),
+        ("first==1.0", True),
+        ("first[extra] >= 1.0; python_version >= '3.8'", True),
+        ("./local/package", False),
+        ("first @ https://example.com/first-1.0.tar.gz", False),
+        ("git+https://github.com/example/package.git", False),
+        ("-r requirements.txt", False),
+        ("--pre", False),
+    ],
+)
+def test_is_index_requirement(requirement, expected):
+    """Only requirements that are installed from a package index are index
+    requirements."""
+    assert is_index_requirement(requirement) == expected
@@ -0,0 +1,121 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from briefcase.locks import FileLock
+
+# A script that holds a lock until it is told to release it.
+HOLD_LOCK = """
+import sys
+from briefcase.locks import FileLock
+
+with FileLock.for_path(sys.argv[1]):
+    print("locked", flush=True)
+    sys.stdin.readline()
+"""
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    return tmp_path / "locks" / "test.lock"
+
+
+@pytest.fixture
+def other_process(lock_path):
+    """A process that holds the lock until its stdin is closed."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(lock_path)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout.readline() == "locked\n"
+    yield process
+    process.stdin.close()
+    process.wait()
+
+
+def test_for_path(lock_path):
+    """Every user of a lock file shares the same lock."""
+    lock = FileLock.for_path(lock_path)
+
+    assert FileLock.for_path(lock_path) is lock
+    assert FileLock.for_path(lock_path.parent / "other.lock") is not lock
+
+
+def test_acquire(lock_path):
+    """Acquiring a lock creates the lock file."""
+    lock = FileLock.for_path(lock_path)
+
+    with lock:
+        assert lock_path.exists()
+
+
+def test_reentrant(lock_path):
+    """A thread that holds a lock can acquire it again."""
+    lock = FileLock.for_path(lock_path)
+
+    with lock:
+        with lock:
+            pass
+        # The lock is still held after the inner release.
+        assert lock._file is not None
+
+    assert lock._file is None
+
+
+def test_threads(lock_path):
+    """Only one thread can hold a lock at a time."""
+    lock = FileLock.for_path(lock_path)
+    acquired = threading.Event()
+
+    def acquire():
+        with lock:
+            acquired.set()
+
+    with lock:
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.2)
+
+    thread.join(5)
+    assert acquired.is_set()
+
+
+def test_wait_for_other_process(lock_path, other_process):
+    """If another process holds the lock, the lock is acquired once the other
+    process releases it."""
+    lock = FileLock.for_path(lock_path)
+    waiting = threading.Event()
+    acquired = threading.Event()
+
+    def acquire():
+        lock.acquire(on_wait=waiting.set)
+        acquired.set()
+        lock.release()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+
+    # The other process holds the lock.
+    assert waiting.wait(5)
+    assert not acquired.wait(0.2)
+
+    # Once the other process releases the lock, it can be acquired.
+    other_process.stdin.write("\n")
+    other_process.stdin.flush()
+    thread.join(5)
+    assert acquired.is_set()
+
+
+def test_no_wait(lock_path):
+    """If the lock is available, the wait handler isn't invoked."""
+    lock = FileLock.for_path(lock_path)
+
+    def on_wait():
+        pytest.fail("Lock wasn't available")
+
+    lock.acquire(on_wait=on_wait)
+    lock.release()
@@ -0,0 +1,112 @@
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+from briefcase.mirrors import Mirrors
+
+
+def test_no_mirrors():
+    """If there are no mirrors, no mirror URLs are provided."""
+    mirrors = Mirrors()
+
+    assert not mirrors
+    assert mirrors.urls("https://example.com/file.zip") == []
+
+
+def test_mirror_urls():
+    """Mirror URLs are constructed by replacing the upstream prefix."""
+    mirrors = Mirrors(
+        {
+            "https://example.com/": [
+                "http://mirror.local/example/",
+                "file:///srv/mirror/example/",
+            ],
+        }
+    )
+
+    assert mirrors
+    assert mirrors.urls("https://example.com/path/to/file.zip") == [
+        "http://mirror.local/example/path/to/file.zip",
+        "file:///srv/mirror/example/path/to/file.zip",
+    ]
+    assert mirrors.urls("https://example.org/path/to/file.zip") == []
+
+
+def test_longest_prefix():
+    """If more than one prefix matches, the longest prefix is used."""
+    mirrors = Mirrors(
+        {
+            "https://example.com/": ["http://mirror.local/example/"],
+            "https://example.com/special/": ["http://special.local/"],
+        }
+    )
+
+    assert mirrors.urls("https://example.com/special/file.zip") == [
+        "http://special.local/file.zip"
+    ]
+    assert mirrors.urls("https://example.com/other/file.zip") == [
+        "http://mirror.local/example/other/file.zip"
+    ]
+
+
+def test_load(tmp_path):
+    """Mirrors can be loaded from a configuration file."""
+    config_path = tmp_path / "mirrors.toml"
+    config_path.write_text(
+        """
+[mirrors]
+"https://example.com/" = ["http://mirror.local/example/", "file:///srv/example/"]
+"https://example.org/" = "http://mirror.local/org/"
+""",
+        encoding="utf-8",
+    )
+
+    mirrors = Mirrors.load(config_path)
+
+    assert mirrors.mirrors == {
+        "https://example.com/": [
+            "http://mirror.local/example/",
+            "file:///srv/example/",
+        ],
+        "https://example.org/": ["http://mirror.local/org/"],
+    }
+
+
+def test_load_empty(tmp_path):
+    """A configuration file with no mirrors table defines no mirrors."""
+    config_path = tmp_path / "mirrors.toml"
+    config_path.write_text("", encoding="utf-8")
+
+    assert not Mirrors.load(config_path)
+
+
+def test_load_missing(tmp_path):
+    """If the configuration file doesn't exist, an error is raised."""
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"Unable to read mirror configuration",
+    ):
+        Mirrors.load(tmp_path / "mirrors.toml")
+
+
+def test_load_invalid_toml(tmp_path):
+    """If the configuration file isn't valid TOML, an error is raised."""
+    config_path = tmp_path / "mirrors.toml"
+    config_path.write_text("[mirrors\n", encoding="utf-8")
+
+    with pytest.raises(BriefcaseCommandError, match=r"is not valid TOML"):
+        Mirrors.load(config_path)
+
+
+def test_load_invalid_mirrors(tmp_path):
+    """If a mirror isn't a URL or list of URLs, an error is raised."""
+    config_path = tmp_path / "mirrors.toml"
+    config_path.write_text(
+        '[mirrors]\n"https://example.com/" = [1, 2]\n',
+        encoding="utf-8",
+    )
+
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"The mirrors for 'https://example.com/' in .* must be a URL",
+    ):
+        Mirrors.load(config_path)
@@ -0,0 +1,35 @@
+from briefcase.mirrors import mirrors_from_environ
+
+CONFIG = '[mirrors]\n"https://example.com/" = "http://mirror.local/"\n'
+
+
+def test_no_configuration(tmp_path):
+    """If there is no mirror configuration, there are no mirrors."""
+    assert not mirrors_from_environ({}, tmp_path)
+
+
+def test_data_path_configuration(tmp_path):
+    """A mirror configuration in the data path is used."""
+    (tmp_path / "mirrors.toml").write_text(CONFIG, encoding="utf-8")
+
+    mirrors = mirrors_from_environ({}, tmp_path)
+
+    assert mirrors.mirrors == {"https://example.com/": ["http://mirror.local/"]}
+
+
+def test_environment_configuration(tmp_path):
+    """The environment can name a mirror configuration file, which takes
+    precedence over the data path configuration."""
+    (tmp_path / "mirrors.toml").write_text(
+        '[mirrors]\n"https://example.com/" = "http://ignored.local/"\n',
+        encoding="utf-8",
+    )
+    config_path = tmp_path / "custom.toml"
+    config_path.write_text(CONFIG, encoding="utf-8")
+
+    mirrors = mirrors_from_environ(
+        {"BRIEFCASE_MIRRORS": str(config_path)},
+        tmp_path,
+    )
+
+    assert mirrors.mirrors == {"https://example.com/": ["http://mirror.local/"]}
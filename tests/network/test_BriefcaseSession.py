@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+import requests
+
+from briefcase.network import BriefcaseSession
+
+
+@pytest.fixture
+def mock_request(monkeypatch):
+    request = mock.Mock(return_value="response")
+    monkeypatch.setattr(requests.Session, "request", request)
+    return request
+
+
+def test_default_timeout(mock_request):
+    """The session's timeout is applied to requests that don't specify one."""
+    session = BriefcaseSession(timeout=(3, 7))
+
+    assert session.get("https://example.com/file.zip", stream=True) == "response"
+
+    mock_request.assert_called_once()
+    assert mock_request.call_args.args == ("GET", "https://example.com/file.zip")
+    assert mock_request.call_args.kwargs["stream"]
+    assert mock_request.call_args.kwargs["timeout"] == (3, 7)
+
+
+def test_explicit_timeout(mock_request):
+    """A request can override the session's timeout."""
+    session = BriefcaseSession(timeout=(3, 7))
+
+    session.get("https://example.com/file.zip", timeout=42)
+
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["timeout"] == 42
+
+
+@pytest.mark.parametrize("scheme", ["http", "https"])
+def test_retries(scheme):
+    """Requests are retried with a backoff on connection errors and 5xx
+    responses."""
+    session = BriefcaseSession(retries=3, backoff_factor=0.25)
+
+    adapter = session.get_adapter(f"{scheme}://example.com/file.zip")
+    retry = adapter.max_retries
+    assert retry.total == 3
+    assert retry.connect == 3
+    assert retry.read == 3
+    assert retry.backoff_factor == 0.25
+    assert set(retry.status_forcelist) == {500, 502, 503, 504}
+    assert not retry.raise_on_status
+
+    assert session.retries == 3
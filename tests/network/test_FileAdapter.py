@@ -0,0 +1,70 @@
+import pytest
+
+from briefcase.network import BriefcaseSession
+
+
+@pytest.fixture
+def session():
+    return BriefcaseSession()
+
+
+@pytest.fixture
+def local_file(tmp_path):
+    path = tmp_path / "mirror" / "file.zip"
+    path.parent.mkdir()
+    path.write_bytes(b"0123456789")
+    return path
+
+
+def test_get(session, local_file):
+    """A local file can be retrieved with a file:// URL."""
+    response = session.get(local_file.as_uri(), stream=True)
+
+    assert response.status_code == 200
+    assert response.url == local_file.as_uri()
+    assert response.headers["Content-Length"] == "10"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert b"".join(response.iter_content(chunk_size=4)) == b"0123456789"
+    response.close()
+
+
+@pytest.mark.parametrize(
+    "byte_range, content, content_range",
+    [
+        ("bytes=4-", b"456789", "bytes 4-9/10"),
+        ("bytes=2-5", b"2345", "bytes 2-5/10"),
+        ("bytes=8-100", b"89", "bytes 8-9/10"),
+    ],
+)
+def test_get_range(session, local_file, byte_range, content, content_range):
+    """A byte range of a local file can be requested."""
+    response = session.get(
+        local_file.as_uri(),
+        stream=True,
+        headers={"Range": byte_range},
+    )
+
+    assert response.status_code == 206
+    assert response.headers["Content-Range"] == content_range
+    assert response.headers["Content-Length"] == str(len(content))
+    assert response.content == content
+
+
+def test_get_unsatisfiable_range(session, local_file):
+    """A range beyond the end of the file can't be satisfied."""
+    response = session.get(
+        local_file.as_uri(),
+        stream=True,
+        headers={"Range": "bytes=10-"},
+    )
+
+    assert response.status_code == 416
+    assert response.content == b""
+
+
+def test_get_missing(session, tmp_path):
+    """A missing file is reported as a 404."""
+    response = session.get((tmp_path / "missing.zip").as_uri(), stream=True)
+
+    assert response.status_code == 404
+    assert response.content == b""
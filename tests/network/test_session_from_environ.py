@@ -0,0 +1,54 @@
+import pytest
+
+from briefcase.exceptions import BriefcaseCommandError
+from briefcase.network import DEFAULT_RETRIES, DEFAULT_TIMEOUT, session_from_environ
+
+
+def test_defaults():
+    """If the environment doesn't configure HTTP, defaults are used."""
+    session = session_from_environ({})
+
+    assert session.timeout == DEFAULT_TIMEOUT
+    assert session.retries == DEFAULT_RETRIES
+
+
+@pytest.mark.parametrize(
+    "value, timeout",
+    [
+        ("30", 30.0),
+        ("2.5,120", (2.5, 120.0)),
+    ],
+)
+def test_timeout(value, timeout):
+    """The timeout can be configured with an environment variable."""
+    session = session_from_environ({"BRIEFCASE_HTTP_TIMEOUT": value})
+
+    assert session.timeout == timeout
+
+
+@pytest.mark.parametrize("value", ["soon", "1,2,3", "1,"])
+def test_bad_timeout(value):
+    """An invalid timeout raises an error."""
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"The value of BRIEFCASE_HTTP_TIMEOUT must be",
+    ):
+        session_from_environ({"BRIEFCASE_HTTP_TIMEOUT": value})
+
+
+def test_retries():
+    """The number of retries can be configured with an environment
+    variable."""
+    session = session_from_environ({"BRIEFCASE_HTTP_RETRIES": "0"})
+
+    assert session.retries == 0
+
+
+@pytest.mark.parametrize("value", ["many", "-1"])
+def test_bad_retries(value):
+    """An invalid retry count raises an error."""
+    with pytest.raises(
+        BriefcaseCommandError,
+        match=r"The value of BRIEFCASE_HTTP_RETRIES must be a positive integer.",
+    ):
+        session_from_environ({"BRIEFCASE_HTTP_RETRIES": value})
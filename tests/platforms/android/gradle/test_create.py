@@ -1,5 +1,9 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from briefcase.integrations.android_sdk import AndroidSDK
+from briefcase.integrations.java import JDK
 from briefcase.platforms.android.gradle import GradleCreateCommand
 
 
@@ -48,3 +52,43 @@ def test_version_code(create_command, first_app_config, version, build, version_
     }
     # Version code must be less than a 32 bit signed integer MAXINT.
     assert int(version_code) < 2147483647
+
+
+def test_required_tools(create_command, first_app_config):
+    """The JDK and Android SDK are required to build Android apps."""
+    assert create_command.required_tools(first_app_config) == [
+        (JDK, {}),
+        (AndroidSDK, {}),
+    ]
+
+
+def test_verify_tools(create_command, monkeypatch):
+    """The Android SDK is downloaded while the JDK is verified, and is then
+    verified with that JDK; the licenses are accepted once every tool has
+    been verified."""
+    create_command.integrations = MagicMock()
+    jdk = MagicMock()
+    android_sdk = MagicMock()
+    monkeypatch.setattr(JDK, "verify", MagicMock(return_value=jdk))
+    monkeypatch.setattr(AndroidSDK, "fetch", MagicMock())
+    monkeypatch.setattr(AndroidSDK, "verify", MagicMock(return_value=android_sdk))
+
+    create_command.verify_tools()
+
+    JDK.verify.assert_called_once_with(create_command)
+    AndroidSDK.fetch.assert_called_once_with(create_command)
+    AndroidSDK.verify.assert_called_once_with(
+        create_command, jdk=jdk, accept_license=False
+    )
+    assert create_command.android_sdk == android_sdk
+    android_sdk.verify_license.assert_called_once_with()
+
+
+def test_wheel_platforms(create_command, first_app_config):
+    """Wheels are prefetched for every Android ABI."""
+    assert create_command.wheel_platforms(first_app_config) == [
+        "android_21_arm64_v8a",
+        "android_21_armeabi_v7a",
+        "android_21_x86",
+        "android_21_x86_64",
+    ]
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, call
 import pytest
 
 from briefcase.integrations.android_sdk import AndroidSDK
+from briefcase.integrations.java import JDK
 from briefcase.platforms.android.gradle import GradleRunCommand
 
 
@@ -183,7 +184,10 @@ def test_run_idle_device(run_command, first_app_config):
 def test_log_file_extra(run_command, monkeypatch):
     """Android commands register a log file extra to list SDK packages."""
     verify = MagicMock(return_value=run_command.android_sdk)
+    monkeypatch.setattr(JDK, "verify", MagicMock())
+    monkeypatch.setattr(AndroidSDK, "fetch", MagicMock())
     monkeypatch.setattr(AndroidSDK, "verify", verify)
+    monkeypatch.setattr(AndroidSDK, "verify_license", MagicMock())
     monkeypatch.setattr(AndroidSDK, "verify_emulator", MagicMock())
 
     # Even if one command triggers another, the sdkmanager should only be run once.
@@ -111,6 +111,8 @@ def test_verify_tools_download_failure(build_command):
         url="https://github.com/linuxdeploy/linuxdeploy/releases/download/continuous/linuxdeploy-wonky.AppImage",
         download_path=build_command.tools_path,
         role="linuxdeploy",
+        revalidate=True,
+        executable=True,
     )
 
     # But it failed, so the file won't be made executable...
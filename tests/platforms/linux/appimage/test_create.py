@@ -27,7 +27,10 @@ def test_install_app_dependencies(first_app_config, tmp_path):
     """If Docker is in use, a docker context is used to invoke pip."""
     first_app_config.requires = ["foo==1.2.3", "bar>=4.5"]
 
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+    )
     command.use_docker = True
     command.subprocess = MagicMock()
     docker = MagicMock()
@@ -70,7 +73,10 @@ def test_install_app_dependencies_no_docker(first_app_config, tmp_path):
     """If docker is *not* in use, calls are made on raw subprocess."""
     first_app_config.requires = ["foo==1.2.3", "bar>=4.5"]
 
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+    )
     command.use_docker = False
     command.subprocess = MagicMock()
     docker = MagicMock()
@@ -105,3 +111,85 @@ def test_install_app_dependencies_no_docker(first_app_config, tmp_path):
         ],
         check=True,
     )
+
+
+def test_dependency_environment(first_app_config, tmp_path):
+    """Dependencies installed in Docker aren't reused outside Docker."""
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+    )
+
+    command.use_docker = True
+    docker_environment = command.dependency_environment(first_app_config)
+    command.use_docker = False
+    native_environment = command.dependency_environment(first_app_config)
+
+    assert docker_environment["use_docker"]
+    assert not native_environment["use_docker"]
+
+
+def test_wheel_platforms(first_app_config, tmp_path):
+    """Wheels are only prefetched for the manylinux platform if Docker is in
+    use."""
+    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command.host_arch = "wonky"
+
+    command.use_docker = True
+    assert command.wheel_platforms(first_app_config) == ["manylinux2014_wonky"]
+
+    command.use_docker = False
+    assert command.wheel_platforms(first_app_config) == []
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Windows paths aren't converted in Docker context"
+)
+def test_install_app_dependencies_prefetch_wheels(first_app_config, tmp_path):
+    """If the app prefetches wheels, they are downloaded on the host, and
+    pip inside Docker installs from the wheelhouse."""
+    first_app_config.requires = ["foo==1.2.3"]
+    first_app_config.prefetch_wheels = True
+
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+    )
+    command.use_docker = True
+    command.host_arch = "wonky"
+    command.subprocess = MagicMock()
+    command.subprocess.check_output.return_value = ""
+    docker = MagicMock()
+    command.Docker = MagicMock()
+    command.Docker.return_value = docker
+
+    command._path_index = {
+        first_app_config: {"app_packages_path": "path/to/app_packages"}
+    }
+
+    command.install_app_dependencies(first_app_config)
+
+    # Wheels were downloaded by the host's subprocess, not in Docker.
+    download_args = command.subprocess.check_output.call_args[0][0]
+    assert download_args[3] == "download"
+    assert "--platform=manylinux2014_wonky" in download_args
+    assert all(
+        call[0][0][3] != "download" for call in docker.check_output.call_args_list
+    )
+
+    # pip was invoked inside docker, using the wheelhouse.
+    docker.run.assert_called_with(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--upgrade",
+            "--no-user",
+            f"--target={tmp_path}/linux/appimage/First App/path/to/app_packages",
+            f"--find-links={tmp_path / 'data' / 'cache' / 'wheelhouse'}",
+            "--no-index",
+            "foo==1.2.3",
+        ],
+        check=True,
+    )
@@ -5,12 +5,19 @@ import pytest
 
 from briefcase.exceptions import BriefcaseCommandError
 from briefcase.integrations.docker import Docker
+from briefcase.integrations.linuxdeploy import (
+    LinuxDeploy,
+    LinuxDeployGtkPlugin,
+    LinuxDeployURLPlugin,
+)
 from briefcase.integrations.subprocess import Subprocess
 from briefcase.platforms.linux.appimage import LinuxAppImageCreateCommand
 
 
 def test_binary_path(first_app_config, tmp_path):
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     # Force the architecture to x86_64 for test purposes.
     command.host_arch = "x86_64"
     binary_path = command.binary_path(first_app_config)
@@ -19,7 +26,9 @@ def test_binary_path(first_app_config, tmp_path):
 
 
 def test_distribution_path(first_app_config, tmp_path):
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     # Force the architecture to x86_64 for test purposes.
     command.host_arch = "x86_64"
     distribution_path = command.distribution_path(first_app_config, "appimage")
@@ -28,7 +37,9 @@ def test_distribution_path(first_app_config, tmp_path):
 
 
 def test_docker_image_tag(first_app_config, tmp_path):
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
 
     image_tag = command.docker_image_tag(first_app_config)
 
@@ -36,7 +47,9 @@ def test_docker_image_tag(first_app_config, tmp_path):
 
 
 def test_docker_image_tag_uppercase_name(uppercase_app_config, tmp_path):
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
 
     image_tag = command.docker_image_tag(uppercase_app_config)
 
@@ -44,7 +57,9 @@ def test_docker_image_tag_uppercase_name(uppercase_app_config, tmp_path):
 
 
 def test_dockerize(first_app_config, tmp_path):
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.Docker = Docker
     command.use_docker = True
 
@@ -61,7 +76,9 @@ def test_dockerize(first_app_config, tmp_path):
 
 def test_dockerize_nodocker(first_app_config, tmp_path):
     """If docker is not in use, dockerize() is a no-op."""
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.Docker = Docker
     command.use_docker = False
 
@@ -78,7 +95,9 @@ def test_dockerize_nodocker(first_app_config, tmp_path):
 
 def test_verify_linux_no_docker(tmp_path):
     """If Docker is disabled on Linux, the Docker alias is not set."""
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.host_os = "Linux"
     command.use_docker = False
 
@@ -91,7 +110,9 @@ def test_verify_linux_no_docker(tmp_path):
 
 def test_verify_non_linux_no_docker(tmp_path):
     """If Docker is disabled on non-Linux, an error is raised."""
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.host_os = "WeirdOS"
     command.use_docker = False
 
@@ -102,7 +123,9 @@ def test_verify_non_linux_no_docker(tmp_path):
 
 def test_verify_linux_docker(tmp_path):
     """If Docker is enabled on Linux, the Docker alias is set."""
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.host_os = "Linux"
     command.use_docker = True
     # Mock the existence of Docker.
@@ -120,7 +143,9 @@ def test_verify_linux_docker(tmp_path):
 
 def test_verify_non_linux_docker(tmp_path):
     """If Docker is enabled on non-Linux, the Docker alias is set."""
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.host_os = "WierdOS"
     command.use_docker = True
     # Mock the existence of Docker.
@@ -138,10 +163,42 @@ def test_verify_non_linux_docker(tmp_path):
 
 def test_verify_windows_docker(tmp_path):
     """Docker cannot currently be used on Windows due to path issues."""
-    command = LinuxAppImageCreateCommand(base_path=tmp_path)
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
     command.host_os = "Windows"
     command.use_docker = True
 
     # Verify the tools
     with pytest.raises(BriefcaseCommandError):
         command.verify_tools()
+
+
+def test_required_tools(first_app_config, tmp_path):
+    """linuxdeploy is required to build an AppImage."""
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
+
+    assert command.required_tools(first_app_config) == [(LinuxDeploy, {})]
+
+
+def test_required_tools_plugins(first_app_config, tmp_path):
+    """Any plugins that need to be downloaded are required."""
+    command = LinuxAppImageCreateCommand(
+        base_path=tmp_path, data_path=tmp_path / "data"
+    )
+    first_app_config.linuxdeploy_plugins = [
+        "DEPLOY_GTK_VERSION=3 gtk",
+        "https://example.com/linuxdeploy-plugin-custom.sh",
+        "/path/to/linuxdeploy-plugin-local.sh",
+    ]
+
+    assert command.required_tools(first_app_config) == [
+        (LinuxDeploy, {}),
+        (LinuxDeployGtkPlugin, {}),
+        (
+            LinuxDeployURLPlugin,
+            {"url": "https://example.com/linuxdeploy-plugin-custom.sh"},
+        ),
+    ]
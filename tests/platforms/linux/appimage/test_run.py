@@ -12,6 +12,7 @@ def test_verify_linux(tmp_path):
     command = LinuxAppImageRunCommand(
         base_path=tmp_path / "base",
         home_path=tmp_path / "home",
+        data_path=tmp_path / "data",
     )
     command.use_docker = True
     command.host_os = "Linux"
@@ -30,6 +31,7 @@ def test_verify_non_linux(tmp_path):
     command = LinuxAppImageRunCommand(
         base_path=tmp_path / "base",
         home_path=tmp_path / "home",
+        data_path=tmp_path / "data",
     )
     command.use_docker = True
     command.host_os = "WierdOS"
@@ -49,6 +51,7 @@ def test_run_app(first_app_config, tmp_path):
     command = LinuxAppImageRunCommand(
         base_path=tmp_path / "base",
         home_path=tmp_path / "home",
+        data_path=tmp_path / "data",
     )
 
     # Set the host architecture for test purposes.
@@ -70,6 +73,7 @@ def test_run_app_failed(first_app_config, tmp_path):
     command = LinuxAppImageRunCommand(
         base_path=tmp_path / "base",
         home_path=tmp_path / "home",
+        data_path=tmp_path / "data",
     )
 
     # Set the host architecture for test purposes.
@@ -36,4 +36,62 @@ def test_build(first_app_config, tmp_path):
         bundle="com.example",
         app_name="first-app",
         path=tmp_path / "linux" / "flatpak" / "First App",
+        manifest="manifest.yml",
     )
+
+
+def test_build_index_proxy(first_app_config, tmp_path):
+    """If the app uses the index proxy, a copy of the manifest that names the
+    proxy is built, and the generated files are left alone."""
+    command = LinuxFlatpakBuildCommand(base_path=tmp_path, data_path=tmp_path / "data")
+    command.flatpak = mock.MagicMock()
+    bundle_path = command.bundle_path(first_app_config)
+    bundle_path.mkdir(parents=True)
+    manifest = "app-id: com.example.first-app\nmodules:\n  - name: first-app\n"
+    (bundle_path / "manifest.yml").write_text(manifest, encoding="utf-8")
+    (bundle_path / "requirements.txt").write_text("first\n", encoding="utf-8")
+    first_app_config.index_proxy = True
+
+    def build(bundle, app_name, path, manifest):
+        assert manifest == "manifest-index.yml"
+        original, env = (
+            (path / manifest).read_text(encoding="utf-8").split("build-options:\n")
+        )
+        assert (
+            original == "app-id: com.example.first-app\nmodules:\n  - name: first-app\n"
+        )
+        assert env.startswith('  env:\n    PIP_INDEX_URL: "http://127.0.0.1:')
+
+    command.flatpak.build.side_effect = build
+
+    command.build_app(first_app_config)
+
+    command.flatpak.build.assert_called_once()
+    # The copy of the manifest is removed, and the generated files are unchanged.
+    assert not (bundle_path / "manifest-index.yml").exists()
+    assert (bundle_path / "manifest.yml").read_text(encoding="utf-8") == manifest
+    assert (bundle_path / "requirements.txt").read_text(encoding="utf-8") == "first\n"
+
+
+def test_build_index_proxy_build_options(first_app_config, tmp_path):
+    """If the manifest declares its own build options, the app's manifest is
+    built with the default index."""
+    command = LinuxFlatpakBuildCommand(base_path=tmp_path, data_path=tmp_path / "data")
+    command.flatpak = mock.MagicMock()
+    bundle_path = command.bundle_path(first_app_config)
+    bundle_path.mkdir(parents=True)
+    (bundle_path / "manifest.yml").write_text(
+        "app-id: com.example.first-app\nbuild-options:\n  env: {}\n",
+        encoding="utf-8",
+    )
+    first_app_config.index_proxy = True
+
+    command.build_app(first_app_config)
+
+    command.flatpak.build.assert_called_once_with(
+        bundle="com.example",
+        app_name="first-app",
+        path=bundle_path,
+        manifest="manifest.yml",
+    )
+    assert not (bundle_path / "manifest-index.yml").exists()
@@ -1,27 +1,38 @@
-import zipfile
 from unittest import mock
 
 from briefcase.platforms.macOS.app import macOSAppCreateCommand
 
+from ....utils import mock_zip_download
+
 
 def test_install_app_support_package(first_app_config, tmp_path):
     """A support package can be downloaded and unpacked where it is needed."""
-    # Write a temporary support zip file which includes the Python lib
-    support_file = tmp_path / "out.zip"
-    with zipfile.ZipFile(support_file, "w") as support_zip:
-        support_zip.writestr("internal/file.txt", data="hello world")
-        support_zip.writestr("Python/Resources/lib/module.py", data="code")
-
     # create app paths
     app_path = tmp_path / "macOS" / "app" / "First App" / "First App.app"
     lib_path = app_path / "Contents" / "Resources"
     support_path = lib_path / "Python" / "Support"
     support_path.mkdir(parents=True)
 
-    create_command = macOSAppCreateCommand(base_path=tmp_path)
-
-    # Modify download_file to return the temp zipfile
-    create_command.download_file = mock.MagicMock(return_value=support_file)
+    # Put some content in the support folder that isn't part of the
+    # support package.
+    (support_path / "placeholder.txt").write_text("placeholder")
+
+    create_command = macOSAppCreateCommand(
+        base_path=tmp_path,
+        data_path=tmp_path / "data",
+    )
+
+    # Modify download_file to return a support zipfile which includes the
+    # Python lib
+    create_command.download_file = mock.MagicMock(
+        side_effect=mock_zip_download(
+            "out.zip",
+            [
+                ("internal/file.txt", "hello world"),
+                ("Python/Resources/lib/module.py", "code"),
+            ],
+        )
+    )
 
     # Mock support package path
     create_command.support_path = mock.MagicMock(return_value=support_path)
@@ -33,3 +44,11 @@ def test_install_app_support_package(first_app_config, tmp_path):
     assert (support_path / "Python" / "Resources" / "lib").exists()
     assert (support_path / "Python" / "Resources" / "lib" / "module.py").exists()
     assert not (support_path / "internal").exists()
+    assert not (support_path / "placeholder.txt").exists()
+
+    # Only the lib was unpacked into the unpacked archive store
+    (entry,) = create_command.unpacked_archives.entries()
+    unpacked_path = create_command.unpacked_archives.path / entry["name"]
+    assert entry["name"].endswith(create_command.support_package_members.key)
+    assert (unpacked_path / "Python" / "Resources" / "lib" / "module.py").exists()
+    assert not (unpacked_path / "internal").exists()
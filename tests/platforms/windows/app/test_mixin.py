@@ -1,3 +1,5 @@
+from briefcase.integrations.rcedit import RCEdit
+from briefcase.integrations.wix import WiX
 from briefcase.platforms.windows.app import WindowsAppCreateCommand
 
 
@@ -16,3 +18,10 @@ def test_distribution_path(first_app_config, tmp_path):
     distribution_path = command.distribution_path(first_app_config, "app")
 
     assert distribution_path == tmp_path / "windows" / "First App-0.0.1.msi"
+
+
+def test_required_tools(first_app_config, tmp_path):
+    """WiX and RCEdit are required to build and package Windows apps."""
+    command = WindowsAppCreateCommand(base_path=tmp_path)
+
+    assert command.required_tools(first_app_config) == [(WiX, {}), (RCEdit, {})]
@@ -0,0 +1,40 @@
+import py_compile
+
+from briefcase.stdlib import compiled_imports
+
+
+def test_compiled_imports(tmp_path):
+    """Absolute imports in compiled bytecode are found."""
+    source = tmp_path / "module.py"
+    source.write_text(
+        "import os.path, json\n"
+        "from email import message\n"
+        "from . import sibling\n"
+        "from .other import thing\n"
+        "def f():\n"
+        "    from xml.etree import ElementTree as ET\n"
+    )
+    py_compile.compile(str(source), cfile=str(tmp_path / "module.pyc"), doraise=True)
+
+    assert compiled_imports(tmp_path / "module.pyc") == {
+        "os",
+        "os.path",
+        "json",
+        "email",
+        "email.message",
+        "xml",
+        "xml.etree",
+        "xml.etree.ElementTree",
+    }
+
+
+def test_other_python_version(tmp_path):
+    """Bytecode compiled by another version of Python is ignored."""
+    (tmp_path / "module.pyc").write_bytes(b"\0\0\r\n" + b"\0" * 20)
+
+    assert compiled_imports(tmp_path / "module.pyc") == set()
+
+
+def test_missing(tmp_path):
+    """A file that can't be read doesn't import anything."""
+    assert compiled_imports(tmp_path / "module.pyc") == set()
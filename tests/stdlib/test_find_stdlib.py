@@ -0,0 +1,23 @@
+from briefcase.stdlib import find_stdlib
+
+
+def test_find_stdlib(tmp_path):
+    """The standard library is found in a support package."""
+    stdlib_path = tmp_path / "python" / "lib" / "python3.X"
+    (stdlib_path / "encodings").mkdir(parents=True)
+    (stdlib_path / "encodings" / "__init__.py").write_text("")
+    (stdlib_path / "os.py").write_text("")
+
+    # A vendored copy of a module with the same name isn't the stdlib.
+    (stdlib_path / "site-packages" / "other" / "os.py").parent.mkdir(parents=True)
+    (stdlib_path / "site-packages" / "other" / "os.py").write_text("")
+
+    assert find_stdlib(tmp_path) == stdlib_path
+
+
+def test_compiled_stdlib(tmp_path):
+    """A standard library provided as compiled bytecode isn't found."""
+    (tmp_path / "python311.zip").write_bytes(b"")
+    (tmp_path / "python.exe").write_bytes(b"")
+
+    assert find_stdlib(tmp_path) is None
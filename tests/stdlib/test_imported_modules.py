@@ -0,0 +1,74 @@
+import pytest
+
+from briefcase.stdlib import imported_modules
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("import os", {"os"}),
+        ("import os.path, json", {"os", "os.path", "json"}),
+        (
+            "import xml.etree.ElementTree as ET",
+            {"xml", "xml.etree", "xml.etree.ElementTree"},
+        ),
+        ("from email import message", {"email", "email.message"}),
+        ("from collections import *", {"collections"}),
+        ("def f():\n    import csv", {"csv"}),
+        ("try:\n    import ssl\nexcept ImportError:\n    ssl = None", {"ssl"}),
+        ("import importlib\nimportlib.import_module('csv')", {"importlib", "csv"}),
+        ("__import__('sqlite3.dbapi2')", {"sqlite3", "sqlite3.dbapi2"}),
+        ("import importlib\nimportlib.import_module(name)", {"importlib"}),
+        ("x = 1", set()),
+    ],
+)
+def test_imports(tmp_path, source, expected):
+    """Imported modules (and their parent packages) are found."""
+    path = tmp_path / "module.py"
+    path.write_text(source)
+
+    assert imported_modules(path) == expected
+
+
+@pytest.mark.parametrize(
+    "filename, source, expected",
+    [
+        ("module.py", "from . import sibling", {"pkg", "pkg.sibling"}),
+        (
+            "module.py",
+            "from .sibling import x",
+            {"pkg", "pkg.sibling", "pkg.sibling.x"},
+        ),
+        ("__init__.py", "from . import child", {"pkg", "pkg.child"}),
+        ("module.py", "from .. import other", set()),
+    ],
+)
+def test_relative_imports(tmp_path, filename, source, expected):
+    """Relative imports are resolved relative to the module."""
+    path = tmp_path / filename
+    path.write_text(source)
+
+    module_name = "pkg" if filename == "__init__.py" else "pkg.module"
+    assert imported_modules(path, module_name=module_name) == expected
+
+
+def test_relative_imports_unknown_module(tmp_path):
+    """Relative imports are ignored if the name of the module is unknown."""
+    path = tmp_path / "module.py"
+    path.write_text("from . import sibling\nimport os")
+
+    assert imported_modules(path) == {"os"}
+
+
+def test_unparseable(tmp_path):
+    """If a file can't be parsed, anything that looks like an import is
+    found."""
+    path = tmp_path / "module.py"
+    path.write_text("print 'hello'\nimport os, json\nfrom urllib import parse\n")
+
+    assert imported_modules(path) == {"os", "json", "urllib"}
+
+
+def test_missing(tmp_path):
+    """A file that can't be read doesn't import anything."""
+    assert imported_modules(tmp_path / "missing.py") == set()
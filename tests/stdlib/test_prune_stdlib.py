@@ -0,0 +1,108 @@
+from briefcase.bytecode import compile_bytecode
+from briefcase.stdlib import prune_stdlib
+
+
+def create_files(path, files):
+    for name, content in files.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            (path / name).write_bytes(content)
+        else:
+            (path / name).write_text(content)
+
+
+def test_prune_stdlib(tmp_path):
+    """Unreachable modules and packages are removed."""
+    stdlib_path = tmp_path / "lib"
+    create_files(
+        stdlib_path,
+        {
+            "os.py": "",
+            "encodings/__init__.py": "",
+            "json/__init__.py": "from .decoder import JSONDecoder",
+            "json/decoder.py": "",
+            "json/tool.py": "import argparse",
+            "argparse.py": "",
+            "__pycache__/argparse.cpython-311.pyc": b"1234",
+            "lib2to3/__init__.py": "",
+            "lib2to3/Grammar.txt": "grammar",
+            "lib-dynload/_json.cpython-311.so": b"binary",
+        },
+    )
+    app_path = tmp_path / "app"
+    create_files(app_path, {"my_app/__main__.py": "import json"})
+
+    modules, size = prune_stdlib(stdlib_path, [app_path])
+
+    # json.tool, argparse, and lib2to3 are removed
+    assert modules == 3
+    assert size == len("import argparse") + 4 + len("grammar")
+
+    assert (stdlib_path / "os.py").exists()
+    assert (stdlib_path / "encodings" / "__init__.py").exists()
+    assert (stdlib_path / "json" / "decoder.py").exists()
+    assert not (stdlib_path / "json" / "tool.py").exists()
+    assert not (stdlib_path / "argparse.py").exists()
+    assert not (stdlib_path / "__pycache__" / "argparse.cpython-311.pyc").exists()
+    assert not (stdlib_path / "lib2to3").exists()
+    # Extension modules are always retained
+    assert (stdlib_path / "lib-dynload" / "_json.cpython-311.so").exists()
+
+
+def test_binary_imports(tmp_path):
+    """Modules named in an extension module in the app's packages are
+    retained."""
+    stdlib_path = tmp_path / "lib"
+    create_files(
+        stdlib_path,
+        {"os.py": "", "encodings/__init__.py": "", "csv.py": "", "json.py": ""},
+    )
+    packages_path = tmp_path / "app_packages"
+    create_files(packages_path, {"fast/_speedups.so": b"\x7fELF\0csv\0other\0"})
+
+    modules, _ = prune_stdlib(stdlib_path, [packages_path])
+
+    assert modules == 1
+    assert (stdlib_path / "csv.py").exists()
+    assert not (stdlib_path / "json.py").exists()
+
+
+def test_keep(tmp_path):
+    """Modules matching the keep list are retained."""
+    stdlib_path = tmp_path / "lib"
+    create_files(
+        stdlib_path,
+        {"os.py": "", "encodings/__init__.py": "", "csv.py": "", "json.py": ""},
+    )
+
+    modules, _ = prune_stdlib(stdlib_path, [], keep=["json"])
+
+    assert modules == 1
+    assert not (stdlib_path / "csv.py").exists()
+    assert (stdlib_path / "json.py").exists()
+
+
+def test_sourceless_app(tmp_path):
+    """The imports of sourceless bytecode in the app are found, and sourceless
+    bytecode of removed modules is removed."""
+    stdlib_path = tmp_path / "lib"
+    create_files(
+        stdlib_path,
+        {
+            "os.py": "",
+            "encodings/__init__.py": "",
+            "csv.py": "",
+            "json.py": "",
+            "json.pyc": b"bytecode",
+        },
+    )
+    app_path = tmp_path / "app"
+    create_files(app_path, {"my_app/__main__.py": "import csv"})
+    compile_bytecode([app_path], sourceless=True, max_workers=1)
+
+    modules, _ = prune_stdlib(stdlib_path, [app_path])
+
+    assert modules == 1
+    assert (stdlib_path / "csv.py").exists()
+    assert not (stdlib_path / "json.py").exists()
+    assert not (stdlib_path / "json.pyc").exists()
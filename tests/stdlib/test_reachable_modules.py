@@ -0,0 +1,66 @@
+import pytest
+
+from briefcase.stdlib import find_modules, reachable_modules
+
+
+@pytest.fixture
+def stdlib(tmp_path):
+    sources = {
+        "os.py": "import stat",
+        "stat.py": "",
+        "json/__init__.py": "from .decoder import JSONDecoder",
+        "json/decoder.py": "import re",
+        "json/tool.py": "import argparse",
+        "re/__init__.py": "from . import _parser",
+        "re/_parser.py": "",
+        "argparse.py": "import gettext",
+        "gettext.py": "",
+        "tkinter/__init__.py": "",
+        "tkinter/ttk.py": "",
+        "data/notapackage.py": "",
+    }
+    for name, source in sources.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(source)
+    return find_modules(tmp_path)
+
+
+def test_find_modules(stdlib, tmp_path):
+    """Modules are found, but not in folders that aren't packages."""
+    assert stdlib["os"] == tmp_path / "os.py"
+    assert stdlib["json"] == tmp_path / "json" / "__init__.py"
+    assert stdlib["json.decoder"] == tmp_path / "json" / "decoder.py"
+    assert "data.notapackage" not in stdlib
+
+
+def test_reachable(stdlib):
+    """Modules imported by reachable modules are reachable."""
+    assert reachable_modules(stdlib, {"json", "unknown"}) == {
+        "json",
+        "json.decoder",
+        "re",
+        "re._parser",
+    }
+
+
+def test_submodule_root(stdlib):
+    """Importing a submodule makes its parent package reachable."""
+    assert reachable_modules(stdlib, {"json.tool"}) == {
+        "json",
+        "json.decoder",
+        "json.tool",
+        "re",
+        "re._parser",
+        "argparse",
+        "gettext",
+    }
+
+
+def test_keep(stdlib):
+    """Kept modules, their submodules, and their imports are reachable."""
+    assert reachable_modules(stdlib, set(), keep=["os", "tk*"]) == {
+        "os",
+        "stat",
+        "tkinter",
+        "tkinter.ttk",
+    }
@@ -0,0 +1,113 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from briefcase.tasks import Task, run_tasks
+
+
+def test_no_tasks():
+    """An empty graph of tasks can be run."""
+    assert run_tasks({}) == {}
+
+
+def test_results():
+    """The results of required tasks are passed to the tasks that require
+    them."""
+    results = run_tasks(
+        {
+            "first": Task(lambda: 1),
+            "second": Task(lambda: 2),
+            "total": Task(
+                lambda first, second: first + second, requires=["first", "second"]
+            ),
+        }
+    )
+
+    assert results == {"first": 1, "second": 2, "total": 3}
+
+
+def test_independent_tasks_concurrent():
+    """Tasks that don't depend on each other are run concurrently."""
+    # Each task waits for the other; if the tasks weren't run concurrently,
+    # the barrier would time out.
+    barrier = threading.Barrier(2, timeout=5)
+
+    run_tasks({"first": Task(barrier.wait), "second": Task(barrier.wait)})
+
+
+def test_after():
+    """A task can be ordered after another task without receiving its
+    result."""
+    events = []
+    run_tasks(
+        {
+            "last": Task(lambda: events.append("last"), after=["first"]),
+            "first": Task(lambda: events.append("first")),
+        }
+    )
+
+    assert events == ["first", "last"]
+
+
+def test_max_workers():
+    """The number of concurrent tasks can be limited."""
+    lock = threading.Lock()
+
+    def exclusive():
+        # If two tasks ran at the same time, the lock would be held.
+        assert lock.acquire(blocking=False)
+        lock.release()
+
+    run_tasks({f"task{i}": Task(exclusive) for i in range(5)}, max_workers=1)
+
+
+def test_failure():
+    """If a task fails, the tasks that depend on it aren't run, running tasks
+    are completed, and the error is raised."""
+    started = threading.Event()
+    independent = mock.Mock()
+
+    def fail():
+        started.wait(5)
+        raise ValueError("Task failed")
+
+    def slow():
+        started.set()
+        independent()
+
+    dependent = mock.Mock()
+
+    with pytest.raises(ValueError, match=r"Task failed"):
+        run_tasks(
+            {
+                "fail": Task(fail),
+                "slow": Task(slow),
+                "dependent": Task(dependent, requires=["fail"]),
+            }
+        )
+
+    independent.assert_called_once_with()
+    dependent.assert_not_called()
+
+
+def test_unknown_dependency():
+    """A task can't depend on a task that doesn't exist."""
+    with pytest.raises(ValueError, match=r"depends on unknown task 'missing'"):
+        run_tasks({"first": Task(mock.Mock(), after=["missing"])})
+
+
+def test_circular_dependency():
+    """Circular dependencies are detected."""
+    first = mock.Mock()
+
+    with pytest.raises(ValueError, match=r"circular dependencies: second, third"):
+        run_tasks(
+            {
+                "first": Task(first),
+                "second": Task(mock.Mock(), requires=["first", "third"]),
+                "third": Task(mock.Mock(), requires=["second"]),
+            }
+        )
+
+    first.assert_called_once_with()
@@ -4,7 +4,13 @@ import pytest
 
 from briefcase import __version__
 from briefcase.cmdline import parse_cmdline
-from briefcase.commands import DevCommand, NewCommand, UpgradeCommand
+from briefcase.commands import (
+    CacheCommand,
+    DevCommand,
+    FetchCommand,
+    NewCommand,
+    UpgradeCommand,
+)
 from briefcase.exceptions import (
     InvalidFormatError,
     NoCommandError,
@@ -127,6 +133,40 @@ def test_upgrade_command(monkeypatch):
     }
 
 
+def test_cache_command(monkeypatch):
+    """``briefcase cache`` returns the cache command."""
+    # Pretend we're on macOS, regardless of where the tests run.
+    monkeypatch.setattr(sys, "platform", "darwin")
+
+    cmd, options = parse_cmdline("cache gc --max-size 10G".split())
+
+    assert isinstance(cmd, CacheCommand)
+    assert cmd.platform == "macOS"
+    assert cmd.output_format is None
+    assert options == {
+        "action": "gc",
+        "older_than": 30,
+        "max_size": "10G",
+    }
+
+
+def test_fetch_command(monkeypatch):
+    """``briefcase fetch`` returns the fetch command."""
+    # Pretend we're on macOS, regardless of where the tests run.
+    monkeypatch.setattr(sys, "platform", "darwin")
+
+    cmd, options = parse_cmdline("fetch android linux:appimage -a first -j 8".split())
+
+    assert isinstance(cmd, FetchCommand)
+    assert cmd.platform == "macOS"
+    assert cmd.output_format is None
+    assert options == {
+        "targets": ["android", "linux:appimage"],
+        "app_names": ["first"],
+        "jobs": 8,
+    }
+
+
 def test_bare_command(monkeypatch):
     """``briefcase create`` returns the macOS create app command."""
     # Pretend we're on macOS, regardless of where the tests run.
@@ -139,7 +179,7 @@ def test_bare_command(monkeypatch):
     assert cmd.output_format == "app"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 @pytest.mark.skipif(sys.platform != "linux", reason="requires Linux")
@@ -154,7 +194,7 @@ def test_linux_default():
     assert cmd.output_format == "appimage"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 @pytest.mark.skipif(sys.platform != "darwin", reason="requires macOS")
@@ -169,7 +209,7 @@ def test_macOS_default():
     assert cmd.output_format == "app"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 @pytest.mark.skipif(sys.platform != "win32", reason="requires Windows")
@@ -184,7 +224,7 @@ def test_windows_default():
     assert cmd.output_format == "app"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 def test_bare_command_help(monkeypatch, capsys):
@@ -201,6 +241,7 @@ def test_bare_command_help(monkeypatch, capsys):
     output = capsys.readouterr().out
     assert output.startswith(
         "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input] [--log]\n"
+        "                                  [--offline] [--no-cache] [-j JOBS]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -259,7 +300,7 @@ def test_command_explicit_platform(monkeypatch):
     assert cmd.output_format == "appimage"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 def test_command_explicit_platform_case_handling(monkeypatch):
@@ -275,7 +316,7 @@ def test_command_explicit_platform_case_handling(monkeypatch):
     assert cmd.output_format == "app"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 def test_command_explicit_platform_help(monkeypatch, capsys):
@@ -293,6 +334,7 @@ def test_command_explicit_platform_help(monkeypatch, capsys):
     output = capsys.readouterr().out
     assert output.startswith(
         "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input] [--log]\n"
+        "                                  [--offline] [--no-cache] [-j JOBS]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -323,7 +365,7 @@ def test_command_explicit_format(monkeypatch):
     assert cmd.output_format == "app"
     assert cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 def test_command_unknown_format(monkeypatch):
@@ -362,6 +404,7 @@ def test_command_explicit_format_help(monkeypatch, capsys):
     output = capsys.readouterr().out
     assert output.startswith(
         "usage: briefcase create macOS app [-h] [-v] [-V] [--no-input] [--log]\n"
+        "                                  [--offline] [--no-cache] [-j JOBS]\n"
         "\n"
         "Create and populate a macOS app.\n"
     )
@@ -392,7 +435,7 @@ def test_command_disable_input(monkeypatch):
     assert cmd.output_format == "app"
     assert not cmd.input.enabled
     assert cmd.logger.verbosity == 1
-    assert options == {}
+    assert options == {"jobs": 1}
 
 
 def test_command_options(monkeypatch, capsys):
@@ -426,6 +469,6 @@ def test_unknown_command_options(monkeypatch, capsys):
 
     assert output.startswith(
         "usage: briefcase publish macOS Xcode [-h] [-v] [-V] [--no-input] [--log]\n"
-        "                                     [-c {s3}]\n"
+        "                                     [--offline] [--no-cache] [-c {s3}]\n"
         "briefcase publish macOS Xcode: error: unrecognized arguments: -x"
     )
@@ -2,6 +2,7 @@ import os
 import zipfile
 from unittest.mock import MagicMock
 
+from briefcase.archive import unpack_archive
 from briefcase.console import Console, InputDisabled
 
 
@@ -87,8 +88,13 @@ def mock_file_download(filename, content, mode="w", role=None):
     :returns: a function that can act as a mock side effect for `download_file()`
     """
 
-    def _download_file(url, download_path, role):
-        return create_file(download_path / filename, content, mode=mode)
+    def _download_file(
+        url, download_path, role, extract_path=None, extract_members=None, **kwargs
+    ):
+        path = create_file(download_path / filename, content, mode=mode)
+        if extract_path:
+            unpack_archive(path, extract_dir=extract_path, members=extract_members)
+        return path
 
     return _download_file
 
@@ -100,7 +106,12 @@ def mock_zip_download(filename, content, role=None):
     :returns: a function that can act as a mock side effect for `download_file()`
     """
 
-    def _download_file(url, download_path, role):
-        return create_zip_file(download_path / filename, content)
+    def _download_file(
+        url, download_path, role, extract_path=None, extract_members=None, **kwargs
+    ):
+        path = create_zip_file(download_path / filename, content)
+        if extract_path:
+            unpack_archive(path, extract_dir=extract_path, members=extract_members)
+        return path
 
     return _download_file